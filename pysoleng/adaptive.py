@@ -0,0 +1,287 @@
+from datetime import datetime
+from typing import Callable, Dict, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from pysoleng.regular import (
+    _NANOSECONDS_PER_HOUR,
+    _calculate_regular_terms,
+    _resolve_start,
+    _resolve_step,
+)
+from pysoleng.site import Site
+from pysoleng.solar_geom import (
+    _calculate_air_mass,
+    _calculate_position,
+    _calculate_sunset_hour_angle_radians,
+    _resolve_air_mass_altitude_factor,
+    _resolve_latitude_trig,
+    _resolve_longitude,
+)
+from pysoleng.utils import ensure_numeric, validate_numeric_value
+
+# Largest spacing of the initial grid of exactly-calculated timestamps
+_INITIAL_INTERVAL_NS = _NANOSECONDS_PER_HOUR
+
+
+def _wrap_degrees(angle: np.ndarray) -> np.ndarray:
+    """
+    Method to wrap angles (in degrees) to [-180, 180).
+    """
+
+    return (angle + 180.0) % 360.0 - 180.0
+
+
+def _refine_nodes(
+    nodes: np.ndarray,
+    evaluate: Callable[[np.ndarray], Tuple[np.ndarray, np.ndarray]],
+    max_error_degrees: float,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Method to add timestamps to the (sorted) timestamp indices in
+    `nodes` until linear interpolation between consecutive nodes
+    is within `max_error_degrees` at the midpoint of every interval.
+
+    Each round calculates the midpoint of every interval still
+    pending.  An interval is accepted when the interpolated solar
+    zenith and azimuth angles at its midpoint are within
+    `max_error_degrees` of the calculated ones; otherwise, both of its
+    halves are checked in the next round.  The midpoint becomes a node
+    either way, so accepted intervals are interpolated over halves.
+
+    :param evaluate: A function returning the solar zenith and azimuth
+        angles (in degrees) at an array of timestamp indices.
+
+    :returns: A tuple of the final (sorted) node indices and the solar
+        zenith and azimuth angles at each of them.
+    """
+
+    zenith, azimuth = evaluate(nodes)
+    all_nodes, all_zenith, all_azimuth = [nodes], [zenith], [azimuth]
+
+    lower, upper = nodes[:-1], nodes[1:]
+    lower_zenith, upper_zenith = zenith[:-1], zenith[1:]
+    lower_azimuth, upper_azimuth = azimuth[:-1], azimuth[1:]
+    while True:
+        # Only intervals with timestamps between their ends are pending
+        pending = (upper - lower) > 1
+        if not (pending.any()):
+            break
+        lower, upper = lower[pending], upper[pending]
+        lower_zenith, upper_zenith = (
+            lower_zenith[pending],
+            upper_zenith[pending],
+        )
+        lower_azimuth = lower_azimuth[pending]
+        upper_azimuth = upper_azimuth[pending]
+
+        middle = (lower + upper) // 2
+        middle_zenith, middle_azimuth = evaluate(middle)
+        all_nodes.append(middle)
+        all_zenith.append(middle_zenith)
+        all_azimuth.append(middle_azimuth)
+
+        # Interpolate the azimuth across the shorter arc
+        weight = (middle - lower) / (upper - lower)
+        zenith_error = np.abs(
+            lower_zenith
+            + weight * (upper_zenith - lower_zenith)
+            - middle_zenith
+        )
+        azimuth_error = np.abs(
+            _wrap_degrees(
+                lower_azimuth
+                + weight * _wrap_degrees(upper_azimuth - lower_azimuth)
+                - middle_azimuth
+            )
+        )
+        refine = np.maximum(zenith_error, azimuth_error) > max_error_degrees
+
+        # Check both halves of each interval that needs refining
+        lower = np.concatenate([lower[refine], middle[refine]])
+        upper = np.concatenate([middle[refine], upper[refine]])
+        lower_zenith = np.concatenate(
+            [lower_zenith[refine], middle_zenith[refine]]
+        )
+        upper_zenith = np.concatenate(
+            [middle_zenith[refine], upper_zenith[refine]]
+        )
+        lower_azimuth = np.concatenate(
+            [lower_azimuth[refine], middle_azimuth[refine]]
+        )
+        upper_azimuth = np.concatenate(
+            [middle_azimuth[refine], upper_azimuth[refine]]
+        )
+
+    nodes = np.concatenate(all_nodes)
+    order = np.argsort(nodes, kind="stable")
+    return (
+        nodes[order],
+        np.concatenate(all_zenith)[order],
+        np.concatenate(all_azimuth)[order],
+    )
+
+
+def calculate_adaptive_positions(
+    start: Union[datetime, str],
+    periods: int,
+    freq: Union[str, pd.Timedelta],
+    latitude_degrees: Union[int, float, Site],
+    longitude_degrees: Union[int, float, Site],
+    site_altitude_m: Union[int, float, Site] = 0,
+    max_error_degrees: Union[int, float] = 0.01,
+) -> Dict[str, np.ndarray]:
+    """
+    Method to calculate the solar position at a single site over a
+    dense regular time range (as for
+    `pysoleng.regular.calculate_regular_positions()`), calculating the
+    solar zenith and azimuth angles exactly only at an adaptively
+    refined subset of the timestamps and interpolating the rest.
+
+    The exact calculation starts on a grid at most an hour apart (plus
+    both sides of every local midnight, where the daily terms step).
+    Each interval is halved until linear interpolation is within
+    `max_error_degrees` of the exact zenith and azimuth angles at its
+    midpoint, so the refinement concentrates where the angles curve
+    sharply (at sunrise and sunset, and where the sun passes nearly
+    overhead).  Linear interpolation error is largest mid-interval,
+    and the accepted intervals are interpolated over their halves, so
+    for these smooth angles the error is generally a quarter of
+    `max_error_degrees` or less.  The number of exact calculations
+    grows with the number of days, not of timestamps.
+
+    The declination and hour angles are calculated exactly for every
+    timestamp (they need no trigonometry per timestamp), the solar
+    altitude angle is taken from the interpolated zenith angle, and
+    the air mass is calculated from the interpolated zenith angle.
+
+    :param start: A `datetime` object, or a string that can be parsed
+        into one, containing a fixed time zone offset (e.g.,
+        `1/1/2019 12:00 AM -06:00`).
+    :param periods: The number of timestamps, which must be
+        a non-negative integer.
+    :param freq: A fixed Pandas frequency (e.g., "1s").
+    :param latitude_degrees: A numeric value representing a
+        location's position north (positive) or south (negative)
+        of the equator, which must be between -90 and 90 degrees.
+        A `pysoleng.site.Site` may be given instead.
+    :param longitude_degrees: A numeric value representing a
+        location's angular distance west of the meridian at
+        Greenwich, England.
+        `longitude_degrees` should be between 0 and 360 degrees.
+        A `pysoleng.site.Site` may be given instead.
+    :param site_altitude_m: A numeric value representing the
+        altitude above sea level (0 m, the default),
+        which must be at least -413 m.
+        A `pysoleng.site.Site` may be given instead.
+    :param max_error_degrees: A positive numeric value representing
+        the largest acceptable interpolation error of the solar zenith
+        and azimuth angles (0.01 degrees, by default).
+
+    :returns: A dictionary with the same keys as
+        `pysoleng.regular.calculate_regular_positions()`, each mapped
+        to a numpy array with one value per timestamp.
+    """
+
+    # Validate arguments
+    sin_latitude, cos_latitude = _resolve_latitude_trig(latitude_degrees)
+    longitude_degrees, _ = _resolve_longitude(longitude_degrees, None)
+    altitude_factor = _resolve_air_mass_altitude_factor(site_altitude_m)
+    ensure_numeric(
+        periods,
+        valid_types=[int],
+        nan_acceptable=False,
+        inf_acceptable=False,
+    )
+    validate_numeric_value(periods, minimum=0, maximum=None, tolerance=0.0)
+    validate_numeric_value(max_error_degrees, minimum=0, maximum=None)
+    if max_error_degrees <= 0:
+        raise ValueError("`max_error_degrees` must be positive.")
+    start_ns, utc_offset_hours = _resolve_start(start)
+    step_ns = _resolve_step(freq)
+
+    day_index, day_numbers, declination_degrees, hour_angle_degrees = (
+        _calculate_regular_terms(
+            start_ns, step_ns, periods, utc_offset_hours, longitude_degrees
+        )
+    )
+    # Calculate the sunset hour angle once for each local date
+    sunset_hour_angle_degrees = np.degrees(
+        _calculate_sunset_hour_angle_radians(
+            sin_latitude, cos_latitude, np.radians(declination_degrees)
+        )
+    )[day_index]
+    declination_degrees = declination_degrees[day_index]
+
+    def evaluate(index: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        solar_zenith_radians, solar_azimuth_radians = _calculate_position(
+            sin_latitude=sin_latitude,
+            cos_latitude=cos_latitude,
+            declination_radians=np.radians(declination_degrees[index]),
+            hour_angle_radians=np.radians(hour_angle_degrees[index]),
+        )
+        return (
+            np.degrees(solar_zenith_radians),
+            np.degrees(solar_azimuth_radians),
+        )
+
+    if periods:
+        """Start from a grid at most `_INITIAL_INTERVAL_NS` apart, with
+        nodes on both sides of every local midnight (where the daily terms
+        step), of every sunrise and sunset (where the zenith angle is held
+        at 90 degrees), and of every solar noon and midnight (where the
+        azimuth angle turns fastest), so no interval spans a step or
+        a kink."""
+        daylight = np.abs(hour_angle_degrees) <= sunset_hour_angle_degrees
+        boundaries = np.flatnonzero(
+            np.diff(day_index).astype(bool)
+            | np.diff(daylight)
+            | np.diff(hour_angle_degrees >= 0)
+        )
+        nodes = np.unique(
+            np.concatenate(
+                [
+                    np.arange(
+                        0, periods, max(_INITIAL_INTERVAL_NS // step_ns, 1)
+                    ),
+                    boundaries,
+                    boundaries + 1,
+                    [periods - 1],
+                ]
+            )
+        )
+        nodes, node_zenith, node_azimuth = _refine_nodes(
+            nodes, evaluate, max_error_degrees
+        )
+        # Interpolate the azimuth across the shorter arc, then re-wrap it
+        timestamps = np.arange(periods)
+        solar_zenith_degrees = np.interp(timestamps, nodes, node_zenith)
+        # `np.unwrap(..., period=360.0)` needs numpy 1.21 or later
+        solar_azimuth_degrees = _wrap_degrees(
+            np.interp(
+                timestamps,
+                nodes,
+                np.degrees(np.unwrap(np.radians(node_azimuth))),
+            )
+        )
+    else:
+        solar_zenith_degrees = np.empty(0)
+        solar_azimuth_degrees = np.empty(0)
+
+    # The air mass is constant while the sun is held at the horizon
+    air_mass = np.full(periods, _calculate_air_mass(90.0, altitude_factor))
+    above_horizon = solar_zenith_degrees < 90.0
+    air_mass[above_horizon] = _calculate_air_mass(
+        solar_zenith_degrees[above_horizon], altitude_factor
+    )
+
+    return {
+        "day_number": day_numbers[day_index].astype(np.int16),
+        "declination_degrees": declination_degrees,
+        "hour_angle_degrees": hour_angle_degrees,
+        "solar_zenith_degrees": solar_zenith_degrees,
+        "solar_altitude_degrees": 90.0 - solar_zenith_degrees,
+        "solar_azimuth_degrees": solar_azimuth_degrees,
+        "air_mass": air_mass,
+    }
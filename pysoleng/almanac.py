@@ -0,0 +1,254 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Optional, Union
+
+import numpy as np
+
+from pysoleng.events import _resolve_sites
+from pysoleng.lookup import _memmap_npz_member
+from pysoleng.site import Site
+from pysoleng.solar_geom import (
+    _calculate_sunset_hour_angle_radians,
+    calculate_daily_terms,
+)
+from pysoleng.utils import ensure_numeric, validate_numeric_value
+
+_SECONDS_PER_HOUR = 3_600
+_SECONDS_PER_DAY = 86_400
+# Columns with one value per site and date
+_TABLE_COLUMNS = (
+    "sunrise_local_standard_time",
+    "solar_noon_local_standard_time",
+    "sunset_local_standard_time",
+    "day_length_hours",
+)
+
+
+def _to_datetime64(midnight_s: np.ndarray, hours: np.ndarray) -> np.ndarray:
+    """
+    Method to convert wall clock times of day (in hours, NaN for none)
+    on dates starting at `midnight_s` (in seconds since the Unix epoch)
+    to `datetime64[s]` values, rounded to the second.
+    """
+
+    seconds = np.round(hours * _SECONDS_PER_HOUR)
+    valid = np.isfinite(seconds)
+    # NaT is the smallest int64
+    return np.where(
+        valid,
+        midnight_s + np.where(valid, seconds, 0).astype(np.int64),
+        np.iinfo(np.int64).min,
+    ).view("M8[s]")
+
+
+def _calculate_almanac_rows(
+    almanac: Dict[str, np.ndarray],
+    sites: slice,
+    latitude_degrees: np.ndarray,
+    longitude_correction_mins: np.ndarray,
+    daily_terms: Dict[str, np.ndarray],
+    midnight_s: np.ndarray,
+) -> None:
+    """
+    Method to calculate the almanac of a block of sites (for every
+    date), writing it into the (sites, dates) columns of `almanac`.
+    """
+
+    # Sites down axis 0, and dates along axis 1
+    latitude_radians = np.radians(latitude_degrees[sites])[:, None]
+    sin_latitude = np.sin(latitude_radians)
+    cos_latitude = np.cos(latitude_radians)
+    declination_radians = np.radians(daily_terms["declination_degrees"])
+    shift_hours = (
+        longitude_correction_mins[sites][:, None] + daily_terms["E_min"]
+    ) / 60
+
+    sunset_hour_angle_degrees = np.degrees(
+        _calculate_sunset_hour_angle_radians(
+            sin_latitude, cos_latitude, declination_radians
+        )
+    )
+    # Duffie & Beckman (2006) Equation 1.6.11
+    day_length_hours = 2.0 / 15.0 * sunset_hour_angle_degrees
+    """As in `pysoleng.events.calculate_altitude_crossings()`, the sun
+    rises and sets (modulo 24 hours) half a day length either side of
+    solar noon, except when it is up (or down) all day."""
+    solar_noon_hours = 12.0 - shift_hours
+    half_day_hours = np.where(
+        (day_length_hours > 0) & (day_length_hours < 24),
+        day_length_hours / 2,
+        np.nan,
+    )
+    almanac["sunrise_local_standard_time"][sites] = _to_datetime64(
+        midnight_s, (solar_noon_hours - half_day_hours) % 24.0
+    )
+    # As in `calculate_solar_noon_in_local_standard_time()`
+    almanac["solar_noon_local_standard_time"][sites] = _to_datetime64(
+        midnight_s, solar_noon_hours
+    )
+    almanac["sunset_local_standard_time"][sites] = _to_datetime64(
+        midnight_s, (solar_noon_hours + half_day_hours) % 24.0
+    )
+    almanac["day_length_hours"][sites] = day_length_hours
+
+
+def calculate_almanac(
+    year: int,
+    latitude_degrees: Union[int, float, Iterable[float], Site],
+    longitude_degrees: Union[int, float, Iterable[float], Site],
+    utc_offset_hours: Optional[Union[int, float, Iterable[float]]] = None,
+    workers: int = 1,
+    block_sites: int = 256,
+    path: Optional[str] = None,
+) -> Dict[str, np.ndarray]:
+    """
+    Method to calculate a year's almanac (the sunrise, solar noon, and
+    sunset times, and the day length, of every date) for many sites
+    at once.
+
+    The daily terms are calculated once for the year and shared by
+    every site, and the sites are calculated `block_sites` at a time,
+    each block as (sites, dates) arrays.  With `workers` above 1, the
+    blocks are calculated on that many threads (numpy releases the
+    GIL in its array operations, so the blocks run in parallel on
+    multiple cores).
+
+    The sunrise and sunset times are those of
+    `pysoleng.events.calculate_altitude_crossings()` for a solar
+    altitude angle of 0 degrees, the solar noon times those of
+    `pysoleng.solar_geom.calculate_solar_noon_in_local_standard_time()`,
+    and the day length is from the sunset hour angle (Duffie &
+    Beckman (2006) Equation 1.6.11; 0 hours when the sun does not
+    rise, and 24 hours when it does not set).  Times are wall clock
+    local standard times (in each site's offset from UTC), rounded
+    to the second.
+
+    :param year: The year, which must be an integer
+        between 1 and 9998.
+    :param latitude_degrees: A numeric value, or a 1-D array with one
+        value per site, representing the sites' positions north
+        (positive) or south (negative) of the equator, each between
+        -90 and 90 degrees.  A `pysoleng.site.Site` may be given
+        instead.
+    :param longitude_degrees: A numeric value, or a 1-D array with one
+        value per site, representing the sites' angular distances west
+        of the meridian at Greenwich, England, each between 0 and 360
+        degrees.  A `pysoleng.site.Site` may be given instead.
+    :param utc_offset_hours: A numeric value, or a 1-D array with one
+        value per site, representing the (standard time) offset from
+        UTC in hours, between -12 and 14 (by default, the offset of
+        a `Site` given as `longitude_degrees`).
+    :param workers: The number of threads calculating blocks of sites
+        (1, by default, for no threads), which must be
+        a positive integer.
+    :param block_sites: The number of sites calculated at a time
+        (256, by default), which must be a positive integer.
+    :param path: An optional path of an (uncompressed) `.npz` file to
+        write the almanac to, one array per column, which can be read
+        (or memory-mapped) with `load_almanac()`.
+
+    :returns: A dictionary of columns: "latitude_degrees",
+        "longitude_degrees", and "utc_offset_hours" (one value per
+        site), "date" (`datetime64[D]`, one value per date),
+        "sunrise_local_standard_time", "solar_noon_local_standard_time",
+        and "sunset_local_standard_time" (`datetime64[s]`, NaT for no
+        sunrise or sunset), and "day_length_hours" (each of shape
+        (sites, dates)).
+    """
+
+    # Validate arguments
+    for value in (year, workers, block_sites):
+        ensure_numeric(
+            value,
+            valid_types=[int],
+            nan_acceptable=False,
+            inf_acceptable=False,
+        )
+    validate_numeric_value(year, minimum=1, maximum=9_998, tolerance=0.0)
+    validate_numeric_value(workers, minimum=1, maximum=None, tolerance=0.0)
+    validate_numeric_value(block_sites, minimum=1, maximum=None, tolerance=0.0)
+    (
+        latitude_degrees,
+        longitude_degrees,
+        utc_offset_hours,
+        standard_meridian,
+    ) = (
+        np.array(values, ndmin=1)
+        for values in _resolve_sites(
+            latitude_degrees, longitude_degrees, utc_offset_hours
+        )
+    )
+
+    # Calculate the daily terms once for the year
+    dates = np.arange(
+        np.datetime64(f"{year:04d}-01-01"),
+        np.datetime64(f"{year + 1:04d}-01-01"),
+    )
+    daily_terms = calculate_daily_terms(np.arange(1, len(dates) + 1))
+    midnight_s = dates.astype(np.int64) * _SECONDS_PER_DAY
+    longitude_correction_mins = 4.0 * (standard_meridian - longitude_degrees)
+
+    shape = (len(latitude_degrees), len(dates))
+    almanac = {
+        "latitude_degrees": latitude_degrees,
+        "longitude_degrees": longitude_degrees,
+        "utc_offset_hours": utc_offset_hours,
+        "date": dates,
+        **{
+            column: np.empty(
+                shape,
+                dtype=float if column == "day_length_hours" else "M8[s]",
+            )
+            for column in _TABLE_COLUMNS
+        },
+    }
+
+    def calculate_block(start: int) -> None:
+        _calculate_almanac_rows(
+            almanac,
+            slice(start, start + block_sites),
+            latitude_degrees,
+            longitude_correction_mins,
+            daily_terms,
+            midnight_s,
+        )
+
+    starts = range(0, shape[0], block_sites)
+    if workers == 1:
+        for start in starts:
+            calculate_block(start)
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Consume the results, to raise any error from a block
+            list(executor.map(calculate_block, starts))
+
+    if path is not None:
+        np.savez(path, **almanac)
+    return almanac
+
+
+def load_almanac(
+    path: str, mmap_mode: Optional[str] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Method to load an almanac written by `calculate_almanac()`.
+
+    :param path: The path of the `.npz` file to read.
+    :param mmap_mode: `None` (the default) to read the columns into
+        memory, or a `numpy.memmap` mode (e.g., "r") to memory-map
+        the (sites, dates) columns from the file instead.
+
+    :returns: A dictionary of columns, as from `calculate_almanac()`.
+    """
+
+    with np.load(path) as archive:
+        almanac = {
+            column: archive[column]
+            for column in archive.files
+            if (mmap_mode is None) or (column not in _TABLE_COLUMNS)
+        }
+    if mmap_mode is not None:
+        for column in _TABLE_COLUMNS:
+            almanac[column] = _memmap_npz_member(
+                path, f"{column}.npy", mmap_mode
+            )
+    return almanac
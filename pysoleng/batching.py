@@ -0,0 +1,238 @@
+import queue
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Future
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from pysoleng.site import Site, _site_value
+from pysoleng.streaming import calculate_batch_positions
+from pysoleng.utils import ensure_numeric, validate_numeric_value
+
+# Sentinel placed on the request queue to stop the worker thread
+_STOP = object()
+
+
+class CoalescingBatcher:
+    """
+    Thread-safe batcher that coalesces many concurrent single-timestamp
+    solar position requests for one site into vectorized batches.
+
+    Each call to `submit()` returns a `concurrent.futures.Future`
+    immediately.  A background worker thread waits for the first
+    pending request, collects any others that arrive within
+    `max_latency_seconds` (up to `max_batch_size` requests),
+    computes them with one call to
+    `pysoleng.streaming.calculate_batch_positions()`,
+    and resolves each caller's future.
+
+    :param latitude_degrees: A numeric value representing a location's
+        position north (positive) or south (negative) of the equator,
+        which must be between -90 and 90 degrees.
+        A `pysoleng.site.Site` may be given instead.
+    :param longitude_degrees: A numeric value representing a location's
+        angular distance west of the meridian at Greenwich, England.
+        `longitude_degrees` should be between 0 and 360 degrees.
+        A `pysoleng.site.Site` may be given instead.
+    :param site_altitude_m: A numeric value representing the
+        altitude above sea level (0 m, the default),
+        which must be at least -413 m.
+        A `pysoleng.site.Site` may be given instead.
+    :param max_batch_size: The maximum number of requests computed
+        together (256, by default).
+    :param max_latency_seconds: The maximum time, in seconds, the first
+        request in a batch waits for others to arrive
+        (0.005 seconds, by default).
+    """
+
+    def __init__(
+        self,
+        latitude_degrees: Union[int, float, Site],
+        longitude_degrees: Union[int, float, Site],
+        site_altitude_m: Union[int, float, Site] = 0,
+        max_batch_size: int = 256,
+        max_latency_seconds: Union[int, float] = 0.005,
+    ):
+        # Validate arguments
+        latitude_degrees = _site_value(latitude_degrees, "latitude_degrees")
+        longitude_degrees = _site_value(longitude_degrees, "longitude_degrees")
+        site_altitude_m = _site_value(site_altitude_m, "site_altitude_m")
+        validate_numeric_value(latitude_degrees, minimum=-90, maximum=90)
+        validate_numeric_value(longitude_degrees, minimum=0, maximum=360)
+        validate_numeric_value(site_altitude_m, minimum=-413, maximum=None)
+        ensure_numeric(
+            max_batch_size,
+            valid_types=[int],
+            nan_acceptable=False,
+            inf_acceptable=False,
+        )
+        validate_numeric_value(
+            max_batch_size, minimum=1, maximum=None, tolerance=0.0
+        )
+        validate_numeric_value(max_latency_seconds, minimum=0, maximum=None)
+
+        self.latitude_degrees = latitude_degrees
+        self.longitude_degrees = longitude_degrees
+        self.site_altitude_m = site_altitude_m
+        self.max_batch_size = max_batch_size
+        self.max_latency_seconds = max_latency_seconds
+
+        self._requests = queue.Queue()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._request_count = 0
+        self._batch_sizes = Counter()
+        self._worker = threading.Thread(
+            target=self._run, name="pysoleng-batcher", daemon=True
+        )
+        self._worker.start()
+
+    def submit(self, local_standard_time: Union[datetime, str]) -> Future:
+        """
+        Method to request the solar position of a single timestamp.
+
+        :param local_standard_time: A `datetime` object (or a parse-able
+            string), containing a timezone offset.
+
+        :returns: A `concurrent.futures.Future` that resolves to a
+            dictionary of float values, with the keys returned by
+            `pysoleng.streaming.calculate_batch_positions()`.
+        """
+
+        future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("The batcher has been closed.")
+            self._requests.put((local_standard_time, future))
+        return future
+
+    def calculate(
+        self,
+        local_standard_time: Union[datetime, str],
+        timeout: Optional[float] = None,
+    ) -> Dict[str, float]:
+        """
+        Method to calculate the solar position of a single timestamp,
+        blocking until its batch has been computed.
+
+        :param local_standard_time: A `datetime` object (or a parse-able
+            string), containing a timezone offset.
+        :param timeout: The maximum number of seconds to wait, or
+            `None` (the default) to wait indefinitely.
+
+        :returns: A dictionary of float values, with the keys returned by
+            `pysoleng.streaming.calculate_batch_positions()`.
+        """
+
+        return self.submit(local_standard_time).result(timeout)
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """
+        Counters describing the batches achieved so far:
+        the number of requests and batches computed,
+        the mean and maximum batch size, and a mapping of
+        each batch size to the number of batches of that size.
+        """
+
+        with self._lock:
+            batch_sizes = dict(self._batch_sizes)
+            request_count = self._request_count
+        batch_count = sum(batch_sizes.values())
+        return {
+            "requests": request_count,
+            "batches": batch_count,
+            "mean_batch_size": (
+                request_count / batch_count if batch_count else 0.0
+            ),
+            "max_batch_size": max(batch_sizes, default=0),
+            "batch_size_counts": batch_sizes,
+        }
+
+    def close(self) -> None:
+        """
+        Method to stop the worker thread once all pending requests
+        have been computed.  Further calls to `submit()` will raise
+        a `RuntimeError`.
+        """
+
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._requests.put(_STOP)
+        self._worker.join()
+
+    def __enter__(self) -> "CoalescingBatcher":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            request = self._requests.get()
+            if request is _STOP:
+                break
+            batch = [request]
+            deadline = time.monotonic() + self.max_latency_seconds
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - time.monotonic()
+                try:
+                    if timeout > 0:
+                        request = self._requests.get(timeout=timeout)
+                    else:
+                        # Still take whatever is already waiting
+                        request = self._requests.get_nowait()
+                except queue.Empty:
+                    break
+                if request is _STOP:
+                    stopping = True
+                    break
+                batch.append(request)
+            self._process(batch)
+
+    def _process(self, batch: List[Tuple[Any, Future]]) -> None:
+        # Skip requests whose callers have already cancelled them
+        batch = [
+            (timestamp, future)
+            for timestamp, future in batch
+            if future.set_running_or_notify_cancel()
+        ]
+        if not batch:
+            return
+
+        with self._lock:
+            self._request_count += len(batch)
+            self._batch_sizes[len(batch)] += 1
+
+        try:
+            positions = self._calculate([timestamp for timestamp, _ in batch])
+        except Exception:
+            """One invalid request should not fail the others in its
+            batch, so fall back to computing each request alone."""
+            for timestamp, future in batch:
+                try:
+                    position = self._calculate([timestamp])
+                except Exception as error:
+                    future.set_exception(error)
+                else:
+                    future.set_result(
+                        {key: values[0] for key, values in position.items()}
+                    )
+        else:
+            for i, (_, future) in enumerate(batch):
+                future.set_result(
+                    {key: values[i] for key, values in positions.items()}
+                )
+
+    def _calculate(self, timestamps: List[Any]) -> Dict[str, List[float]]:
+        positions = calculate_batch_positions(
+            timestamps,
+            self.latitude_degrees,
+            self.longitude_degrees,
+            self.site_altitude_m,
+        )
+        return {key: values.tolist() for key, values in positions.items()}
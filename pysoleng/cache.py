@@ -0,0 +1,356 @@
+import hashlib
+import os
+import threading
+import zipfile
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from pysoleng.regular import calculate_regular_positions
+from pysoleng.site import Site, _site_value
+from pysoleng.streaming import calculate_batch_positions
+from pysoleng.utils import validate_datetime, validate_numeric_value
+
+# File extension used for cache entries spilled to disk
+_DISK_SUFFIX = ".npz"
+
+
+def _nbytes(positions: Dict[str, np.ndarray]) -> int:
+    return sum(values.nbytes for values in positions.values())
+
+
+class SolarGeometryCache:
+    """
+    Two-tier cache of solar geometry results, keyed on a site's
+    parameters plus a time range and frequency.
+
+    Recently used results are kept in memory, up to
+    `max_memory_bytes`; the least recently used results are evicted
+    from memory first, and (if `cache_dir` is given) are spilled to
+    `.npz` files in `cache_dir`.  The files in `cache_dir` are in turn
+    evicted, least recently used first, to keep their total size
+    within `max_disk_bytes`.  Cached files are reused by any cache
+    created with the same `cache_dir`.  Concurrent requests for an
+    entry that is not cached wait for it to be computed once.
+
+    :param max_memory_bytes: The maximum total size, in bytes, of the
+        results kept in memory (64 MiB, by default).
+    :param cache_dir: The directory used for results spilled to disk,
+        or `None` (the default) to keep results in memory only.
+    :param max_disk_bytes: The maximum total size, in bytes, of the
+        files kept in `cache_dir` (1 GiB, by default).
+    """
+
+    def __init__(
+        self,
+        max_memory_bytes: int = 64 * 2**20,
+        cache_dir: Optional[str] = None,
+        max_disk_bytes: int = 2**30,
+    ):
+        # Validate arguments
+        validate_numeric_value(max_memory_bytes, minimum=0, maximum=None)
+        validate_numeric_value(max_disk_bytes, minimum=0, maximum=None)
+
+        self.max_memory_bytes = max_memory_bytes
+        self.cache_dir = cache_dir
+        self.max_disk_bytes = max_disk_bytes
+
+        self._lock = threading.RLock()
+        self._memory = OrderedDict()
+        self._memory_bytes = 0
+        self._disk = OrderedDict()
+        self._disk_bytes = 0
+        # Events set once the results being computed for a key are stored
+        self._computing = {}
+        self._counters = dict.fromkeys(
+            [
+                "memory_hits",
+                "disk_hits",
+                "misses",
+                "memory_evictions",
+                "disk_evictions",
+            ],
+            0,
+        )
+
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+            # Index existing files, least recently used first
+            paths = [
+                os.path.join(cache_dir, name)
+                for name in os.listdir(cache_dir)
+                if name.endswith(_DISK_SUFFIX)
+            ]
+            for path in sorted(paths, key=os.path.getmtime):
+                self._disk[os.path.basename(path)] = os.path.getsize(path)
+                self._disk_bytes += self._disk[os.path.basename(path)]
+            self._evict_disk()
+
+    def get(
+        self,
+        latitude_degrees: Union[int, float, Site],
+        longitude_degrees: Union[int, float, Site],
+        utc_offset_hours: Union[int, float, Site],
+        start: Union[datetime, str],
+        end: Union[datetime, str],
+        freq: str = "1min",
+        site_altitude_m: Union[int, float, Site] = 0,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Method to get the solar geometry for a site over a regular
+        time range, computing it only if it is not already cached.
+
+        :param latitude_degrees: A numeric value representing a
+            location's position north (positive) or south (negative)
+            of the equator, which must be between -90 and 90 degrees.
+            A `pysoleng.site.Site` may be given instead.
+        :param longitude_degrees: A numeric value representing a
+            location's angular distance west of the meridian at
+            Greenwich, England.
+            `longitude_degrees` should be between 0 and 360 degrees.
+            A `pysoleng.site.Site` may be given instead.
+        :param utc_offset_hours: A numeric value representing the site's
+            (standard time) offset from UTC, in hours,
+            which must be between -12 and 14 hours.
+            A `pysoleng.site.Site` with a fixed offset from UTC
+            may be given instead.
+        :param start: A `datetime` object, or a string that can be
+            parsed into one, representing the start of the time range
+            (inclusive).  Naive values are taken to be in the site's
+            local standard time.
+        :param end: The end of the time range (inclusive),
+            as for `start`.
+        :param freq: A Pandas frequency string ("1min", by default).
+        :param site_altitude_m: A numeric value representing the
+            altitude above sea level (0 m, the default),
+            which must be at least -413 m.
+            A `pysoleng.site.Site` may be given instead.
+
+        :returns: A new dictionary of (shared) read-only numpy arrays,
+            with the keys returned by
+            `pysoleng.streaming.calculate_batch_positions()`.
+        """
+
+        # Validate arguments
+        latitude_degrees = _site_value(latitude_degrees, "latitude_degrees")
+        longitude_degrees = _site_value(longitude_degrees, "longitude_degrees")
+        utc_offset_hours = _site_value(utc_offset_hours, "utc_offset_hours")
+        site_altitude_m = _site_value(site_altitude_m, "site_altitude_m")
+        validate_numeric_value(latitude_degrees, minimum=-90, maximum=90)
+        validate_numeric_value(longitude_degrees, minimum=0, maximum=360)
+        validate_numeric_value(utc_offset_hours, minimum=-12, maximum=14)
+        validate_numeric_value(site_altitude_m, minimum=-413, maximum=None)
+
+        tz = timezone(timedelta(hours=utc_offset_hours))
+        start_ts, end_ts = (
+            self._localize(validate_datetime(value), tz)
+            for value in (start, end)
+        )
+        if end_ts < start_ts:
+            raise ValueError("`end` must not be before `start`.")
+        offset = pd.tseries.frequencies.to_offset(freq)
+        try:
+            # Equivalent fixed frequencies (e.g., "60min" and "1H")
+            # share the same key
+            freq_key = offset.nanos
+        except ValueError:
+            freq_key = offset.freqstr
+
+        key = (
+            float(latitude_degrees),
+            float(longitude_degrees),
+            float(utc_offset_hours),
+            float(site_altitude_m),
+            start_ts.value,
+            end_ts.value,
+            freq_key,
+        )
+
+        while True:
+            with self._lock:
+                positions = self._memory.get(key)
+                if positions is not None:
+                    self._memory.move_to_end(key)
+                    self._counters["memory_hits"] += 1
+                    # Callers may add or remove keys without altering
+                    # the cache
+                    return dict(positions)
+
+                positions = self._read_disk(key)
+                if positions is not None:
+                    self._counters["disk_hits"] += 1
+                    self._store_memory(key, positions)
+                    return dict(positions)
+
+                computing = self._computing.get(key)
+                if computing is None:
+                    # This caller computes the results for the key
+                    computing = self._computing[key] = threading.Event()
+                    self._counters["misses"] += 1
+                    break
+            # Wait for the results being computed by another caller,
+            # then look them up again
+            computing.wait()
+
+        try:
+            positions = self._calculate(
+                start_ts,
+                end_ts,
+                offset,
+                freq_key,
+                latitude_degrees,
+                longitude_degrees,
+                site_altitude_m,
+            )
+            with self._lock:
+                self._store_memory(key, positions)
+        finally:
+            with self._lock:
+                del self._computing[key]
+            computing.set()
+        return dict(positions)
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """
+        Counters for memory hits, disk hits, misses, and evictions
+        (from memory and from disk), along with the number and
+        total size of the entries in each tier.
+        """
+
+        with self._lock:
+            return dict(
+                self._counters,
+                memory_entries=len(self._memory),
+                memory_bytes=self._memory_bytes,
+                disk_entries=len(self._disk),
+                disk_bytes=self._disk_bytes,
+            )
+
+    def clear(self) -> None:
+        """
+        Method to remove every entry from memory and from disk.
+        """
+
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+            for filename in self._disk:
+                self._remove_file(filename)
+            self._disk.clear()
+            self._disk_bytes = 0
+
+    @staticmethod
+    def _localize(timestamp: pd.Timestamp, tz: timezone) -> pd.Timestamp:
+        if timestamp.tzinfo is None:
+            return timestamp.tz_localize(tz)
+        return timestamp.tz_convert(tz)
+
+    @staticmethod
+    def _filename(key: Tuple) -> str:
+        return hashlib.sha1(repr(key).encode()).hexdigest() + _DISK_SUFFIX
+
+    @staticmethod
+    def _calculate(
+        start_ts: pd.Timestamp,
+        end_ts: pd.Timestamp,
+        offset: pd.DateOffset,
+        freq_key: Union[int, str],
+        latitude_degrees: Union[int, float],
+        longitude_degrees: Union[int, float],
+        site_altitude_m: Union[int, float],
+    ) -> Dict[str, np.ndarray]:
+        if isinstance(freq_key, int):
+            # Fixed frequencies never need the timestamps themselves
+            positions = calculate_regular_positions(
+                start_ts,
+                (end_ts.value - start_ts.value) // freq_key + 1,
+                offset,
+                latitude_degrees,
+                longitude_degrees,
+                site_altitude_m,
+            )
+            del positions["day_number"]
+        else:
+            positions = calculate_batch_positions(
+                pd.Series(pd.date_range(start_ts, end_ts, freq=offset)),
+                latitude_degrees,
+                longitude_degrees,
+                site_altitude_m,
+            )
+        for values in positions.values():
+            values.setflags(write=False)
+        return positions
+
+    def _store_memory(
+        self, key: Tuple, positions: Dict[str, np.ndarray]
+    ) -> None:
+        replaced = self._memory.pop(key, None)
+        if replaced is not None:
+            self._memory_bytes -= _nbytes(replaced)
+        self._memory[key] = positions
+        self._memory_bytes += _nbytes(positions)
+        # Evict least recently used entries, spilling them to disk
+        while self._memory_bytes > self.max_memory_bytes and self._memory:
+            evicted_key, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= _nbytes(evicted)
+            self._counters["memory_evictions"] += 1
+            self._write_disk(evicted_key, evicted)
+
+    def _read_disk(self, key: Tuple) -> Optional[Dict[str, np.ndarray]]:
+        if self.cache_dir is None:
+            return None
+        filename = self._filename(key)
+        if filename not in self._disk:
+            return None
+        path = os.path.join(self.cache_dir, filename)
+        try:
+            with np.load(path) as archive:
+                positions = {name: archive[name] for name in archive.files}
+        except OSError:
+            # The file was removed by another process
+            self._disk_bytes -= self._disk.pop(filename)
+            return None
+        except (EOFError, KeyError, ValueError, zipfile.BadZipFile):
+            # The file is corrupt or truncated, so drop it and recompute
+            self._disk_bytes -= self._disk.pop(filename)
+            self._remove_file(filename)
+            return None
+        for values in positions.values():
+            values.setflags(write=False)
+        # Mark the file as recently used
+        os.utime(path)
+        self._disk.move_to_end(filename)
+        return positions
+
+    def _write_disk(
+        self, key: Tuple, positions: Dict[str, np.ndarray]
+    ) -> None:
+        if self.cache_dir is None:
+            return
+        filename = self._filename(key)
+        path = os.path.join(self.cache_dir, filename)
+        if filename in self._disk:
+            os.utime(path)
+            self._disk.move_to_end(filename)
+            return
+        np.savez(path, **positions)
+        self._disk[filename] = os.path.getsize(path)
+        self._disk_bytes += self._disk[filename]
+        self._evict_disk()
+
+    def _evict_disk(self) -> None:
+        while self._disk_bytes > self.max_disk_bytes and self._disk:
+            filename, size = self._disk.popitem(last=False)
+            self._disk_bytes -= size
+            self._counters["disk_evictions"] += 1
+            self._remove_file(filename)
+
+    def _remove_file(self, filename: str) -> None:
+        try:
+            os.remove(os.path.join(self.cache_dir, filename))
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,246 @@
+from datetime import date
+from typing import Dict, Iterable, Optional, Tuple, Union
+
+import numpy as np
+
+from pysoleng.regular import _NANOSECONDS_PER_HOUR
+from pysoleng.site import Site
+from pysoleng.solar_geom import calculate_daily_terms
+from pysoleng.utils import validate_numeric_value
+
+
+def _resolve_sites(
+    latitude_degrees: Union[int, float, Iterable[float], Site],
+    longitude_degrees: Union[int, float, Iterable[float], Site],
+    utc_offset_hours: Optional[Union[int, float, Iterable[float]]],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Method to validate the sites' latitudes, longitudes, and offsets
+    from UTC (or to take them from a `Site`), each a single value or
+    a 1-D array with one value per site.
+
+    :returns: A tuple of the latitudes, longitudes, offsets from UTC
+        (in hours), and standard meridians (in degrees), broadcast
+        to one value per site.
+    """
+
+    if isinstance(latitude_degrees, Site):
+        latitude_degrees = latitude_degrees.latitude_degrees
+    if isinstance(longitude_degrees, Site):
+        site = longitude_degrees
+        longitude_degrees = site.longitude_degrees
+        if utc_offset_hours is None:
+            utc_offset_hours = site.utc_offset_hours
+    if utc_offset_hours is None:
+        raise ValueError(
+            "`utc_offset_hours` must be given, or a `Site` with a fixed "
+            "offset from UTC as `longitude_degrees`."
+        )
+
+    for name, value, minimum, maximum in (
+        ("latitude_degrees", latitude_degrees, -90, 90),
+        ("longitude_degrees", longitude_degrees, 0, 360),
+        ("utc_offset_hours", utc_offset_hours, -12, 14),
+    ):
+        if np.ndim(value) > 1:
+            raise ValueError(f"`{name}` must be a value or a 1-D array.")
+        validate_numeric_value(value, minimum=minimum, maximum=maximum)
+    try:
+        latitude_degrees, longitude_degrees, utc_offset_hours = (
+            np.broadcast_arrays(
+                np.asarray(latitude_degrees, dtype=float),
+                np.asarray(longitude_degrees, dtype=float),
+                np.asarray(utc_offset_hours, dtype=float),
+            )
+        )
+    except ValueError:
+        raise ValueError(
+            "`latitude_degrees`, `longitude_degrees`, and "
+            "`utc_offset_hours` must have one value per site."
+        )
+    # As for timestamps, the standard meridian uses whole hours
+    standard_meridian = 15 * np.abs(np.floor(utc_offset_hours))
+    return (
+        latitude_degrees,
+        longitude_degrees,
+        utc_offset_hours,
+        standard_meridian,
+    )
+
+
+def _resolve_dates(
+    dates: Union[date, str, Iterable[Union[date, str]], np.ndarray],
+) -> np.ndarray:
+    """
+    Method to validate the local dates (`datetime.date` objects,
+    "YYYY-MM-DD" strings, or `datetime64` values).
+
+    :returns: A 1-D numpy array of integer days since the Unix epoch.
+    """
+
+    try:
+        days = np.atleast_1d(np.asarray(dates, dtype="datetime64[D]"))
+    except (TypeError, ValueError):
+        raise TypeError(
+            "`dates` must contain dates, such as `datetime.date` objects "
+            "or 'YYYY-MM-DD' strings."
+        )
+    if days.ndim != 1:
+        raise ValueError("`dates` must be a date or a 1-D array of them.")
+    if np.isnat(days).any():
+        raise ValueError("`dates` must not contain NaT.")
+    return days.astype(np.int64)
+
+
+def _calculate_crossing_hours(
+    sin_latitude: np.ndarray,
+    cos_latitude: np.ndarray,
+    declination_radians: np.ndarray,
+    shift_hours: np.ndarray,
+    sin_altitude: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Method to calculate the wall clock times of day (in hours) when the
+    sun rises and sets through an altitude angle, with the day's
+    declination angle and solar time shift (the longitude correction
+    and the equation of time, in hours), from the closed-form
+    hour angle.
+
+    :returns: A tuple of the rising and setting times, which are NaN
+        on days the sun does not cross the altitude angle.
+    """
+
+    """From Duffie & Beckman (2006) Equation 1.6.5 for a horizontal
+    surface, sin(altitude) = sin(latitude) sin(declination)
+    + cos(latitude) cos(declination) cos(hour angle).  Out of [-1, 1],
+    the sun is above (or below) the altitude angle all day; at a pole
+    (0 / 0, or +-inf), the altitude angle does not change in a day."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cos_hour_angle = (
+            sin_altitude - sin_latitude * np.sin(declination_radians)
+        ) / (cos_latitude * np.cos(declination_radians))
+    crosses = np.abs(cos_hour_angle) <= 1.0
+    hour_angle_hours = (
+        np.degrees(np.arccos(np.where(crosses, cos_hour_angle, np.nan))) / 15.0
+    )
+    """Solar noon is at 12:00 solar time, and (as for the hour angle)
+    the solar time of day is the wall clock time of day plus the shift,
+    modulo 24 hours."""
+    return (
+        (12.0 - hour_angle_hours - shift_hours) % 24.0,
+        (12.0 + hour_angle_hours - shift_hours) % 24.0,
+    )
+
+
+def calculate_altitude_crossings(
+    dates: Union[date, str, Iterable[Union[date, str]], np.ndarray],
+    latitude_degrees: Union[int, float, Iterable[float], Site],
+    longitude_degrees: Union[int, float, Iterable[float], Site],
+    utc_offset_hours: Optional[Union[int, float, Iterable[float]]] = None,
+    altitude_degrees: Union[int, float, Iterable[float]] = 0,
+) -> Dict[str, np.ndarray]:
+    """
+    Method to calculate the local standard times when the sun rises
+    through, and sets through, given solar altitude angles (e.g.,
+    5 or 10 degrees, to wake inverters or stow trackers), for arrays
+    of sites and local dates, without scanning altitude series.
+
+    As in `pysoleng.solar_geom.calculate_hour_angle_degrees()` (through
+    `pysoleng.solar_geom.convert_to_solar_time()`), the equation of time
+    is held for each local date and the hour angle follows the wall
+    clock time of day, and the declination angle is likewise that of
+    the local date (see `pysoleng.solar_geom.calculate_daily_terms()`),
+    so the hour angle of each crossing has a closed form (Duffie &
+    Beckman (2006) Equation 1.6.5, solved for the hour angle), which
+    is converted to local standard time as in
+    `pysoleng.solar_geom.calculate_solar_noon_in_local_standard_time()`.
+    Every crossing is calculated at once, with no iteration, and each
+    is the one on its local date.
+
+    Altitude angles below 0 degrees (e.g., -6 degrees, for civil
+    twilight) are crossed by the geometric solar altitude angle,
+    although `pysoleng.solar_geom.calculate_solar_altitude_degrees()`
+    holds the sun at the horizon at night.
+
+    :param dates: A local date (a `datetime.date` object, a
+        "YYYY-MM-DD" string, or a `numpy.datetime64`), or a 1-D
+        iterable of them.
+    :param latitude_degrees: A numeric value, or a 1-D array with one
+        value per site, representing the sites' positions north
+        (positive) or south (negative) of the equator, each between
+        -90 and 90 degrees.  A `pysoleng.site.Site` may be given
+        instead.
+    :param longitude_degrees: A numeric value, or a 1-D array with one
+        value per site, representing the sites' angular distances west
+        of the meridian at Greenwich, England, each between 0 and 360
+        degrees.  A `pysoleng.site.Site` may be given instead.
+    :param utc_offset_hours: A numeric value, or a 1-D array with one
+        value per site, representing the (standard time) offset from
+        UTC in hours, between -12 and 14 (by default, the offset of
+        a `Site` given as `longitude_degrees`).
+    :param altitude_degrees: A numeric value, or a 1-D array of them,
+        representing the solar altitude angles to find the crossings
+        of (0 degrees, the horizon, by default), each between
+        -90 and 90 degrees.
+
+    :returns: A dictionary mapping "rising_local_standard_time" and
+        "setting_local_standard_time" to numpy `datetime64[ns]` arrays
+        of the wall clock local standard time (in each site's offset
+        from UTC) of each crossing, or NaT when the sun stays above
+        or below the altitude angle all day.  The arrays have shape
+        (sites, dates, altitudes), without the sites axis for a single
+        site, and without the altitudes axis for a single altitude.
+    """
+
+    # Validate arguments
+    latitude_degrees, longitude_degrees, _, standard_meridian = _resolve_sites(
+        latitude_degrees, longitude_degrees, utc_offset_hours
+    )
+    days = _resolve_dates(dates)
+    if np.ndim(altitude_degrees) > 1:
+        raise ValueError("`altitude_degrees` must be a value or a 1-D array.")
+    validate_numeric_value(altitude_degrees, minimum=-90, maximum=90)
+
+    # Calculate the daily terms once for each local date
+    day_numbers = (
+        days.astype("datetime64[D]")
+        - days.astype("datetime64[D]").astype("datetime64[Y]")
+    ).astype(np.int64) + 1
+    daily_terms = calculate_daily_terms(day_numbers)
+
+    # Sites down axis 0, dates along axis 1, and altitudes along axis 2
+    latitude_radians = np.radians(latitude_degrees)[..., None, None]
+    longitude_correction_mins = (
+        4.0 * (standard_meridian - longitude_degrees)
+    )[..., None, None]
+    rising_hours, setting_hours = _calculate_crossing_hours(
+        sin_latitude=np.sin(latitude_radians),
+        cos_latitude=np.cos(latitude_radians),
+        declination_radians=np.radians(
+            daily_terms["declination_degrees"][:, None]
+        ),
+        shift_hours=(longitude_correction_mins + daily_terms["E_min"][:, None])
+        / 60,
+        sin_altitude=np.sin(
+            np.radians(np.atleast_1d(np.asarray(altitude_degrees, float)))
+        ),
+    )
+
+    def to_datetime64(hours: np.ndarray) -> np.ndarray:
+        # Wall clock times, from the local midnight starting each date
+        crossing = np.full(hours.shape, np.datetime64("NaT"), "M8[ns]")
+        crosses = np.isfinite(hours)
+        midnight_ns = np.broadcast_to(
+            days[:, None] * (24 * _NANOSECONDS_PER_HOUR), hours.shape
+        )
+        crossing[crosses] = (
+            midnight_ns[crosses]
+            + np.round(hours[crosses] * _NANOSECONDS_PER_HOUR).astype(np.int64)
+        ).astype("M8[ns]")
+        # Drop the altitudes axis for a single altitude
+        return crossing if np.ndim(altitude_degrees) else crossing[..., 0]
+
+    return {
+        "rising_local_standard_time": to_datetime64(rising_hours),
+        "setting_local_standard_time": to_datetime64(setting_hours),
+    }
@@ -0,0 +1,287 @@
+from datetime import datetime, tzinfo
+from typing import Iterable, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from pysoleng.regular import _resolve_step, calculate_regular_positions
+from pysoleng.solar_geom import _calculate_local_day_numbers
+from pysoleng.streaming import (
+    _calculate_validated_batch_positions,
+    calculate_batch_positions,
+)
+from pysoleng.utils import (
+    _MixedOffsetTimes,
+    _validate_local_times,
+    validate_datetime,
+    validate_numeric_value,
+)
+
+# Float columns of a `SolarPositionFrame`, in storage order
+FRAME_COLUMNS = (
+    "declination_degrees",
+    "hour_angle_degrees",
+    "solar_zenith_degrees",
+    "solar_altitude_degrees",
+    "solar_azimuth_degrees",
+    "air_mass",
+)
+
+
+class SolarPositionFrame:
+    """
+    Compact, columnar container for solar position results,
+    backed by contiguous numpy arrays with consistent dtypes:
+
+    - `times`: `datetime64[ns]` timestamps (in UTC; see `tz`)
+    - `day_number`: `int16` day numbers (of the local date)
+    - one `float64` array per column in `FRAME_COLUMNS`, stored
+      together as the rows of one C-contiguous 2-D array.
+
+    Columns are available by name (e.g.,
+    `frame["solar_zenith_degrees"]`) as contiguous views.
+    `to_numpy()` returns the 2-D float array itself, and
+    `to_pandas()` builds a DataFrame whose float columns and
+    time index share memory with the frame (no copies).
+
+    :param times: An array of `datetime64[ns]` values (or values
+        convertible to them), in UTC.
+    :param day_number: An array of day numbers (1 to 366),
+        aligned with `times`.
+    :param values: A 2-D array with one row per column in
+        `FRAME_COLUMNS`, aligned with `times`.
+    :param tz: The time zone used to present `times`
+        in `to_pandas()`, or `None` (the default) for UTC.
+    """
+
+    __slots__ = ("times", "day_number", "tz", "_values")
+
+    def __init__(
+        self,
+        times: np.ndarray,
+        day_number: np.ndarray,
+        values: np.ndarray,
+        tz: Optional[Union[str, tzinfo]] = None,
+    ):
+        times = np.ascontiguousarray(times, dtype="datetime64[ns]")
+        day_number = np.ascontiguousarray(day_number)
+        values = np.ascontiguousarray(values, dtype=np.float64)
+
+        # Validate arguments
+        if times.ndim != 1:
+            raise ValueError("`times` must be one-dimensional.")
+        if values.shape != (len(FRAME_COLUMNS), len(times)):
+            raise ValueError(
+                f"`values` must have shape ({len(FRAME_COLUMNS)}, "
+                f"{len(times)})."
+            )
+        if day_number.shape != times.shape:
+            raise ValueError("`day_number` must be aligned with `times`.")
+        if len(day_number):
+            validate_numeric_value(
+                [int(day_number.min()), int(day_number.max())],
+                minimum=1,
+                maximum=366,
+            )
+
+        self.times = times
+        self.day_number = day_number.astype(np.int16, copy=False)
+        self.tz = tz
+        self._values = values
+
+    @classmethod
+    def from_timestamps(
+        cls,
+        local_standard_time: Iterable[Union[datetime, str]],
+        latitude_degrees: Union[int, float],
+        longitude_degrees: Union[int, float],
+        site_altitude_m: Union[int, float] = 0,
+        daylight_only: bool = False,
+    ) -> "SolarPositionFrame":
+        """
+        Method to calculate the solar position for a batch of
+        timestamps at a single site, as a `SolarPositionFrame`.
+
+        :param local_standard_time: An iterable of `datetime` objects
+            (or parse-able strings), each containing a timezone offset.
+            The offsets may differ from row to row, in which case the
+            frame's `tz` is `None` (UTC).
+        :param latitude_degrees: A numeric value representing a
+            location's position north (positive) or south (negative)
+            of the equator, which must be between -90 and 90 degrees.
+        :param longitude_degrees: A numeric value representing a
+            location's angular distance west of the meridian at
+            Greenwich, England.
+            `longitude_degrees` should be between 0 and 360 degrees.
+        :param site_altitude_m: A numeric value representing the
+            altitude above sea level (0 m, the default),
+            which must be at least -413 m.
+        :param daylight_only: Whether to calculate the solar position
+            only for the timestamps in daylight (see
+            `pysoleng.streaming.calculate_batch_positions()`)
+            (default `False`).
+
+        :returns: A `SolarPositionFrame`.
+        """
+
+        if not isinstance(local_standard_time, (pd.Series, pd.Index)):
+            local_standard_time = list(local_standard_time)
+        if not len(local_standard_time):
+            # Validate the site, for an empty frame
+            calculate_batch_positions(
+                [], latitude_degrees, longitude_degrees, site_altitude_m
+            )
+            return cls(
+                times=np.empty(0, dtype="datetime64[ns]"),
+                day_number=np.empty(0, dtype=np.int16),
+                values=np.empty((len(FRAME_COLUMNS), 0)),
+            )
+
+        # Validate the timestamps once, keeping any per-row offsets
+        local_ts = _validate_local_times(
+            local_standard_time, tz=None, epoch_unit="s"
+        )
+        day_number = _calculate_local_day_numbers(local_ts)
+        positions = _calculate_validated_batch_positions(
+            local_ts,
+            day_number,
+            latitude_degrees,
+            longitude_degrees,
+            site_altitude_m,
+            daylight_only,
+        )
+        if isinstance(local_ts, _MixedOffsetTimes):
+            # Times with mixed offsets are presented in UTC
+            utc_ns = local_ts.wall_clock.asi8 - local_ts.utc_offset_ns
+            tz = None
+        else:
+            local_index = pd.DatetimeIndex(local_ts)
+            utc_ns = local_index.asi8
+            tz = local_index.tz
+        return cls(
+            times=utc_ns.view("datetime64[ns]"),
+            day_number=day_number,
+            values=np.vstack([positions[column] for column in FRAME_COLUMNS]),
+            tz=tz,
+        )
+
+    @classmethod
+    def from_range(
+        cls,
+        start: Union[datetime, str],
+        periods: int,
+        freq: Union[str, pd.Timedelta],
+        latitude_degrees: Union[int, float],
+        longitude_degrees: Union[int, float],
+        site_altitude_m: Union[int, float] = 0,
+        daylight_only: bool = False,
+    ) -> "SolarPositionFrame":
+        """
+        Method to calculate the solar position at a single site over a
+        regular time range, as a `SolarPositionFrame`, without creating
+        any timestamps (see
+        `pysoleng.regular.calculate_regular_positions()`).
+
+        :param start: A `datetime` object, or a string that can be
+            parsed into one, containing a fixed time zone offset.
+        :param periods: The number of timestamps, which must be
+            a non-negative integer.
+        :param freq: A fixed Pandas frequency (e.g., "1min").
+        :param latitude_degrees: A numeric value representing a
+            location's position north (positive) or south (negative)
+            of the equator, which must be between -90 and 90 degrees.
+        :param longitude_degrees: A numeric value representing a
+            location's angular distance west of the meridian at
+            Greenwich, England.
+            `longitude_degrees` should be between 0 and 360 degrees.
+        :param site_altitude_m: A numeric value representing the
+            altitude above sea level (0 m, the default),
+            which must be at least -413 m.
+        :param daylight_only: Whether to calculate the solar position
+            only for the timestamps in daylight (see
+            `pysoleng.regular.calculate_regular_positions()`)
+            (default `False`).
+
+        :returns: A `SolarPositionFrame`.
+        """
+
+        positions = calculate_regular_positions(
+            start,
+            periods,
+            freq,
+            latitude_degrees,
+            longitude_degrees,
+            site_altitude_m,
+            daylight_only=daylight_only,
+        )
+        start_ts = validate_datetime(start)
+        times = start_ts.value + _resolve_step(freq) * np.arange(
+            periods, dtype=np.int64
+        )
+        return cls(
+            times=times.view("datetime64[ns]"),
+            day_number=positions["day_number"],
+            values=np.vstack([positions[column] for column in FRAME_COLUMNS]),
+            tz=start_ts.tzinfo,
+        )
+
+    @property
+    def columns(self) -> Tuple[str, ...]:
+        """The names of the float columns, in storage order."""
+        return FRAME_COLUMNS
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def __getitem__(self, column: str) -> np.ndarray:
+        if column == "times":
+            return self.times
+        if column == "day_number":
+            return self.day_number
+        try:
+            return self._values[FRAME_COLUMNS.index(column)]
+        except ValueError:
+            raise KeyError(column)
+
+    def __repr__(self) -> str:
+        return (
+            f"<SolarPositionFrame: {len(self)} rows x "
+            f"{len(FRAME_COLUMNS) + 2} columns>"
+        )
+
+    def to_numpy(self) -> np.ndarray:
+        """
+        Method to get the float columns as one 2-D array
+        (one row per column in `FRAME_COLUMNS`), without copying.
+
+        :returns: A C-contiguous 2-D numpy array of float64 values.
+        """
+
+        return self._values
+
+    def to_pandas(self) -> pd.DataFrame:
+        """
+        Method to present the frame as a Pandas DataFrame, indexed by
+        the (timezone-aware, if `tz` is set) timestamps.
+
+        The float columns and the index share memory with the frame,
+        so changes to one are visible in the other; the (small)
+        `day_number` column is copied.
+
+        :returns: A Pandas DataFrame.
+        """
+
+        dtype = (
+            np.dtype("datetime64[ns]")
+            if self.tz is None
+            else pd.DatetimeTZDtype(tz=self.tz)
+        )
+        index = pd.DatetimeIndex(
+            pd.arrays.DatetimeArray(self.times, dtype=dtype, copy=False),
+            copy=False,
+        )
+        df = pd.DataFrame(
+            self._values.T, index=index, columns=FRAME_COLUMNS, copy=False
+        )
+        df.insert(0, "day_number", self.day_number)
+        return df
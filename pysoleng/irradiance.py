@@ -0,0 +1,542 @@
+from typing import Dict, Iterable, Optional, Union
+
+import numpy as np
+
+from pysoleng.site import Site
+from pysoleng.utils import ensure_numeric, validate_numeric_value
+
+# Climate correction factors (r0, r1, rk) of Hottel's clear-sky model
+# (Duffie & Beckman (2006) Table 2.8.1)
+_HOTTEL_CLIMATE_CORRECTIONS = {
+    "tropical": (0.95, 0.98, 1.02),
+    "midlatitude summer": (0.97, 0.99, 1.02),
+    "subarctic summer": (0.99, 0.99, 1.01),
+    "midlatitude winter": (1.03, 1.01, 1.00),
+}
+# Highest altitude (in m) for which Hottel's model is given
+_HOTTEL_MAX_ALTITUDE_M = 2_500
+
+
+def _validate_solar_zenith_degrees(
+    solar_zenith_degrees: Union[int, float, Iterable[Union[int, float]]],
+) -> np.ndarray:
+    """
+    Method to type- and range-check an array of solar zenith angles
+    (see `pysoleng.solar_geom.calculate_solar_zenith_degrees()`).
+
+    :returns: A numpy array of floats.
+    """
+
+    ensure_numeric(
+        solar_zenith_degrees,
+        valid_types=[int, float, np.number],
+        nan_acceptable=False,
+        inf_acceptable=False,
+    )
+    validate_numeric_value(solar_zenith_degrees, minimum=0, maximum=90)
+    return np.asarray(solar_zenith_degrees, dtype=float)
+
+
+def calculate_hottel_beam_transmittance(
+    solar_zenith_degrees: Union[int, float, Iterable[Union[int, float]]],
+    site_altitude_m: Union[int, float, Iterable[Union[int, float]], Site] = 0,
+    climate: str = "midlatitude summer",
+) -> Union[float, np.ndarray]:
+    """
+    The atmospheric transmittance for beam radiation of a clear
+    (23 km visibility) atmosphere, per Hottel (1976): the ratio of
+    the clear-sky beam radiation to the extraterrestrial radiation,
+    both on the plane normal to the radiation.
+
+    The equations used are from Duffie & Beckman (2006)
+    Equations 2.8.1 and 2.8.2a-c, with the climate correction
+    factors of Table 2.8.1.
+
+    The transmittance is 0 with the sun at (or held at) the horizon.
+    The arguments are broadcast against each other, so, e.g.,
+    a (sites, 1) array of altitudes and a (sites, timestamps) array of
+    solar zenith angles give a (sites, timestamps) array.
+
+    :param solar_zenith_degrees: A numeric value, or an array of them,
+        representing the solar zenith angle, which must be between
+        0 and 90 degrees (as returned by
+        `pysoleng.solar_geom.calculate_solar_zenith_degrees()`).
+    :param site_altitude_m: A numeric value, or an array of them,
+        representing the altitude above sea level (0 m, the default),
+        which must be between -413 m and 2,500 m.
+        A `pysoleng.site.Site` may be given instead.
+    :param climate: The climate type: "tropical",
+        "midlatitude summer" (the default), "subarctic summer",
+        or "midlatitude winter".
+
+    :returns: A float value (or a numpy array of them) between 0 and 1.
+    """
+
+    # Validate arguments
+    solar_zenith_degrees = _validate_solar_zenith_degrees(solar_zenith_degrees)
+    if isinstance(site_altitude_m, Site):
+        site_altitude_m = site_altitude_m.site_altitude_m
+    validate_numeric_value(
+        site_altitude_m, minimum=-413, maximum=_HOTTEL_MAX_ALTITUDE_M
+    )
+    if climate not in _HOTTEL_CLIMATE_CORRECTIONS:
+        raise ValueError(
+            f"`climate` must be one of: {list(_HOTTEL_CLIMATE_CORRECTIONS)}."
+        )
+    r0, r1, rk = _HOTTEL_CLIMATE_CORRECTIONS[climate]
+
+    # Constants for the standard atmosphere, at the altitude in km
+    altitude_km = np.asarray(site_altitude_m, dtype=float) / 1_000
+    a0 = r0 * (0.4237 - 0.00821 * (6.0 - altitude_km) ** 2)
+    a1 = r1 * (0.5055 + 0.00595 * (6.5 - altitude_km) ** 2)
+    k = rk * (0.2711 + 0.01858 * (2.5 - altitude_km) ** 2)
+
+    cos_zenith = np.cos(np.radians(solar_zenith_degrees))
+    """With the sun at the horizon (90 degrees, where the zenith angle
+    is held at night), `cos_zenith` is 0 (or just off it), and
+    no beam radiation gets through."""
+    above_horizon = cos_zenith > 1e-12
+    with np.errstate(divide="ignore"):
+        beam_transmittance = np.where(
+            above_horizon,
+            a0 + a1 * np.exp(-k / np.where(above_horizon, cos_zenith, 1.0)),
+            0.0,
+        )
+    return (
+        beam_transmittance
+        if beam_transmittance.ndim
+        else float(beam_transmittance)
+    )
+
+
+def calculate_liu_jordan_diffuse_transmittance(
+    beam_transmittance: Union[int, float, Iterable[Union[int, float]]],
+) -> Union[float, np.ndarray]:
+    """
+    The transmittance for diffuse radiation of a clear atmosphere,
+    per Liu and Jordan (1960): the ratio of the clear-sky diffuse
+    radiation on a horizontal plane to the extraterrestrial radiation
+    on a horizontal plane, estimated from the beam transmittance.
+
+    The equation used is from Duffie & Beckman (2006)
+    Equation 2.8.5.
+
+    :param beam_transmittance: A numeric value, or an array of them,
+        between 0 and 1 (e.g., as returned by
+        `calculate_hottel_beam_transmittance()`).
+
+    :returns: A float value (or a numpy array of them).
+    """
+
+    # Validate `beam_transmittance`
+    ensure_numeric(
+        beam_transmittance,
+        valid_types=[int, float, np.number],
+        nan_acceptable=False,
+        inf_acceptable=False,
+    )
+    validate_numeric_value(beam_transmittance, minimum=0, maximum=1)
+
+    diffuse_transmittance = 0.271 - 0.294 * np.asarray(
+        beam_transmittance, dtype=float
+    )
+    return (
+        diffuse_transmittance
+        if diffuse_transmittance.ndim
+        else float(diffuse_transmittance)
+    )
+
+
+def calculate_clear_sky_irradiance(
+    solar_zenith_degrees: Union[int, float, Iterable[Union[int, float]]],
+    G_on_W_m2: Union[int, float, Iterable[Union[int, float]]],
+    site_altitude_m: Union[int, float, Iterable[Union[int, float]], Site] = 0,
+    climate: str = "midlatitude summer",
+) -> Dict[str, Union[float, np.ndarray]]:
+    """
+    Method to calculate the clear-sky beam and diffuse irradiance from
+    already-computed solar zenith angles and extraterrestrial
+    radiation, with Hottel's beam transmittance (see
+    `calculate_hottel_beam_transmittance()`) and Liu and Jordan's
+    diffuse transmittance (see
+    `calculate_liu_jordan_diffuse_transmittance()`).
+
+    The cosine of the solar zenith angle is calculated once and shared
+    by every component, and all of the arguments are broadcast against
+    each other, so one call covers, e.g., a (sites, timestamps) array
+    of solar zenith angles, a (timestamps,) array of G_on, and a
+    (sites, 1) array of altitudes.
+
+    :param solar_zenith_degrees: A numeric value, or an array of them,
+        representing the solar zenith angle, which must be between
+        0 and 90 degrees.
+    :param G_on_W_m2: A numeric value, or an array of them,
+        representing the extraterrestrial radiation on the plane normal
+        to the radiation, in W/m^2 (as returned by
+        `pysoleng.solar_geom.calculate_G_on_W_m2()`).
+    :param site_altitude_m: A numeric value, or an array of them,
+        representing the altitude above sea level (0 m, the default),
+        which must be between -413 m and 2,500 m.
+        A `pysoleng.site.Site` may be given instead.
+    :param climate: The climate type (see
+        `calculate_hottel_beam_transmittance()`).
+
+    :returns: A dictionary mapping "beam_normal_W_m2",
+        "beam_horizontal_W_m2", "diffuse_horizontal_W_m2", and
+        "global_horizontal_W_m2" to float values (or numpy arrays).
+    """
+
+    # Validate `G_on_W_m2` (the others are validated below)
+    ensure_numeric(
+        G_on_W_m2,
+        valid_types=[int, float, np.number],
+        nan_acceptable=False,
+        inf_acceptable=False,
+    )
+    validate_numeric_value(G_on_W_m2, minimum=0, maximum=None)
+    G_on_W_m2 = np.asarray(G_on_W_m2, dtype=float)
+
+    beam_transmittance = calculate_hottel_beam_transmittance(
+        solar_zenith_degrees, site_altitude_m, climate
+    )
+    # As in `calculate_liu_jordan_diffuse_transmittance()` (validated)
+    diffuse_transmittance = 0.271 - 0.294 * beam_transmittance
+    # The extraterrestrial radiation on a horizontal plane (Eq. 1.10.1)
+    G_o_W_m2 = G_on_W_m2 * np.cos(
+        np.radians(_validate_solar_zenith_degrees(solar_zenith_degrees))
+    )
+
+    beam_normal_W_m2 = G_on_W_m2 * beam_transmittance
+    beam_horizontal_W_m2 = G_o_W_m2 * beam_transmittance
+    # No diffuse radiation either, with the sun at the horizon
+    diffuse_horizontal_W_m2 = np.where(
+        beam_transmittance > 0, G_o_W_m2 * diffuse_transmittance, 0.0
+    )
+    irradiance = {
+        "beam_normal_W_m2": beam_normal_W_m2,
+        "beam_horizontal_W_m2": beam_horizontal_W_m2,
+        "diffuse_horizontal_W_m2": diffuse_horizontal_W_m2,
+        "global_horizontal_W_m2": beam_horizontal_W_m2
+        + diffuse_horizontal_W_m2,
+    }
+    return {
+        key: (values if np.ndim(values) else float(values))
+        for key, values in irradiance.items()
+    }
+
+
+def _validate_values(
+    values: Union[int, float, Iterable[Union[int, float]]],
+    minimum: Optional[float],
+    maximum: Optional[float],
+) -> np.ndarray:
+    """
+    Method to type- and range-check an array of angles (in degrees)
+    or irradiances (in W/m^2).
+
+    :returns: A numpy array of floats.
+    """
+
+    ensure_numeric(
+        values,
+        valid_types=[int, float, np.number],
+        nan_acceptable=False,
+        inf_acceptable=False,
+    )
+    validate_numeric_value(values, minimum=minimum, maximum=maximum)
+    return np.asarray(values, dtype=float)
+
+
+def _calculate_beam_tilt_factor(
+    cos_zenith: np.ndarray,
+    cos_incidence: np.ndarray,
+    max_solar_zenith_degrees: float,
+) -> np.ndarray:
+    """
+    Method to calculate R_b from the cosines of the solar zenith and
+    incidence angles, with the cosine of the solar zenith angle held
+    at that of `max_solar_zenith_degrees` near the horizon.
+
+    :returns: A numpy array of floats.
+    """
+
+    above_horizon = cos_zenith > 1e-12
+    return np.where(
+        above_horizon,
+        np.maximum(cos_incidence, 0.0)
+        / np.maximum(cos_zenith, np.cos(np.radians(max_solar_zenith_degrees))),
+        0.0,
+    )
+
+
+def calculate_incidence_angle_degrees(
+    solar_zenith_degrees: Union[int, float, Iterable[Union[int, float]]],
+    solar_azimuth_degrees: Union[int, float, Iterable[Union[int, float]]],
+    slope_degrees: Union[int, float, Iterable[Union[int, float]]],
+    surface_azimuth_degrees: Union[int, float, Iterable[Union[int, float]]],
+) -> Union[float, np.ndarray]:
+    """
+    The angle of incidence is the angle between the beam radiation
+    on a surface and the normal to that surface.
+
+    The equation used is from Duffie & Beckman (2006)
+    Equation 1.6.3, which takes the sun's position (e.g., as returned
+    by `pysoleng.solar_geom.calculate_solar_position()`) rather than
+    the declination and hour angles.  The arguments are broadcast
+    against each other.
+
+    :param solar_zenith_degrees: A numeric value, or an array of them,
+        representing the solar zenith angle, which must be between
+        0 and 90 degrees.
+    :param solar_azimuth_degrees: A numeric value, or an array of them,
+        representing the solar azimuth angle (east of south negative,
+        west of south positive), which must be between
+        -180 and 180 degrees.
+    :param slope_degrees: A numeric value, or an array of them,
+        representing the angle between the plane of the surface and
+        the horizontal, which must be between 0 and 180 degrees.
+    :param surface_azimuth_degrees: A numeric value, or an array of
+        them, representing the deviation of the projection on a
+        horizontal plane of the normal to the surface from the local
+        meridian (east of south negative, west of south positive),
+        which must be between -180 and 180 degrees.
+
+    :returns: A float value (or a numpy array of them)
+        between 0 and 180 degrees.
+    """
+
+    # Validate arguments
+    solar_zenith_radians = np.radians(
+        _validate_solar_zenith_degrees(solar_zenith_degrees)
+    )
+    solar_azimuth_radians = np.radians(
+        _validate_values(solar_azimuth_degrees, -180, 180)
+    )
+    slope_radians = np.radians(_validate_values(slope_degrees, 0, 180))
+    surface_azimuth_radians = np.radians(
+        _validate_values(surface_azimuth_degrees, -180, 180)
+    )
+
+    cos_incidence = np.cos(solar_zenith_radians) * np.cos(
+        slope_radians
+    ) + np.sin(solar_zenith_radians) * np.sin(slope_radians) * np.cos(
+        solar_azimuth_radians - surface_azimuth_radians
+    )
+    # Keep rounding from taking the cosine out of [-1, 1]
+    incidence_angle_degrees = np.degrees(
+        np.arccos(np.clip(cos_incidence, -1.0, 1.0))
+    )
+    return (
+        incidence_angle_degrees
+        if incidence_angle_degrees.ndim
+        else float(incidence_angle_degrees)
+    )
+
+
+def calculate_beam_tilt_factor(
+    solar_zenith_degrees: Union[int, float, Iterable[Union[int, float]]],
+    incidence_angle_degrees: Union[int, float, Iterable[Union[int, float]]],
+    max_solar_zenith_degrees: Union[int, float] = 85,
+) -> Union[float, np.ndarray]:
+    """
+    The geometric factor R_b is the ratio of the beam radiation on a
+    tilted surface to that on a horizontal surface.
+
+    The equation used is from Duffie & Beckman (2006)
+    Equation 1.8.1.
+
+    R_b grows without bound as the sun nears the horizon, where small
+    errors in the beam radiation on a horizontal surface become
+    large errors on the tilted one.  So, the cosine of the solar
+    zenith angle is held at that of `max_solar_zenith_degrees` at lower
+    sun angles (one `np.maximum` over the whole array).  R_b is 0
+    while the sun is behind the surface, or below the horizon.
+
+    :param solar_zenith_degrees: A numeric value, or an array of them,
+        representing the solar zenith angle, which must be between
+        0 and 90 degrees.
+    :param incidence_angle_degrees: A numeric value, or an array of
+        them, representing the angle of incidence of beam radiation on
+        the surface (as returned by
+        `calculate_incidence_angle_degrees()`), which must be between
+        0 and 180 degrees.
+    :param max_solar_zenith_degrees: A numeric value representing the
+        solar zenith angle beyond which the denominator of R_b is held
+        (85 degrees, by default), which must be between
+        0 and 90 degrees.
+
+    :returns: A float value (or a numpy array of them).
+    """
+
+    # Validate arguments
+    cos_zenith = np.cos(
+        np.radians(_validate_solar_zenith_degrees(solar_zenith_degrees))
+    )
+    cos_incidence = np.cos(
+        np.radians(_validate_values(incidence_angle_degrees, 0, 180))
+    )
+    validate_numeric_value(max_solar_zenith_degrees, minimum=0, maximum=90)
+
+    beam_tilt_factor = _calculate_beam_tilt_factor(
+        cos_zenith, cos_incidence, max_solar_zenith_degrees
+    )
+    return (
+        beam_tilt_factor if beam_tilt_factor.ndim else float(beam_tilt_factor)
+    )
+
+
+def calculate_plane_of_array_irradiance(
+    beam_horizontal_W_m2: Union[int, float, Iterable[Union[int, float]]],
+    diffuse_horizontal_W_m2: Union[int, float, Iterable[Union[int, float]]],
+    solar_zenith_degrees: Union[int, float, Iterable[Union[int, float]]],
+    incidence_angle_degrees: Union[int, float, Iterable[Union[int, float]]],
+    slope_degrees: Union[int, float, Iterable[Union[int, float]]],
+    ground_reflectance: Union[int, float, Iterable[Union[int, float]]] = 0.2,
+    model: str = "isotropic",
+    G_on_W_m2: Optional[Union[int, float, Iterable[Union[int, float]]]] = None,
+    max_solar_zenith_degrees: Union[int, float] = 85,
+) -> Dict[str, Union[float, np.ndarray]]:
+    """
+    Method to transpose the beam and diffuse irradiance on a
+    horizontal surface to a tilted surface (the plane of array).
+
+    The models available are:
+
+    - "isotropic": the isotropic diffuse model of Liu and Jordan
+      (1963), from Duffie & Beckman (2006) Equation 2.15.1, in which
+      all of the sky diffuse radiation is taken to be isotropic.
+    - "hdkr": the anisotropic model of Hay and Davies (1980), Klucher
+      (1979), and Reindl et al. (1990), from Duffie & Beckman (2006)
+      Equation 2.16.7, in which part of the sky diffuse radiation
+      (per the anisotropy index, Equation 2.16.3) is taken to be
+      circumsolar, and the horizon is brightened (Equation 2.16.6).
+      It needs the extraterrestrial radiation, `G_on_W_m2`.
+
+    R_b is calculated once, as in `calculate_beam_tilt_factor()` (so it
+    is held near the horizon, per `max_solar_zenith_degrees`), and all
+    of the arguments are broadcast against each other.  With the sun
+    below the horizon, only the diffuse and reflected radiation are
+    transposed.
+
+    :param beam_horizontal_W_m2: A numeric value, or an array of them,
+        representing the beam radiation on a horizontal surface,
+        in W/m^2, which must be at least 0.
+    :param diffuse_horizontal_W_m2: A numeric value, or an array of
+        them, representing the diffuse radiation on a horizontal
+        surface, in W/m^2, which must be at least 0.
+    :param solar_zenith_degrees: A numeric value, or an array of them,
+        representing the solar zenith angle, which must be between
+        0 and 90 degrees.
+    :param incidence_angle_degrees: A numeric value, or an array of
+        them, representing the angle of incidence of beam radiation on
+        the surface (as returned by
+        `calculate_incidence_angle_degrees()`), which must be between
+        0 and 180 degrees.
+    :param slope_degrees: A numeric value, or an array of them,
+        representing the angle between the plane of the surface and
+        the horizontal, which must be between 0 and 180 degrees.
+    :param ground_reflectance: A numeric value, or an array of them,
+        representing the diffuse reflectance of the ground (0.2, by
+        default), which must be between 0 and 1.
+    :param model: The transposition model: "isotropic" (the default)
+        or "hdkr".
+    :param G_on_W_m2: A numeric value, or an array of them,
+        representing the extraterrestrial radiation on the plane normal
+        to the radiation, in W/m^2 (as returned by
+        `pysoleng.solar_geom.calculate_G_on_W_m2()`), which must be
+        positive.  It is needed only for the "hdkr" model.
+    :param max_solar_zenith_degrees: A numeric value representing the
+        solar zenith angle beyond which the denominator of R_b is held
+        (85 degrees, by default), which must be between
+        0 and 90 degrees.
+
+    :returns: A dictionary mapping "beam_W_m2", "sky_diffuse_W_m2",
+        "ground_reflected_W_m2", and "plane_of_array_W_m2" (their sum)
+        to float values (or numpy arrays) of the radiation on the
+        tilted surface.
+    """
+
+    # Validate arguments
+    beam_horizontal_W_m2 = _validate_values(beam_horizontal_W_m2, 0, None)
+    diffuse_horizontal_W_m2 = _validate_values(
+        diffuse_horizontal_W_m2, 0, None
+    )
+    cos_zenith = np.cos(
+        np.radians(_validate_solar_zenith_degrees(solar_zenith_degrees))
+    )
+    cos_incidence = np.cos(
+        np.radians(_validate_values(incidence_angle_degrees, 0, 180))
+    )
+    slope_radians = np.radians(_validate_values(slope_degrees, 0, 180))
+    ground_reflectance = _validate_values(ground_reflectance, 0, 1)
+    validate_numeric_value(max_solar_zenith_degrees, minimum=0, maximum=90)
+    if model not in ("isotropic", "hdkr"):
+        raise ValueError('`model` must be one of: ["isotropic", "hdkr"].')
+    if model == "hdkr":
+        if G_on_W_m2 is None:
+            raise ValueError('The "hdkr" model needs `G_on_W_m2`.')
+        G_on_W_m2 = _validate_values(G_on_W_m2, 0, None)
+        if (G_on_W_m2 <= 0).any():
+            raise ValueError("`G_on_W_m2` must be positive.")
+
+    beam_tilt_factor = _calculate_beam_tilt_factor(
+        cos_zenith, cos_incidence, max_solar_zenith_degrees
+    )
+    cos_slope = np.cos(slope_radians)
+    global_horizontal_W_m2 = beam_horizontal_W_m2 + diffuse_horizontal_W_m2
+
+    if model == "isotropic":
+        sky_diffuse_W_m2 = diffuse_horizontal_W_m2 * (1 + cos_slope) / 2
+    else:
+        """The anisotropy index is the beam radiation's share of the
+        extraterrestrial radiation on a horizontal surface (held near
+        the horizon, like R_b, and 0 below it)."""
+        G_o_W_m2 = G_on_W_m2 * np.maximum(
+            cos_zenith, np.cos(np.radians(max_solar_zenith_degrees))
+        )
+        anisotropy_index = np.where(
+            cos_zenith > 1e-12,
+            np.minimum(beam_horizontal_W_m2 / G_o_W_m2, 1.0),
+            0.0,
+        )
+        # The horizon brightening factor, f (0 with no radiation at all)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            horizon_factor = np.where(
+                global_horizontal_W_m2 > 0,
+                np.sqrt(beam_horizontal_W_m2 / global_horizontal_W_m2),
+                0.0,
+            )
+        sky_diffuse_W_m2 = diffuse_horizontal_W_m2 * (
+            anisotropy_index * beam_tilt_factor
+            + (1 - anisotropy_index)
+            * (1 + cos_slope)
+            / 2
+            * (1 + horizon_factor * np.sin(slope_radians / 2) ** 3)
+        )
+
+    beam_W_m2 = beam_horizontal_W_m2 * beam_tilt_factor
+    ground_reflected_W_m2 = (
+        global_horizontal_W_m2 * ground_reflectance * (1 - cos_slope) / 2
+    )
+    irradiance = {
+        "beam_W_m2": beam_W_m2,
+        "sky_diffuse_W_m2": sky_diffuse_W_m2,
+        "ground_reflected_W_m2": ground_reflected_W_m2,
+        "plane_of_array_W_m2": beam_W_m2
+        + sky_diffuse_W_m2
+        + ground_reflected_W_m2,
+    }
+    # Give every component the full broadcast shape
+    shape = np.shape(irradiance["plane_of_array_W_m2"])
+    return {
+        key: (
+            float(values)
+            if not shape
+            else (
+                values
+                if np.shape(values) == shape
+                else np.broadcast_to(values, shape).copy()
+            )
+        )
+        for key, values in irradiance.items()
+    }
@@ -0,0 +1,394 @@
+import struct
+import zipfile
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from pysoleng.site import Site, _site_value
+from pysoleng.solar_geom import (
+    calculate_air_mass,
+    calculate_daily_terms,
+    calculate_hour_angle_degrees,
+    calculate_solar_position,
+)
+from pysoleng.utils import (
+    ensure_numeric,
+    validate_datetime,
+    validate_numeric_value,
+)
+
+# Quantities stored in a `SolarPositionTable`, in row order
+TABLE_QUANTITIES = (
+    "solar_zenith_degrees",
+    "solar_azimuth_degrees",
+    "air_mass",
+)
+# Site and grid parameters stored alongside the table values
+_METADATA_FIELDS = (
+    "latitude_degrees",
+    "longitude_degrees",
+    "utc_offset_hours",
+    "site_altitude_m",
+    "start_epoch_seconds",
+    "resolution_seconds",
+)
+
+
+def _calculate_grid_positions(
+    local_ts: pd.Series,
+    latitude_degrees: Union[int, float],
+    longitude_degrees: Union[int, float],
+    site_altitude_m: Union[int, float],
+) -> np.ndarray:
+    """
+    Method to calculate the table quantities at each timestamp
+    in `local_ts` with the `pysoleng.solar_geom` methods.
+
+    :returns: A 2-D numpy array with one row per quantity in
+        `TABLE_QUANTITIES` and one column per timestamp.
+    """
+
+    declination_degrees = calculate_daily_terms(
+        local_ts.dt.dayofyear.values
+    )["declination_degrees"]
+    hour_angle_degrees = calculate_hour_angle_degrees(
+        local_ts, longitude_degrees
+    )
+    position = calculate_solar_position(
+        latitude_degrees=latitude_degrees,
+        declination_degrees=declination_degrees,
+        hour_angle_degrees=hour_angle_degrees,
+    )
+    air_mass = calculate_air_mass(
+        position["solar_zenith_degrees"], site_altitude_m
+    )
+    return np.vstack(
+        [
+            np.asarray(position["solar_zenith_degrees"], dtype=float),
+            np.asarray(position["solar_azimuth_degrees"], dtype=float),
+            np.asarray(air_mass, dtype=float),
+        ]
+    )
+
+
+def _interpolate(
+    values: np.ndarray, position: np.ndarray
+) -> Dict[str, np.ndarray]:
+    """
+    Method to linearly interpolate each row of `values` at the
+    fractional column positions in `position`.
+    """
+
+    lower = np.minimum(np.floor(position).astype(np.int64), len(values[0]) - 2)
+    weight = position - lower
+    lower_values = np.asarray(values[:, lower], dtype=float)
+    delta = np.asarray(values[:, lower + 1], dtype=float) - lower_values
+
+    # The azimuth wraps from +180 to -180 degrees at solar midnight,
+    # so interpolate across the shorter arc.
+    azimuth_row = TABLE_QUANTITIES.index("solar_azimuth_degrees")
+    delta[azimuth_row] = (delta[azimuth_row] + 180.0) % 360.0 - 180.0
+    interpolated = lower_values + weight * delta
+    interpolated[azimuth_row] = (
+        interpolated[azimuth_row] + 180.0
+    ) % 360.0 - 180.0
+
+    return {
+        quantity: interpolated[i]
+        for i, quantity in enumerate(TABLE_QUANTITIES)
+    }
+
+
+def _memmap_npz_member(path: str, member: str, mmap_mode: str) -> np.memmap:
+    """
+    Method to memory-map an array stored (uncompressed) in
+    a `.npz` archive, without reading it into memory.
+    """
+
+    with zipfile.ZipFile(path) as archive:
+        info = archive.getinfo(member)
+    if info.compress_type != zipfile.ZIP_STORED:
+        raise ValueError(
+            f"`{member}` in {path} is compressed, so it cannot be "
+            "memory-mapped."
+        )
+
+    with open(path, "rb") as f:
+        # Skip the zip local file header to reach the `.npy` data
+        f.seek(info.header_offset)
+        local_header = f.read(30)
+        name_length, extra_length = struct.unpack("<HH", local_header[26:30])
+        f.seek(info.header_offset + 30 + name_length + extra_length)
+        version = np.lib.format.read_magic(f)
+        if version == (1, 0):
+            header = np.lib.format.read_array_header_1_0(f)
+        else:
+            header = np.lib.format.read_array_header_2_0(f)
+        shape, fortran_order, dtype = header
+        offset = f.tell()
+
+    return np.memmap(
+        path,
+        dtype=dtype,
+        mode=mmap_mode,
+        shape=shape,
+        order="F" if fortran_order else "C",
+        offset=offset,
+    )
+
+
+class SolarPositionTable:
+    """
+    Precomputed table of the sun's position at a single site,
+    on a regular time grid spanning one year, that answers
+    batch queries at arbitrary times by linear interpolation.
+
+    The table stores the solar zenith angle, the solar azimuth
+    angle, and the air mass (see `TABLE_QUANTITIES`) as `float32`
+    values.  The maximum interpolation error of each quantity,
+    measured against the `pysoleng.solar_geom` methods at the
+    midpoint of every daylight grid interval when the table is
+    built, is available from `max_error`.  Linear interpolation
+    error is largest mid-interval, so `max_error` is a close
+    estimate of the worst case while the sun is above the horizon.
+    It grows with the square of the resolution (e.g., roughly
+    0.01 degrees of zenith and azimuth at 5-minute resolution for
+    mid-latitude sites), with a floor of about 0.1 degrees where the
+    sun is up at local midnight (when the daily declination steps).
+    The azimuth error can be large where the sun passes (nearly)
+    overhead.  At night the zenith is limited to 90 degrees and the
+    azimuth flips sign at solar midnight, so values interpolated
+    at night are not meaningful.
+
+    Tables are usually created with `SolarPositionTable.build()`
+    or `SolarPositionTable.load()`.
+
+    :param values: A 2-D array with one row per quantity in
+        `TABLE_QUANTITIES` and one column per grid timestamp.
+    :param metadata: A dictionary containing the site and grid
+        parameters (latitude_degrees, longitude_degrees,
+        utc_offset_hours, site_altitude_m, start_epoch_seconds,
+        and resolution_seconds).
+    :param max_error: A dictionary mapping each quantity in
+        `TABLE_QUANTITIES` to its maximum interpolation error.
+    """
+
+    def __init__(
+        self,
+        values: np.ndarray,
+        metadata: Dict[str, float],
+        max_error: Dict[str, float],
+    ):
+        if values.ndim != 2 or values.shape[0] != len(TABLE_QUANTITIES):
+            raise ValueError(
+                f"`values` must have shape ({len(TABLE_QUANTITIES)}, n)."
+            )
+        if values.shape[1] < 2:
+            raise ValueError("`values` must contain at least two columns.")
+        self.values = values
+        self.metadata = {
+            field: float(metadata[field]) for field in _METADATA_FIELDS
+        }
+        self.max_error = {
+            quantity: float(max_error[quantity])
+            for quantity in TABLE_QUANTITIES
+        }
+
+    @classmethod
+    def build(
+        cls,
+        latitude_degrees: Union[int, float, Site],
+        longitude_degrees: Union[int, float, Site],
+        utc_offset_hours: Union[int, float, Site],
+        year: int,
+        resolution_minutes: Union[int, float] = 5,
+        site_altitude_m: Union[int, float, Site] = 0,
+    ) -> "SolarPositionTable":
+        """
+        Method to build a table for one site and one (local standard)
+        calendar year, using the `pysoleng.solar_geom` methods.
+
+        :param latitude_degrees: A numeric value representing a
+            location's position north (positive) or south (negative)
+            of the equator, which must be between -90 and 90 degrees.
+            A `pysoleng.site.Site` may be given instead.
+        :param longitude_degrees: A numeric value representing a
+            location's angular distance west of the meridian at
+            Greenwich, England.
+            `longitude_degrees` should be between 0 and 360 degrees.
+            A `pysoleng.site.Site` may be given instead.
+        :param utc_offset_hours: A numeric value representing the site's
+            (standard time) offset from UTC, in hours,
+            which must be between -12 and 14 hours.
+            A `pysoleng.site.Site` with a fixed offset from UTC
+            may be given instead.
+        :param year: An integer representing the calendar year.
+        :param resolution_minutes: A numeric value representing
+            the grid spacing, in minutes (5, by default),
+            which must be between 1 second and 1 day.
+        :param site_altitude_m: A numeric value representing the
+            altitude above sea level (0 m, the default),
+            which must be at least -413 m.
+            A `pysoleng.site.Site` may be given instead.
+
+        :returns: A `SolarPositionTable`.
+        """
+
+        # Validate arguments
+        latitude_degrees = _site_value(latitude_degrees, "latitude_degrees")
+        longitude_degrees = _site_value(longitude_degrees, "longitude_degrees")
+        utc_offset_hours = _site_value(utc_offset_hours, "utc_offset_hours")
+        site_altitude_m = _site_value(site_altitude_m, "site_altitude_m")
+        validate_numeric_value(latitude_degrees, minimum=-90, maximum=90)
+        validate_numeric_value(longitude_degrees, minimum=0, maximum=360)
+        validate_numeric_value(utc_offset_hours, minimum=-12, maximum=14)
+        validate_numeric_value(site_altitude_m, minimum=-413, maximum=None)
+        ensure_numeric(
+            year, valid_types=[int], nan_acceptable=False, inf_acceptable=False
+        )
+        validate_numeric_value(
+            resolution_minutes, minimum=1 / 60, maximum=1_440, tolerance=0.0
+        )
+
+        tz = timezone(timedelta(hours=utc_offset_hours))
+        start = datetime(year, 1, 1, tzinfo=tz)
+        end = datetime(year + 1, 1, 1, tzinfo=tz)
+        resolution_seconds = resolution_minutes * 60.0
+        periods = int(
+            np.ceil((end - start).total_seconds() / resolution_seconds)
+        )
+
+        # Grid timestamps, and the midpoint of every grid interval
+        offsets = pd.to_timedelta(
+            np.arange(periods + 1) * resolution_seconds, unit="s"
+        )
+        grid = pd.Series(pd.Timestamp(start) + offsets)
+        midpoints = (
+            pd.Series(
+                grid.iloc[:-1].values
+                + pd.Timedelta(seconds=resolution_seconds / 2)
+            )
+            .dt.tz_localize("UTC")
+            .dt.tz_convert(tz)
+        )
+
+        site = (latitude_degrees, longitude_degrees, site_altitude_m)
+        values = _calculate_grid_positions(grid, *site).astype(np.float32)
+        reference = _calculate_grid_positions(midpoints, *site)
+
+        metadata = {
+            "latitude_degrees": latitude_degrees,
+            "longitude_degrees": longitude_degrees,
+            "utc_offset_hours": utc_offset_hours,
+            "site_altitude_m": site_altitude_m,
+            "start_epoch_seconds": start.timestamp(),
+            "resolution_seconds": resolution_seconds,
+        }
+        interpolated = _interpolate(values, np.arange(periods) + 0.5)
+        # Only intervals with the sun above the horizon at both ends
+        zenith = values[TABLE_QUANTITIES.index("solar_zenith_degrees")]
+        daylight = (zenith[:-1] < 90.0) & (zenith[1:] < 90.0)
+        max_error = {}
+        for i, quantity in enumerate(TABLE_QUANTITIES):
+            error = interpolated[quantity] - reference[i]
+            if quantity == "solar_azimuth_degrees":
+                error = (error + 180.0) % 360.0 - 180.0
+            max_error[quantity] = np.max(np.abs(error[daylight]), initial=0.0)
+
+        return cls(values, metadata, max_error)
+
+    def query(
+        self,
+        local_standard_time: Union[
+            datetime, str, Iterable[Union[datetime, str]], np.ndarray
+        ],
+    ) -> Dict[str, np.ndarray]:
+        """
+        Method to look up the sun's position at arbitrary times
+        within the table's year.
+
+        :param local_standard_time: A numpy array of numeric values
+            representing seconds since the Unix epoch (UTC) (the
+            fastest option), or a timezone-aware `datetime` object,
+            parse-able string, or iterable of either.
+
+        :returns: A dictionary mapping each quantity in
+            `TABLE_QUANTITIES` to a numpy array of float values.
+        """
+
+        if isinstance(local_standard_time, np.ndarray) and (
+            local_standard_time.dtype.kind in "iuf"
+        ):
+            epoch_seconds = local_standard_time
+        else:
+            local_ts = validate_datetime(local_standard_time)
+            if isinstance(local_ts, (pd.Series, pd.DatetimeIndex)):
+                local_index = pd.DatetimeIndex(local_ts)
+                tz = local_index.tz
+            else:
+                local_index = pd.DatetimeIndex([local_ts])
+                tz = local_ts.tzinfo
+            # Ensure local_ts has time zone information
+            if tz is None:
+                raise ValueError(
+                    """`local_standard_time` must provide a time zone offset,
+            such as `1/1/2019 12:00 PM -06:00`."""
+                )
+            epoch_seconds = local_index.asi8 / 1e9
+
+        position = (
+            np.asarray(epoch_seconds, dtype=float)
+            - self.metadata["start_epoch_seconds"]
+        ) / self.metadata["resolution_seconds"]
+        if np.any(position < 0) or np.any(position > self.values.shape[1] - 1):
+            raise ValueError(
+                "`local_standard_time` must be within the table's year."
+            )
+
+        return _interpolate(self.values, position)
+
+    def save(self, path: str) -> None:
+        """
+        Method to save the table to an (uncompressed) `.npz` file,
+        which can be memory-mapped by `SolarPositionTable.load()`.
+
+        :param path: The path of the file to write.
+        """
+
+        np.savez(
+            path,
+            values=np.asarray(self.values),
+            metadata=np.array(
+                [self.metadata[field] for field in _METADATA_FIELDS]
+            ),
+            max_error=np.array(
+                [self.max_error[quantity] for quantity in TABLE_QUANTITIES]
+            ),
+        )
+
+    @classmethod
+    def load(
+        cls, path: str, mmap_mode: Optional[str] = None
+    ) -> "SolarPositionTable":
+        """
+        Method to load a table saved by `SolarPositionTable.save()`.
+
+        :param path: The path of the `.npz` file to read.
+        :param mmap_mode: `None` (the default) to read the table values
+            into memory, or a `numpy.memmap` mode (e.g., "r") to
+            memory-map them from the file instead.
+
+        :returns: A `SolarPositionTable`.
+        """
+
+        with np.load(path) as archive:
+            metadata = dict(zip(_METADATA_FIELDS, archive["metadata"]))
+            max_error = dict(zip(TABLE_QUANTITIES, archive["max_error"]))
+            if mmap_mode is None:
+                values = archive["values"]
+        if mmap_mode is not None:
+            values = _memmap_npz_member(path, "values.npy", mmap_mode)
+
+        return cls(values, metadata, max_error)
@@ -0,0 +1,238 @@
+import os
+from datetime import datetime
+from typing import Dict, Iterable, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from pysoleng.regular import _calculate_wall_clock_hour_angle_degrees
+from pysoleng.solar_geom import (
+    _calculate_local_day_numbers,
+    _calculate_position,
+    _calculate_utc_offset_hours,
+    calculate_daily_terms,
+    calculate_G_on_W_m2,
+)
+from pysoleng.utils import (
+    _MixedOffsetTimes,
+    _validate_local_times,
+    ensure_numeric,
+    validate_numeric_value,
+)
+
+# Quantities calculated for every cell of the grid, at every timestamp
+_GRID_KEYS = (
+    "solar_zenith_degrees",
+    "solar_azimuth_degrees",
+    "extraterrestrial_horizontal_W_m2",
+)
+
+
+def _resolve_axis(
+    axis: Iterable[Union[int, float]],
+    name: str,
+    minimum: float,
+    maximum: float,
+) -> np.ndarray:
+    """
+    Method to validate a 1-D axis of the grid (latitudes
+    or longitudes, in degrees).
+
+    :returns: A 1-D numpy array of floats.
+    """
+
+    axis = np.asarray(axis, dtype=float)
+    if axis.ndim != 1:
+        raise ValueError(f"`{name}` must be a 1-D array.")
+    validate_numeric_value(axis, minimum=minimum, maximum=maximum)
+    return axis
+
+
+def _allocate_outputs(
+    shape: tuple,
+    dtype: Union[str, np.dtype],
+    out: Optional[Dict[str, np.ndarray]],
+    memmap_dir: Optional[str],
+) -> Dict[str, np.ndarray]:
+    """
+    Method to take the grid output arrays given in `out`, checking
+    their shapes, and to allocate the rest (in memory, or as `.npy`
+    files memory-mapped in `memmap_dir`).
+
+    :returns: A dictionary mapping each of `_GRID_KEYS`
+        to an array of `shape`.
+    """
+
+    out = {} if out is None else dict(out)
+    unknown = set(out) - set(_GRID_KEYS)
+    if unknown:
+        raise ValueError(
+            f"`out` has unknown keys {sorted(unknown)}; "
+            f"valid keys are: {list(_GRID_KEYS)}."
+        )
+    for key, values in out.items():
+        if np.shape(values) != shape:
+            raise ValueError(
+                f"`out['{key}']` must have shape {shape}, "
+                f"not {np.shape(values)}."
+            )
+
+    if memmap_dir is not None:
+        os.makedirs(memmap_dir, exist_ok=True)
+    for key in _GRID_KEYS:
+        if key in out:
+            continue
+        if memmap_dir is None:
+            out[key] = np.empty(shape, dtype=dtype)
+        else:
+            # Readable later with `np.load(path, mmap_mode="r")`
+            out[key] = np.lib.format.open_memmap(
+                os.path.join(memmap_dir, f"{key}.npy"),
+                mode="w+",
+                dtype=dtype,
+                shape=shape,
+            )
+    return out
+
+
+def calculate_raster_positions(
+    local_standard_time: Union[
+        datetime, str, Iterable[Union[datetime, str]], np.ndarray
+    ],
+    latitude_degrees: Iterable[Union[int, float]],
+    longitude_degrees: Iterable[Union[int, float]],
+    G_sc: Union[int, float] = 1_367,
+    tile_rows: int = 256,
+    dtype: Union[str, np.dtype] = "float64",
+    out: Optional[Dict[str, np.ndarray]] = None,
+    memmap_dir: Optional[str] = None,
+) -> Dict[str, np.ndarray]:
+    """
+    Method to calculate the sun's position, and the extraterrestrial
+    radiation on a horizontal plane, over a grid of locations (the
+    outer product of a latitude axis and a longitude axis) at one
+    or more timestamps, e.g., to render maps of continental grids.
+
+    The terms that depend only on the timestamp (the day number,
+    equation of time, declination angle, and extraterrestrial
+    radiation, G_on) are calculated once per timestamp, and the hour
+    angle once per timestamp and longitude; the grid itself is
+    calculated `tile_rows` latitudes at a time, so the temporary
+    arrays stay small however large the grid is.  The results match
+    `pysoleng.solar_geom.calculate_solar_position()` for each cell.
+
+    The extraterrestrial radiation on a horizontal plane is
+    G_on times the cosine of the solar zenith angle (Duffie &
+    Beckman (2006) Equation 1.10.1), which is 0 while the sun is
+    below the horizon.
+
+    :param local_standard_time: A `datetime` object (or a string that
+        can be parsed into one), containing a timezone offset, or an
+        iterable of them.  The offsets may differ from one timestamp
+        to another.
+    :param latitude_degrees: A 1-D array of latitudes (the rows of
+        the grid), each between -90 and 90 degrees.
+    :param longitude_degrees: A 1-D array of longitudes (the columns of
+        the grid), in degrees west of the meridian at Greenwich,
+        England, each between 0 and 360 degrees.
+    :param G_sc: The solar constant, in W/m^2 (1,367, by default).
+    :param tile_rows: The number of latitudes calculated at a time
+        (256, by default), which must be a positive integer.
+    :param dtype: The dtype of the grid arrays allocated by this
+        method ("float64", by default; e.g., "float32" halves the
+        memory of large maps).
+    :param out: An optional dictionary mapping any of
+        "solar_zenith_degrees", "solar_azimuth_degrees", and
+        "extraterrestrial_horizontal_W_m2" to a caller-provided array
+        (e.g., a `numpy.memmap`) of shape (timestamps, latitudes,
+        longitudes), which is filled in place.
+    :param memmap_dir: An optional directory in which the grid arrays
+        not given in `out` are created as memory-mapped `.npy` files
+        (named after their keys), rather than in memory.
+
+    :returns: A dictionary mapping "day_number", "declination_degrees",
+        and "G_on_W_m2" to numpy arrays with one value per timestamp,
+        "hour_angle_degrees" to an array of shape (timestamps,
+        longitudes), and "solar_zenith_degrees",
+        "solar_azimuth_degrees", and "extraterrestrial_horizontal_W_m2"
+        to arrays of shape (timestamps, latitudes, longitudes).
+    """
+
+    # Validate arguments
+    latitude_degrees = _resolve_axis(
+        latitude_degrees, "latitude_degrees", -90, 90
+    )
+    longitude_degrees = _resolve_axis(
+        longitude_degrees, "longitude_degrees", 0, 360
+    )
+    ensure_numeric(
+        tile_rows,
+        valid_types=[int],
+        nan_acceptable=False,
+        inf_acceptable=False,
+    )
+    validate_numeric_value(tile_rows, minimum=1, maximum=None, tolerance=0.0)
+    local_ts = _validate_local_times(
+        local_standard_time=local_standard_time, tz=None, epoch_unit="s"
+    )
+    if isinstance(local_ts, pd.Timestamp):
+        local_ts = pd.DatetimeIndex([local_ts])
+
+    # Calculate the terms that depend only on the timestamp, once each
+    if isinstance(local_ts, _MixedOffsetTimes):
+        wall_clock_ns = local_ts.wall_clock.asi8
+    else:
+        wall_clock_ns = pd.DatetimeIndex(local_ts).tz_localize(None).asi8
+    utc_offset_hours = _calculate_utc_offset_hours(local_ts)
+    day_number = _calculate_local_day_numbers(local_ts)
+    daily_terms = calculate_daily_terms(day_number)
+    G_on_W_m2 = np.asarray(
+        calculate_G_on_W_m2(daily_terms["B_degrees"], G_sc), dtype=float
+    )
+
+    # Timestamps down the rows, and longitudes across the columns
+    hour_angle_degrees = _calculate_wall_clock_hour_angle_degrees(
+        wall_clock_ns[:, None],
+        utc_offset_hours[:, None],
+        longitude_degrees[None, :],
+        daily_terms["E_min"][:, None],
+    )
+
+    grids = _allocate_outputs(
+        (len(wall_clock_ns), len(latitude_degrees), len(longitude_degrees)),
+        dtype,
+        out,
+        memmap_dir,
+    )
+    # Latitudes down the rows, hour angles across the columns
+    latitude_radians = np.radians(latitude_degrees)[:, None]
+    sin_latitude = np.sin(latitude_radians)
+    cos_latitude = np.cos(latitude_radians)
+    declination_radians = np.radians(daily_terms["declination_degrees"])
+    for time_index, declination in enumerate(declination_radians):
+        hour_angle_radians = np.radians(hour_angle_degrees[time_index, None])
+        for start in range(0, len(latitude_degrees), tile_rows):
+            tile = slice(start, start + tile_rows)
+            solar_zenith_radians, solar_azimuth_radians = _calculate_position(
+                sin_latitude=sin_latitude[tile],
+                cos_latitude=cos_latitude[tile],
+                declination_radians=declination,
+                hour_angle_radians=hour_angle_radians,
+            )
+            grids["solar_zenith_degrees"][time_index, tile] = np.degrees(
+                solar_zenith_radians
+            )
+            grids["solar_azimuth_degrees"][time_index, tile] = np.degrees(
+                solar_azimuth_radians
+            )
+            grids["extraterrestrial_horizontal_W_m2"][time_index, tile] = (
+                G_on_W_m2[time_index] * np.cos(solar_zenith_radians)
+            )
+
+    return {
+        "day_number": np.asarray(day_number).astype(np.int16),
+        "declination_degrees": daily_terms["declination_degrees"],
+        "G_on_W_m2": G_on_W_m2,
+        "hour_angle_degrees": hour_angle_degrees,
+        **grids,
+    }
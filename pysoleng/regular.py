@@ -0,0 +1,246 @@
+from datetime import datetime
+from typing import Dict, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from pysoleng.site import Site
+from pysoleng.solar_geom import (
+    _calculate_air_mass,
+    _calculate_daylight_positions,
+    _calculate_position,
+    _calculate_sunset_hour_angle_radians,
+    _resolve_air_mass_altitude_factor,
+    _resolve_latitude_trig,
+    _resolve_longitude,
+    calculate_B_degrees,
+    calculate_declination_degrees,
+    calculate_E_min,
+)
+from pysoleng.utils import (
+    ensure_numeric,
+    validate_datetime,
+    validate_numeric_value,
+)
+
+_NANOSECONDS_PER_HOUR = 3_600_000_000_000
+_NANOSECONDS_PER_DAY = 86_400_000_000_000
+
+
+def _resolve_start(start: Union[datetime, str]) -> Tuple[int, float]:
+    """
+    Method to validate the start of a regular time range, which must
+    carry a fixed offset from UTC (as local standard time does).
+
+    :returns: A tuple of the start's wall clock time, in integer
+        nanoseconds since the Unix epoch, and its offset from UTC
+        (in whole hours, rounded down).
+    """
+
+    start_ts = validate_datetime(start)
+    if not isinstance(start_ts, pd.Timestamp):
+        raise TypeError("`start` must be a single timestamp.")
+    if (start_ts.tzinfo is None) or (start_ts.tzinfo.utcoffset(None) is None):
+        raise ValueError("""`start` must provide a fixed time zone offset,
+            such as `1/1/2019 12:00 AM -06:00`.""")
+    return (
+        start_ts.tz_localize(None).value,
+        start_ts.utcoffset().total_seconds() // 3_600,
+    )
+
+
+def _resolve_step(freq: Union[str, pd.Timedelta]) -> int:
+    """
+    Method to validate the frequency of a regular time range,
+    which must be a fixed, positive duration.
+
+    :returns: The step between timestamps, in integer nanoseconds.
+    """
+
+    try:
+        step_ns = pd.tseries.frequencies.to_offset(freq).nanos
+    except ValueError:
+        raise ValueError(
+            f"`freq` ({freq}) must be a fixed duration, such as '1min'."
+        )
+    if step_ns <= 0:
+        raise ValueError("`freq` must be a positive duration.")
+    return step_ns
+
+
+def _calculate_wall_clock_hour_angle_degrees(
+    wall_clock_ns: np.ndarray,
+    utc_offset_hours: Union[float, np.ndarray],
+    longitude_degrees: Union[int, float, np.ndarray],
+    E_min: np.ndarray,
+) -> np.ndarray:
+    """
+    Method to calculate the hour angle (in degrees) from wall clock
+    times, in integer nanoseconds since the Unix epoch, with their
+    offsets from UTC (in whole hours), longitudes, and equation of
+    time values, all broadcast together.
+
+    As in `pysoleng.solar_geom.convert_to_solar_time()`, the wall clock
+    time (in hours) is shifted by the longitude correction and the
+    equation of time, and the hour angle is taken from the time of day.
+    """
+
+    standard_meridian = 15 * np.abs(utc_offset_hours)
+    shift_hours = (4.0 * (standard_meridian - longitude_degrees) + E_min) / 60
+    solar_hours = (
+        (wall_clock_ns % _NANOSECONDS_PER_DAY) / _NANOSECONDS_PER_HOUR
+        + shift_hours
+    ) % 24
+    return (solar_hours - 12.0) * 15.0
+
+
+def _calculate_regular_terms(
+    start_ns: int,
+    step_ns: int,
+    periods: int,
+    utc_offset_hours: float,
+    longitude_degrees: Union[int, float],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Method to calculate the terms of a regular time range that need
+    no trigonometry per timestamp: the daily terms, once for each
+    local date, and the hour angle of every timestamp.
+
+    :returns: A tuple of the index of each timestamp's local date,
+        and the day number and declination angle of each local date
+        (in order from the first), and the hour angle
+        of each timestamp (in degrees).
+    """
+
+    # Wall clock times, and the index of each one's local date
+    wall_clock_ns = start_ns + step_ns * np.arange(periods, dtype=np.int64)
+    day_index = wall_clock_ns // _NANOSECONDS_PER_DAY
+    first_day = day_index[0] if periods else 0
+    day_index -= first_day
+
+    # Calculate the daily terms once for each local date in the range
+    days = np.arange(
+        first_day, first_day + (day_index[-1] + 1 if periods else 0)
+    ).astype("datetime64[D]")
+    day_numbers = (days - days.astype("datetime64[Y]")).astype(np.int64) + 1
+    B_degrees = calculate_B_degrees(day_numbers)
+    E_min = calculate_E_min(B_degrees)
+    declination_degrees = calculate_declination_degrees(B_degrees)
+
+    hour_angle_degrees = _calculate_wall_clock_hour_angle_degrees(
+        wall_clock_ns, utc_offset_hours, longitude_degrees, E_min[day_index]
+    )
+
+    return day_index, day_numbers, declination_degrees, hour_angle_degrees
+
+
+def calculate_regular_positions(
+    start: Union[datetime, str],
+    periods: int,
+    freq: Union[str, pd.Timedelta],
+    latitude_degrees: Union[int, float, Site],
+    longitude_degrees: Union[int, float, Site],
+    site_altitude_m: Union[int, float, Site] = 0,
+    daylight_only: bool = False,
+) -> Dict[str, np.ndarray]:
+    """
+    Method to calculate the solar position at a single site over a
+    regular time range (`periods` timestamps, `freq` apart, from
+    `start`), as for `pd.date_range(start, periods=periods, freq=freq)`.
+
+    No timestamps are created: the wall clock times are generated as
+    integers with `np.arange`, the daily terms (day number, equation of
+    time, and declination) are calculated once per local date and
+    broadcast, and the hour angle follows arithmetically.  The results
+    match those of `pysoleng.streaming.calculate_batch_positions()`
+    for the equivalent timestamps.
+
+    :param start: A `datetime` object, or a string that can be parsed
+        into one, containing a fixed time zone offset (e.g.,
+        `1/1/2019 12:00 AM -06:00`).
+    :param periods: The number of timestamps, which must be
+        a non-negative integer.
+    :param freq: A fixed Pandas frequency (e.g., "1min").
+    :param latitude_degrees: A numeric value representing a
+        location's position north (positive) or south (negative)
+        of the equator, which must be between -90 and 90 degrees.
+        A `pysoleng.site.Site` may be given instead.
+    :param longitude_degrees: A numeric value representing a
+        location's angular distance west of the meridian at
+        Greenwich, England.
+        `longitude_degrees` should be between 0 and 360 degrees.
+        A `pysoleng.site.Site` may be given instead.
+    :param site_altitude_m: A numeric value representing the
+        altitude above sea level (0 m, the default),
+        which must be at least -413 m.
+        A `pysoleng.site.Site` may be given instead.
+    :param daylight_only: Whether to calculate the solar position
+        only for the timestamps in daylight, found from each day's
+        sunset hour angle, filling the night rows with a zenith angle
+        of 90 degrees, an altitude angle of 0 degrees, and an azimuth
+        angle and air mass of NaN (default `False`).
+
+    :returns: A dictionary mapping "day_number" and each key returned
+        by `pysoleng.streaming.calculate_batch_positions()` to a numpy
+        array with one value per timestamp.
+    """
+
+    # Validate arguments
+    sin_latitude, cos_latitude = _resolve_latitude_trig(latitude_degrees)
+    longitude_degrees, _ = _resolve_longitude(longitude_degrees, None)
+    altitude_factor = _resolve_air_mass_altitude_factor(site_altitude_m)
+    ensure_numeric(
+        periods,
+        valid_types=[int],
+        nan_acceptable=False,
+        inf_acceptable=False,
+    )
+    validate_numeric_value(periods, minimum=0, maximum=None, tolerance=0.0)
+    start_ns, utc_offset_hours = _resolve_start(start)
+    step_ns = _resolve_step(freq)
+
+    day_index, day_numbers, declination_degrees, hour_angle_degrees = (
+        _calculate_regular_terms(
+            start_ns, step_ns, periods, utc_offset_hours, longitude_degrees
+        )
+    )
+
+    if daylight_only:
+        sunset_hour_angle_degrees = np.degrees(
+            _calculate_sunset_hour_angle_radians(
+                sin_latitude, cos_latitude, np.radians(declination_degrees)
+            )
+        )
+        declination_degrees = declination_degrees[day_index]
+        return {
+            "day_number": day_numbers[day_index].astype(np.int16),
+            "declination_degrees": declination_degrees,
+            "hour_angle_degrees": hour_angle_degrees,
+            **_calculate_daylight_positions(
+                sin_latitude=sin_latitude,
+                cos_latitude=cos_latitude,
+                declination_degrees=declination_degrees,
+                hour_angle_degrees=hour_angle_degrees,
+                sunset_hour_angle_degrees=sunset_hour_angle_degrees[day_index],
+                altitude_factor=altitude_factor,
+            ),
+        }
+
+    declination_degrees = declination_degrees[day_index]
+    solar_zenith_radians, solar_azimuth_radians = _calculate_position(
+        sin_latitude=sin_latitude,
+        cos_latitude=cos_latitude,
+        declination_radians=np.radians(declination_degrees),
+        hour_angle_radians=np.radians(hour_angle_degrees),
+    )
+    solar_zenith_degrees = np.degrees(solar_zenith_radians)
+
+    return {
+        "day_number": day_numbers[day_index].astype(np.int16),
+        "declination_degrees": declination_degrees,
+        "hour_angle_degrees": hour_angle_degrees,
+        "solar_zenith_degrees": solar_zenith_degrees,
+        "solar_altitude_degrees": 90.0 - solar_zenith_degrees,
+        "solar_azimuth_degrees": np.degrees(solar_azimuth_radians),
+        "air_mass": _calculate_air_mass(solar_zenith_degrees, altitude_factor),
+    }
@@ -0,0 +1,111 @@
+from datetime import timedelta, timezone, tzinfo
+from typing import Any, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from pysoleng.utils import validate_numeric_value
+
+
+class Site:
+    """
+    A location, validated once, with the site-dependent constants
+    used by the `pysoleng.solar_geom` methods precomputed.
+
+    A `Site` can be passed to the `pysoleng.solar_geom` methods
+    in place of `latitude_degrees`, `longitude_degrees`, or
+    `site_altitude_m`.
+
+    :param latitude_degrees: A numeric value representing a location's
+        position north (positive) or south (negative) of the equator,
+        which must be between -90 and 90 degrees.
+    :param longitude_degrees: A numeric value representing a location's
+        angular distance west of the meridian at Greenwich, England.
+        `longitude_degrees` should be between 0 and 360 degrees.
+    :param site_altitude_m: A numeric value representing the
+        altitude above sea level (0 m, the default),
+        which must be at least -413 m.
+    :param tz: The site's time zone: an IANA time zone name,
+        a tzinfo object, a numeric (standard time) offset from UTC
+        in hours (between -12 and 14), or `None` (the default).
+    """
+
+    __slots__ = (
+        "latitude_degrees",
+        "longitude_degrees",
+        "site_altitude_m",
+        "tz",
+        "utc_offset_hours",
+        "sin_latitude",
+        "cos_latitude",
+        "standard_meridian_degrees",
+        "longitude_correction_mins",
+        "air_mass_altitude_factor",
+    )
+
+    def __init__(
+        self,
+        latitude_degrees: Union[int, float],
+        longitude_degrees: Union[int, float],
+        site_altitude_m: Union[int, float] = 0,
+        tz: Optional[Union[str, tzinfo, int, float]] = None,
+    ):
+        # Validate arguments
+        validate_numeric_value(latitude_degrees, minimum=-90, maximum=90)
+        validate_numeric_value(longitude_degrees, minimum=0, maximum=360)
+        validate_numeric_value(site_altitude_m, minimum=-413, maximum=None)
+
+        if isinstance(tz, (int, float)):
+            validate_numeric_value(tz, minimum=-12, maximum=14)
+            tz = timezone(timedelta(hours=tz))
+        elif isinstance(tz, str):
+            tz = pd.DatetimeTZDtype(tz=tz).tz
+
+        self.latitude_degrees = latitude_degrees
+        self.longitude_degrees = longitude_degrees
+        self.site_altitude_m = site_altitude_m
+        self.tz = tz
+
+        self.sin_latitude = np.sin(np.radians(latitude_degrees))
+        self.cos_latitude = np.cos(np.radians(latitude_degrees))
+        self.air_mass_altitude_factor = np.exp(-0.0001184 * site_altitude_m)
+
+        """The standard meridian (and so the longitude correction) is
+        only fixed for a fixed offset from UTC; otherwise it is derived
+        from each timestamp's offset."""
+        offset = None if tz is None else tz.utcoffset(None)
+        if offset is None:
+            self.utc_offset_hours = None
+            self.standard_meridian_degrees = None
+            self.longitude_correction_mins = None
+        else:
+            self.utc_offset_hours = offset.total_seconds() / 3_600
+            self.standard_meridian_degrees = 15 * abs(
+                offset.total_seconds() // 3_600
+            )
+            self.longitude_correction_mins = 4.0 * (
+                self.standard_meridian_degrees - longitude_degrees
+            )
+
+    def __repr__(self) -> str:
+        return (
+            f"Site(latitude_degrees={self.latitude_degrees}, "
+            f"longitude_degrees={self.longitude_degrees}, "
+            f"site_altitude_m={self.site_altitude_m}, tz={self.tz!r})"
+        )
+
+
+def _site_value(value: Any, name: str) -> Any:
+    """
+    Method to take the (already validated) attribute `name` of a `Site`
+    given in place of a value, or to return `value` itself.
+    """
+
+    if not isinstance(value, Site):
+        return value
+    site_value = getattr(value, name)
+    if site_value is None:
+        raise ValueError(
+            f"A `Site` given as `{name}` must have a fixed offset from UTC."
+        )
+    return site_value
@@ -1,44 +1,84 @@
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, tzinfo
 from math import copysign
-from typing import Iterable, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
 
+from pysoleng.site import Site
 from pysoleng.utils import (
+    Validity,
+    _is_epoch_array,
+    _mixed_offset_times_to_timestamps,
+    _MixedOffsetTimes,
+    _validate_local_times,
     ensure_numeric,
-    validate_datetime,
+    mask_numeric_value,
     validate_numeric_value,
 )
 
+# Tolerance used to range-check angles in radians (0.01 degrees)
+_RADIANS_TOLERANCE = float(np.radians(1e-2))
+# Largest magnitude of the declination angle, in radians
+_MAX_DECLINATION_RADIANS = float(np.radians(23.45))
+# Values of `errors`: raise a ValueError for the first invalid row,
+# or set invalid rows to NaN and return their `Validity`
+_ERRORS_MODES = ("raise", "mask")
+# Ways of calculating the equation of time and the declination angle:
+# the Spencer (1971) series, or a (faster) polynomial fit of it
+_DAILY_TERM_METHODS = ("spencer", "polynomial")
+
 
 def calculate_day_number(
-    date: Union[datetime, str, Iterable[Union[datetime, str]]]
+    date: Union[datetime, str, Iterable[Union[datetime, str]], np.ndarray],
+    tz: Optional[Union[str, tzinfo, int, float, np.ndarray]] = None,
+    epoch_unit: str = "s",
 ) -> Union[int, Iterable[int]]:
     """
     Method to calculate the day number of the year
     given a proper date.
 
     :param date: A proper datetime object or a string
-        that can be parsed into a proper datetime object.
-
-    :returns: An integer corresponding to the day number of `date`.
+        that can be parsed into a proper datetime object,
+        or (with `tz`) a numpy array of integer times since
+        the Unix epoch (UTC).
+    :param tz: The time zone (an IANA time zone name, a tzinfo
+        object, or a numeric offset from UTC in hours) of the
+        local dates when `date` is an epoch array, or a numpy array
+        of the offset from UTC (in hours) of each epoch time.
+    :param epoch_unit: The unit of a numeric epoch array:
+        "s" (the default), "ms", "us", or "ns".
+
+    :returns: An integer corresponding to the day number of `date`
+        (a numpy array of integers for an epoch array).
     """
 
+    is_epoch = _is_epoch_array(date, tz)
     # Ensure `date` can be parsed into a datetime object
-    date = validate_datetime(datetime_object=date)
+    local_date = _validate_local_times(
+        local_standard_time=date, tz=tz, epoch_unit=epoch_unit
+    )
     # Return the day number corresponding to `date`
-    if isinstance(date, pd.Timestamp):
-        return date.dayofyear
-    elif isinstance(date, pd.Series):
-        return date.dt.dayofyear
+    if isinstance(local_date, pd.Timestamp):
+        return local_date.dayofyear
+    elif isinstance(local_date, pd.Series):
+        return local_date.dt.dayofyear
+    elif isinstance(local_date, _MixedOffsetTimes):
+        # Use the local date of each row
+        day_number = local_date.wall_clock.dayofyear.values
+        if isinstance(date, pd.Series):
+            return pd.Series(day_number, index=date.index)
+        return day_number if is_epoch else list(day_number)
+    elif is_epoch:
+        return local_date.dayofyear.values
     else:
-        return list(date.dayofyear)
+        return list(local_date.dayofyear)
 
 
 def calculate_B_degrees(
-    day_number: Union[int, Iterable[int]]
-) -> Union[float, Iterable[float]]:
+    day_number: Union[int, Iterable[int]],
+    errors: str = "raise",
+) -> Union[float, Iterable[float], Tuple[Iterable[float], Validity]]:
     """
     B is a preliminary value used in calculating the extraterrestrial
     radiation incident on the plane normal to the radiation on the
@@ -53,20 +93,29 @@ def calculate_B_degrees(
         January 1 corresponds to day number 1, and
         December 31 corresponds to day number 365
         (or 366, if a leap year).
+    :param errors: "raise" (the default) or "mask"
+        (see `calculate_solar_zenith_degrees()`).
 
     :returns: A float value, in units of degrees.
+        With `errors="mask"`, a tuple of B and its
+        `pysoleng.utils.Validity`.
     """
 
-    # Ensure `day_number` is an integer
+    # Ensure `day_number` is an integer (NaN rows are masked below)
     ensure_numeric(
         day_number,
         valid_types=[int, np.number],
-        nan_acceptable=False,
-        inf_acceptable=False,
+        nan_acceptable=errors == "mask",
+        inf_acceptable=errors == "mask",
     )
     # Ensure `day_number` is in the proper range
-    validate_numeric_value(day_number, minimum=1, maximum=366)
+    (day_number,), validity = _validate_rows(
+        errors, {"day_number": (day_number, 1, 366, 1e-2)}
+    )
 
+    if validity is not None:
+        B_degrees = (day_number - 1) * 360.0 / 365.0
+        return _mask_rows(B_degrees, validity), validity
     try:
         return (day_number - 1) * 360.0 / 365.0
     except TypeError:
@@ -74,10 +123,173 @@ def calculate_B_degrees(
         return (np.array(day_number) - 1) * 360.0 / 365
 
 
+def calculate_B_radians(
+    day_number: Union[int, Iterable[int]],
+    errors: str = "raise",
+) -> Union[float, Iterable[float], Tuple[Iterable[float], Validity]]:
+    """
+    B (see `calculate_B_degrees()`), in units of radians.
+
+    The equation used is from Duffie & Beckman (2006)
+    Equation 1.4.2.
+
+    :param day_number: An integer representing the day number
+        (of the year) of a specific date.  For example,
+        January 1 corresponds to day number 1, and
+        December 31 corresponds to day number 365
+        (or 366, if a leap year).
+    :param errors: "raise" (the default) or "mask"
+        (see `calculate_solar_zenith_degrees()`).
+
+    :returns: A float value, in units of radians.
+        With `errors="mask"`, a tuple of B and its
+        `pysoleng.utils.Validity`.
+    """
+
+    # Ensure `day_number` is an integer (NaN rows are masked below)
+    ensure_numeric(
+        day_number,
+        valid_types=[int, np.number],
+        nan_acceptable=errors == "mask",
+        inf_acceptable=errors == "mask",
+    )
+    # Ensure `day_number` is in the proper range
+    (day_number,), validity = _validate_rows(
+        errors, {"day_number": (day_number, 1, 366, 1e-2)}
+    )
+
+    if validity is not None:
+        B_radians = (day_number - 1) * 2.0 * np.pi / 365.0
+        return _mask_rows(B_radians, validity), validity
+    try:
+        return (day_number - 1) * 2.0 * np.pi / 365.0
+    except TypeError:
+        # When `day_number` is an iterable, but not a numpy array
+        return (np.array(day_number) - 1) * 2.0 * np.pi / 365.0
+
+
+def _calculate_spencer_E_min(
+    B_radians: Union[float, np.ndarray]
+) -> Union[float, np.ndarray]:
+    """
+    Method to evaluate the Fourier series of Spencer (1971) for the
+    equation of time, in minutes (see `calculate_E_min()`).
+    """
+
+    return 229.2 * (
+        0.000075
+        + (0.001868 * np.cos(B_radians))
+        - (0.032077 * np.sin(B_radians))
+        - (0.014615 * np.cos(2 * B_radians))
+        - (0.04089 * np.sin(2 * B_radians))
+    )
+
+
+def _calculate_spencer_declination_radians(
+    B_radians: Union[float, np.ndarray]
+) -> Union[float, np.ndarray]:
+    """
+    Method to evaluate the Fourier series of Spencer (1971) for the
+    declination angle, in radians (see `calculate_declination_degrees()`).
+    """
+
+    return (
+        0.006918
+        - (0.399912 * np.cos(B_radians))
+        + (0.070257 * np.sin(B_radians))
+        - (0.006758 * np.cos(2 * B_radians))
+        + (0.000907 * np.sin(2 * B_radians))
+        - (0.002697 * np.cos(3 * B_radians))
+        + (0.00148 * np.sin(3 * B_radians))
+    )
+
+
+def _fit_daily_polynomial(spencer_series: Callable) -> np.ndarray:
+    """
+    Method to fit a polynomial (by Chebyshev interpolation) to one of
+    the Spencer (1971) series over the year, B = 0 to 2 pi radians.
+
+    :returns: The polynomial's coefficients (lowest order first) in
+        the scaled variable u = B / pi - 1, which is between -1 and 1.
+    """
+
+    chebyshev_coefficients = np.polynomial.chebyshev.chebinterpolate(
+        lambda u: spencer_series(np.pi * (u + 1.0)),
+        _DAILY_POLYNOMIAL_DEGREE,
+    )
+    return np.polynomial.chebyshev.cheb2poly(chebyshev_coefficients)
+
+
+def _evaluate_daily_polynomial(
+    coefficients: np.ndarray,
+    B: Union[int, float, Iterable[Union[int, float]]],
+    half_year: float,
+) -> Union[float, np.ndarray]:
+    """
+    Method to evaluate a polynomial from `_fit_daily_polynomial()`
+    with Horner's scheme, in place on one array, given `B` in the
+    units for which half of a year is `half_year`
+    (180 for degrees, or pi for radians).
+
+    :returns: A numpy float for a scalar `B` (as from the Spencer
+        series), otherwise a numpy array.
+    """
+
+    u = np.asarray(B, dtype=float) / half_year - 1.0
+    result = np.full_like(u, coefficients[-1])
+    for coefficient in coefficients[-2::-1]:
+        result *= u
+        result += coefficient
+    return result if result.ndim else result[()]
+
+
+# Polynomial fits of the Spencer (1971) series (see `calculate_E_min()`
+# and `calculate_declination_degrees()`).  Over the whole year, the fitted
+# equation of time is within 1e-5 minutes, and the fitted declination
+# angle within 1e-4 degrees, of the series.
+_DAILY_POLYNOMIAL_DEGREE = 16
+_E_MIN_POLYNOMIAL = _fit_daily_polynomial(_calculate_spencer_E_min)
+_DECLINATION_RADIANS_POLYNOMIAL = _fit_daily_polynomial(
+    _calculate_spencer_declination_radians
+)
+_DECLINATION_DEGREES_POLYNOMIAL = np.degrees(_DECLINATION_RADIANS_POLYNOMIAL)
+
+
+def _validate_daily_term_method(method: str) -> None:
+    """
+    Method to ensure `method` names a way of calculating
+    the daily terms: "spencer" or "polynomial".
+    """
+
+    if method not in _DAILY_TERM_METHODS:
+        raise ValueError(
+            f"`method` must be one of: {list(_DAILY_TERM_METHODS)}."
+        )
+
+
+def _B_degrees_checks(
+    B_degrees: Union[int, float, Iterable[Union[int, float]]],
+) -> Dict[str, Tuple[Any, float, float, float]]:
+    """
+    Method to build the range check (see `_validate_rows()`) of B,
+    in degrees, over the year (day numbers 1 to 366).
+    """
+
+    return {
+        "B_degrees": (
+            B_degrees,
+            calculate_B_degrees(1),
+            calculate_B_degrees(366),
+            1e-2,
+        )
+    }
+
+
 def calculate_G_on_W_m2(
     B_degrees: Union[int, float, Iterable[Union[int, float]]],
     G_sc: Union[int, float] = 1_367,
-) -> Union[float, Iterable[float]]:
+    errors: str = "raise",
+) -> Union[float, Iterable[float], Tuple[Iterable[float], Validity]]:
     """
     Method to calculate the extraterrestrial radiation
     incident on the plane normal to the radiation
@@ -92,17 +304,21 @@ def calculate_G_on_W_m2(
         in units of degrees.
     :param G_sc: The extraterrestrial solar radiation,
         assumed to be 1,367 W/m2 by default.
+    :param errors: "raise" (the default) or "mask"
+        (see `calculate_solar_zenith_degrees()`) for the rows of
+        `B_degrees`; an invalid `G_sc` always raises.
 
     :returns: A float value corresponding to `G_on` in units
-        of W/m2.
+        of W/m2.  With `errors="mask"`, a tuple of `G_on` and its
+        `pysoleng.utils.Validity`.
     """
 
-    # Type-check `B_degrees` and `G_sc`
+    # Type-check `B_degrees` and `G_sc` (NaN rows are masked below)
     ensure_numeric(
         B_degrees,
         valid_types=[int, float, np.number],
-        nan_acceptable=False,
-        inf_acceptable=False,
+        nan_acceptable=errors == "mask",
+        inf_acceptable=errors == "mask",
     )
     ensure_numeric(
         G_sc,
@@ -112,10 +328,8 @@ def calculate_G_on_W_m2(
     )
 
     # Range-check `B_degrees` and `G_sc`
-    validate_numeric_value(
-        B_degrees,
-        minimum=calculate_B_degrees(1),
-        maximum=calculate_B_degrees(366),
+    (B_degrees,), validity = _validate_rows(
+        errors, _B_degrees_checks(B_degrees)
     )
     validate_numeric_value(G_sc, minimum=0, maximum=None)
 
@@ -130,12 +344,16 @@ def calculate_G_on_W_m2(
         + (0.000719 * np.cos(2 * B_radians))
         + (0.000077 * np.sin(2 * B_radians))
     )
-    return G_sc * multiplier
+    if validity is None:
+        return G_sc * multiplier
+    return _mask_rows(G_sc * multiplier, validity), validity
 
 
 def calculate_E_min(
-    B_degrees: Union[int, float, Iterable[Union[int, float]]]
-) -> Union[float, Iterable[float]]:
+    B_degrees: Union[int, float, Iterable[Union[int, float]]],
+    method: str = "spencer",
+    errors: str = "raise",
+) -> Union[float, Iterable[float], Tuple[Iterable[float], Validity]]:
     """
     E is the equation of time (in minutes), which is
     based on the day of the year.
@@ -144,41 +362,391 @@ def calculate_E_min(
     The equation used is from Duffie & Beckman (2006)
     Equation 1.5.3.
 
+    With `method="polynomial"`, a degree-16 polynomial fit of the
+    equation is evaluated (with Horner's scheme) instead of its
+    trigonometric terms, which is several times faster for large
+    arrays.  The fit is within 1e-5 minutes of the equation
+    over the whole year.
+
     :param B_degrees: A numeric value (generally a float)
         which is calculated based on the day of the year,
         in units of degrees.
+    :param method: "spencer" (the default) or "polynomial".
+    :param errors: "raise" (the default) or "mask"
+        (see `calculate_solar_zenith_degrees()`).
 
     :returns: A float value representing the equation of
         time for the given `B_degrees`, in units of minutes.
+        With `errors="mask"`, a tuple of the equation of time
+        and its `pysoleng.utils.Validity`.
     """
 
-    # Type-check `B_degrees`
+    # Type-check `B_degrees` (NaN rows are masked below)
     ensure_numeric(
         B_degrees,
         valid_types=[int, float, np.number],
-        nan_acceptable=False,
-        inf_acceptable=False,
+        nan_acceptable=errors == "mask",
+        inf_acceptable=errors == "mask",
     )
     # Range-check `B_degrees`
-    validate_numeric_value(
-        B_degrees,
-        minimum=calculate_B_degrees(1),
-        maximum=calculate_B_degrees(366),
+    (B_degrees,), validity = _validate_rows(
+        errors, _B_degrees_checks(B_degrees)
     )
-    # Convert `B_degrees` to radians for use in the calculation
-    B_radians = np.radians(B_degrees)
-    return 229.2 * (
-        0.000075
-        + (0.001868 * np.cos(B_radians))
-        - (0.032077 * np.sin(B_radians))
-        - (0.014615 * np.cos(2 * B_radians))
-        - (0.04089 * np.sin(2 * B_radians))
+    _validate_daily_term_method(method)
+
+    if method == "polynomial":
+        E_min = _evaluate_daily_polynomial(
+            _E_MIN_POLYNOMIAL, B_degrees, half_year=180.0
+        )
+    else:
+        # Convert `B_degrees` to radians for use in the calculation
+        E_min = _calculate_spencer_E_min(np.radians(B_degrees))
+
+    if validity is None:
+        return E_min
+    return _mask_rows(E_min, validity), validity
+
+
+def _resolve_longitude(
+    longitude_degrees: Union[int, float, Iterable[float], Site],
+    tz: Optional[Union[str, tzinfo, int, float, np.ndarray]],
+) -> Tuple[Union[int, float], Optional[Union[str, tzinfo, int, float]]]:
+    """
+    Method to validate `longitude_degrees`, or to take the
+    (already validated) longitude and time zone of a `Site`.
+
+    :returns: A tuple of the longitude, in degrees, and the time zone
+        (`tz`, or the site's time zone if `tz` is `None`).
+    """
+
+    if isinstance(longitude_degrees, Site):
+        site = longitude_degrees
+        return site.longitude_degrees, (site.tz if tz is None else tz)
+    # Type- and range-check `longitude_degrees`
+    validate_numeric_value(longitude_degrees, minimum=0, maximum=360)
+    return longitude_degrees, tz
+
+
+def _resolve_latitude_trig(
+    latitude: Union[int, float, Site], in_radians: bool = False
+) -> Tuple[float, float]:
+    """
+    Method to validate `latitude` (in degrees, or in radians if
+    `in_radians`) and calculate its sine and cosine, or to take
+    the precomputed values of a `Site`.
+
+    :returns: A tuple of the sine and cosine of the latitude.
+    """
+
+    if isinstance(latitude, Site):
+        return latitude.sin_latitude, latitude.cos_latitude
+    if in_radians:
+        validate_numeric_value(
+            value=latitude,
+            minimum=-np.pi / 2,
+            maximum=np.pi / 2,
+            tolerance=_RADIANS_TOLERANCE,
+        )
+        latitude_radians = latitude
+    else:
+        validate_numeric_value(value=latitude, minimum=-90, maximum=90)
+        latitude_radians = np.radians(latitude)
+    return np.sin(latitude_radians), np.cos(latitude_radians)
+
+
+def _resolve_air_mass_altitude_factor(
+    site_altitude_m: Union[int, float, Site]
+) -> float:
+    """
+    Method to validate `site_altitude_m` and calculate the altitude
+    factor of the air mass, or to take the precomputed value
+    of a `Site`.
+    """
+
+    if isinstance(site_altitude_m, Site):
+        return site_altitude_m.air_mass_altitude_factor
+    validate_numeric_value(value=site_altitude_m, minimum=-413, maximum=None)
+    return np.exp(-0.0001184 * site_altitude_m)
+
+
+def _declination_and_hour_angle_checks(
+    declination: Union[int, float, Iterable[Union[int, float]]],
+    hour_angle: Union[int, float, Iterable[Union[int, float]]],
+    in_radians: bool = False,
+) -> Dict[str, Tuple[Any, float, float, float]]:
+    """
+    Method to build the range checks (see `_validate_rows()`) of a
+    declination angle and an hour angle, both in degrees (or both
+    in radians if `in_radians`).
+    """
+
+    if in_radians:
+        return {
+            "declination_radians": (
+                declination,
+                -_MAX_DECLINATION_RADIANS,
+                _MAX_DECLINATION_RADIANS,
+                _RADIANS_TOLERANCE,
+            ),
+            "hour_angle_radians": (
+                hour_angle,
+                -np.pi,
+                np.pi,
+                _RADIANS_TOLERANCE,
+            ),
+        }
+    return {
+        "declination_degrees": (declination, -23.45, 23.45, 1e-2),
+        "hour_angle_degrees": (hour_angle, -180, 180, 1e-2),
+    }
+
+
+def _validate_alignment(arguments: Dict[str, Any]) -> None:
+    """
+    Method to ensure the per-row arguments of a calculation (mapped
+    from their names in `arguments`) are aligned: every argument that
+    is not a single value must have the same shape.
+    """
+
+    shapes = {}
+    for name, value in arguments.items():
+        if isinstance(value, _MixedOffsetTimes):
+            shape = value.wall_clock.shape
+        elif isinstance(value, (str, datetime, Site)):
+            shape = ()
+        else:
+            shape = np.shape(value)
+        if shape != ():
+            shapes[name] = shape
+    if len(set(shapes.values())) > 1:
+        raise ValueError(
+            "Per-row arguments must have one value per row, but got "
+            + ", ".join(
+                f"`{name}` of shape {shape}" for name, shape in shapes.items()
+            )
+            + "."
+        )
+
+
+def _validate_rows(
+    errors: str,
+    checks: Dict[str, Tuple[Any, float, float, float]],
+    **aligned: Any,
+) -> Tuple[List[Any], Optional[Validity]]:
+    """
+    Method to range-check the per-row arguments of a calculation.
+
+    `checks` maps the name of each argument to a tuple of its value
+    and the `minimum`, `maximum`, and `tolerance` it is checked
+    against.  With `errors="raise"`, the first invalid value raises a
+    ValueError (see `validate_numeric_value()`).  With
+    `errors="mask"`, the invalid values are replaced by NaN instead,
+    and their rows are flagged in the returned `Validity`.
+    The checked values, and any other (already validated) per-row
+    arguments given by name in `aligned` (e.g., a latitude array),
+    must be aligned (see `_validate_alignment()`).
+
+    :returns: A tuple of the (checked) values, in the order of
+        `checks`, and their `Validity` (or `None` for
+        `errors="raise"`).
+    """
+
+    if errors not in _ERRORS_MODES:
+        raise ValueError(f"`errors` must be one of: {list(_ERRORS_MODES)}.")
+    _validate_alignment(
+        {**{name: check[0] for name, check in checks.items()}, **aligned}
+    )
+
+    if errors == "raise":
+        for value, minimum, maximum, tolerance in checks.values():
+            validate_numeric_value(
+                value=value,
+                minimum=minimum,
+                maximum=maximum,
+                tolerance=tolerance,
+            )
+        return [check[0] for check in checks.values()], None
+
+    values, counts = [], {}
+    mask = np.True_
+    for name, (value, minimum, maximum, tolerance) in checks.items():
+        valid, counts[name] = mask_numeric_value(
+            value=value,
+            minimum=minimum,
+            maximum=maximum,
+            tolerance=tolerance,
+        )
+        values.append(np.where(valid, np.asarray(value, dtype=float), np.nan))
+        mask = mask & valid
+    return values, Validity(mask=np.asarray(mask), counts=counts)
+
+
+def _mask_rows(
+    result: Union[float, np.ndarray], validity: Validity
+) -> Union[float, np.ndarray]:
+    """
+    Method to set the rows of `result` flagged as invalid
+    in `validity` to NaN.
+
+    :returns: A float for a scalar result, otherwise a numpy array.
+    """
+
+    result = np.where(validity.mask, result, np.nan)
+    return result if result.ndim else result[()]
+
+
+def _calculate_utc_offset_hours(
+    local_ts: Union[
+        pd.Timestamp, pd.Series, pd.DatetimeIndex, _MixedOffsetTimes
+    ]
+) -> Union[float, np.ndarray]:
+    """
+    Method to calculate the offset from UTC (in whole hours,
+    rounded down) of a timezone-aware timestamp, or of each
+    timestamp in a Pandas Series or DatetimeIndex, already in local
+    standard time (see `pysoleng.utils._validate_local_times()`).
+
+    For a Series or DatetimeIndex the offsets are calculated per
+    element, from the difference between the int64 local (wall clock)
+    and UTC representations, in one array operation.  Times with
+    per-row offsets (`_MixedOffsetTimes`) carry their offsets already.
+
+    :param local_ts: A Pandas Timestamp, Series, or DatetimeIndex,
+        containing time zone information.
+
+    :returns: A float value, or a numpy array of float values,
+        representing the offset from UTC in hours.
+    """
+
+    if isinstance(local_ts, _MixedOffsetTimes):
+        return (local_ts.utc_offset_ns // 3_600_000_000_000).astype(float)
+    if isinstance(local_ts, (pd.Series, pd.DatetimeIndex)):
+        local_index = pd.DatetimeIndex(local_ts)
+        tz = local_index.tz
+    else:
+        tz = local_ts.tzinfo
+
+    # Ensure local_ts has time zone information
+    if tz is None:
+        raise ValueError(
+            """`local_standard_time` must provide a time zone offset,
+            such as `1/1/2019 12:00 PM -06:00`."""
+        )
+
+    if isinstance(local_ts, (pd.Series, pd.DatetimeIndex)):
+        offset_ns = local_index.tz_localize(None).asi8 - local_index.asi8
+        return (offset_ns // 3_600_000_000_000).astype(float)
+    return local_ts.tzinfo.utcoffset(local_ts).total_seconds() // 3_600
+
+
+def _calculate_local_day_numbers(
+    local_ts: Union[pd.Series, pd.DatetimeIndex, _MixedOffsetTimes]
+) -> np.ndarray:
+    """
+    Method to calculate the day number of the local date of each
+    timestamp in an already-validated Pandas Series or DatetimeIndex
+    (or `_MixedOffsetTimes`).
+
+    :returns: A numpy array of integers.
+    """
+
+    if isinstance(local_ts, _MixedOffsetTimes):
+        return local_ts.wall_clock.dayofyear.values
+    return pd.DatetimeIndex(local_ts).dayofyear.values
+
+
+def _calculate_E_min_per_timestamp(
+    local_ts: Union[
+        pd.Timestamp, pd.Series, pd.DatetimeIndex, _MixedOffsetTimes
+    ]
+) -> Union[float, np.ndarray]:
+    """
+    Method to calculate the equation of time (in minutes) for an
+    already-validated Pandas Timestamp, Series, or DatetimeIndex
+    (or `_MixedOffsetTimes`); for many timestamps, it is calculated
+    once per day (see `calculate_daily_terms()`).
+    """
+
+    if isinstance(local_ts, (pd.Series, pd.DatetimeIndex, _MixedOffsetTimes)):
+        return calculate_daily_terms(_calculate_local_day_numbers(local_ts))[
+            "E_min"
+        ]
+    return calculate_E_min(calculate_B_degrees(calculate_day_number(local_ts)))
+
+
+def _validate_longitude_rows(
+    local_ts: Union[
+        pd.Timestamp, pd.Series, pd.DatetimeIndex, _MixedOffsetTimes
+    ],
+    longitude_degrees: Union[int, float, Iterable[Union[int, float]]],
+) -> None:
+    """
+    Method to ensure an array of (already validated) longitudes has
+    one value per timestamp in `local_ts`.
+    """
+
+    if np.ndim(longitude_degrees) and isinstance(local_ts, pd.Timestamp):
+        raise ValueError(
+            "`longitude_degrees` must be a single value "
+            "for a single timestamp."
+        )
+    _validate_alignment(
+        {
+            "local_standard_time": local_ts,
+            "longitude_degrees": longitude_degrees,
+        }
     )
 
 
+def _convert_to_solar_time(
+    local_ts: Union[
+        pd.Timestamp, pd.Series, pd.DatetimeIndex, _MixedOffsetTimes
+    ],
+    longitude_degrees: Union[int, float, Iterable[Union[int, float]]],
+) -> Union[pd.Timestamp, pd.DatetimeIndex, _MixedOffsetTimes]:
+    """
+    Method to calculate solar time for an already-validated
+    Pandas Timestamp, Series, or DatetimeIndex
+    (or `_MixedOffsetTimes`).
+
+    :returns: A Pandas Timestamp, a DatetimeIndex for a
+        Series or DatetimeIndex, or `_MixedOffsetTimes` (each row
+        keeping its offset from UTC).
+    """
+
+    _validate_longitude_rows(local_ts, longitude_degrees)
+    # Calculate offset from UTC, using timezone offset(s) in `local_ts`
+    utc_offset = _calculate_utc_offset_hours(local_ts)
+
+    """Determine the standard meridian for the given `longitude_degrees`,
+    which corresponds to 15 degrees per hour offset."""
+    standard_meridian = 15 * np.abs(utc_offset)
+
+    E = _calculate_E_min_per_timestamp(local_ts)
+    longitude_correction_mins = 4.0 * (standard_meridian - longitude_degrees)
+
+    if isinstance(local_ts, (pd.Series, pd.DatetimeIndex, _MixedOffsetTimes)):
+        # Shift every timestamp in one array operation
+        shift = pd.to_timedelta(
+            np.asarray(longitude_correction_mins + E, dtype=float), unit="min"
+        )
+        if isinstance(local_ts, _MixedOffsetTimes):
+            return local_ts._replace(wall_clock=local_ts.wall_clock + shift)
+        # Shift the (standard time) wall clock, not the elapsed time
+        local_index = pd.DatetimeIndex(local_ts)
+        return (local_index.tz_localize(None) + shift).tz_localize(
+            local_index.tz
+        )
+    return local_ts + timedelta(minutes=longitude_correction_mins + E)
+
+
 def convert_to_solar_time(
-    local_standard_time: Union[datetime, str, Iterable[Union[datetime, str]]],
-    longitude_degrees: Union[int, float],
+    local_standard_time: Union[
+        datetime, str, Iterable[Union[datetime, str]], np.ndarray
+    ],
+    longitude_degrees: Union[int, float, Iterable[float], Site],
+    tz: Optional[Union[str, tzinfo, int, float, np.ndarray]] = None,
+    epoch_unit: str = "s",
 ) -> Union[datetime, Iterable[datetime]]:
     """
     Method to calculate solar time given a local standard timestamp
@@ -188,70 +756,65 @@ def convert_to_solar_time(
     The equation used is from Duffie & Beckman (2006)
     Equation 1.5.2.
 
+    Unlike the angle calculations, this method has no `errors="mask"`
+    mode, as its results are timestamps: an invalid longitude always
+    raises a ValueError.
+
     :param local_standard_time: A `datetime` object,
         containing a timezone offset, representing the time that
-        will be converted to solar time.
+        will be converted to solar time, or (with `tz`) a numpy
+        array of integer times since the Unix epoch (UTC).
+        The offsets from UTC of an iterable of timestamps may
+        differ from row to row.
     :param longitude_degrees: A numeric value representing a location's
         angular distance west of the meridian at Greenwich, England.
         `longitude_degrees` should be between 0 and 360 degrees.
+        A `pysoleng.site.Site` may be given instead, or a numpy
+        array with one longitude per timestamp.
+    :param tz: The time zone (an IANA time zone name, a tzinfo
+        object, or a numeric offset from UTC in hours) of the
+        local standard time when `local_standard_time` is
+        an epoch array (by default, the time zone of a `Site`
+        given as `longitude_degrees`), or a numpy array of the
+        offset from UTC (in hours) of each epoch time.
+    :param epoch_unit: The unit of a numeric epoch array:
+        "s" (the default), "ms", "us", or "ns".
 
     :returns: A datetime object representing the solar time
         corresponding to `local_standard_time` at the given
-        `longitude_degrees`.
+        `longitude_degrees` (a list of them for an iterable,
+        or a Pandas DatetimeIndex for an epoch array).  When the
+        offsets from UTC differ from row to row, each solar time
+        keeps its row's offset (and an epoch array gives a Pandas
+        Index of them).
     """
 
-    # Type- and range-check `longitude_degrees`
-    validate_numeric_value(longitude_degrees, minimum=0, maximum=360)
+    # Validate `longitude_degrees` (or take it from a `Site`)
+    longitude_degrees, tz = _resolve_longitude(longitude_degrees, tz)
     # Validate `local_standard_time`
-    local_ts = validate_datetime(datetime_object=local_standard_time)
-
-    if isinstance(local_ts, pd.Series):
-        # Ensure local_ts has time zone information
-        if local_ts.dt.tz is None:
-            raise ValueError(
-                """`local_standard_time` must provide a time zone offset,
-            such as `1/1/2019 12:00 PM -06:00`."""
-            )
-
-        # Calculate offset from UTC, using timezone offset in `local_ts`
-        utc_offset = (
-            local_ts.dt.tz.utcoffset(local_ts).total_seconds() // 3_600
-        )
-    else:
-        # Ensure local_ts has time zone information
-        if local_ts.tzinfo is None:
-            raise ValueError(
-                """`local_standard_time` must provide a time zone offset,
-            such as `1/1/2019 12:00 PM -06:00`."""
-            )
-
-        # Calculate offset from UTC, using timezone offset in `local_ts`
-        utc_offset = (
-            local_ts.tzinfo.utcoffset(local_ts).total_seconds() // 3_600
-        )
-
-    """Determine the standard meridian for the given `longitude_degrees`,
-    which corresponds to 15 degrees per hour offset."""
-    standard_meridian = 15 * np.abs(utc_offset)
-
-    E = calculate_E_min(
-        calculate_B_degrees(calculate_day_number(local_standard_time))
+    local_ts = _validate_local_times(
+        local_standard_time=local_standard_time, tz=tz, epoch_unit=epoch_unit
     )
-    longitude_correction_mins = 4.0 * (standard_meridian - longitude_degrees)
 
-    try:
-        return local_ts + timedelta(minutes=longitude_correction_mins + E)
-    except TypeError:
-        # When working with iterables
-        return [
-            x + timedelta(minutes=longitude_correction_mins + E[i])
-            for i, x in enumerate(local_ts)
-        ]
+    solar_ts = _convert_to_solar_time(local_ts, longitude_degrees)
+    if isinstance(solar_ts, _MixedOffsetTimes):
+        # Present each row in its own offset from UTC
+        solar_ts = _mixed_offset_times_to_timestamps(solar_ts)
+        if _is_epoch_array(local_standard_time, tz):
+            return pd.Index(solar_ts, dtype=object)
+        return list(solar_ts)
+    if isinstance(solar_ts, pd.DatetimeIndex) and not (
+        _is_epoch_array(local_standard_time, tz)
+    ):
+        return list(solar_ts)
+    return solar_ts
 
 
 def calculate_declination_degrees(
-    B_degrees: Union[int, float, Iterable[Union[int, float]]]
-) -> Union[float, Iterable[float]]:
+    B_degrees: Union[int, float, Iterable[Union[int, float]]],
+    method: str = "spencer",
+    errors: str = "raise",
+) -> Union[float, Iterable[float], Tuple[Iterable[float], Validity]]:
     """
     The declination is the angular position of the sun
     at solar noon with respect to the plane of the
@@ -262,124 +825,422 @@ def calculate_declination_degrees(
     The equation used is from Duffie & Beckman (2006)
     Equation 1.6.1b.
 
+    With `method="polynomial"`, a degree-16 polynomial fit of the
+    equation is evaluated (with Horner's scheme) instead of its
+    trigonometric terms, which is several times faster for large
+    arrays.  The fit is within 1e-4 degrees of the equation
+    over the whole year.
+
     :param B_degrees: A numeric value (generally a float)
         which is calculated based on the day of the year,
         in units of degrees.
+    :param method: "spencer" (the default) or "polynomial".
+    :param errors: "raise" (the default) or "mask"
+        (see `calculate_solar_zenith_degrees()`).
 
     :returns: A float value representing the
-        declination angle of the sun.
+        declination angle of the sun.  With `errors="mask"`,
+        a tuple of the declination angle and its
+        `pysoleng.utils.Validity`.
     """
 
-    # Type-check `B_degrees`
+    # Type-check `B_degrees` (NaN rows are masked below)
     ensure_numeric(
         B_degrees,
         valid_types=[int, float, np.number],
-        nan_acceptable=False,
-        inf_acceptable=False,
+        nan_acceptable=errors == "mask",
+        inf_acceptable=errors == "mask",
     )
-    # Range-check `B_degrees` and `G_sc`
+    # Range-check `B_degrees`
+    (B_degrees,), validity = _validate_rows(
+        errors, _B_degrees_checks(B_degrees)
+    )
+    _validate_daily_term_method(method)
+
+    if method == "polynomial":
+        declination_degrees = _evaluate_daily_polynomial(
+            _DECLINATION_DEGREES_POLYNOMIAL, B_degrees, half_year=180.0
+        )
+    else:
+        # Convert `B_degrees` to radians for use in the calculation
+        declination_degrees = np.degrees(
+            _calculate_spencer_declination_radians(np.radians(B_degrees))
+        )
+
+    # Range-check `declination_degrees` (of the valid rows) before returning
     validate_numeric_value(
-        B_degrees,
-        minimum=calculate_B_degrees(1),
-        maximum=calculate_B_degrees(366),
+        (
+            declination_degrees
+            if validity is None
+            else np.asarray(declination_degrees)[validity.mask]
+        ),
+        minimum=-23.45,
+        maximum=23.45,
     )
 
-    # Convert `B_degrees` to radians for use in the calculation
-    B_radians = np.radians(B_degrees)
-    declination_degrees = (
-        180.0
-        / np.pi
-        * (
-            0.006918
-            - (0.399912 * np.cos(B_radians))
-            + (0.070257 * np.sin(B_radians))
-            - (0.006758 * np.cos(2 * B_radians))
-            + (0.000907 * np.sin(2 * B_radians))
-            - (0.002697 * np.cos(3 * B_radians))
-            + (0.00148 * np.sin(3 * B_radians))
+    if validity is None:
+        return declination_degrees
+    return _mask_rows(declination_degrees, validity), validity
+
+
+def calculate_declination_radians(
+    B_radians: Union[int, float, Iterable[Union[int, float]]],
+    method: str = "spencer",
+    errors: str = "raise",
+) -> Union[float, Iterable[float], Tuple[Iterable[float], Validity]]:
+    """
+    The declination angle (see `calculate_declination_degrees()`),
+    in units of radians.
+
+    The equation used is from Duffie & Beckman (2006)
+    Equation 1.6.1b.
+
+    :param B_radians: A numeric value (generally a float)
+        which is calculated based on the day of the year,
+        in units of radians.
+    :param method: "spencer" (the default) or "polynomial"
+        (see `calculate_declination_degrees()`).
+    :param errors: "raise" (the default) or "mask"
+        (see `calculate_solar_zenith_degrees()`).
+
+    :returns: A float value representing the declination angle
+        in radians.  With `errors="mask"`, a tuple of the
+        declination angle and its `pysoleng.utils.Validity`.
+    """
+
+    # Type-check `B_radians` (NaN rows are masked below)
+    ensure_numeric(
+        B_radians,
+        valid_types=[int, float, np.number],
+        nan_acceptable=errors == "mask",
+        inf_acceptable=errors == "mask",
+    )
+    # Range-check `B_radians`
+    (B_radians,), validity = _validate_rows(
+        errors,
+        {
+            "B_radians": (
+                B_radians,
+                calculate_B_radians(1),
+                calculate_B_radians(366),
+                _RADIANS_TOLERANCE,
+            )
+        },
+    )
+    _validate_daily_term_method(method)
+
+    if method == "polynomial":
+        declination_radians = _evaluate_daily_polynomial(
+            _DECLINATION_RADIANS_POLYNOMIAL, B_radians, half_year=np.pi
+        )
+    else:
+        declination_radians = _calculate_spencer_declination_radians(
+            B_radians
+        )
+
+    # Range-check `declination_radians` (of the valid rows) before returning
+    validate_numeric_value(
+        (
+            declination_radians
+            if validity is None
+            else np.asarray(declination_radians)[validity.mask]
+        ),
+        minimum=-_MAX_DECLINATION_RADIANS,
+        maximum=_MAX_DECLINATION_RADIANS,
+        tolerance=_RADIANS_TOLERANCE,
+    )
+
+    if validity is None:
+        return declination_radians
+    return _mask_rows(declination_radians, validity), validity
+
+
+def calculate_daily_terms(
+    day_number: Union[int, Iterable[int]]
+) -> Dict[str, Union[float, np.ndarray]]:
+    """
+    Method to calculate the terms that only depend on the day of the
+    year (B, the equation of time, and the declination angle) for
+    many timestamps at once.
+
+    Each term is calculated once per day number between the smallest
+    and largest in `day_number` (at most 366 times), and broadcast back
+    to every element with an index array, so that the cost for
+    high-frequency data is essentially that of the indexing.
+
+    :param day_number: An integer, or an iterable (e.g., a numpy array)
+        of integers, representing day numbers (of the year)
+        between 1 and 366.
+
+    :returns: A dictionary with the keys "B_degrees", "E_min", and
+        "declination_degrees", each aligned with `day_number`.
+    """
+
+    day_number = np.asarray(day_number)
+    # Ensure `day_number` holds integers
+    if (day_number.dtype.kind not in "iu") and (day_number.size > 0):
+        raise TypeError("`day_number` must contain integer values.")
+    if day_number.size == 0:
+        empty = np.empty(day_number.shape, dtype=float)
+        return {
+            "B_degrees": empty,
+            "E_min": empty.copy(),
+            "declination_degrees": empty.copy(),
+        }
+
+    # Calculate (and range-check) each term once per day number
+    first_day = int(day_number.min())
+    B_degrees = calculate_B_degrees(
+        np.arange(first_day, int(day_number.max()) + 1)
+    )
+    day_index = day_number - first_day
+    return {
+        "B_degrees": B_degrees[day_index],
+        "E_min": calculate_E_min(B_degrees)[day_index],
+        "declination_degrees": calculate_declination_degrees(B_degrees)[
+            day_index
+        ],
+    }
+
+
+def _validate_longitude_rows_mask(
+    errors: str,
+    longitude_degrees: Union[int, float, Iterable[float], Site],
+    tz: Optional[Union[str, tzinfo, int, float, np.ndarray]],
+) -> Tuple[
+    Union[int, float, np.ndarray, Site],
+    Optional[Union[str, tzinfo, int, float, np.ndarray]],
+    Optional[Validity],
+]:
+    """
+    Method to range-check `longitude_degrees` per row (see
+    `_validate_rows()`), taking the longitude and time zone of a
+    `Site` first.  With `errors="mask"`, the invalid longitudes are
+    replaced by 0 degrees, so that every row can be calculated before
+    the invalid ones are masked.
+
+    :returns: A tuple of the longitude(s), the time zone, and their
+        `Validity` (or `None` for `errors="raise"`).
+    """
+
+    if errors == "raise":
+        # `_resolve_longitude()` validates the longitude(s) later
+        return longitude_degrees, tz, None
+    if isinstance(longitude_degrees, Site):
+        longitude_degrees, tz = _resolve_longitude(longitude_degrees, tz)
+    (longitude_degrees,), validity = _validate_rows(
+        errors, {"longitude_degrees": (longitude_degrees, 0, 360, 1e-2)}
+    )
+    longitude_degrees = np.where(validity.mask, longitude_degrees, 0.0)
+    if not longitude_degrees.ndim:
+        longitude_degrees = float(longitude_degrees)
+    return longitude_degrees, tz, validity
+
+
+def _calculate_hours_from_solar_noon(
+    local_standard_time: Union[
+        datetime, str, Iterable[Union[datetime, str]], np.ndarray
+    ],
+    longitude_degrees: Union[int, float, Iterable[float], Site],
+    tz: Optional[Union[str, tzinfo, int, float, np.ndarray]],
+    epoch_unit: str,
+) -> Union[float, np.ndarray]:
+    """
+    Method to calculate the difference (in hours) between the solar
+    time of `local_standard_time` and noon on the same (solar) date.
+
+    :returns: A float value, or a numpy array of float values.
+    """
+
+    # Validate `longitude_degrees` (or take it from a `Site`)
+    longitude_degrees, tz = _resolve_longitude(longitude_degrees, tz)
+    # Validate `local_standard_time`
+    local_ts = _validate_local_times(
+        local_standard_time=local_standard_time, tz=tz, epoch_unit=epoch_unit
+    )
+    solar_ts = _convert_to_solar_time(local_ts, longitude_degrees)
+
+    # Calculate the difference (in hours) from noon on the same
+    # date as `solar_ts`
+    if isinstance(solar_ts, (pd.DatetimeIndex, _MixedOffsetTimes)):
+        # Use the wall clock time of day of every timestamp at once
+        wall_clock_ns = (
+            solar_ts.wall_clock.asi8
+            if isinstance(solar_ts, _MixedOffsetTimes)
+            else solar_ts.tz_localize(None).asi8
+        )
+        return (wall_clock_ns % 86_400_000_000_000) / (
+            3_600_000_000_000
+        ) - 12.0
+    # Create a datetime object for noon on the same date as `solar_ts`
+    solar_noon = datetime(
+        year=solar_ts.date().year,
+        month=solar_ts.date().month,
+        day=solar_ts.date().day,
+        hour=12,
+        minute=0,
+        second=0,
+        tzinfo=solar_ts.tzinfo,
+    )
+    return (solar_ts - solar_noon).total_seconds() / 3600
+
+
+def calculate_hour_angle_degrees(
+    local_standard_time: Union[
+        datetime, str, Iterable[Union[datetime, str]], np.ndarray
+    ],
+    longitude_degrees: Union[int, float, Iterable[float], Site],
+    tz: Optional[Union[str, tzinfo, int, float, np.ndarray]] = None,
+    epoch_unit: str = "s",
+    errors: str = "raise",
+) -> Union[float, Iterable[float], Tuple[Iterable[float], Validity]]:
+    """
+    The hour angle is the angular displacement of the
+    sun east (negative) or west (positive) of the local
+    meridian due to rotation of the earth on its axis at
+    15 degrees per hour, which must be between
+    -180 and 180 degrees (+/- 15 degreees/hour * 12 hours).
+
+    :param local_standard_time: A `datetime` object,
+        containing a timezone offset, representing the time that
+        will be converted to solar time, or (with `tz`) a numpy
+        array of integer times since the Unix epoch (UTC).
+        The offsets from UTC of an iterable of timestamps may
+        differ from row to row.
+    :param longitude_degrees: A numeric value representing a location's
+        angular distance west of the meridian at Greenwich, England.
+        `longitude_degrees` should be between 0 and 360 degrees.
+        A `pysoleng.site.Site` may be given instead, or a numpy
+        array with one longitude per timestamp.
+    :param tz: The time zone (an IANA time zone name, a tzinfo
+        object, or a numeric offset from UTC in hours) of the
+        local standard time when `local_standard_time` is
+        an epoch array (by default, the time zone of a `Site`
+        given as `longitude_degrees`), or a numpy array of the
+        offset from UTC (in hours) of each epoch time.
+    :param epoch_unit: The unit of a numeric epoch array:
+        "s" (the default), "ms", "us", or "ns".
+
+    :param errors: "raise" (the default) to raise a ValueError for
+        a NaN or out-of-range `longitude_degrees` value, or "mask" to
+        set the rows with such a value to NaN instead.  Timestamps
+        that cannot be parsed always raise.
+
+    :returns: A float value representing the angular displacement
+        of the sun.  With `errors="mask"`, a tuple of the hour angle
+        and its `pysoleng.utils.Validity`.
+    """
+
+    longitude_degrees, tz, validity = _validate_longitude_rows_mask(
+        errors, longitude_degrees, tz
+    )
+    # Calculate the difference (in hours) from noon on the same
+    # date as the solar time, and multiply by 15
+    hour_angle = (
+        _calculate_hours_from_solar_noon(
+            local_standard_time, longitude_degrees, tz, epoch_unit
         )
+        * 15.0
     )
 
-    # Range-check `declination_degrees` before returning
-    validate_numeric_value(declination_degrees, minimum=-23.45, maximum=23.45)
-
-    return declination_degrees
-
-
-def calculate_hour_angle_degrees(
-    local_standard_time: Union[datetime, str, Iterable[Union[datetime, str]]],
-    longitude_degrees: Union[int, float],
-) -> Union[float, Iterable[float]]:
+    # Valiate `hour_angle`
+    validate_numeric_value(hour_angle, minimum=-180, maximum=180)
+    if validity is None:
+        return hour_angle
+    return _mask_rows(hour_angle, validity), validity
+
+
+def calculate_hour_angle_radians(
+    local_standard_time: Union[
+        datetime, str, Iterable[Union[datetime, str]], np.ndarray
+    ],
+    longitude_degrees: Union[int, float, Iterable[float], Site],
+    tz: Optional[Union[str, tzinfo, int, float, np.ndarray]] = None,
+    epoch_unit: str = "s",
+    errors: str = "raise",
+) -> Union[float, Iterable[float], Tuple[Iterable[float], Validity]]:
     """
-    The hour angle is the angular displacement of the
-    sun east (negative) or west (positive) of the local
-    meridian due to rotation of the earth on its axis at
-    15 degrees per hour, which must be between
-    -180 and 180 degrees (+/- 15 degreees/hour * 12 hours).
+    The hour angle (see `calculate_hour_angle_degrees()`),
+    in units of radians, which must be between -pi and pi.
 
     :param local_standard_time: A `datetime` object,
         containing a timezone offset, representing the time that
-        will be converted to solar time.
+        will be converted to solar time, or (with `tz`) a numpy
+        array of integer times since the Unix epoch (UTC).
+        The offsets from UTC of an iterable of timestamps may
+        differ from row to row.
     :param longitude_degrees: A numeric value representing a location's
         angular distance west of the meridian at Greenwich, England.
         `longitude_degrees` should be between 0 and 360 degrees.
+        A `pysoleng.site.Site` may be given instead, or a numpy
+        array with one longitude per timestamp.
+    :param tz: The time zone (an IANA time zone name, a tzinfo
+        object, or a numeric offset from UTC in hours) of the
+        local standard time when `local_standard_time` is
+        an epoch array (by default, the time zone of a `Site`
+        given as `longitude_degrees`), or a numpy array of the
+        offset from UTC (in hours) of each epoch time.
+    :param epoch_unit: The unit of a numeric epoch array:
+        "s" (the default), "ms", "us", or "ns".
+
+    :param errors: "raise" (the default) or "mask"
+        (see `calculate_hour_angle_degrees()`).
 
     :returns: A float value representing the angular displacement
-        of the sun.
+        of the sun, in radians.  With `errors="mask"`, a tuple of the
+        hour angle and its `pysoleng.utils.Validity`.
     """
 
-    # The `convert_to_solar_time()` method will validate the inputs
-    solar_ts = convert_to_solar_time(local_standard_time, longitude_degrees)
+    longitude_degrees, tz, validity = _validate_longitude_rows_mask(
+        errors, longitude_degrees, tz
+    )
+    # Calculate the difference (in hours) from noon on the same
+    # date as the solar time, at pi/12 radians per hour
+    hour_angle = _calculate_hours_from_solar_noon(
+        local_standard_time, longitude_degrees, tz, epoch_unit
+    ) * (np.pi / 12.0)
 
-    # Create a datetime object for noon on the same date as `solar_ts`
-    try:
-        solar_noon = np.array(
-            [
-                datetime(
-                    year=x.date().year,
-                    month=x.date().month,
-                    day=x.date().day,
-                    hour=12,
-                    minute=0,
-                    second=0,
-                    tzinfo=x.tzinfo,
-                )
-                for x in solar_ts
-            ]
-        )
-    except TypeError:
-        solar_noon = datetime(
-            year=solar_ts.date().year,
-            month=solar_ts.date().month,
-            day=solar_ts.date().day,
-            hour=12,
-            minute=0,
-            second=0,
-            tzinfo=solar_ts.tzinfo,
-        )
+    # Valiate `hour_angle`
+    validate_numeric_value(
+        hour_angle,
+        minimum=-np.pi,
+        maximum=np.pi,
+        tolerance=_RADIANS_TOLERANCE,
+    )
+    if validity is None:
+        return hour_angle
+    return _mask_rows(hour_angle, validity), validity
 
-    # Calculate the difference (in hours) and multiply by 15
-    if not (isinstance(solar_noon, np.ndarray)):
-        hours_diff = (solar_ts - solar_noon).total_seconds() / 3600
-    else:
-        hours_diff = np.array(
-            [
-                (x - solar_noon[i]).total_seconds() / 3600
-                for i, x in enumerate(solar_ts)
-            ]
-        )
-    hour_angle = hours_diff * 15.0
 
-    # Valiate `hour_angle`
-    validate_numeric_value(hour_angle, minimum=-180, maximum=180)
-    return hour_angle
+def _calculate_zenith_radians(
+    sin_latitude: float,
+    cos_latitude: float,
+    declination_radians: Union[float, Iterable[float]],
+    hour_angle_radians: Union[float, Iterable[float]],
+) -> Union[float, Iterable[float]]:
+    """
+    Method to calculate the solar zenith angle, in radians, for an
+    already-validated latitude (given by its sine and cosine),
+    declination angle, and hour angle
+    (see `calculate_solar_zenith_degrees()`).
+    """
+
+    cos_zenith = (
+        cos_latitude * np.cos(declination_radians) * np.cos(hour_angle_radians)
+    ) + (sin_latitude * np.sin(declination_radians))
+    """With the sun directly overhead, rounding can carry `cos_zenith`
+    just above 1, so cap it."""
+    calculated_zenith = np.arccos(np.minimum(cos_zenith, 1.0))
+
+    return np.minimum(calculated_zenith, np.pi / 2)
 
 
 def calculate_solar_zenith_degrees(
-    latitude_degrees: Union[int, float],
+    latitude_degrees: Union[int, float, Iterable[float], Site],
     declination_degrees: Union[int, float, Iterable[Union[int, float]]],
     hour_angle_degrees: Union[int, float, Iterable[Union[int, float]]],
-) -> Union[float, Iterable[float]]:
+    errors: str = "raise",
+) -> Union[float, Iterable[float], Tuple[Iterable[float], Validity]]:
     """
     The solar zenith angle is the angle between
     the vertical and the line to the sun, that is,
@@ -395,6 +1256,8 @@ def calculate_solar_zenith_degrees(
     :param latitude_degrees: A numeric value representing a location's
         position north (positive) or south (negative) of the equator,
         which must be between -90 and 90 degrees.
+        A `pysoleng.site.Site` may be given instead, or a numpy
+        array with one latitude per row (e.g., for a moving platform).
     :param declination_degrees: A numeric value representing
         the declination angle of the sun,
         which must be between -23.45 and 23.45 degrees.
@@ -403,37 +1266,100 @@ def calculate_solar_zenith_degrees(
         or west (positive) of the local meridian due to rotation
         of the earth on its axis at 15 degrees per hour,
         which must be between -180 and 180 degrees.
+    :param errors: "raise" (the default) to raise a ValueError for
+        a NaN or out-of-range `declination_degrees` or
+        `hour_angle_degrees` value, or "mask" to set the rows with
+        such a value to NaN instead.
 
     :returns: A float value representing the solar zenith angle in degrees.
+        With `errors="mask"`, a tuple of the solar zenith angle and
+        its `pysoleng.utils.Validity`.
     """
 
     # Validate arguments
-    validate_numeric_value(value=latitude_degrees, minimum=-90, maximum=90)
-    validate_numeric_value(
-        value=declination_degrees, minimum=-23.45, maximum=23.45
+    sin_latitude, cos_latitude = _resolve_latitude_trig(latitude_degrees)
+    (declination_degrees, hour_angle_degrees), validity = _validate_rows(
+        errors,
+        _declination_and_hour_angle_checks(
+            declination_degrees, hour_angle_degrees
+        ),
+        latitude_degrees=latitude_degrees,
     )
-    validate_numeric_value(value=hour_angle_degrees, minimum=-180, maximum=180)
 
-    calculated_zenith = np.degrees(
-        np.arccos(
-            (
-                np.cos(np.radians(latitude_degrees))
-                * np.cos(np.radians(declination_degrees))
-                * np.cos(np.radians(hour_angle_degrees))
-            )
-            + (
-                np.sin(np.radians(latitude_degrees))
-                * np.sin(np.radians(declination_degrees))
-            )
+    solar_zenith_degrees = np.degrees(
+        _calculate_zenith_radians(
+            sin_latitude=sin_latitude,
+            cos_latitude=cos_latitude,
+            declination_radians=np.radians(declination_degrees),
+            hour_angle_radians=np.radians(hour_angle_degrees),
         )
     )
 
-    return np.minimum(calculated_zenith, 90.0)
+    if validity is None:
+        return solar_zenith_degrees
+    return _mask_rows(solar_zenith_degrees, validity), validity
+
+
+def calculate_solar_zenith_radians(
+    latitude_radians: Union[int, float, Iterable[float], Site],
+    declination_radians: Union[int, float, Iterable[Union[int, float]]],
+    hour_angle_radians: Union[int, float, Iterable[Union[int, float]]],
+    errors: str = "raise",
+) -> Union[float, Iterable[float], Tuple[Iterable[float], Validity]]:
+    """
+    The solar zenith angle (see `calculate_solar_zenith_degrees()`),
+    in units of radians, which must be between 0 and pi/2.
+
+    The equation used is from Duffie & Beckman (2006)
+    Equation 1.6.5.
+
+    :param latitude_radians: A numeric value representing a location's
+        position north (positive) or south (negative) of the equator,
+        which must be between -pi/2 and pi/2 radians.
+        A `pysoleng.site.Site` may be given instead, or a numpy
+        array with one latitude per row (e.g., for a moving platform).
+    :param declination_radians: A numeric value representing
+        the declination angle of the sun, in radians.
+    :param hour_angle_radians: A numeric value corresponding
+        to the angular displacement of the sun east (negative)
+        or west (positive) of the local meridian,
+        which must be between -pi and pi radians.
+    :param errors: "raise" (the default) or "mask"
+        (see `calculate_solar_zenith_degrees()`).
+
+    :returns: A float value representing the solar zenith angle
+        in radians.  With `errors="mask"`, a tuple of the solar
+        zenith angle and its `pysoleng.utils.Validity`.
+    """
+
+    # Validate arguments
+    sin_latitude, cos_latitude = _resolve_latitude_trig(
+        latitude_radians, in_radians=True
+    )
+    (declination_radians, hour_angle_radians), validity = _validate_rows(
+        errors,
+        _declination_and_hour_angle_checks(
+            declination_radians, hour_angle_radians, in_radians=True
+        ),
+        latitude_radians=latitude_radians,
+    )
+
+    solar_zenith_radians = _calculate_zenith_radians(
+        sin_latitude=sin_latitude,
+        cos_latitude=cos_latitude,
+        declination_radians=declination_radians,
+        hour_angle_radians=hour_angle_radians,
+    )
+
+    if validity is None:
+        return solar_zenith_radians
+    return _mask_rows(solar_zenith_radians, validity), validity
 
 
 def calculate_solar_altitude_degrees(
-    solar_zenith_degrees: Union[float, Iterable[float]]
-) -> Union[float, Iterable[float]]:
+    solar_zenith_degrees: Union[float, Iterable[float]],
+    errors: str = "raise",
+) -> Union[float, Iterable[float], Tuple[Iterable[float], Validity]]:
     """
     The solar altitude is the angle complementing the
     solar zenith angle.  Therefore, it is the angle
@@ -442,23 +1368,46 @@ def calculate_solar_altitude_degrees(
     :param solar_zenith_degrees: A float value representing the
         sun's current zenith angle,
         which must be between 0 and 90 degrees.
+    :param errors: "raise" (the default) or "mask"
+        (see `calculate_solar_zenith_degrees()`).
 
     :returns: A float value representing the solar altitude angle in degrees.
+        With `errors="mask"`, a tuple of the solar altitude angle
+        and its `pysoleng.utils.Validity`.
     """
 
     # Validate `solar_zenith_degrees`
-    validate_numeric_value(value=solar_zenith_degrees, minimum=0, maximum=90)
+    (solar_zenith_degrees,), validity = _validate_rows(
+        errors, {"solar_zenith_degrees": (solar_zenith_degrees, 0, 90, 1e-2)}
+    )
 
+    if validity is not None:
+        return _mask_rows(90.0 - solar_zenith_degrees, validity), validity
     try:
         return 90.0 - solar_zenith_degrees
     except TypeError:
         return 90.0 - np.array(solar_zenith_degrees)
 
 
+def _calculate_air_mass(
+    solar_zenith_degrees: Union[float, np.ndarray], altitude_factor: float
+) -> Union[float, np.ndarray]:
+    """
+    Method to calculate the air mass for an already-validated solar
+    zenith angle and altitude factor (see `calculate_air_mass()`).
+    """
+
+    return altitude_factor / (
+        np.cos(np.radians(solar_zenith_degrees))
+        + (0.5057 * (96.080 - solar_zenith_degrees) ** -1.634)
+    )
+
+
 def calculate_air_mass(
     solar_zenith_degrees: Union[int, float, Iterable[Union[int, float]]],
-    site_altitude_m: Union[int, float] = 0,
-) -> Union[float, Iterable[float]]:
+    site_altitude_m: Union[int, float, Site] = 0,
+    errors: str = "raise",
+) -> Union[float, Iterable[float], Tuple[Iterable[float], Validity]]:
     """
     Air mass is the ratio of the mass of atmosphere through which
     beam radiation passes to the mass it would pass through if
@@ -475,31 +1424,134 @@ def calculate_air_mass(
         altitude above sea level (0 m, the default),
         which must be at least -413 m
         (the lowest land elevation, on the shore of the Dead Sea).
+        A `pysoleng.site.Site` may be given instead.
+    :param errors: "raise" (the default) or "mask"
+        (see `calculate_solar_zenith_degrees()`).
 
     :returns: A float value representing the air mass.
+        With `errors="mask"`, a tuple of the air mass
+        and its `pysoleng.utils.Validity`.
     """
 
     # Validate `solar_zenith_degrees` and `site_altitude_m`
-    validate_numeric_value(value=solar_zenith_degrees, minimum=0, maximum=90)
-    validate_numeric_value(value=site_altitude_m, minimum=-413, maximum=None)
+    (solar_zenith_degrees,), validity = _validate_rows(
+        errors, {"solar_zenith_degrees": (solar_zenith_degrees, 0, 90, 1e-2)}
+    )
+    altitude_factor = _resolve_air_mass_altitude_factor(site_altitude_m)
 
+    if validity is not None:
+        air_mass = _calculate_air_mass(solar_zenith_degrees, altitude_factor)
+        return _mask_rows(air_mass, validity), validity
     try:
-        return np.exp(-0.0001184 * site_altitude_m) / (
-            np.cos(np.radians(solar_zenith_degrees))
-            + (0.5057 * (96.080 - solar_zenith_degrees) ** -1.634)
-        )
+        return _calculate_air_mass(solar_zenith_degrees, altitude_factor)
     except TypeError:
-        return np.exp(-0.0001184 * site_altitude_m) / (
-            np.cos(np.radians(np.array(solar_zenith_degrees)))
-            + (0.5057 * (96.080 - np.array(solar_zenith_degrees)) ** -1.634)
+        return _calculate_air_mass(
+            np.array(solar_zenith_degrees), altitude_factor
         )
 
 
+def calculate_air_mass_from_zenith_radians(
+    solar_zenith_radians: Union[int, float, Iterable[Union[int, float]]],
+    site_altitude_m: Union[int, float, Site] = 0,
+    errors: str = "raise",
+) -> Union[float, Iterable[float], Tuple[Iterable[float], Validity]]:
+    """
+    The air mass (see `calculate_air_mass()`), given the
+    solar zenith angle in radians.
+
+    The empirical correction term of Kasten and Young (1989)
+    is defined in degrees, so only that term converts the angle.
+
+    :param solar_zenith_radians: A numeric value representing the
+        sun's current zenith angle,
+        which must be between 0 and pi/2 radians.
+    :param site_altitude_m: A numeric value representing the
+        altitude above sea level (0 m, the default),
+        which must be at least -413 m.
+        A `pysoleng.site.Site` may be given instead.
+    :param errors: "raise" (the default) or "mask"
+        (see `calculate_solar_zenith_degrees()`).
+
+    :returns: A float value representing the air mass.
+        With `errors="mask"`, a tuple of the air mass
+        and its `pysoleng.utils.Validity`.
+    """
+
+    # Validate `solar_zenith_radians` and `site_altitude_m`
+    (solar_zenith_radians,), validity = _validate_rows(
+        errors,
+        {
+            "solar_zenith_radians": (
+                solar_zenith_radians,
+                0,
+                np.pi / 2,
+                _RADIANS_TOLERANCE,
+            )
+        },
+    )
+    altitude_factor = _resolve_air_mass_altitude_factor(site_altitude_m)
+
+    solar_zenith_radians = np.asarray(solar_zenith_radians, dtype=float)
+    air_mass = altitude_factor / (
+        np.cos(solar_zenith_radians)
+        + (0.5057 * (96.080 - np.degrees(solar_zenith_radians)) ** -1.634)
+    )
+
+    if validity is not None:
+        return _mask_rows(air_mass, validity), validity
+    # Return a float for a scalar input
+    return air_mass if air_mass.ndim else float(air_mass)
+
+
+def _calculate_azimuth_from_trig(
+    hour_angle: Union[int, float, Iterable[Union[int, float]]],
+    sin_latitude: float,
+    cos_latitude: float,
+    sin_declination: Union[float, np.ndarray],
+    cos_zenith: Union[float, np.ndarray],
+    sin_zenith: Union[float, np.ndarray],
+) -> Union[float, Iterable[float]]:
+    """
+    Method to calculate the solar azimuth angle from already-computed
+    sines and cosines of the latitude, declination, and zenith angles
+    (Duffie & Beckman (2006) Equation 1.6.6).  Only the sign of
+    `hour_angle` (in degrees or radians) is used.
+
+    :returns: A float value (or array of float values)
+        representing the solar azimuth angle, in radians.
+    """
+
+    cos_azimuth = ((cos_zenith * sin_latitude) - sin_declination) / (
+        sin_zenith * cos_latitude
+    )
+    """With the sun on the meridian, rounding can carry `cos_azimuth`
+    just outside of [-1, 1], so clip it."""
+    # copysign(x, y) returns `x` with the sign of `y`
+    pre = np.copysign(1, hour_angle) * np.arccos(
+        np.clip(cos_azimuth, -1.0, 1.0)
+    )
+
+    """Zero division can occur when the sun
+        is directly overhead, which is possible:
+        on the equator, on an equinox, at solar noon.
+        In this case, just return 0."""
+    if isinstance(pre, (np.ndarray, pd.Series)):
+        pre[~np.isfinite(cos_azimuth)] = 0.0
+    else:
+        if not (np.isfinite(cos_azimuth)):
+            pre = 0.0
+    return pre
+
+
 def calculate_solar_azimuth_degrees(
     hour_angle_degrees: Union[int, float, Iterable[Union[int, float]]],
-    latitude_degrees: Union[int, float],
+    latitude_degrees: Union[int, float, Iterable[float], Site],
     declination_degrees: Union[int, float, Iterable[Union[int, float]]],
-) -> Union[float, Iterable[float]]:
+    solar_zenith_degrees: Optional[
+        Union[int, float, Iterable[Union[int, float]]]
+    ] = None,
+    errors: str = "raise",
+) -> Union[float, Iterable[float], Tuple[Iterable[float], Validity]]:
     """
     The solar azimuth angle is the angular displacement from south
     of the projection of beam radiation on the horizontal plane.
@@ -517,61 +1569,458 @@ def calculate_solar_azimuth_degrees(
     :param latitude_degrees: A numeric value representing a location's
         position north (positive) or south (negative) of the equator,
         which must be between -90 and 90 degrees.
+        A `pysoleng.site.Site` may be given instead, or a numpy
+        array with one latitude per row (e.g., for a moving platform).
     :param declination_degrees: A numeric value representing
         the declination angle of the sun,
         which must be between -23.45 and 23.45 degrees.
+    :param solar_zenith_degrees: The already-calculated solar zenith
+        angle (between 0 and 90 degrees) for the same arguments,
+        or `None` (the default) to calculate it.
+    :param errors: "raise" (the default) or "mask"
+        (see `calculate_solar_zenith_degrees()`).
 
     :returns: A float value representing the solar azimuth angle.
+        With `errors="mask"`, a tuple of the solar azimuth angle
+        and its `pysoleng.utils.Validity`.
     """
 
     # Validate arguments
-    validate_numeric_value(value=hour_angle_degrees, minimum=-180, maximum=180)
-    validate_numeric_value(value=latitude_degrees, minimum=-90, maximum=90)
-    validate_numeric_value(
-        value=declination_degrees, minimum=-23.45, maximum=23.45
+    sin_latitude, cos_latitude = _resolve_latitude_trig(latitude_degrees)
+    checks = _declination_and_hour_angle_checks(
+        declination_degrees, hour_angle_degrees
+    )
+    if solar_zenith_degrees is not None:
+        checks["solar_zenith_degrees"] = (solar_zenith_degrees, 0, 90, 1e-2)
+    values, validity = _validate_rows(
+        errors, checks, latitude_degrees=latitude_degrees
+    )
+    declination_degrees, hour_angle_degrees = values[:2]
+
+    if solar_zenith_degrees is None:
+        # Calculate solar zenith angle
+        solar_zenith_degrees = np.degrees(
+            _calculate_zenith_radians(
+                sin_latitude=sin_latitude,
+                cos_latitude=cos_latitude,
+                declination_radians=np.radians(declination_degrees),
+                hour_angle_radians=np.radians(hour_angle_degrees),
+            )
+        )
+    else:
+        solar_zenith_degrees = values[2]
+    zenith_radians = np.radians(solar_zenith_degrees)
+
+    solar_azimuth_degrees = np.degrees(
+        _calculate_azimuth_from_trig(
+            hour_angle=hour_angle_degrees,
+            sin_latitude=sin_latitude,
+            cos_latitude=cos_latitude,
+            sin_declination=np.sin(np.radians(declination_degrees)),
+            cos_zenith=np.cos(zenith_radians),
+            sin_zenith=np.sin(zenith_radians),
+        )
+    )
+
+    if validity is None:
+        return solar_azimuth_degrees
+    return _mask_rows(solar_azimuth_degrees, validity), validity
+
+
+def calculate_solar_azimuth_radians(
+    hour_angle_radians: Union[int, float, Iterable[Union[int, float]]],
+    latitude_radians: Union[int, float, Iterable[float], Site],
+    declination_radians: Union[int, float, Iterable[Union[int, float]]],
+    solar_zenith_radians: Optional[
+        Union[int, float, Iterable[Union[int, float]]]
+    ] = None,
+    errors: str = "raise",
+) -> Union[float, Iterable[float], Tuple[Iterable[float], Validity]]:
+    """
+    The solar azimuth angle (see `calculate_solar_azimuth_degrees()`),
+    in units of radians.
+
+    The equation used is from Duffie & Beckman (2006)
+    Equation 1.6.6.
+
+    :param hour_angle_radians: A numeric value corresponding
+        to the angular displacement of the sun east (negative)
+        or west (positive) of the local meridian,
+        which must be between -pi and pi radians.
+    :param latitude_radians: A numeric value representing a location's
+        position north (positive) or south (negative) of the equator,
+        which must be between -pi/2 and pi/2 radians.
+        A `pysoleng.site.Site` may be given instead, or a numpy
+        array with one latitude per row (e.g., for a moving platform).
+    :param declination_radians: A numeric value representing
+        the declination angle of the sun, in radians.
+    :param solar_zenith_radians: The already-calculated solar zenith
+        angle (between 0 and pi/2 radians) for the same arguments,
+        or `None` (the default) to calculate it.
+    :param errors: "raise" (the default) or "mask"
+        (see `calculate_solar_zenith_degrees()`).
+
+    :returns: A float value representing the solar azimuth angle
+        in radians.  With `errors="mask"`, a tuple of the solar
+        azimuth angle and its `pysoleng.utils.Validity`.
+    """
+
+    # Validate arguments
+    sin_latitude, cos_latitude = _resolve_latitude_trig(
+        latitude_radians, in_radians=True
+    )
+    checks = _declination_and_hour_angle_checks(
+        declination_radians, hour_angle_radians, in_radians=True
+    )
+    if solar_zenith_radians is not None:
+        checks["solar_zenith_radians"] = (
+            solar_zenith_radians,
+            0,
+            np.pi / 2,
+            _RADIANS_TOLERANCE,
+        )
+    values, validity = _validate_rows(
+        errors, checks, latitude_radians=latitude_radians
+    )
+    declination_radians, hour_angle_radians = values[:2]
+
+    if solar_zenith_radians is None:
+        # Calculate solar zenith angle
+        solar_zenith_radians = _calculate_zenith_radians(
+            sin_latitude=sin_latitude,
+            cos_latitude=cos_latitude,
+            declination_radians=declination_radians,
+            hour_angle_radians=hour_angle_radians,
+        )
+    else:
+        solar_zenith_radians = values[2]
+
+    solar_azimuth_radians = _calculate_azimuth_from_trig(
+        hour_angle=hour_angle_radians,
+        sin_latitude=sin_latitude,
+        cos_latitude=cos_latitude,
+        sin_declination=np.sin(declination_radians),
+        cos_zenith=np.cos(solar_zenith_radians),
+        sin_zenith=np.sin(solar_zenith_radians),
+    )
+
+    if validity is None:
+        return solar_azimuth_radians
+    return _mask_rows(solar_azimuth_radians, validity), validity
+
+
+def _calculate_position(
+    sin_latitude: float,
+    cos_latitude: float,
+    declination_radians: Union[float, Iterable[float]],
+    hour_angle_radians: Union[float, Iterable[float]],
+) -> Tuple[Union[float, np.ndarray], Union[float, np.ndarray]]:
+    """
+    Method to calculate the solar zenith and azimuth angles (both in
+    radians) from one shared set of sine and cosine evaluations.
+
+    :returns: A tuple of the solar zenith and azimuth angles.
+    """
+
+    sin_declination = np.sin(declination_radians)
+    cos_zenith = (
+        cos_latitude
+        * np.cos(declination_radians)
+        * np.cos(hour_angle_radians)
+    ) + (sin_latitude * sin_declination)
+
+    """As in `calculate_solar_zenith_degrees()`, `cos_zenith` is capped
+    at 1, and the sun is held at the horizon when it is below it."""
+    cos_zenith = np.clip(cos_zenith, 0.0, 1.0)
+    solar_zenith_radians = np.arccos(cos_zenith)
+
+    solar_azimuth_radians = _calculate_azimuth_from_trig(
+        hour_angle=hour_angle_radians,
+        sin_latitude=sin_latitude,
+        cos_latitude=cos_latitude,
+        sin_declination=sin_declination,
+        cos_zenith=cos_zenith,
+        sin_zenith=np.sqrt(1.0 - cos_zenith**2),
     )
+    return solar_zenith_radians, solar_azimuth_radians
+
+
+def calculate_solar_position(
+    latitude_degrees: Union[int, float, Iterable[float], Site],
+    declination_degrees: Union[int, float, Iterable[Union[int, float]]],
+    hour_angle_degrees: Union[int, float, Iterable[Union[int, float]]],
+    errors: str = "raise",
+) -> Union[
+    Dict[str, Union[float, Iterable[float]]],
+    Tuple[Dict[str, Iterable[float]], Validity],
+]:
+    """
+    Method to calculate the solar zenith, altitude, and azimuth
+    angles together, from one shared set of sine and cosine
+    evaluations.  The results match those of
+    `calculate_solar_zenith_degrees()`,
+    `calculate_solar_altitude_degrees()`, and
+    `calculate_solar_azimuth_degrees()`, with roughly a third
+    of the trigonometric work of calling all three.
+
+    The equations used are from Duffie & Beckman (2006)
+    Equations 1.6.5 and 1.6.6.
+
+    :param latitude_degrees: A numeric value representing a location's
+        position north (positive) or south (negative) of the equator,
+        which must be between -90 and 90 degrees.
+        A `pysoleng.site.Site` may be given instead, or a numpy
+        array with one latitude per row (e.g., for a moving platform).
+    :param declination_degrees: A numeric value representing
+        the declination angle of the sun,
+        which must be between -23.45 and 23.45 degrees.
+    :param hour_angle_degrees: A numeric value corresponding
+        to the angular displacement of the sun east (negative)
+        or west (positive) of the local meridian due to rotation
+        of the earth on its axis at 15 degrees per hour,
+        which must be between -180 and 180 degrees.
+    :param errors: "raise" (the default) or "mask"
+        (see `calculate_solar_zenith_degrees()`).
+
+    :returns: A dictionary with the keys "solar_zenith_degrees",
+        "solar_altitude_degrees", and "solar_azimuth_degrees".
+        With `errors="mask"`, a tuple of the dictionary and
+        its `pysoleng.utils.Validity`.
+    """
 
-    # Calculate solar zenith angle
-    solar_zenith_degrees = calculate_solar_zenith_degrees(
+    # Validate arguments
+    sin_latitude, cos_latitude = _resolve_latitude_trig(latitude_degrees)
+    (declination_degrees, hour_angle_degrees), validity = _validate_rows(
+        errors,
+        _declination_and_hour_angle_checks(
+            declination_degrees, hour_angle_degrees
+        ),
         latitude_degrees=latitude_degrees,
-        declination_degrees=declination_degrees,
-        hour_angle_degrees=hour_angle_degrees,
     )
 
-    # copysign(x, y) returns `x` with the sign of `y`
-    pre = np.copysign(1, hour_angle_degrees) * np.abs(
-        np.degrees(
-            np.arccos(
-                (
-                    (
-                        np.cos(np.radians(solar_zenith_degrees))
-                        * np.sin(np.radians(latitude_degrees))
-                    )
-                    - np.sin(np.radians(declination_degrees))
-                )
-                / (
-                    np.sin(np.radians(solar_zenith_degrees))
-                    * np.cos(np.radians(latitude_degrees))
-                )
-            )
+    solar_zenith_radians, solar_azimuth_radians = _calculate_position(
+        sin_latitude=sin_latitude,
+        cos_latitude=cos_latitude,
+        declination_radians=np.radians(declination_degrees),
+        hour_angle_radians=np.radians(hour_angle_degrees),
+    )
+    solar_zenith_degrees = np.degrees(solar_zenith_radians)
+
+    position = {
+        "solar_zenith_degrees": solar_zenith_degrees,
+        "solar_altitude_degrees": 90.0 - solar_zenith_degrees,
+        "solar_azimuth_degrees": np.degrees(solar_azimuth_radians),
+    }
+    if validity is None:
+        return position
+    return {
+        key: _mask_rows(value, validity) for key, value in position.items()
+    }, validity
+
+
+def calculate_solar_position_radians(
+    latitude_radians: Union[int, float, Iterable[float], Site],
+    declination_radians: Union[int, float, Iterable[Union[int, float]]],
+    hour_angle_radians: Union[int, float, Iterable[Union[int, float]]],
+    errors: str = "raise",
+) -> Union[
+    Dict[str, Union[float, Iterable[float]]],
+    Tuple[Dict[str, Iterable[float]], Validity],
+]:
+    """
+    The solar zenith, altitude, and azimuth angles
+    (see `calculate_solar_position()`), in units of radians.
+
+    The equations used are from Duffie & Beckman (2006)
+    Equations 1.6.5 and 1.6.6.
+
+    :param latitude_radians: A numeric value representing a location's
+        position north (positive) or south (negative) of the equator,
+        which must be between -pi/2 and pi/2 radians.
+        A `pysoleng.site.Site` may be given instead, or a numpy
+        array with one latitude per row (e.g., for a moving platform).
+    :param declination_radians: A numeric value representing
+        the declination angle of the sun, in radians.
+    :param hour_angle_radians: A numeric value corresponding
+        to the angular displacement of the sun east (negative)
+        or west (positive) of the local meridian,
+        which must be between -pi and pi radians.
+    :param errors: "raise" (the default) or "mask"
+        (see `calculate_solar_zenith_degrees()`).
+
+    :returns: A dictionary with the keys "solar_zenith_radians",
+        "solar_altitude_radians", and "solar_azimuth_radians".
+        With `errors="mask"`, a tuple of the dictionary and
+        its `pysoleng.utils.Validity`.
+    """
+
+    # Validate arguments
+    sin_latitude, cos_latitude = _resolve_latitude_trig(
+        latitude_radians, in_radians=True
+    )
+    (declination_radians, hour_angle_radians), validity = _validate_rows(
+        errors,
+        _declination_and_hour_angle_checks(
+            declination_radians, hour_angle_radians, in_radians=True
+        ),
+        latitude_radians=latitude_radians,
+    )
+
+    solar_zenith_radians, solar_azimuth_radians = _calculate_position(
+        sin_latitude=sin_latitude,
+        cos_latitude=cos_latitude,
+        declination_radians=declination_radians,
+        hour_angle_radians=hour_angle_radians,
+    )
+
+    position = {
+        "solar_zenith_radians": solar_zenith_radians,
+        "solar_altitude_radians": np.pi / 2 - solar_zenith_radians,
+        "solar_azimuth_radians": solar_azimuth_radians,
+    }
+    if validity is None:
+        return position
+    return {
+        key: _mask_rows(value, validity) for key, value in position.items()
+    }, validity
+
+
+def _calculate_sunset_hour_angle_radians(
+    sin_latitude: float,
+    cos_latitude: float,
+    declination_radians: Union[float, np.ndarray],
+) -> Union[float, np.ndarray]:
+    """
+    Method to calculate the sunset hour angle, in radians, for an
+    already-validated latitude (given by its sine and cosine) and
+    declination angle (see `calculate_sunset_hour_angle_degrees()`).
+    """
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cos_sunset = -(sin_latitude * np.sin(declination_radians)) / (
+            cos_latitude * np.cos(declination_radians)
+        )
+    """With no sunset (cos_sunset < -1) the sun is up all day, and with
+    no sunrise (cos_sunset > 1) it is down all day.  At a pole on an
+    equinox (0 / 0), treat the sun as up all day."""
+    cos_sunset = np.where(np.isnan(cos_sunset), -1.0, cos_sunset)
+    return np.arccos(np.clip(cos_sunset, -1.0, 1.0))
+
+
+def calculate_sunset_hour_angle_degrees(
+    latitude_degrees: Union[int, float, Iterable[float], Site],
+    declination_degrees: Union[int, float, Iterable[Union[int, float]]],
+) -> Union[float, Iterable[float]]:
+    """
+    The sunset hour angle is the hour angle at which the solar
+    zenith angle reaches 90 degrees; the sun is above the horizon
+    while the magnitude of the hour angle is less than it.
+    It is 0 degrees when the sun does not rise, and 180 degrees
+    when it does not set.
+
+    The equation used is from Duffie & Beckman (2006)
+    Equation 1.6.10.
+
+    :param latitude_degrees: A numeric value representing a location's
+        position north (positive) or south (negative) of the equator,
+        which must be between -90 and 90 degrees.
+        A `pysoleng.site.Site` may be given instead, or a numpy
+        array with one latitude per row (e.g., for a moving platform).
+    :param declination_degrees: A numeric value representing
+        the declination angle of the sun,
+        which must be between -23.45 and 23.45 degrees.
+
+    :returns: A float value representing the sunset hour angle
+        in degrees, between 0 and 180.
+    """
+
+    # Validate arguments
+    sin_latitude, cos_latitude = _resolve_latitude_trig(latitude_degrees)
+    validate_numeric_value(
+        value=declination_degrees, minimum=-23.45, maximum=23.45
+    )
+    _validate_alignment(
+        {
+            "latitude_degrees": latitude_degrees,
+            "declination_degrees": declination_degrees,
+        }
+    )
+
+    sunset_hour_angle_degrees = np.degrees(
+        _calculate_sunset_hour_angle_radians(
+            sin_latitude=sin_latitude,
+            cos_latitude=cos_latitude,
+            declination_radians=np.radians(declination_degrees),
         )
     )
+    return (
+        sunset_hour_angle_degrees
+        if sunset_hour_angle_degrees.ndim
+        else float(sunset_hour_angle_degrees)
+    )
 
-    """Zero division can occur when the sun
-        is directly overhead, which is possible:
-        on the equator, on an equinox, at solar noon.
-        In this case, just return 0."""
-    if isinstance(pre, (np.ndarray, pd.Series)):
-        pre[~np.isfinite(pre)] = 0.0
-    else:
-        if not (np.isfinite(pre)):
-            pre = 0.0
-    return pre
+
+def _calculate_daylight_positions(
+    sin_latitude: Union[float, np.ndarray],
+    cos_latitude: Union[float, np.ndarray],
+    declination_degrees: np.ndarray,
+    hour_angle_degrees: np.ndarray,
+    sunset_hour_angle_degrees: np.ndarray,
+    altitude_factor: Union[float, np.ndarray],
+) -> Dict[str, np.ndarray]:
+    """
+    Method to calculate the solar zenith, altitude, and azimuth angles
+    and the air mass (as `calculate_solar_position()` and
+    `calculate_air_mass()` do) only for the rows in daylight, where
+    the magnitude of the hour angle is at most the sunset hour angle,
+    for already-validated arguments.  Night rows are filled with a
+    zenith angle of 90 degrees (the sun held at the horizon, as the
+    full calculation does), an altitude angle of 0 degrees, and an
+    azimuth angle and air mass of NaN.  The latitude and altitude
+    terms may be single values or per-row arrays.
+
+    :returns: A dictionary with the keys "solar_zenith_degrees",
+        "solar_altitude_degrees", "solar_azimuth_degrees", and
+        "air_mass".
+    """
+
+    daylight = np.abs(hour_angle_degrees) <= sunset_hour_angle_degrees
+
+    def daylight_rows(value: Union[float, np.ndarray]) -> Any:
+        # Select the daylight rows of a per-row (or a single) value
+        return np.asarray(value)[daylight] if np.ndim(value) else value
+
+    solar_zenith_degrees = np.full(daylight.shape, 90.0)
+    solar_azimuth_degrees = np.full(daylight.shape, np.nan)
+    air_mass = np.full(daylight.shape, np.nan)
+
+    solar_zenith_radians, solar_azimuth_radians = _calculate_position(
+        sin_latitude=daylight_rows(sin_latitude),
+        cos_latitude=daylight_rows(cos_latitude),
+        declination_radians=np.radians(daylight_rows(declination_degrees)),
+        hour_angle_radians=np.radians(daylight_rows(hour_angle_degrees)),
+    )
+    solar_zenith_degrees[daylight] = np.degrees(solar_zenith_radians)
+    solar_azimuth_degrees[daylight] = np.degrees(solar_azimuth_radians)
+    air_mass[daylight] = _calculate_air_mass(
+        solar_zenith_degrees[daylight], daylight_rows(altitude_factor)
+    )
+
+    return {
+        "solar_zenith_degrees": solar_zenith_degrees,
+        "solar_altitude_degrees": 90.0 - solar_zenith_degrees,
+        "solar_azimuth_degrees": solar_azimuth_degrees,
+        "air_mass": air_mass,
+    }
 
 
 def calculate_solar_noon_in_local_standard_time(
-    local_standard_time: Union[datetime, str, Iterable[Union[datetime, str]]],
-    longitude_degrees: Union[int, float],
+    local_standard_time: Union[
+        datetime, str, Iterable[Union[datetime, str]], np.ndarray
+    ],
+    longitude_degrees: Union[int, float, Iterable[float], Site],
+    tz: Optional[Union[str, tzinfo, int, float, np.ndarray]] = None,
+    epoch_unit: str = "s",
 ) -> Union[datetime, Iterable[datetime]]:
     """
     Method to calculate solar noon given a local standard timestamp
@@ -581,74 +2030,66 @@ def calculate_solar_noon_in_local_standard_time(
     The equation used is from Duffie & Beckman (2006)
     Equation 1.5.2.
 
+    Unlike the angle calculations, this method has no `errors="mask"`
+    mode, as its results are timestamps: an invalid longitude always
+    raises a ValueError.
+
     :param local_standard_time: A `datetime` object,
         containing a timezone offset, representing the time that
-        will be converted to solar time.
+        will be converted to solar time, or (with `tz`) a numpy
+        array of integer times since the Unix epoch (UTC).
+        The offsets from UTC of an iterable of timestamps may
+        differ from row to row.
     :param longitude_degrees: A numeric value representing a location's
         angular distance west of the meridian at Greenwich, England.
         `longitude_degrees` should be between 0 and 360 degrees.
+        A `pysoleng.site.Site` may be given instead, or a numpy
+        array with one longitude per timestamp.
+    :param tz: The time zone (an IANA time zone name, a tzinfo
+        object, or a numeric offset from UTC in hours) of the
+        local standard time when `local_standard_time` is
+        an epoch array (by default, the time zone of a `Site`
+        given as `longitude_degrees`), or a numpy array of the
+        offset from UTC (in hours) of each epoch time.
+    :param epoch_unit: The unit of a numeric epoch array:
+        "s" (the default), "ms", "us", or "ns".
 
     :returns: A datetime object representing the local standard
         time that corresponds to solar noon for the given
-        date in `local_standard_time` and `longitude_degrees`.
+        date in `local_standard_time` and `longitude_degrees`
+        (a numpy array of them for an iterable, or a Pandas
+        DatetimeIndex for an epoch array).
     """
 
-    # Type- and range-check `longitude_degrees`
-    validate_numeric_value(longitude_degrees, minimum=0, maximum=360)
+    # Validate `longitude_degrees` (or take it from a `Site`)
+    longitude_degrees, tz = _resolve_longitude(longitude_degrees, tz)
     # Validate `local_standard_time`
-    local_ts = validate_datetime(datetime_object=local_standard_time)
+    local_ts = _validate_local_times(
+        local_standard_time=local_standard_time, tz=tz, epoch_unit=epoch_unit
+    )
+    _validate_longitude_rows(local_ts, longitude_degrees)
 
-    if isinstance(local_ts, pd.Series):
+    if isinstance(local_ts, _MixedOffsetTimes):
+        # Noon (wall clock) on the same date, in each row's offset
+        solar_noon = local_ts._replace(
+            wall_clock=local_ts.wall_clock.normalize() + pd.Timedelta(hours=12)
+        )
+        utc_offset = _calculate_utc_offset_hours(local_ts)
+    elif isinstance(local_ts, (pd.Series, pd.DatetimeIndex)):
+        local_index = pd.DatetimeIndex(local_ts)
         # Ensure local_ts has time zone information
-        if local_ts.dt.tz is None:
-            raise ValueError(
-                """`local_standard_time` must provide a time zone offset,
-            such as `1/1/2019 12:00 PM -06:00`."""
-            )
+        utc_offset = _calculate_utc_offset_hours(local_index)
 
-        # Calculate offset from UTC, using timezone offset in `local_ts`
-        utc_offset = (
-            local_ts.dt.tz.utcoffset(local_ts).total_seconds() // 3_600
-        )
+        """Create noon (standard time wall clock) on the same date as
+        each timestamp, in the same fixed offset from UTC."""
+        solar_noon = (
+            local_index.tz_localize(None).normalize() + pd.Timedelta(hours=12)
+        ).tz_localize(local_index.tz)
     else:
         # Ensure local_ts has time zone information
-        if local_ts.tzinfo is None:
-            raise ValueError(
-                """`local_standard_time` must provide a time zone offset,
-            such as `1/1/2019 12:00 PM -06:00`."""
-            )
-
-        # Calculate offset from UTC, using timezone offset in `local_ts`
-        utc_offset = (
-            local_ts.tzinfo.utcoffset(local_ts).total_seconds() // 3_600
-        )
-
-    """Determine the standard meridian for the given `longitude_degrees`,
-    which corresponds to 15 degrees per hour offset."""
-    standard_meridian = 15 * abs(utc_offset)
-
-    E = calculate_E_min(
-        calculate_B_degrees(calculate_day_number(local_standard_time))
-    )
-    longitude_correction_mins = 4.0 * (standard_meridian - longitude_degrees)
+        utc_offset = _calculate_utc_offset_hours(local_ts)
 
-    # Create a datetime object for noon on the same date as `solar_ts`
-    try:
-        solar_noon = np.array(
-            [
-                datetime(
-                    year=x.date().year,
-                    month=x.date().month,
-                    day=x.date().day,
-                    hour=12,
-                    minute=0,
-                    second=0,
-                    tzinfo=x.tzinfo,
-                )
-                for x in local_ts
-            ]
-        )
-    except TypeError:
+        # Create a datetime object for noon on the same date as `local_ts`
         solar_noon = datetime(
             year=local_ts.date().year,
             month=local_ts.date().month,
@@ -659,13 +2100,29 @@ def calculate_solar_noon_in_local_standard_time(
             tzinfo=local_ts.tzinfo,
         )
 
-    if isinstance(solar_noon, np.ndarray):
-        result = np.array(
-            [
-                x - timedelta(minutes=E[i] + longitude_correction_mins)
-                for i, x in enumerate(solar_noon)
-            ]
+    """Determine the standard meridian for the given `longitude_degrees`,
+    which corresponds to 15 degrees per hour offset."""
+    standard_meridian = 15 * np.abs(utc_offset)
+
+    E = _calculate_E_min_per_timestamp(local_ts)
+    longitude_correction_mins = 4.0 * (standard_meridian - longitude_degrees)
+
+    if isinstance(solar_noon, _MixedOffsetTimes):
+        shift = pd.to_timedelta(
+            np.asarray(E + longitude_correction_mins, dtype=float), unit="min"
+        )
+        result = _mixed_offset_times_to_timestamps(
+            solar_noon._replace(wall_clock=solar_noon.wall_clock - shift)
+        )
+        if _is_epoch_array(local_standard_time, tz):
+            result = pd.Index(result, dtype=object)
+    elif isinstance(solar_noon, pd.DatetimeIndex):
+        shift = pd.to_timedelta(
+            np.asarray(E + longitude_correction_mins, dtype=float), unit="min"
         )
+        result = solar_noon - shift
+        if not (_is_epoch_array(local_standard_time, tz)):
+            result = result.to_pydatetime()
     else:
         result = solar_noon - timedelta(minutes=E + longitude_correction_mins)
 
@@ -0,0 +1,323 @@
+import asyncio
+from datetime import datetime
+from functools import partial
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Union,
+)
+
+import numpy as np
+import pandas as pd
+
+from pysoleng.solar_geom import (
+    _calculate_daylight_positions,
+    _calculate_local_day_numbers,
+    _resolve_air_mass_altitude_factor,
+    _resolve_latitude_trig,
+    _validate_alignment,
+    calculate_air_mass,
+    calculate_daily_terms,
+    calculate_hour_angle_degrees,
+    calculate_solar_position,
+    calculate_sunset_hour_angle_degrees,
+)
+from pysoleng.utils import (
+    _MixedOffsetTimes,
+    _validate_local_times,
+    ensure_numeric,
+    validate_numeric_value,
+)
+
+# Quantities returned by `calculate_batch_positions()`
+_BATCH_KEYS = (
+    "declination_degrees",
+    "hour_angle_degrees",
+    "solar_zenith_degrees",
+    "solar_altitude_degrees",
+    "solar_azimuth_degrees",
+    "air_mass",
+)
+
+
+def calculate_batch_positions(
+    local_standard_time: Iterable[Union[datetime, str]],
+    latitude_degrees: Union[int, float, Iterable[float]],
+    longitude_degrees: Union[int, float, Iterable[float]],
+    site_altitude_m: Union[int, float, Iterable[float]] = 0,
+    daylight_only: bool = False,
+) -> Dict[str, np.ndarray]:
+    """
+    Method to calculate the solar position for a batch of timestamps
+    at a single site in one vectorized pass.
+
+    :param local_standard_time: An iterable of `datetime` objects
+        (or parse-able strings), each containing a timezone offset.
+        The offsets may differ from row to row (e.g., fleet data from
+        several regions); each row is calculated with its own offset.
+    :param latitude_degrees: A numeric value representing a location's
+        position north (positive) or south (negative) of the equator,
+        which must be between -90 and 90 degrees.
+    :param longitude_degrees: A numeric value representing a location's
+        angular distance west of the meridian at Greenwich, England.
+        `longitude_degrees` should be between 0 and 360 degrees.
+    :param site_altitude_m: A numeric value representing the
+        altitude above sea level (0 m, the default),
+        which must be at least -413 m.
+        For a moving platform (e.g., a vehicle or a ship), each of
+        `latitude_degrees`, `longitude_degrees`, and `site_altitude_m`
+        may instead be a numpy array with one value per timestamp.
+    :param daylight_only: Whether to calculate the solar position
+        only for the timestamps in daylight, found from each day's
+        sunset hour angle (see
+        `pysoleng.solar_geom.calculate_sunset_hour_angle_degrees()`),
+        filling the night rows with a zenith angle of 90 degrees, an
+        altitude angle of 0 degrees, and an azimuth angle and air mass
+        of NaN (default `False`).
+
+    :returns: A dictionary mapping each solar position quantity
+        (e.g., "solar_zenith_degrees") to a numpy array aligned with
+        `local_standard_time` (empty arrays for an empty batch).
+    """
+
+    local_standard_time = list(local_standard_time)
+    if not local_standard_time:
+        # An empty micro-batch has no rows to calculate
+        _validate_alignment(
+            {
+                "local_standard_time": local_standard_time,
+                "latitude_degrees": latitude_degrees,
+                "longitude_degrees": longitude_degrees,
+                "site_altitude_m": site_altitude_m,
+            }
+        )
+        validate_numeric_value(latitude_degrees, minimum=-90, maximum=90)
+        validate_numeric_value(longitude_degrees, minimum=0, maximum=360)
+        validate_numeric_value(site_altitude_m, minimum=-413, maximum=None)
+        return {key: np.empty(0) for key in _BATCH_KEYS}
+
+    # Offsets from UTC may differ from row to row
+    local_ts = _validate_local_times(
+        local_standard_time, tz=None, epoch_unit="s"
+    )
+    return _calculate_validated_batch_positions(
+        local_ts,
+        _calculate_local_day_numbers(local_ts),
+        latitude_degrees,
+        longitude_degrees,
+        site_altitude_m,
+        daylight_only,
+    )
+
+
+def _calculate_validated_batch_positions(
+    local_ts: Union[pd.Series, pd.DatetimeIndex, _MixedOffsetTimes],
+    day_number: np.ndarray,
+    latitude_degrees: Union[int, float, Iterable[float]],
+    longitude_degrees: Union[int, float, Iterable[float]],
+    site_altitude_m: Union[int, float, Iterable[float]],
+    daylight_only: bool,
+) -> Dict[str, np.ndarray]:
+    """
+    Method to calculate the solar position for a non-empty batch of
+    already-validated timestamps (see `calculate_batch_positions()`),
+    given the day number of each timestamp's local date.
+    """
+
+    _validate_alignment(
+        {
+            "local_standard_time": local_ts,
+            "latitude_degrees": latitude_degrees,
+            "longitude_degrees": longitude_degrees,
+            "site_altitude_m": site_altitude_m,
+        }
+    )
+
+    declination_degrees = calculate_daily_terms(day_number)[
+        "declination_degrees"
+    ]
+    hour_angle_degrees = calculate_hour_angle_degrees(
+        local_ts, longitude_degrees
+    )
+
+    if daylight_only and len(day_number):
+        if np.ndim(latitude_degrees):
+            # Calculate the sunset hour angle of each row's latitude
+            sunset_hour_angle_degrees = calculate_sunset_hour_angle_degrees(
+                latitude_degrees, declination_degrees
+            )
+        else:
+            # Calculate the sunset hour angle once per day number
+            first_day = day_number.min()
+            sunset_hour_angle_degrees = calculate_sunset_hour_angle_degrees(
+                latitude_degrees,
+                calculate_daily_terms(
+                    np.arange(first_day, day_number.max() + 1)
+                )["declination_degrees"],
+            )[day_number - first_day]
+        sin_latitude, cos_latitude = _resolve_latitude_trig(latitude_degrees)
+        return {
+            "declination_degrees": declination_degrees,
+            "hour_angle_degrees": np.asarray(hour_angle_degrees),
+            **_calculate_daylight_positions(
+                sin_latitude=sin_latitude,
+                cos_latitude=cos_latitude,
+                declination_degrees=declination_degrees,
+                hour_angle_degrees=np.asarray(hour_angle_degrees),
+                sunset_hour_angle_degrees=sunset_hour_angle_degrees,
+                altitude_factor=_resolve_air_mass_altitude_factor(
+                    site_altitude_m
+                ),
+            ),
+        }
+    position = calculate_solar_position(
+        latitude_degrees=latitude_degrees,
+        declination_degrees=declination_degrees,
+        hour_angle_degrees=hour_angle_degrees,
+    )
+
+    return {
+        "declination_degrees": np.asarray(declination_degrees),
+        "hour_angle_degrees": np.asarray(hour_angle_degrees),
+        "solar_zenith_degrees": np.asarray(position["solar_zenith_degrees"]),
+        "solar_altitude_degrees": np.asarray(
+            position["solar_altitude_degrees"]
+        ),
+        "solar_azimuth_degrees": np.asarray(
+            position["solar_azimuth_degrees"]
+        ),
+        "air_mass": np.asarray(
+            calculate_air_mass(
+                position["solar_zenith_degrees"], site_altitude_m
+            )
+        ),
+    }
+
+
+async def _micro_batches(
+    readings: AsyncIterable[Any], batch_size: int, window_seconds: float
+) -> AsyncIterator[List[Any]]:
+    """
+    Async generator grouping `readings` into lists of at most
+    `batch_size` items, emitting a partial batch once `window_seconds`
+    have passed since its first item arrived.
+    """
+
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue(maxsize=batch_size)
+    done = object()
+
+    async def _produce():
+        try:
+            async for reading in readings:
+                await queue.put(reading)
+        finally:
+            await queue.put(done)
+
+    # Pull from `readings` in a separate task, so that waiting on
+    # the window deadline never cancels the source iterator itself.
+    producer = asyncio.ensure_future(_produce())
+    try:
+        finished = False
+        while not finished:
+            reading = await queue.get()
+            if reading is done:
+                break
+            batch = [reading]
+            deadline = loop.time() + window_seconds
+            while len(batch) < batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    reading = await asyncio.wait_for(queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if reading is done:
+                    finished = True
+                    break
+                batch.append(reading)
+            yield batch
+        # Re-raise any exception raised by `readings`
+        await producer
+    finally:
+        producer.cancel()
+
+
+async def stream_solar_positions(
+    readings: AsyncIterable[Mapping[str, Any]],
+    latitude_degrees: Union[int, float],
+    longitude_degrees: Union[int, float],
+    site_altitude_m: Union[int, float] = 0,
+    timestamp_key: str = "timestamp",
+    batch_size: int = 1_000,
+    window_seconds: Union[int, float] = 1.0,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Async generator that enriches a live feed of timestamped readings
+    from a single site with the sun's position.
+
+    Readings are grouped into micro-batches of up to `batch_size`
+    readings (or whatever has arrived within `window_seconds` of the
+    first reading in the batch), and each batch is computed in one
+    vectorized pass in the event loop's default executor, so the
+    event loop is never blocked by the calculation.
+
+    :param readings: An async iterable of mappings (e.g., dictionaries),
+        each containing a timezone-aware timestamp under `timestamp_key`.
+    :param latitude_degrees: A numeric value representing a location's
+        position north (positive) or south (negative) of the equator,
+        which must be between -90 and 90 degrees.
+    :param longitude_degrees: A numeric value representing a location's
+        angular distance west of the meridian at Greenwich, England.
+        `longitude_degrees` should be between 0 and 360 degrees.
+    :param site_altitude_m: A numeric value representing the
+        altitude above sea level (0 m, the default),
+        which must be at least -413 m.
+    :param timestamp_key: The key holding each reading's timestamp
+        ("timestamp", by default).
+    :param batch_size: The maximum number of readings per batch
+        (1,000, by default).
+    :param window_seconds: The maximum time, in seconds, to wait for
+        a batch to fill before computing it (1 second, by default).
+
+    :returns: An async iterator of dictionaries, each containing the
+        original reading plus the keys returned by
+        `calculate_batch_positions()`, in the order received.
+    """
+
+    # Validate arguments
+    validate_numeric_value(latitude_degrees, minimum=-90, maximum=90)
+    validate_numeric_value(longitude_degrees, minimum=0, maximum=360)
+    validate_numeric_value(site_altitude_m, minimum=-413, maximum=None)
+    ensure_numeric(
+        batch_size,
+        valid_types=[int],
+        nan_acceptable=False,
+        inf_acceptable=False,
+    )
+    validate_numeric_value(batch_size, minimum=1, maximum=None, tolerance=0.0)
+    validate_numeric_value(window_seconds, minimum=0, maximum=None)
+
+    loop = asyncio.get_running_loop()
+    async for batch in _micro_batches(readings, batch_size, window_seconds):
+        positions = await loop.run_in_executor(
+            None,
+            partial(
+                calculate_batch_positions,
+                [reading[timestamp_key] for reading in batch],
+                latitude_degrees,
+                longitude_degrees,
+                site_altitude_m,
+            ),
+        )
+        for i, reading in enumerate(batch):
+            record = dict(reading)
+            for key, values in positions.items():
+                record[key] = float(values[i])
+            yield record
@@ -0,0 +1,274 @@
+from datetime import date, datetime
+from math import acos, cos, copysign, degrees, exp, floor, radians, sin
+from typing import Union
+
+from pysoleng.solar_geom import (
+    calculate_B_degrees,
+    calculate_declination_degrees,
+    calculate_E_min,
+)
+from pysoleng.site import Site
+from pysoleng.utils import validate_numeric_value
+
+# Ordinal (per `date.toordinal()`) of the Unix epoch, 1970-01-01
+_EPOCH_ORDINAL = 719_163
+_SECONDS_PER_DAY = 86_400
+
+
+class SolarTracker:
+    """
+    Stateful solar position calculator for a single site, intended
+    for real-time loops that advance by small, fixed time steps.
+
+    The daily terms (day number, equation of time, and declination)
+    are computed once per local date and cached; the hour angle is
+    then advanced incrementally at 15 degrees per hour.  The daily
+    terms are only recomputed when the local date rolls over.
+    Pandas is not used after construction.
+
+    As in `pysoleng.solar_geom.convert_to_solar_time()`, the standard
+    meridian is taken to be 15 degrees per hour of `utc_offset_hours`.
+
+    :param latitude_degrees: A numeric value representing a location's
+        position north (positive) or south (negative) of the equator,
+        which must be between -90 and 90 degrees.
+    :param longitude_degrees: A numeric value representing a location's
+        angular distance west of the meridian at Greenwich, England.
+        `longitude_degrees` should be between 0 and 360 degrees.
+    :param utc_offset_hours: A numeric value representing the site's
+        (standard time) offset from UTC, in hours,
+        which must be between -12 and 14 hours.
+    :param site_altitude_m: A numeric value representing the
+        altitude above sea level (0 m, the default),
+        which must be at least -413 m.
+    """
+
+    __slots__ = (
+        "latitude_degrees",
+        "longitude_degrees",
+        "utc_offset_hours",
+        "site_altitude_m",
+        "_sin_latitude",
+        "_cos_latitude",
+        "_altitude_factor",
+        "_utc_offset_seconds",
+        "_longitude_correction_mins",
+        "_local_seconds",
+        "_day_start",
+        "_day_end",
+        "_day_number",
+        "_E_min",
+        "_declination_degrees",
+        "_sin_declination",
+        "_cos_declination",
+        "_hour_angle_degrees",
+    )
+
+    def __init__(
+        self,
+        latitude_degrees: Union[int, float],
+        longitude_degrees: Union[int, float],
+        utc_offset_hours: Union[int, float],
+        site_altitude_m: Union[int, float] = 0,
+    ):
+        # Validate arguments
+        validate_numeric_value(latitude_degrees, minimum=-90, maximum=90)
+        validate_numeric_value(longitude_degrees, minimum=0, maximum=360)
+        validate_numeric_value(utc_offset_hours, minimum=-12, maximum=14)
+        validate_numeric_value(site_altitude_m, minimum=-413, maximum=None)
+
+        self.latitude_degrees = latitude_degrees
+        self.longitude_degrees = longitude_degrees
+        self.utc_offset_hours = utc_offset_hours
+        self.site_altitude_m = site_altitude_m
+
+        # Site constants that never change between updates
+        self._sin_latitude = sin(radians(latitude_degrees))
+        self._cos_latitude = cos(radians(latitude_degrees))
+        self._altitude_factor = exp(-0.0001184 * site_altitude_m)
+        self._utc_offset_seconds = utc_offset_hours * 3_600
+        # The standard meridian is taken from the whole hours of the
+        # offset, rounded down, as in pysoleng.solar_geom
+        standard_meridian = 15 * abs(self._utc_offset_seconds // 3_600)
+        self._longitude_correction_mins = 4.0 * (
+            standard_meridian - longitude_degrees
+        )
+
+        # No time has been set yet
+        self._local_seconds = None
+        self._day_start = None
+        self._day_end = None
+
+    @classmethod
+    def from_site(cls, site: Site) -> "SolarTracker":
+        """
+        Method to create a tracker for a `pysoleng.site.Site`,
+        which must have a fixed offset from UTC as its time zone.
+
+        :param site: A `pysoleng.site.Site`.
+
+        :returns: A `SolarTracker`.
+        """
+
+        if not isinstance(site, Site):
+            raise TypeError("`site` must be a `pysoleng.site.Site`.")
+        if site.utc_offset_hours is None:
+            raise ValueError(
+                "`site` must have a fixed offset from UTC as its time zone."
+            )
+        return cls(
+            site.latitude_degrees,
+            site.longitude_degrees,
+            site.utc_offset_hours,
+            site.site_altitude_m,
+        )
+
+    def at(self, timestamp: Union[datetime, int, float]) -> "SolarTracker":
+        """
+        Method to set the tracker to an absolute point in time.
+
+        :param timestamp: A time zone-aware `datetime` object, or a
+            numeric value representing seconds since the Unix epoch (UTC).
+
+        :returns: The `SolarTracker` itself, to allow chaining.
+        """
+
+        if isinstance(timestamp, datetime):
+            # Ensure `timestamp` has time zone information
+            if timestamp.tzinfo is None:
+                raise ValueError(
+                    """`timestamp` must provide a time zone offset,
+            such as `1/1/2019 12:00 PM -06:00`."""
+                )
+            epoch_seconds = timestamp.timestamp()
+        else:
+            epoch_seconds = timestamp
+
+        self._local_seconds = epoch_seconds + self._utc_offset_seconds
+        self._update_day()
+        return self
+
+    def step(self, dt: Union[int, float]) -> "SolarTracker":
+        """
+        Method to advance the tracker by `dt` seconds.
+
+        Within a local date only the hour angle is updated;
+        the daily terms are recomputed when the date rolls over.
+
+        :param dt: A numeric value representing the number of
+            seconds to advance (negative values step backward).
+
+        :returns: The `SolarTracker` itself, to allow chaining.
+        """
+
+        if self._local_seconds is None:
+            raise ValueError("`at()` must be called before `step()`.")
+
+        self._local_seconds += dt
+        if self._day_start <= self._local_seconds < self._day_end:
+            # 15 degrees per hour is 1 degree per 240 seconds
+            hour_angle = self._hour_angle_degrees + dt / 240.0
+            if hour_angle >= 180.0:
+                hour_angle -= 360.0
+            elif hour_angle < -180.0:
+                hour_angle += 360.0
+            self._hour_angle_degrees = hour_angle
+        else:
+            self._update_day()
+        return self
+
+    def _update_day(self) -> None:
+        """
+        Method to (re)compute the cached daily terms for the
+        current local date, along with the hour angle.
+        """
+
+        day_index = floor(self._local_seconds / _SECONDS_PER_DAY)
+        self._day_start = day_index * _SECONDS_PER_DAY
+        self._day_end = self._day_start + _SECONDS_PER_DAY
+
+        day_number = (
+            date.fromordinal(_EPOCH_ORDINAL + day_index).timetuple().tm_yday
+        )
+        B_degrees = calculate_B_degrees(day_number)
+        declination_degrees = calculate_declination_degrees(B_degrees)
+
+        self._day_number = day_number
+        self._E_min = float(calculate_E_min(B_degrees))
+        self._declination_degrees = float(declination_degrees)
+        self._sin_declination = sin(radians(declination_degrees))
+        self._cos_declination = cos(radians(declination_degrees))
+
+        # Recompute the hour angle exactly from the solar time of day
+        solar_seconds = self._local_seconds + 60.0 * (
+            self._longitude_correction_mins + self._E_min
+        )
+        self._hour_angle_degrees = (
+            solar_seconds % _SECONDS_PER_DAY
+        ) / 240.0 - 180.0
+
+    @property
+    def day_number(self) -> int:
+        """The day number of the year of the current local date."""
+        return self._day_number
+
+    @property
+    def E_min(self) -> float:
+        """The equation of time for the current local date, in minutes."""
+        return self._E_min
+
+    @property
+    def declination_degrees(self) -> float:
+        """The declination angle for the current local date, in degrees."""
+        return self._declination_degrees
+
+    @property
+    def hour_angle_degrees(self) -> float:
+        """The hour angle at the current time, in degrees."""
+        return self._hour_angle_degrees
+
+    @property
+    def _cos_zenith(self) -> float:
+        cos_zenith = (
+            self._cos_latitude
+            * self._cos_declination
+            * cos(radians(self._hour_angle_degrees))
+        ) + (self._sin_latitude * self._sin_declination)
+        # Guard against rounding just outside of [-1, 1]
+        return min(max(cos_zenith, -1.0), 1.0)
+
+    @property
+    def solar_zenith_degrees(self) -> float:
+        """The solar zenith angle at the current time, in degrees
+        (limited to 90 degrees, as in
+        `pysoleng.solar_geom.calculate_solar_zenith_degrees()`)."""
+        return min(degrees(acos(self._cos_zenith)), 90.0)
+
+    @property
+    def solar_altitude_degrees(self) -> float:
+        """The solar altitude angle at the current time, in degrees."""
+        return 90.0 - self.solar_zenith_degrees
+
+    @property
+    def solar_azimuth_degrees(self) -> float:
+        """The solar azimuth angle at the current time, in degrees."""
+        zenith_radians = radians(self.solar_zenith_degrees)
+        try:
+            ratio = (
+                (cos(zenith_radians) * self._sin_latitude)
+                - self._sin_declination
+            ) / (sin(zenith_radians) * self._cos_latitude)
+        except ZeroDivisionError:
+            # The sun is directly overhead, or the site is at a pole
+            return 0.0
+        ratio = min(max(ratio, -1.0), 1.0)
+        return copysign(degrees(acos(ratio)), self._hour_angle_degrees)
+
+    @property
+    def air_mass(self) -> float:
+        """The air mass at the current time."""
+        zenith_degrees = self.solar_zenith_degrees
+        return self._altitude_factor / (
+            cos(radians(zenith_degrees))
+            + (0.5057 * (96.080 - zenith_degrees) ** -1.634)
+        )
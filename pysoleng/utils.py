@@ -1,7 +1,7 @@
 from collections.abc import Iterable
-from datetime import datetime
+from datetime import datetime, timedelta, timezone, tzinfo
 from math import isinf, isnan
-from typing import Any, Iterable, Optional, Union
+from typing import Any, Dict, Iterable, NamedTuple, Optional, Tuple, Union
 
 from dateutil.parser import parse
 
@@ -9,13 +9,42 @@ import numpy as np
 import pandas as pd
 
 
+# Nanoseconds per unit of time since the Unix epoch
+_NANOSECONDS_PER_EPOCH_UNIT = {
+    "s": 1_000_000_000,
+    "ms": 1_000_000,
+    "us": 1_000,
+    "ns": 1,
+}
+# Types of the elements yielded when iterating over a Pandas object,
+# by dtype kind
+_PANDAS_ELEMENT_TYPES = {"b": bool, "i": int, "u": int, "f": float}
+
+
+class Validity(NamedTuple):
+    """
+    The validity of each row of a batch calculated with
+    `errors="mask"`.
+
+    :param mask: A boolean numpy array, `True` for each valid row.
+    :param counts: A dictionary mapping each argument checked to a
+        dictionary of the number of its invalid rows per reason
+        ("nan", "infinite", and "out_of_range").
+    """
+
+    mask: np.ndarray
+    counts: Dict[str, Dict[str, int]]
+
+
 def validate_datetime(
     datetime_object: Union[
         datetime,
         np.datetime64,
         str,
         Iterable[Union[datetime, np.datetime64, str]],
-    ]
+    ],
+    tz: Optional[Union[str, tzinfo, int, float]] = None,
+    epoch_unit: str = "s",
 ) -> Union[pd.Timestamp, Iterable[pd.Timestamp]]:
     """
     Method to validate a datetime object.
@@ -23,15 +52,31 @@ def validate_datetime(
     This method relies on the Pandas to_datetime() method for
     parsing the input into a proper datetime object.
 
+    When `tz` is given and `datetime_object` is a numpy array of
+    integers or floats (or of `datetime64` values), the array is
+    instead taken to hold times since the Unix epoch (in UTC), and is
+    converted to a DatetimeIndex in `tz` without any parsing.  Float
+    epochs are rounded to the nanosecond, and must all be finite.
+    The array's buffer is used as-is (zero-copy) for int64
+    nanoseconds or `datetime64[ns]` values.
+
     :param date_time_object: A proper datetime object, a string
         that can be parsed into a proper datetime object, or an
         iterable containing proper datetime objects or
         parse-able strings.
+    :param tz: The time zone (an IANA time zone name, a tzinfo
+        object, or a numeric offset from UTC in hours) used to
+        present an epoch array, or `None` (the default).
+    :param epoch_unit: The unit of a numeric epoch array:
+        "s" (the default), "ms", "us", or "ns".
 
     :returns: A Pandas Timestamp object, or
         a Pandas DatetimeIndex of multiple objects.
     """
 
+    if _is_epoch_array(datetime_object, tz):
+        return _epoch_to_datetime_index(datetime_object, tz, epoch_unit)
+
     try:
         return pd.to_datetime(datetime_object, infer_datetime_format=True)
     # If `datetime_object` can't be parsed, raise a ValueError.
@@ -42,6 +87,471 @@ def validate_datetime(
         )
 
 
+def _is_epoch_array(datetime_object: Any, tz: Any) -> bool:
+    """
+    Method to determine whether `datetime_object` should be
+    treated as a numpy array of times since the Unix epoch.
+    """
+
+    return (
+        (tz is not None)
+        and isinstance(datetime_object, np.ndarray)
+        and (datetime_object.dtype.kind in "iufM")
+    )
+
+
+def _epoch_to_datetime64(epoch: np.ndarray, epoch_unit: str) -> np.ndarray:
+    """
+    Method to view (or, for units other than nanoseconds, convert)
+    a numpy array of times since the Unix epoch as `datetime64[ns]`.
+    """
+
+    if epoch.dtype.kind == "M":
+        return epoch.astype("datetime64[ns]", copy=False)
+    if epoch_unit not in _NANOSECONDS_PER_EPOCH_UNIT:
+        raise ValueError(
+            f"`epoch_unit` must be one of: "
+            f"{list(_NANOSECONDS_PER_EPOCH_UNIT)}."
+        )
+    if epoch.dtype.kind == "f":
+        # Keep any fraction of the unit, to the nanosecond
+        if not np.isfinite(epoch).all():
+            raise ValueError(
+                "A float epoch array must not contain NaN or infinite values."
+            )
+        return (
+            np.round(epoch * _NANOSECONDS_PER_EPOCH_UNIT[epoch_unit])
+            .astype(np.int64)
+            .view("datetime64[ns]")
+        )
+    epoch_ns = epoch.astype(np.int64, copy=False)
+    if epoch_unit != "ns":
+        epoch_ns = epoch_ns * _NANOSECONDS_PER_EPOCH_UNIT[epoch_unit]
+    return epoch_ns.view("datetime64[ns]")
+
+
+def _epoch_to_datetime_index(
+    epoch: np.ndarray, tz: Union[str, tzinfo, int, float], epoch_unit: str
+) -> pd.DatetimeIndex:
+    """
+    Method to convert a numpy array of times since the Unix epoch
+    (in UTC) to a timezone-aware DatetimeIndex in `tz`.
+    """
+
+    if isinstance(tz, (int, float)):
+        # A numeric `tz` is a fixed offset from UTC, in hours
+        validate_numeric_value(tz, minimum=-12, maximum=14)
+        tz = timezone(timedelta(hours=tz))
+
+    # The int64 values of a timezone-aware DatetimeArray are in UTC
+    return pd.DatetimeIndex(
+        pd.arrays.DatetimeArray(
+            _epoch_to_datetime64(epoch, epoch_unit),
+            dtype=pd.DatetimeTZDtype(tz=tz),
+            copy=False,
+        ),
+        copy=False,
+    )
+
+
+class _MixedOffsetTimes(NamedTuple):
+    """
+    Timezone-aware times whose offsets from UTC differ from row to
+    row, which no single Pandas time zone can hold.
+
+    :param wall_clock: A (timezone-naive) Pandas DatetimeIndex of the
+        local wall clock time of each row.
+    :param utc_offset_ns: An int64 numpy array of the offset from UTC
+        of each row, in nanoseconds.
+    """
+
+    wall_clock: pd.DatetimeIndex
+    utc_offset_ns: np.ndarray
+
+
+def _epoch_to_mixed_offset_times(
+    epoch: np.ndarray, utc_offset_hours: Iterable[float], epoch_unit: str
+) -> _MixedOffsetTimes:
+    """
+    Method to convert a numpy array of times since the Unix epoch
+    (in UTC) to local times, given the offset from UTC (in hours)
+    of each row.
+    """
+
+    utc_offset_hours = np.asarray(utc_offset_hours)
+    validate_numeric_value(utc_offset_hours, minimum=-12, maximum=14)
+    if utc_offset_hours.shape != epoch.shape:
+        raise ValueError(
+            "`tz` must hold one offset from UTC per timestamp "
+            f"({utc_offset_hours.shape} offsets for {epoch.shape} "
+            "timestamps)."
+        )
+    utc_offset_ns = np.round(utc_offset_hours * 3_600_000_000_000).astype(
+        np.int64
+    )
+    wall_clock_ns = (
+        _epoch_to_datetime64(epoch, epoch_unit).view(np.int64) + utc_offset_ns
+    )
+    return _MixedOffsetTimes(
+        wall_clock=pd.DatetimeIndex(wall_clock_ns.view("datetime64[ns]")),
+        utc_offset_ns=utc_offset_ns,
+    )
+
+
+def _to_mixed_offset_times(
+    datetime_objects: Iterable[Union[datetime, str]]
+) -> _MixedOffsetTimes:
+    """
+    Method to convert an iterable of timezone-aware datetime objects
+    (or parse-able strings) whose offsets from UTC may differ from
+    row to row to local times with per-row offsets.
+
+    ISO-8601 strings are parsed in one vectorized pass (see
+    `parse_iso8601_timestamps()`); anything else is parsed one
+    element at a time.
+    """
+
+    datetime_objects = list(datetime_objects)
+    if all(isinstance(value, str) for value in datetime_objects):
+        try:
+            epoch_ns, offset_minutes = parse_iso8601_timestamps(
+                datetime_objects
+            )
+            return _MixedOffsetTimes(
+                wall_clock=pd.DatetimeIndex(
+                    (epoch_ns + offset_minutes * 60_000_000_000).view(
+                        "datetime64[ns]"
+                    )
+                ),
+                utc_offset_ns=offset_minutes * np.int64(60_000_000_000),
+            )
+        except ValueError:
+            pass
+
+    epoch_ns = np.empty(len(datetime_objects), dtype=np.int64)
+    utc_offset_ns = np.empty(len(datetime_objects), dtype=np.int64)
+    for row, value in enumerate(datetime_objects):
+        timestamp = validate_datetime(value)
+        if timestamp.tzinfo is None:
+            raise ValueError(
+                f"""{value} must provide a time zone offset,
+                such as `1/1/2019 12:00 PM -06:00`."""
+            )
+        epoch_ns[row] = timestamp.value
+        # Keep the standard time offset, without any daylight saving
+        utc_offset_ns[row] = pd.Timedelta(
+            timestamp.utcoffset() - (timestamp.dst() or timedelta(0))
+        ).value
+    return _MixedOffsetTimes(
+        wall_clock=pd.DatetimeIndex(
+            (epoch_ns + utc_offset_ns).view("datetime64[ns]")
+        ),
+        utc_offset_ns=utc_offset_ns,
+    )
+
+
+def _mixed_offset_times_to_timestamps(times: _MixedOffsetTimes) -> np.ndarray:
+    """
+    Method to convert local times with per-row offsets from UTC to a
+    numpy object array of timezone-aware Pandas Timestamps, each in
+    its own fixed offset, converting all of the rows sharing an offset
+    at once.
+    """
+
+    timestamps = np.empty(len(times.wall_clock), dtype=object)
+    for utc_offset_ns in np.unique(times.utc_offset_ns):
+        rows = times.utc_offset_ns == utc_offset_ns
+        timestamps[rows] = list(
+            times.wall_clock[rows].tz_localize(
+                timezone(pd.Timedelta(utc_offset_ns).to_pytimedelta())
+            )
+        )
+    return timestamps
+
+
+def _standard_utc_offsets_ns(local_index: pd.DatetimeIndex) -> np.ndarray:
+    """
+    Method to calculate the standard time offset from UTC (the offset
+    in effect, less any daylight saving time) of each timestamp in a
+    timezone-aware DatetimeIndex.
+
+    The offsets in effect are taken from the int64 local (wall clock)
+    and UTC representations, and the daylight saving time of each
+    distinct offset is looked up once.
+
+    :returns: An int64 numpy array of offsets, in nanoseconds.
+    """
+
+    offset_ns = local_index.tz_localize(None).asi8 - local_index.asi8
+    _, first_rows, inverse = np.unique(
+        offset_ns, return_index=True, return_inverse=True
+    )
+    dst_ns = np.array(
+        [
+            pd.Timedelta(local_index[row].dst() or timedelta(0)).value
+            for row in first_rows
+        ],
+        dtype=np.int64,
+    )
+    return offset_ns - dst_ns[inverse]
+
+
+def _to_local_standard_time(
+    local_ts: Union[pd.Timestamp, pd.Series, pd.DatetimeIndex]
+) -> Union[pd.Timestamp, pd.Series, pd.DatetimeIndex, _MixedOffsetTimes]:
+    """
+    Method to present timezone-aware times in a time zone with
+    daylight saving time (e.g., "America/Chicago") in local standard
+    time, with a fixed offset from UTC, so that their wall clock times
+    never jump an hour.  Naive times, and times with a fixed offset,
+    are returned as-is.
+
+    :returns: The same type as `local_ts`, in a fixed offset, or
+        `_MixedOffsetTimes` if the standard time offsets differ
+        from row to row.
+    """
+
+    if isinstance(local_ts, pd.Timestamp):
+        if not local_ts.dst():
+            return local_ts
+        return local_ts.tz_convert(
+            timezone(local_ts.utcoffset() - local_ts.dst())
+        )
+
+    local_index = pd.DatetimeIndex(local_ts)
+    if (local_index.tz is None) or (
+        local_index.tz.utcoffset(None) is not None
+    ):
+        return local_ts
+    standard_offset_ns = _standard_utc_offsets_ns(local_index)
+    if len(np.unique(standard_offset_ns)) > 1:
+        return _MixedOffsetTimes(
+            wall_clock=pd.DatetimeIndex(
+                (local_index.asi8 + standard_offset_ns).view("datetime64[ns]")
+            ),
+            utc_offset_ns=standard_offset_ns,
+        )
+    tz = timezone(pd.Timedelta(standard_offset_ns[0]).to_pytimedelta())
+    if isinstance(local_ts, pd.Series):
+        return local_ts.dt.tz_convert(tz)
+    return local_index.tz_convert(tz)
+
+
+def _validate_local_times(
+    local_standard_time: Union[
+        datetime, str, Iterable[Union[datetime, str]], np.ndarray
+    ],
+    tz: Optional[Union[str, tzinfo, int, float, Iterable[float]]],
+    epoch_unit: str,
+) -> Union[pd.Timestamp, pd.Series, pd.DatetimeIndex, _MixedOffsetTimes]:
+    """
+    Method to validate local standard times (see `validate_datetime()`),
+    returning `_MixedOffsetTimes` when their offsets from UTC differ
+    from row to row: an epoch array with an array of per-row offsets
+    (in hours) as `tz`, or an iterable mixing offsets.  Times in a
+    time zone with daylight saving time are presented in local
+    standard time (see `_to_local_standard_time()`).
+    """
+
+    if isinstance(local_standard_time, _MixedOffsetTimes):
+        return local_standard_time
+    if _is_epoch_array(local_standard_time, tz) and np.ndim(tz) > 0:
+        return _epoch_to_mixed_offset_times(
+            local_standard_time, tz, epoch_unit
+        )
+    try:
+        local_ts = validate_datetime(
+            datetime_object=local_standard_time, tz=tz, epoch_unit=epoch_unit
+        )
+    except ValueError:
+        # Pandas cannot convert datetime objects with mixed offsets
+        if isinstance(local_standard_time, (str, datetime, np.ndarray)):
+            raise
+        return _to_mixed_offset_times(local_standard_time)
+    if isinstance(local_ts, (pd.Index, pd.Series)) and (
+        local_ts.dtype == object
+    ):
+        # Pandas parses mixed offsets into an Index (or Series) of objects
+        return _to_mixed_offset_times(local_standard_time)
+    return _to_local_standard_time(local_ts)
+
+
+def _days_from_civil(
+    year: np.ndarray, month: np.ndarray, day: np.ndarray
+) -> np.ndarray:
+    """
+    Method to calculate the number of days since the Unix epoch of
+    proleptic Gregorian calendar dates, with integer arithmetic on
+    arrays (the `days_from_civil` algorithm of Howard Hinnant).
+    """
+
+    # Count years from March, so the leap day ends each year
+    year = year - (month <= 2)
+    era = np.floor_divide(year, 400)
+    year_of_era = year - era * 400
+    month_of_year = month + np.where(month > 2, -3, 9)
+    day_of_year = (153 * month_of_year + 2) // 5 + day - 1
+    day_of_era = (
+        year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+    )
+    return era * 146_097 + day_of_era - 719_468
+
+
+def parse_iso8601_timestamps(
+    timestamps: Iterable[Union[str, bytes]]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Method to parse fixed-layout ISO-8601 timestamps with offsets from
+    UTC, such as `2019-01-01T12:00:00-06:00`, in one vectorized pass
+    over their characters (no per-string parsing).
+
+    Each timestamp must have the layout `YYYY-MM-DDTHH:MM:SS` (with
+    "T" or a space between the date and time), optionally followed by
+    a decimal fraction of a second (up to nine digits), and end with
+    an offset from UTC (`+HH:MM`, `-HH:MM`, or `Z`).  The offsets
+    may differ from row to row.
+
+    The results feed the epoch-array path of the
+    `pysoleng.solar_geom` methods: e.g.,
+    `calculate_hour_angle_degrees(epoch_ns, longitude_degrees,
+    tz=offset_minutes[0] / 60, epoch_unit="ns")` when all of the
+    offsets are the same.
+
+    :param timestamps: An iterable (e.g., a list, a numpy string
+        array, or a Pandas Series) of ISO-8601 strings (or bytes).
+
+    :returns: A tuple of a numpy array of int64 nanoseconds since the
+        Unix epoch (in UTC), and a numpy array of each timestamp's
+        int16 offset from UTC, in minutes.
+    """
+
+    timestamps = np.asarray(
+        timestamps
+        if isinstance(timestamps, (np.ndarray, pd.Series, pd.Index))
+        else list(timestamps)
+    ).ravel()
+    n = len(timestamps)
+    if n == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int16)
+    if timestamps.dtype.kind == "O":
+        # E.g., a Pandas Series of strings
+        if not (all(isinstance(value, str) for value in timestamps)):
+            raise TypeError("`timestamps` must contain strings.")
+        timestamps = timestamps.astype(str)
+    if timestamps.dtype.kind not in "SU":
+        raise TypeError("`timestamps` must contain strings.")
+
+    """View the (fixed-width, zero-padded) strings as a matrix of
+    character codes, stored by column (one contiguous row of codes per
+    character position), as bytes."""
+    timestamps = np.ascontiguousarray(timestamps)
+    if timestamps.dtype.kind == "S":
+        codes = timestamps.view(np.uint8).reshape(n, -1)
+    else:
+        codes = timestamps.view(np.uint32).reshape(n, -1)
+        # Non-ASCII characters are never valid anywhere
+        codes = np.where(codes < 128, codes, 255).astype(np.uint8)
+    if codes.shape[1] < 20:
+        raise ValueError(
+            "`timestamps` must be ISO-8601 strings with offsets from UTC."
+        )
+    columns = np.ascontiguousarray(codes.T)
+    rows = np.arange(n)
+
+    def uniform(value: np.ndarray) -> Union[int, np.ndarray]:
+        # A single position, when it is the same for every row
+        return int(value[0]) if (value == value[0]).all() else value
+
+    def code_at(column: Union[int, np.ndarray]) -> np.ndarray:
+        # The code at `column` (a position, or one per row) of each row
+        if isinstance(column, np.ndarray):
+            return columns[np.clip(column, 0, len(columns) - 1), rows]
+        return columns[min(max(column, 0), len(columns) - 1)]
+
+    def is_digit(column: Union[int, np.ndarray]) -> np.ndarray:
+        code = code_at(column)
+        return (code >= ord("0")) & (code <= ord("9"))
+
+    def digits(column: Union[int, np.ndarray], count: int) -> np.ndarray:
+        value = np.zeros(n, dtype=np.int64)
+        for i in range(count):
+            value = value * 10 + code_at(column + i) - ord("0")
+        return value
+
+    length = (
+        len(columns)
+        if (columns[-1] != 0).all()
+        else uniform((columns != 0).sum(axis=0))
+    )
+
+    # Offset from UTC, at the end of each string
+    utc = code_at(length - 1) == ord("Z")
+    offset_start = uniform(np.where(utc, length - 1, length - 6))
+    sign = code_at(offset_start)
+    offset_hour, offset_minute = digits(length - 5, 2), digits(length - 2, 2)
+    valid = (offset_start >= 19) & (
+        utc
+        | (
+            ((sign == ord("+")) | (sign == ord("-")))
+            & (code_at(length - 3) == ord(":"))
+            & is_digit(length - 5)
+            & is_digit(length - 4)
+            & is_digit(length - 2)
+            & is_digit(length - 1)
+            & (offset_minute <= 59)
+        )
+    )
+    offset_minutes = np.where(
+        utc,
+        0,
+        np.where(sign == ord("-"), -1, 1) * (offset_hour * 60 + offset_minute),
+    )
+    valid &= (offset_minutes >= -12 * 60) & (offset_minutes <= 14 * 60)
+
+    # Date and time, at fixed positions
+    for column in (0, 1, 2, 3, 5, 6, 8, 9, 11, 12, 14, 15, 17, 18):
+        valid &= is_digit(column)
+    valid &= (code_at(4) == ord("-")) & (code_at(7) == ord("-"))
+    valid &= (code_at(10) == ord("T")) | (code_at(10) == ord(" "))
+    valid &= (code_at(13) == ord(":")) & (code_at(16) == ord(":"))
+    year, month, day = digits(0, 4), digits(5, 2), digits(8, 2)
+    hour, minute, second = digits(11, 2), digits(14, 2), digits(17, 2)
+
+    # Fraction of a second (up to nine digits), before the offset
+    fraction_digits = offset_start - 20
+    valid &= (fraction_digits == -1) | (
+        (code_at(19) == ord("."))
+        & (fraction_digits >= 1)
+        & (fraction_digits <= 9)
+    )
+    fraction_ns = np.zeros(n, dtype=np.int64)
+    for i in range(9):
+        present = i < fraction_digits
+        if np.any(present):
+            valid &= ~present | is_digit(20 + i)
+            fraction_ns = fraction_ns * 10 + (
+                np.where(present, code_at(20 + i), ord("0")) - ord("0")
+            )
+        else:
+            fraction_ns = fraction_ns * 10
+
+    # Range-check the fields (the day against the length of its month)
+    days = _days_from_civil(year, month, day)
+    valid &= (month >= 1) & (month <= 12) & (day >= 1)
+    valid &= days < _days_from_civil(year + (month == 12), month % 12 + 1, 1)
+    valid &= (hour <= 23) & (minute <= 59) & (second <= 59)
+    if not (valid.all()):
+        row = int(np.flatnonzero(~valid)[0])
+        raise ValueError(
+            f"{timestamps[row]!r} (row {row}) is not an ISO-8601 timestamp "
+            "with an offset from UTC, such as `2019-01-01T12:00:00-06:00`."
+        )
+
+    local_seconds = days * 86_400 + hour * 3_600 + minute * 60 + second
+    epoch_ns = (local_seconds - offset_minutes * 60) * 1_000_000_000
+    return epoch_ns + fraction_ns, offset_minutes.astype(np.int16)
+
+
 def ensure_numeric(
     value,
     valid_types: Iterable[Any] = [int, float],
@@ -64,6 +574,26 @@ def ensure_numeric(
         infinite values are acceptable.
     """
 
+    element_type = _array_element_type(value)
+    if (element_type is not None) and (
+        issubclass(element_type, tuple(valid_types))
+    ):
+        """Every element of a numeric array has the same type, so only
+        the NaN and infinite checks need to look at the values, and
+        they can look at all of them at once."""
+        values = np.asarray(value)
+        if values.dtype.kind != "f":
+            return
+        invalid = np.zeros(values.shape, dtype=bool)
+        if not (nan_acceptable):
+            invalid |= np.isnan(values)
+        if not (inf_acceptable):
+            invalid |= np.isinf(values)
+        if not (invalid.any()):
+            return
+        # Raise the error for the first invalid element, as below
+        value = [values.flat[np.flatnonzero(invalid)[0]]]
+
     # Convert `value` to a list, if not already an iterable
     if not (isinstance(value, Iterable)):
         value = [value]
@@ -105,7 +635,7 @@ def validate_numeric_value(
     # Type-check `value` and `tolerance`
     ensure_numeric(
         value,
-        valid_types=[int, float],
+        valid_types=[int, float, np.number],
         nan_acceptable=False,
         inf_acceptable=True,
     )
@@ -141,6 +671,15 @@ def validate_numeric_value(
                 inf_acceptable=True,
             )
 
+    if _array_element_type(value) is not None:
+        # Range-check every element of a numeric array at once
+        values = np.asarray(value)
+        if (minimum is not None) and (values < (minimum - tolerance)).any():
+            raise ValueError(error_message)
+        if (maximum is not None) and (values > (maximum + tolerance)).any():
+            raise ValueError(error_message)
+        return
+
     # Convert `value` to a list, if not already an iterable
     if not (isinstance(value, Iterable)):
         value = [value]
@@ -159,3 +698,74 @@ def validate_numeric_value(
                 """If a maximum requirement is set and `value` is
                 more than that requirement, raise a ValueError."""
                 raise ValueError(error_message)
+
+
+def mask_numeric_value(
+    value: Union[int, float, Iterable[Union[int, float]]],
+    minimum: Optional[Union[int, float]] = None,
+    maximum: Optional[Union[int, float]] = None,
+    tolerance: [float] = 1e-2,
+) -> Tuple[np.ndarray, Dict[str, int]]:
+    """
+    Method to flag the invalid elements of a numeric value (NaN, or
+    outside of the range [minimum, maximum]), rather than raising a
+    ValueError for the first one as `validate_numeric_value()` does.
+
+    :param value: A numeric value (generally an array)
+        to be range-checked.
+    :param minimum: A numeric value representing the minimum acceptable value
+        for `value`, or `None` (the default) if no minimum is required.
+    :param maximum: A numeric value representing the maximum acceptable value
+        for `value`, or `None` (the default) if no maximum is required.
+    :param tolerance: An allowable tolerance for comparing to
+        `minimum` and `maximum` (default 1e-2).
+
+    :returns: A tuple of a boolean numpy array (`True` for each valid
+        element) and a dictionary of the number of invalid elements
+        per reason ("nan", "infinite", and "out_of_range").
+    """
+
+    # Type-check `value` (NaN and infinite values are flagged below)
+    ensure_numeric(
+        value,
+        valid_types=[int, float, np.number],
+        nan_acceptable=True,
+        inf_acceptable=True,
+    )
+
+    values = np.asarray(value, dtype=float)
+    nan = np.isnan(values)
+    in_range = ~nan
+    if minimum is not None:
+        in_range &= values >= (minimum - tolerance)
+    if maximum is not None:
+        in_range &= values <= (maximum + tolerance)
+    out_of_range = ~(in_range | nan)
+    infinite = out_of_range & np.isinf(values)
+    out_of_range &= ~infinite
+
+    return in_range, {
+        "nan": int(nan.sum()),
+        "infinite": int(infinite.sum()),
+        "out_of_range": int(out_of_range.sum()),
+    }
+
+
+def _array_element_type(value: Any) -> Optional[type]:
+    """
+    Method to determine the type of the elements yielded when
+    iterating over a numeric numpy array or Pandas Series or Index.
+
+    :returns: The element type, or `None` if `value` is not
+        such an array.
+    """
+
+    if isinstance(value, np.ndarray) and (value.dtype.kind in "biuf"):
+        return value.dtype.type
+    if (
+        isinstance(value, (pd.Series, pd.Index))
+        and isinstance(value.dtype, np.dtype)
+        and (value.dtype.kind in _PANDAS_ELEMENT_TYPES)
+    ):
+        return _PANDAS_ELEMENT_TYPES[value.dtype.kind]
+    return None
@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+
+from pysoleng.adaptive import calculate_adaptive_positions
+from pysoleng.regular import calculate_regular_positions
+from pysoleng.site import Site
+
+
+@pytest.mark.adaptive
+@pytest.mark.parametrize(
+    "start,latitude,longitude,max_error",
+    [
+        ("2020-02-13 00:00 -06:00", 43, 89.4, 0.01),
+        ("2020-06-20 00:00 -06:00", 23, 89.4, 0.01),
+        ("2020-06-20 00:00 +05:30", 70, 280, 0.1),
+        ("2020-12-21 00:00 +10:00", -33.9, 208.8, 0.001),
+    ],
+)
+def test_calculate_adaptive_positions(start, latitude, longitude, max_error):
+    """Functional test to ensure the calculate_adaptive_positions() method
+    stays within `max_error_degrees` of calculate_regular_positions()."""
+    args = (start, 2 * 86_400, "1s", latitude, longitude, 300)
+    positions = calculate_adaptive_positions(
+        *args, max_error_degrees=max_error
+    )
+    expected = calculate_regular_positions(*args)
+
+    assert positions.keys() == expected.keys()
+    for key in ("day_number", "declination_degrees", "hour_angle_degrees"):
+        np.testing.assert_array_equal(positions[key], expected[key])
+    np.testing.assert_allclose(
+        positions["solar_zenith_degrees"],
+        expected["solar_zenith_degrees"],
+        rtol=0,
+        atol=max_error,
+    )
+    np.testing.assert_allclose(
+        positions["solar_altitude_degrees"],
+        90 - positions["solar_zenith_degrees"],
+    )
+    azimuth_error = (
+        positions["solar_azimuth_degrees"]
+        - expected["solar_azimuth_degrees"]
+        + 180.0
+    ) % 360.0 - 180.0
+    assert np.abs(azimuth_error).max() <= max_error
+
+
+@pytest.mark.adaptive
+def test_site():
+    """Test that a Site can be given in place of the site arguments,
+    and that zero periods return empty arrays."""
+    site = Site(
+        latitude_degrees=43, longitude_degrees=89.4, site_altitude_m=300
+    )
+    positions = calculate_adaptive_positions(
+        "2020-02-13 00:00 -06:00", 1_440, "1min", site, site, site
+    )
+    expected = calculate_adaptive_positions(
+        "2020-02-13 00:00 -06:00", 1_440, "1min", 43, 89.4, 300
+    )
+    for key, values in expected.items():
+        np.testing.assert_allclose(positions[key], values)
+
+    positions = calculate_adaptive_positions(
+        "2020-02-13 00:00 -06:00", 0, "1min", 43, 89.4
+    )
+    for values in positions.values():
+        assert len(values) == 0
+
+
+@pytest.mark.adaptive
+@pytest.mark.parametrize("max_error", [0, -0.01, np.nan])
+def test_invalid_max_error(max_error):
+    """Test to ensure a ValueError is raised for a `max_error_degrees`
+    that is not positive."""
+    with pytest.raises(ValueError):
+        calculate_adaptive_positions(
+            "2020-02-13 00:00 -06:00",
+            10,
+            "1min",
+            43,
+            89.4,
+            max_error_degrees=max_error,
+        )
@@ -0,0 +1,129 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pysoleng.almanac import calculate_almanac
+from pysoleng.events import calculate_altitude_crossings
+from pysoleng.site import Site
+from pysoleng.solar_geom import calculate_solar_noon_in_local_standard_time
+
+LATITUDES = np.array([43.07, -33.9, 69.6, 0.0])
+LONGITUDES = np.array([89.4, 341.6, 341.0, 280.0])
+UTC_OFFSET_HOURS = np.array([-6, 2, 1, -5])
+
+
+@pytest.mark.almanac
+def test_calculate_almanac():
+    """Functional test to ensure the calculate_almanac() method matches
+    the solar noon and altitude crossing methods for every site
+    and date."""
+    almanac = calculate_almanac(
+        2024, LATITUDES, LONGITUDES, UTC_OFFSET_HOURS, block_sites=3
+    )
+    assert almanac["date"].shape == (366,)
+    for column in (
+        "sunrise_local_standard_time",
+        "solar_noon_local_standard_time",
+        "sunset_local_standard_time",
+        "day_length_hours",
+    ):
+        assert almanac[column].shape == (4, 366)
+
+    crossings = calculate_altitude_crossings(
+        almanac["date"], LATITUDES, LONGITUDES, UTC_OFFSET_HOURS
+    )
+    for key, column in (
+        ("rising_local_standard_time", "sunrise_local_standard_time"),
+        ("setting_local_standard_time", "sunset_local_standard_time"),
+    ):
+        expected = crossings[key]
+        assert (np.isnat(almanac[column]) == np.isnat(expected)).all()
+        difference = (almanac[column] - expected)[~np.isnat(expected)]
+        assert (np.abs(difference) <= np.timedelta64(500, "ms")).all()
+
+    for site in range(4):
+        hours, minutes = divmod(abs(UTC_OFFSET_HOURS[site]) * 60, 60)
+        sign = "-" if UTC_OFFSET_HOURS[site] < 0 else "+"
+        solar_noon = calculate_solar_noon_in_local_standard_time(
+            [
+                f"{day}T06:00:00{sign}{hours:02d}:{minutes:02d}"
+                for day in almanac["date"][::30]
+            ],
+            LONGITUDES[site],
+        )
+        expected = pd.DatetimeIndex(solar_noon).tz_localize(None).values
+        difference = (
+            almanac["solar_noon_local_standard_time"][site, ::30] - expected
+        )
+        assert (np.abs(difference) <= np.timedelta64(500, "ms")).all()
+
+
+@pytest.mark.almanac
+def test_day_length():
+    """Test to ensure the day length is the time from sunrise to
+    sunset, and is 0 or 24 hours in polar night or day."""
+    almanac = calculate_almanac(2023, LATITUDES, LONGITUDES, UTC_OFFSET_HOURS)
+    assert almanac["date"].shape == (365,)
+    day_length = almanac["day_length_hours"]
+    rises = ~np.isnat(almanac["sunrise_local_standard_time"])
+    # Sunset follows sunrise (on the wall clock, modulo a day)
+    seconds = (
+        almanac["sunset_local_standard_time"][rises]
+        - almanac["sunrise_local_standard_time"][rises]
+    ).astype(np.int64) % 86_400
+    assert np.allclose(seconds / 3_600, day_length[rises], atol=1e-3)
+    assert np.allclose(day_length[3], 12.0, atol=0.01)
+    # Tromso, in polar night on January 1 and polar day on June 21
+    assert day_length[2, 0] == 0
+    assert day_length[2, 171] == 24
+    assert not rises[2, [0, 171]].any()
+
+
+@pytest.mark.almanac
+def test_workers_and_site():
+    """Test to ensure the threaded calculation matches the serial one,
+    and a `Site` supplies the location and offset."""
+    serial = calculate_almanac(2024, LATITUDES, LONGITUDES, UTC_OFFSET_HOURS)
+    threaded = calculate_almanac(
+        2024,
+        LATITUDES,
+        LONGITUDES,
+        UTC_OFFSET_HOURS,
+        workers=2,
+        block_sites=1,
+    )
+    for column, values in serial.items():
+        assert np.array_equal(
+            (
+                threaded[column].view(np.int64)
+                if values.dtype.kind == "M"
+                else threaded[column]
+            ),
+            values.view(np.int64) if values.dtype.kind == "M" else values,
+        )
+
+    site = Site(latitude_degrees=43.07, longitude_degrees=89.4, tz=-6)
+    almanac = calculate_almanac(2024, site, site)
+    assert almanac["utc_offset_hours"].tolist() == [-6.0]
+    assert (
+        almanac["sunrise_local_standard_time"]
+        == serial["sunrise_local_standard_time"][:1]
+    ).all()
+
+
+@pytest.mark.almanac
+@pytest.mark.parametrize(
+    "arguments,keywords,error",
+    [
+        ((2024.0, 43, 89.4, -6), {}, TypeError),
+        ((0, 43, 89.4, -6), {}, ValueError),
+        ((2024, 43, 89.4), {}, ValueError),
+        ((2024, 91, 89.4, -6), {}, ValueError),
+        ((2024, 43, 89.4, -6), {"workers": 0}, ValueError),
+        ((2024, 43, 89.4, -6), {"block_sites": 0}, ValueError),
+    ],
+)
+def test_invalid_arguments(arguments, keywords, error):
+    """Test to ensure invalid arguments raise errors."""
+    with pytest.raises(error):
+        calculate_almanac(*arguments, **keywords)
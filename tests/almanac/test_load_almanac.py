@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+
+from pysoleng.almanac import calculate_almanac, load_almanac
+
+
+@pytest.mark.almanac
+@pytest.mark.parametrize("mmap_mode", [None, "r"])
+def test_load_almanac(tmp_path, mmap_mode):
+    """Functional test to ensure an almanac written by calculate_almanac()
+    is read back (or memory-mapped) unchanged by load_almanac()."""
+    path = str(tmp_path / "almanac.npz")
+    almanac = calculate_almanac(
+        2024,
+        np.array([43.07, 69.6]),
+        np.array([89.4, 341.0]),
+        np.array([-6, 1]),
+        path=path,
+    )
+    loaded = load_almanac(path, mmap_mode=mmap_mode)
+    assert sorted(loaded) == sorted(almanac)
+    if mmap_mode is not None:
+        assert isinstance(loaded["sunrise_local_standard_time"], np.memmap)
+    for column, values in almanac.items():
+        assert loaded[column].dtype == values.dtype
+        assert np.array_equal(
+            (
+                np.asarray(loaded[column]).view(np.int64)
+                if values.dtype.kind == "M"
+                else np.asarray(loaded[column])
+            ),
+            values.view(np.int64) if values.dtype.kind == "M" else values,
+        )
@@ -0,0 +1,114 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import pytest
+
+from pysoleng.batching import CoalescingBatcher
+from pysoleng.site import Site
+from pysoleng.streaming import calculate_batch_positions
+
+TIMESTAMPS = [f"2020-02-13 {hour:02d}:42 -06:00" for hour in range(24)]
+
+
+@pytest.mark.batching
+def test_coalescing_batcher():
+    """Functional test to ensure the CoalescingBatcher class
+    resolves each caller's request with the correct position."""
+    expected = calculate_batch_positions(TIMESTAMPS, 43, 89.4)
+    with CoalescingBatcher(
+        latitude_degrees=43, longitude_degrees=89.4
+    ) as batcher:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(batcher.calculate, TIMESTAMPS))
+    for i, result in enumerate(results):
+        assert isinstance(result, dict)
+        for key, values in expected.items():
+            assert isinstance(result[key], float)
+            assert result[key] == pytest.approx(values[i])
+
+
+@pytest.mark.batching
+def test_requests_are_coalesced():
+    """Test to ensure concurrent requests are computed together,
+    without exceeding `max_batch_size`."""
+    with CoalescingBatcher(
+        latitude_degrees=43,
+        longitude_degrees=89.4,
+        max_batch_size=8,
+        max_latency_seconds=0.5,
+    ) as batcher:
+        futures = [batcher.submit(timestamp) for timestamp in TIMESTAMPS]
+        assert all(isinstance(future, Future) for future in futures)
+        [future.result(timeout=10) for future in futures]
+        stats = batcher.stats
+
+    assert stats["requests"] == len(TIMESTAMPS)
+    assert stats["batches"] < len(TIMESTAMPS)
+    assert stats["max_batch_size"] <= 8
+    assert stats["mean_batch_size"] == pytest.approx(
+        len(TIMESTAMPS) / stats["batches"]
+    )
+    assert sum(
+        size * count for size, count in stats["batch_size_counts"].items()
+    ) == len(TIMESTAMPS)
+
+
+@pytest.mark.batching
+def test_invalid_request():
+    """Test to ensure one invalid request fails only its own future."""
+    with CoalescingBatcher(
+        latitude_degrees=43, longitude_degrees=89.4, max_latency_seconds=0.5
+    ) as batcher:
+        good = batcher.submit(TIMESTAMPS[10])
+        # Naive timestamps are not valid
+        bad = batcher.submit("2020-02-13 10:42")
+        assert good.result(timeout=10)["hour_angle_degrees"] == pytest.approx(
+            -22.46533
+        )
+        with pytest.raises(ValueError):
+            bad.result(timeout=10)
+
+
+@pytest.mark.batching
+def test_closed_batcher():
+    """Test to ensure a RuntimeError is raised when submitting
+    to a closed batcher."""
+    batcher = CoalescingBatcher(latitude_degrees=43, longitude_degrees=89.4)
+    batcher.close()
+    # Closing twice is harmless
+    batcher.close()
+    with pytest.raises(RuntimeError):
+        batcher.submit(TIMESTAMPS[0])
+
+
+@pytest.mark.batching
+def test_site():
+    """Test to ensure a Site can be given in place of the site's
+    parameters."""
+    expected = calculate_batch_positions(TIMESTAMPS[:1], 43, 89.4, 250)
+    site = Site(43, 89.4, site_altitude_m=250)
+    with CoalescingBatcher(site, site, site) as batcher:
+        result = batcher.calculate(TIMESTAMPS[0])
+    for key, values in expected.items():
+        assert result[key] == pytest.approx(values[0], nan_ok=True)
+
+
+@pytest.mark.batching
+def test_invalid_range():
+    """Test to ensure a ValueError or TypeError is raised when an
+    invalid value is provided to CoalescingBatcher."""
+    with pytest.raises(ValueError):
+        CoalescingBatcher(latitude_degrees=100, longitude_degrees=89.4)
+    with pytest.raises(ValueError):
+        CoalescingBatcher(
+            latitude_degrees=43, longitude_degrees=89.4, max_batch_size=0
+        )
+    with pytest.raises(TypeError):
+        CoalescingBatcher(
+            latitude_degrees=43, longitude_degrees=89.4, max_batch_size=2.5
+        )
+    with pytest.raises(ValueError):
+        CoalescingBatcher(
+            latitude_degrees=43,
+            longitude_degrees=89.4,
+            max_latency_seconds=-1,
+        )
@@ -0,0 +1,195 @@
+from math import nan
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from pysoleng.cache import SolarGeometryCache
+from pysoleng.site import Site
+from pysoleng.streaming import calculate_batch_positions
+
+SITE = dict(latitude_degrees=43, longitude_degrees=89.4, utc_offset_hours=-6)
+DAY_1 = dict(start="2020-02-13 00:00", end="2020-02-13 23:00", freq="1H")
+DAY_2 = dict(start="2020-02-14 00:00", end="2020-02-14 23:00", freq="1H")
+DAY_3 = dict(start="2020-02-15 00:00", end="2020-02-15 23:00", freq="1H")
+# Size of the results for one day at hourly frequency
+DAY_BYTES = 6 * 24 * 8
+
+
+@pytest.mark.cache
+def test_solar_geometry_cache():
+    """Functional test to ensure the SolarGeometryCache class
+    returns the same results as computing them directly."""
+    cache = SolarGeometryCache()
+    positions = cache.get(**SITE, **DAY_1)
+    expected = calculate_batch_positions(
+        [f"2020-02-13 {hour:02d}:00 -06:00" for hour in range(24)], 43, 89.4
+    )
+    assert set(positions) == set(expected)
+    for key, values in expected.items():
+        assert isinstance(positions[key], np.ndarray)
+        assert not positions[key].flags.writeable
+        assert positions[key] == pytest.approx(values)
+
+
+@pytest.mark.cache
+def test_memory_hits():
+    """Test to ensure repeated requests are served from memory,
+    including requests with an equivalent time range."""
+    cache = SolarGeometryCache()
+    first = cache.get(**SITE, **DAY_1)
+    for positions in (
+        cache.get(**SITE, **DAY_1),
+        cache.get(
+            **SITE,
+            start="2020-02-13 00:00 -06:00",
+            end="2020-02-14 07:00 +02:00",
+            freq="60min",
+        ),
+    ):
+        # A new dictionary of the same arrays
+        assert positions is not first
+        assert all(positions[key] is first[key] for key in first)
+    stats = cache.stats
+    assert stats["misses"] == 1
+    assert stats["memory_hits"] == 2
+    assert stats["memory_bytes"] == DAY_BYTES
+
+    # A different site is a different entry
+    cache.get(**dict(SITE, latitude_degrees=44), **DAY_1)
+    assert cache.stats["misses"] == 2
+
+
+@pytest.mark.cache
+def test_concurrent_misses():
+    """Test to ensure concurrent requests for the same entry compute
+    and store it only once."""
+    cache = SolarGeometryCache()
+    request = dict(
+        latitude_degrees=40,
+        longitude_degrees=90,
+        utc_offset_hours=-6,
+        start="2019-01-01",
+        end="2019-03-01",
+        freq="1min",
+    )
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: cache.get(**request), range(8)))
+    stats = cache.stats
+    assert stats["misses"] == 1
+    assert stats["memory_hits"] == 7
+    assert stats["memory_entries"] == 1
+    assert stats["memory_bytes"] == sum(
+        values.nbytes for values in results[0].values()
+    )
+    assert all(
+        result[key] is results[0][key] for result in results for key in result
+    )
+
+
+@pytest.mark.cache
+def test_spill_to_disk(tmp_path):
+    """Test to ensure results evicted from memory are spilled to disk,
+    served from disk, and evicted from disk by total size."""
+    cache = SolarGeometryCache(
+        max_memory_bytes=DAY_BYTES,
+        cache_dir=str(tmp_path),
+        max_disk_bytes=2 * DAY_BYTES + 2_000,
+    )
+    first = cache.get(**SITE, **DAY_1)
+    cache.get(**SITE, **DAY_2)
+    stats = cache.stats
+    assert stats["memory_evictions"] == 1
+    assert stats["memory_entries"] == 1
+    assert stats["disk_entries"] == 1
+
+    from_disk = cache.get(**SITE, **DAY_1)
+    assert cache.stats["disk_hits"] == 1
+    for key, values in first.items():
+        np.testing.assert_array_equal(from_disk[key], values)
+
+    cache.get(**SITE, **DAY_3)
+    cache.get(**dict(SITE, latitude_degrees=44), **DAY_3)
+    stats = cache.stats
+    assert stats["disk_evictions"] >= 1
+    assert stats["disk_bytes"] <= 2 * DAY_BYTES + 2_000
+    assert len(list(tmp_path.iterdir())) == stats["disk_entries"]
+
+    # A new cache reuses the files in the same directory
+    reopened = SolarGeometryCache(cache_dir=str(tmp_path))
+    assert reopened.stats["disk_entries"] == stats["disk_entries"]
+    reopened.get(**SITE, **DAY_3)
+    assert reopened.stats["disk_hits"] == 1
+
+    reopened.clear()
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.cache
+def test_returns_copy():
+    """Test to ensure changing a returned dictionary does not change
+    the cached results."""
+    cache = SolarGeometryCache()
+    positions = cache.get(**SITE, **DAY_1)
+    del positions["air_mass"]
+    positions["extra"] = np.zeros(24)
+    positions = cache.get(**SITE, **DAY_1)
+    assert "air_mass" in positions
+    assert "extra" not in positions
+
+
+@pytest.mark.cache
+@pytest.mark.parametrize(
+    "contents", [b"", b"not a zip file", b"PK\x03\x04 truncated"]
+)
+def test_corrupt_disk_entry(tmp_path, contents):
+    """Test to ensure a corrupt or truncated file on disk is dropped
+    and its results recomputed."""
+    cache = SolarGeometryCache(max_memory_bytes=0, cache_dir=str(tmp_path))
+    expected = cache.get(**SITE, **DAY_1)
+    (path,) = tmp_path.iterdir()
+    path.write_bytes(contents)
+
+    positions = cache.get(**SITE, **DAY_1)
+    stats = cache.stats
+    assert stats["disk_hits"] == 0
+    assert stats["misses"] == 2
+    for key, values in expected.items():
+        np.testing.assert_array_equal(positions[key], values)
+    # The recomputed results are spilled to disk again
+    assert stats["disk_entries"] == 1
+    assert cache.get(**SITE, **DAY_1).keys() == expected.keys()
+    assert cache.stats["disk_hits"] == 1
+
+
+@pytest.mark.cache
+def test_site():
+    """Test to ensure a Site can be given in place of the site's
+    parameters, sharing the entry of the same parameters."""
+    cache = SolarGeometryCache()
+    expected = cache.get(**SITE, **DAY_1)
+    site = Site(43, 89.4, tz=-6)
+    positions = cache.get(site, site, site, site_altitude_m=site, **DAY_1)
+    assert all(positions[key] is expected[key] for key in expected)
+    assert cache.stats["memory_hits"] == 1
+    # The offset from UTC of a time zone name is not fixed
+    site = Site(43, 89.4, tz="America/Chicago")
+    with pytest.raises(ValueError):
+        cache.get(site, site, site, **DAY_1)
+
+
+@pytest.mark.cache
+def test_invalid_range():
+    """Test to ensure a ValueError is raised when an invalid value
+    is provided to SolarGeometryCache."""
+    with pytest.raises(ValueError):
+        SolarGeometryCache(max_memory_bytes=-1)
+    cache = SolarGeometryCache()
+    with pytest.raises(ValueError):
+        cache.get(**dict(SITE, latitude_degrees=100), **DAY_1)
+    with pytest.raises(ValueError):
+        cache.get(**dict(SITE, longitude_degrees=nan), **DAY_1)
+    with pytest.raises(ValueError):
+        cache.get(**SITE, **dict(DAY_1, start="February 30, blah"))
+    with pytest.raises(ValueError):
+        cache.get(**SITE, **dict(DAY_1, start=DAY_2["start"]))
@@ -0,0 +1,120 @@
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pysoleng.events import calculate_altitude_crossings
+from pysoleng.site import Site
+from pysoleng.streaming import calculate_batch_positions
+
+
+def _altitude(times, latitude, longitude, utc_offset_hours):
+    # The library's solar altitude angle at wall clock times
+    offset = pd.Timedelta(hours=utc_offset_hours)
+    sign = "-" if offset < pd.Timedelta(0) else "+"
+    hours, minutes = divmod(abs(offset).seconds // 60, 60)
+    suffix = f"{sign}{hours:02d}:{minutes:02d}"
+    timestamps = [
+        pd.Timestamp(time).strftime("%Y-%m-%dT%H:%M:%S.%f") + suffix
+        for time in times
+    ]
+    return calculate_batch_positions(timestamps, latitude, longitude)[
+        "solar_altitude_degrees"
+    ]
+
+
+@pytest.mark.events
+def test_calculate_altitude_crossings():
+    """Functional test to ensure the calculate_altitude_crossings()
+    method matches a one-second scan of the solar altitude angle."""
+    crossings = calculate_altitude_crossings(
+        "2021-03-01", 43.07, 89.4, -6, altitude_degrees=5
+    )
+    times = pd.date_range("2021-03-01", periods=86_400, freq="1s")
+    altitude = _altitude(times, 43.07, 89.4, -6)
+    rising = np.flatnonzero((altitude[:-1] < 5) & (altitude[1:] >= 5))
+    setting = np.flatnonzero((altitude[:-1] >= 5) & (altitude[1:] < 5))
+    assert crossings["rising_local_standard_time"].shape == (1,)
+    assert times[rising[0]] == pd.Timestamp(
+        crossings["rising_local_standard_time"][0]
+    ).floor("1s")
+    assert times[setting[0]] == pd.Timestamp(
+        crossings["setting_local_standard_time"][0]
+    ).floor("1s")
+
+
+@pytest.mark.events
+def test_sites_by_dates():
+    """Test to ensure crossings for arrays of sites, dates, and altitude
+    angles bracket the altitude angles, including sites far from their
+    standard meridians, and are NaT in polar day and night."""
+    latitudes = np.array([69.6, -54.8, 0.0, 66.0])
+    longitudes = np.array([341.0, 68.3, 0.0, 200.0])
+    utc_offset_hours = np.array([1, -3, 0, 5])
+    dates = np.arange(
+        np.datetime64("2021-01-01"), np.datetime64("2022-01-01"), 7
+    )
+    crossings = calculate_altitude_crossings(
+        dates, latitudes, longitudes, utc_offset_hours, [0, 5]
+    )
+    second = np.timedelta64(1, "s")
+    for key, crossing in crossings.items():
+        assert crossing.shape == (4, len(dates), 2)
+        for site in range(4):
+            for index, altitude in enumerate([0, 5]):
+                crosses = ~np.isnat(crossing[site, :, index])
+                times = crossing[site, crosses, index]
+                # The crossings are on their local dates
+                assert (times.astype("datetime64[D]") == dates[crosses]).all()
+                before, after = (
+                    _altitude(
+                        times + step,
+                        latitudes[site],
+                        longitudes[site],
+                        utc_offset_hours[site],
+                    )
+                    for step in (-second, second)
+                )
+                if key.startswith("rising"):
+                    before, after = after, before
+                assert (before >= altitude).all()
+                assert (after <= altitude).all()
+    # No sunrise in polar night, and no sunset in polar day
+    for month_day in ("2021-01-01", "2021-06-24"):
+        index = np.flatnonzero(dates == np.datetime64(month_day))
+        assert np.isnat(
+            crossings["rising_local_standard_time"][0, index, 0]
+        ).all()
+
+
+@pytest.mark.events
+def test_site():
+    """Test to ensure a `Site` supplies the location and offset."""
+    site = Site(latitude_degrees=43.07, longitude_degrees=89.4, tz=-6)
+    expected = calculate_altitude_crossings(
+        [date(2021, 6, 21)], 43.07, 89.4, -6
+    )
+    crossings = calculate_altitude_crossings([date(2021, 6, 21)], site, site)
+    for key, values in expected.items():
+        assert (crossings[key] == values).all()
+
+
+@pytest.mark.events
+@pytest.mark.parametrize(
+    "arguments,error",
+    [
+        (("2021-01-01", 43, 89.4), ValueError),
+        (("2021-01-01", 91, 89.4, -6), ValueError),
+        (("2021-01-01", 43, 361, -6), ValueError),
+        (("2021-01-01", 43, 89.4, 15), ValueError),
+        (("2021-01-01", [43, 44], [89, 90, 91], -6), ValueError),
+        (("2021-01-01", 43, 89.4, -6, 91), ValueError),
+        (("not a date", 43, 89.4, -6), TypeError),
+        ((np.array(["2021-01-01", "NaT"]), 43, 89.4, -6), ValueError),
+    ],
+)
+def test_invalid_arguments(arguments, error):
+    """Test to ensure invalid arguments raise errors."""
+    with pytest.raises(error):
+        calculate_altitude_crossings(*arguments)
@@ -0,0 +1,117 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pysoleng.frame import FRAME_COLUMNS, SolarPositionFrame
+from pysoleng.streaming import calculate_batch_positions
+
+TIMESTAMPS = [
+    "2020-02-13 10:42 -06:00",
+    "2020-02-13 23:42 -06:00",
+    "2020-02-14 00:42 -06:00",
+]
+
+
+@pytest.fixture
+def frame():
+    return SolarPositionFrame.from_timestamps(
+        TIMESTAMPS, latitude_degrees=43, longitude_degrees=89.4
+    )
+
+
+@pytest.mark.frame
+def test_solar_position_frame(frame):
+    """Functional test to ensure the SolarPositionFrame class
+    stores results with consistent dtypes."""
+    assert len(frame) == len(TIMESTAMPS)
+    assert not hasattr(frame, "__dict__")
+    assert frame.times.dtype == np.dtype("datetime64[ns]")
+    assert frame.day_number.dtype == np.int16
+    assert list(frame.day_number) == [44, 44, 45]
+    assert frame.columns == FRAME_COLUMNS
+    for column in FRAME_COLUMNS:
+        assert frame[column].dtype == np.float64
+        assert frame[column].flags.c_contiguous
+    with pytest.raises(KeyError):
+        frame["not_a_column"]
+
+
+@pytest.mark.frame
+def test_known_values(frame):
+    """Run a test with a known answer to ensure
+    SolarPositionFrame.from_timestamps() agrees with
+    calculate_batch_positions().
+
+    These known values are taken from Duffie & Beckman (2006) Example 1.6.1.
+    """
+    assert frame["hour_angle_degrees"][0] == pytest.approx(-22.46533)
+    expected = calculate_batch_positions(TIMESTAMPS, 43, 89.4)
+    for column in FRAME_COLUMNS:
+        assert frame[column] == pytest.approx(expected[column])
+
+
+@pytest.mark.frame
+def test_zero_copy(frame):
+    """Test to ensure to_numpy() and to_pandas() share memory
+    with the frame."""
+    values = frame.to_numpy()
+    assert values.shape == (len(FRAME_COLUMNS), len(TIMESTAMPS))
+    assert np.shares_memory(values, frame["air_mass"])
+
+    df = frame.to_pandas()
+    assert isinstance(df, pd.DataFrame)
+    assert list(df.columns) == ["day_number", *FRAME_COLUMNS]
+    assert df["day_number"].dtype == np.int16
+    assert np.shares_memory(df["solar_zenith_degrees"].values, values)
+    assert np.shares_memory(df.index.asi8, frame.times)
+    assert df.index[0] == pd.Timestamp(TIMESTAMPS[0])
+    assert str(df.index[0].tz) == str(frame.tz)
+
+
+@pytest.mark.frame
+def test_mixed_offsets():
+    """Test to ensure timestamps whose offsets from UTC differ from
+    row to row are each calculated with their own offset."""
+    timestamps = ["2020-02-13 10:42 -06:00", "2020-02-13 11:42 -05:00"]
+    frame = SolarPositionFrame.from_timestamps(timestamps, 43, 89.4)
+    expected = calculate_batch_positions(timestamps, 43, 89.4)
+    for column in FRAME_COLUMNS:
+        np.testing.assert_allclose(frame[column], expected[column])
+    # The same instant, presented in UTC
+    np.testing.assert_array_equal(
+        frame.times, np.array(["2020-02-13T16:42"] * 2, "M8[ns]")
+    )
+    assert list(frame.day_number) == [44, 44]
+    assert frame.tz is None
+
+
+@pytest.mark.frame
+def test_invalid_shape():
+    """Test to ensure a ValueError is raised when misaligned
+    arrays are provided to SolarPositionFrame."""
+    times = np.array(["2020-01-01T00:00", "2020-01-01T01:00"], "M8[ns]")
+    with pytest.raises(ValueError):
+        SolarPositionFrame(times, [1, 1], np.zeros((len(FRAME_COLUMNS), 3)))
+    with pytest.raises(ValueError):
+        SolarPositionFrame(times, [1], np.zeros((len(FRAME_COLUMNS), 2)))
+    with pytest.raises(ValueError):
+        SolarPositionFrame(times, [0, 1], np.zeros((len(FRAME_COLUMNS), 2)))
+
+
+@pytest.mark.frame
+def test_from_range():
+    """Test that SolarPositionFrame.from_range() matches
+    SolarPositionFrame.from_timestamps() for the equivalent timestamps."""
+    timestamps = pd.date_range(
+        "2020-02-13 00:00 -06:00", periods=96, freq="15min"
+    )
+    frame = SolarPositionFrame.from_range(
+        "2020-02-13 00:00 -06:00", 96, "15min", 43, 89.4
+    )
+    expected = SolarPositionFrame.from_timestamps(timestamps, 43, 89.4)
+    np.testing.assert_array_equal(frame.times, expected.times)
+    np.testing.assert_array_equal(frame.day_number, expected.day_number)
+    np.testing.assert_allclose(
+        frame.to_numpy(), expected.to_numpy(), atol=1e-8
+    )
+    assert frame.to_pandas().index.equals(timestamps)
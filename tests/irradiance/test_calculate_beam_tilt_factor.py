@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from pysoleng.irradiance import calculate_beam_tilt_factor
+
+
+@pytest.mark.irradiance
+def test_calculate_beam_tilt_factor():
+    """Functional test to ensure the calculate_beam_tilt_factor() method
+    matches Duffie & Beckman (2006) Equation 1.8.1."""
+    assert np.isclose(
+        calculate_beam_tilt_factor(60, 30), np.cos(np.radians(30)) / 0.5
+    )
+    assert np.allclose(
+        calculate_beam_tilt_factor(np.array([10, 45]), np.array([10, 0])),
+        [1.0, np.sqrt(2)],
+    )
+
+
+@pytest.mark.irradiance
+def test_clamp():
+    """Test to ensure R_b is held near the horizon, and is 0 with the
+    sun behind the surface or below the horizon."""
+    near_horizon = calculate_beam_tilt_factor(
+        np.array([85.0, 87.0, 89.99]), 30
+    )
+    assert np.allclose(
+        near_horizon, np.cos(np.radians(30)) / np.cos(np.radians(85))
+    )
+    assert np.isclose(
+        calculate_beam_tilt_factor(89.99, 30, max_solar_zenith_degrees=89.99),
+        np.cos(np.radians(30)) / np.cos(np.radians(89.99)),
+    )
+    assert (
+        calculate_beam_tilt_factor(np.array([90, 30]), np.array([30, 100]))
+        == 0
+    ).all()
+
+
+@pytest.mark.irradiance
+@pytest.mark.parametrize(
+    "arguments,error",
+    [
+        ((91, 30), ValueError),
+        ((30, 181), ValueError),
+        ((30, 30, 91), ValueError),
+        ((30, "30"), TypeError),
+    ],
+)
+def test_invalid_arguments(arguments, error):
+    """Test to ensure invalid arguments raise errors."""
+    with pytest.raises(error):
+        calculate_beam_tilt_factor(*arguments)
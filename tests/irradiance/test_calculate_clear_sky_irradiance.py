@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+
+from pysoleng.irradiance import (
+    calculate_clear_sky_irradiance,
+    calculate_hottel_beam_transmittance,
+)
+from pysoleng.streaming import calculate_batch_positions
+
+
+@pytest.mark.irradiance
+def test_calculate_clear_sky_irradiance():
+    """Functional test to ensure the calculate_clear_sky_irradiance()
+    method matches Duffie & Beckman (2006) Example 2.8.1 (G_cnb of
+    about 830 W/m^2, and G_cb of about 702 W/m^2)."""
+    solar_zenith_degrees = np.degrees(np.arccos(0.846))
+    irradiance = calculate_clear_sky_irradiance(
+        solar_zenith_degrees, 1_339, 270
+    )
+    assert np.isclose(irradiance["beam_normal_W_m2"], 830, atol=2)
+    assert np.isclose(irradiance["beam_horizontal_W_m2"], 702, atol=2)
+    assert np.isclose(
+        irradiance["diffuse_horizontal_W_m2"], 1_339 * 0.846 * 0.0887, atol=1
+    )
+    assert np.isclose(
+        irradiance["global_horizontal_W_m2"],
+        irradiance["beam_horizontal_W_m2"]
+        + irradiance["diffuse_horizontal_W_m2"],
+    )
+
+
+@pytest.mark.irradiance
+def test_sites_by_timestamps():
+    """Test to ensure the calculate_clear_sky_irradiance() method
+    broadcasts over sites and timestamps, from batch positions, with no
+    irradiance while the sun is below the horizon."""
+    timestamps = [f"2020-06-21T{hour:02d}:00:00-06:00" for hour in range(24)]
+    latitudes = np.array([30.0, 45.0])
+    positions = [
+        calculate_batch_positions(timestamps, latitude, 89.4)
+        for latitude in latitudes
+    ]
+    solar_zenith_degrees = np.stack(
+        [position["solar_zenith_degrees"] for position in positions]
+    )
+    G_on_W_m2 = np.full(24, 1_322.0)
+    site_altitude_m = np.array([[0.0], [1_500.0]])
+    irradiance = calculate_clear_sky_irradiance(
+        solar_zenith_degrees, G_on_W_m2, site_altitude_m
+    )
+    for values in irradiance.values():
+        assert values.shape == (2, 24)
+        assert (values >= 0).all()
+    night = solar_zenith_degrees >= 90
+    assert night.any()
+    assert (irradiance["global_horizontal_W_m2"][night] == 0).all()
+    assert np.allclose(
+        irradiance["beam_normal_W_m2"],
+        G_on_W_m2
+        * calculate_hottel_beam_transmittance(
+            solar_zenith_degrees, site_altitude_m
+        ),
+    )
+
+
+@pytest.mark.irradiance
+def test_invalid_G_on():
+    """Test to ensure invalid extraterrestrial radiation raises errors."""
+    with pytest.raises(ValueError):
+        calculate_clear_sky_irradiance(30, -1)
+    with pytest.raises(TypeError):
+        calculate_clear_sky_irradiance(30, "1367")
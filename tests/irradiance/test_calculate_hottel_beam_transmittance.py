@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+
+from pysoleng.irradiance import calculate_hottel_beam_transmittance
+from pysoleng.site import Site
+
+
+@pytest.mark.irradiance
+def test_calculate_hottel_beam_transmittance():
+    """Functional test to ensure the calculate_hottel_beam_transmittance()
+    method matches Duffie & Beckman (2006) Example 2.8.1 (Madison,
+    270 m, midlatitude summer, cos(zenith) = 0.846)."""
+    solar_zenith_degrees = np.degrees(np.arccos(0.846))
+    assert np.isclose(
+        calculate_hottel_beam_transmittance(solar_zenith_degrees, 270),
+        0.62,
+        atol=0.005,
+    )
+    site = Site(
+        latitude_degrees=43, longitude_degrees=89.4, site_altitude_m=270
+    )
+    assert np.isclose(
+        calculate_hottel_beam_transmittance(solar_zenith_degrees, site),
+        calculate_hottel_beam_transmittance(solar_zenith_degrees, 270),
+    )
+
+
+@pytest.mark.irradiance
+def test_broadcasting():
+    """Test to ensure the calculate_hottel_beam_transmittance() method
+    broadcasts (sites, 1) altitudes over (sites, timestamps) zenith
+    angles, and is 0 with the sun at the horizon."""
+    solar_zenith_degrees = np.array([[0.0, 45.0, 90.0], [30.0, 60.0, 90.0]])
+    site_altitude_m = np.array([[0.0], [2_000.0]])
+    transmittance = calculate_hottel_beam_transmittance(
+        solar_zenith_degrees, site_altitude_m
+    )
+    assert transmittance.shape == (2, 3)
+    assert (transmittance[:, -1] == 0).all()
+    for site_index in range(2):
+        for time_index in range(2):
+            assert np.isclose(
+                transmittance[site_index, time_index],
+                calculate_hottel_beam_transmittance(
+                    solar_zenith_degrees[site_index, time_index],
+                    site_altitude_m[site_index, 0],
+                ),
+            )
+    # Transmittance falls as the sun sinks, and rises with altitude
+    assert (np.diff(transmittance[:, :2], axis=1) < 0).all()
+    assert transmittance[1, 0] > calculate_hottel_beam_transmittance(30.0)
+
+
+@pytest.mark.irradiance
+def test_climate():
+    """Test to ensure the calculate_hottel_beam_transmittance() method
+    applies the climate correction factors."""
+    assert calculate_hottel_beam_transmittance(
+        30, climate="midlatitude winter"
+    ) > calculate_hottel_beam_transmittance(30, climate="tropical")
+    with pytest.raises(ValueError):
+        calculate_hottel_beam_transmittance(30, climate="arctic")
+
+
+@pytest.mark.irradiance
+@pytest.mark.parametrize(
+    "solar_zenith_degrees,site_altitude_m,error",
+    [
+        (-1, 0, ValueError),
+        (91, 0, ValueError),
+        (np.nan, 0, ValueError),
+        ("30", 0, TypeError),
+        (30, 3_000, ValueError),
+        (30, -500, ValueError),
+    ],
+)
+def test_invalid_arguments(solar_zenith_degrees, site_altitude_m, error):
+    """Test to ensure invalid arguments raise errors."""
+    with pytest.raises(error):
+        calculate_hottel_beam_transmittance(
+            solar_zenith_degrees, site_altitude_m
+        )
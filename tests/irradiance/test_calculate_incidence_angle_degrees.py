@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from pysoleng.irradiance import calculate_incidence_angle_degrees
+from pysoleng.solar_geom import calculate_solar_position
+
+
+@pytest.mark.irradiance
+def test_calculate_incidence_angle_degrees():
+    """Functional test to ensure the calculate_incidence_angle_degrees()
+    method matches Duffie & Beckman (2006) Equation 1.6.5 for
+    south-facing surfaces (Madison, February 13, 10:30 solar time)."""
+    latitude, declination, hour_angle = 43, -14, -22.5
+    position = calculate_solar_position(latitude, declination, hour_angle)
+    slopes = np.array([0.0, 30.0, 45.0, 90.0])
+    incidence_angle_degrees = calculate_incidence_angle_degrees(
+        position["solar_zenith_degrees"],
+        position["solar_azimuth_degrees"],
+        slopes,
+        0,
+    )
+    phi, delta, omega = np.radians([latitude, declination, hour_angle])
+    expected = np.degrees(
+        np.arccos(
+            np.cos(phi - np.radians(slopes)) * np.cos(delta) * np.cos(omega)
+            + np.sin(phi - np.radians(slopes)) * np.sin(delta)
+        )
+    )
+    assert np.allclose(incidence_angle_degrees, expected)
+    # A horizontal surface sees the sun at the solar zenith angle
+    assert np.isclose(
+        incidence_angle_degrees[0], position["solar_zenith_degrees"]
+    )
+
+
+@pytest.mark.irradiance
+def test_surface_azimuth():
+    """Test to ensure a vertical surface facing the sun has an angle
+    of incidence equal to the solar altitude angle, and one facing
+    away from the sun has an angle of incidence beyond 90 degrees."""
+    assert np.isclose(calculate_incidence_angle_degrees(60, -40, 90, -40), 30)
+    assert calculate_incidence_angle_degrees(60, -40, 90, 140) > 90
+
+
+@pytest.mark.irradiance
+@pytest.mark.parametrize(
+    "arguments,error",
+    [
+        ((91, 0, 30, 0), ValueError),
+        ((30, 181, 30, 0), ValueError),
+        ((30, 0, -1, 0), ValueError),
+        ((30, 0, 30, -181), ValueError),
+        ((30, 0, "30", 0), TypeError),
+    ],
+)
+def test_invalid_arguments(arguments, error):
+    """Test to ensure invalid arguments raise errors."""
+    with pytest.raises(error):
+        calculate_incidence_angle_degrees(*arguments)
@@ -0,0 +1,29 @@
+import numpy as np
+import pytest
+
+from pysoleng.irradiance import calculate_liu_jordan_diffuse_transmittance
+
+
+@pytest.mark.irradiance
+def test_calculate_liu_jordan_diffuse_transmittance():
+    """Functional test to ensure the
+    calculate_liu_jordan_diffuse_transmittance() method matches
+    Duffie & Beckman (2006) Equation 2.8.5."""
+    assert np.isclose(
+        calculate_liu_jordan_diffuse_transmittance(0.62), 0.08872
+    )
+    assert np.allclose(
+        calculate_liu_jordan_diffuse_transmittance(np.array([0, 0.5])),
+        [0.271, 0.124],
+    )
+
+
+@pytest.mark.irradiance
+@pytest.mark.parametrize(
+    "beam_transmittance,error",
+    [(-0.1, ValueError), (1.1, ValueError), ("0.5", TypeError)],
+)
+def test_invalid_arguments(beam_transmittance, error):
+    """Test to ensure invalid arguments raise errors."""
+    with pytest.raises(error):
+        calculate_liu_jordan_diffuse_transmittance(beam_transmittance)
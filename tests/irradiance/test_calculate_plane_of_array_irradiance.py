@@ -0,0 +1,121 @@
+import numpy as np
+import pytest
+
+from pysoleng.irradiance import (
+    calculate_beam_tilt_factor,
+    calculate_plane_of_array_irradiance,
+)
+
+BEAM, DIFFUSE, ZENITH, INCIDENCE, SLOPE = 400.0, 150.0, 60.0, 25.0, 45.0
+
+
+@pytest.mark.irradiance
+def test_isotropic():
+    """Functional test to ensure the isotropic model matches
+    Duffie & Beckman (2006) Equation 2.15.1."""
+    irradiance = calculate_plane_of_array_irradiance(
+        BEAM, DIFFUSE, ZENITH, INCIDENCE, SLOPE, ground_reflectance=0.6
+    )
+    cos_slope = np.cos(np.radians(SLOPE))
+    assert np.isclose(
+        irradiance["beam_W_m2"],
+        BEAM * calculate_beam_tilt_factor(ZENITH, INCIDENCE),
+    )
+    assert np.isclose(
+        irradiance["sky_diffuse_W_m2"], DIFFUSE * (1 + cos_slope) / 2
+    )
+    assert np.isclose(
+        irradiance["ground_reflected_W_m2"],
+        (BEAM + DIFFUSE) * 0.6 * (1 - cos_slope) / 2,
+    )
+    assert np.isclose(
+        irradiance["plane_of_array_W_m2"],
+        irradiance["beam_W_m2"]
+        + irradiance["sky_diffuse_W_m2"]
+        + irradiance["ground_reflected_W_m2"],
+    )
+
+
+@pytest.mark.irradiance
+def test_hdkr():
+    """Functional test to ensure the HDKR model matches
+    Duffie & Beckman (2006) Equation 2.16.7."""
+    G_on = 1_400.0
+    irradiance = calculate_plane_of_array_irradiance(
+        BEAM,
+        DIFFUSE,
+        ZENITH,
+        INCIDENCE,
+        SLOPE,
+        model="hdkr",
+        G_on_W_m2=G_on,
+    )
+    R_b = calculate_beam_tilt_factor(ZENITH, INCIDENCE)
+    A_i = BEAM / (G_on * np.cos(np.radians(ZENITH)))
+    f = np.sqrt(BEAM / (BEAM + DIFFUSE))
+    cos_slope = np.cos(np.radians(SLOPE))
+    expected = (
+        (BEAM + DIFFUSE * A_i) * R_b
+        + DIFFUSE
+        * (1 - A_i)
+        * (1 + cos_slope)
+        / 2
+        * (1 + f * np.sin(np.radians(SLOPE / 2)) ** 3)
+        + (BEAM + DIFFUSE) * 0.2 * (1 - cos_slope) / 2
+    )
+    assert np.isclose(irradiance["plane_of_array_W_m2"], expected)
+    # Anisotropic diffuse exceeds isotropic diffuse on a sunlit surface
+    assert (
+        irradiance["sky_diffuse_W_m2"]
+        > calculate_plane_of_array_irradiance(
+            BEAM, DIFFUSE, ZENITH, INCIDENCE, SLOPE
+        )["sky_diffuse_W_m2"]
+    )
+
+
+@pytest.mark.irradiance
+@pytest.mark.parametrize("model", ["isotropic", "hdkr"])
+def test_arrays(model):
+    """Test to ensure both models broadcast arrays, stay finite through
+    sunrise and sunset, and transpose only diffuse and reflected
+    radiation with the sun below the horizon."""
+    solar_zenith_degrees = np.array([30.0, 84.0, 89.5, 89.99, 90.0])
+    irradiance = calculate_plane_of_array_irradiance(
+        np.array([600.0, 20.0, 2.0, 0.5, 0.0]),
+        np.array([100.0, 30.0, 10.0, 5.0, 5.0]),
+        solar_zenith_degrees,
+        solar_zenith_degrees - 20,
+        np.array([[0.0], [30.0]]),
+        model=model,
+        G_on_W_m2=1_367,
+    )
+    for values in irradiance.values():
+        assert values.shape == (2, 5)
+        assert np.isfinite(values).all()
+        assert (values >= 0).all()
+    assert (irradiance["beam_W_m2"][:, -1] == 0).all()
+    assert (irradiance["plane_of_array_W_m2"][:, -1] > 0).all()
+
+
+@pytest.mark.irradiance
+@pytest.mark.parametrize(
+    "arguments,keywords,error",
+    [
+        ((-1, 100, 30, 30, 30), {}, ValueError),
+        ((100, -1, 30, 30, 30), {}, ValueError),
+        ((100, 100, 30, 30, 181), {}, ValueError),
+        ((100, 100, 30, 30, 30), {"ground_reflectance": 1.5}, ValueError),
+        ((100, 100, 30, 30, 30), {"model": "perez"}, ValueError),
+        ((100, 100, 30, 30, 30), {"model": "hdkr"}, ValueError),
+        (
+            (100, 100, 30, 30, 30),
+            {"model": "hdkr", "G_on_W_m2": 0},
+            ValueError,
+        ),
+        (("100", 100, 30, 30, 30), {}, TypeError),
+    ],
+)
+def test_invalid_arguments(arguments, keywords, error):
+    """Test to ensure invalid arguments raise errors."""
+    with pytest.raises(error):
+        calculate_plane_of_array_irradiance(*arguments, **keywords)
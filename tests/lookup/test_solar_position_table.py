@@ -0,0 +1,128 @@
+from datetime import datetime, timedelta, timezone
+from math import nan
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pysoleng.lookup import TABLE_QUANTITIES, SolarPositionTable
+from pysoleng.site import Site
+from pysoleng.streaming import calculate_batch_positions
+
+CST = timezone(timedelta(hours=-6))
+
+
+@pytest.fixture(scope="module")
+def table():
+    return SolarPositionTable.build(
+        latitude_degrees=43,
+        longitude_degrees=89.4,
+        utc_offset_hours=-6,
+        year=2020,
+        resolution_minutes=30,
+    )
+
+
+@pytest.mark.lookup
+def test_solar_position_table(table):
+    """Functional test to ensure the SolarPositionTable class
+    builds and answers queries given valid arguments."""
+    assert table.values.dtype == np.float32
+    assert table.values.shape == (len(TABLE_QUANTITIES), 366 * 48 + 1)
+    positions = table.query(
+        ["2020-02-13 10:42 -06:00", "2020-07-01 15:00 -06:00"]
+    )
+    assert set(positions) == set(TABLE_QUANTITIES)
+    for values in positions.values():
+        assert isinstance(values, np.ndarray)
+        assert len(values) == 2
+    for error in table.max_error.values():
+        assert isinstance(error, float)
+
+
+@pytest.mark.lookup
+def test_max_error(table):
+    """Test to ensure interpolated daylight values are within the
+    table's measured `max_error` of the pysoleng.solar_geom methods."""
+    rng = np.random.default_rng(0)
+    epoch_seconds = datetime(2020, 1, 1, tzinfo=CST).timestamp() + np.sort(
+        rng.uniform(0, 365 * 86_400, 500)
+    )
+    timestamps = pd.to_datetime(epoch_seconds, unit="s", utc=True).tz_convert(
+        CST
+    )
+    expected = calculate_batch_positions(timestamps, 43, 89.4)
+    calculated = table.query(epoch_seconds)
+
+    daylight = expected["solar_zenith_degrees"] < 85
+    for quantity in ["solar_zenith_degrees", "solar_azimuth_degrees"]:
+        error = np.abs(calculated[quantity] - expected[quantity])[daylight]
+        assert error.max() <= 1.1 * table.max_error[quantity] + 1e-3
+    assert table.max_error["solar_zenith_degrees"] < 0.5
+
+
+@pytest.mark.lookup
+def test_query_types(table):
+    """Test to ensure epoch seconds and timezone-aware datetimes
+    give the same result."""
+    dt = datetime(2020, 2, 13, 10, 42, tzinfo=CST)
+    from_datetime = table.query(dt)
+    from_epoch = table.query(np.array([dt.timestamp()]))
+    for quantity in TABLE_QUANTITIES:
+        assert from_datetime[quantity] == pytest.approx(from_epoch[quantity])
+
+
+@pytest.mark.lookup
+@pytest.mark.parametrize("mmap_mode", [None, "r"])
+def test_save_and_load(table, tmp_path, mmap_mode):
+    """Test to ensure a table can be saved and loaded,
+    optionally memory-mapped."""
+    path = str(tmp_path / "table.npz")
+    table.save(path)
+    loaded = SolarPositionTable.load(path, mmap_mode=mmap_mode)
+    if mmap_mode is not None:
+        assert isinstance(loaded.values, np.memmap)
+    np.testing.assert_array_equal(loaded.values, table.values)
+    assert loaded.metadata == table.metadata
+    assert loaded.max_error == pytest.approx(table.max_error)
+    query = ["2020-02-13 10:42 -06:00"]
+    for quantity in TABLE_QUANTITIES:
+        assert loaded.query(query)[quantity] == pytest.approx(
+            table.query(query)[quantity]
+        )
+
+
+@pytest.mark.lookup
+def test_invalid_query(table):
+    """Test to ensure a ValueError is raised for naive timestamps,
+    or timestamps outside of the table's year."""
+    with pytest.raises(ValueError):
+        assert table.query("2020-02-13 10:42")
+    with pytest.raises(ValueError):
+        assert table.query("2021-02-13 10:42 -06:00")
+
+
+@pytest.mark.lookup
+def test_site(table):
+    """Test to ensure a Site can be given in place of the site's
+    parameters when building a table."""
+    site = Site(43, 89.4, tz=-6)
+    from_site = SolarPositionTable.build(
+        site, site, site, year=2020, resolution_minutes=30
+    )
+    assert from_site.metadata == table.metadata
+    np.testing.assert_array_equal(from_site.values, table.values)
+
+
+@pytest.mark.lookup
+def test_invalid_range():
+    """Test to ensure a ValueError or TypeError is raised when an
+    invalid value is provided to SolarPositionTable.build()."""
+    with pytest.raises(ValueError):
+        SolarPositionTable.build(100, 89.4, -6, 2020)
+    with pytest.raises(ValueError):
+        SolarPositionTable.build(43, nan, -6, 2020)
+    with pytest.raises(TypeError):
+        SolarPositionTable.build(43, 89.4, -6, 2020.5)
+    with pytest.raises(ValueError):
+        SolarPositionTable.build(43, 89.4, -6, 2020, resolution_minutes=0)
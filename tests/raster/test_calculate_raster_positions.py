@@ -0,0 +1,100 @@
+import numpy as np
+import pytest
+
+from pysoleng.raster import calculate_raster_positions
+from pysoleng.streaming import calculate_batch_positions
+
+TIMESTAMPS = ["2020-07-01T15:00:00-06:00", "2020-12-21T08:30:00+02:00"]
+LATITUDES = np.linspace(-89, 89, 13)
+LONGITUDES = np.linspace(0, 359, 11)
+
+
+@pytest.mark.raster
+def test_calculate_raster_positions():
+    """Functional test to ensure the calculate_raster_positions() method
+    matches the batch calculation of every cell of the grid."""
+    raster = calculate_raster_positions(
+        TIMESTAMPS, LATITUDES, LONGITUDES, tile_rows=5
+    )
+    assert raster["hour_angle_degrees"].shape == (2, 11)
+    for key in ("solar_zenith_degrees", "solar_azimuth_degrees"):
+        assert raster[key].shape == (2, 13, 11)
+    for time_index, timestamp in enumerate(TIMESTAMPS):
+        for longitude_index, longitude in enumerate(LONGITUDES):
+            expected = calculate_batch_positions(
+                [timestamp] * len(LATITUDES), LATITUDES, longitude
+            )
+            cells = {
+                "declination_degrees": raster["declination_degrees"][
+                    time_index
+                ],
+                "hour_angle_degrees": raster["hour_angle_degrees"][
+                    time_index, longitude_index
+                ],
+                "solar_zenith_degrees": raster["solar_zenith_degrees"][
+                    time_index, :, longitude_index
+                ],
+                "solar_azimuth_degrees": raster["solar_azimuth_degrees"][
+                    time_index, :, longitude_index
+                ],
+            }
+            for key, values in cells.items():
+                np.testing.assert_allclose(
+                    np.broadcast_to(values, LATITUDES.shape),
+                    expected[key],
+                    atol=1e-6,
+                )
+    np.testing.assert_allclose(
+        raster["extraterrestrial_horizontal_W_m2"],
+        raster["G_on_W_m2"][:, None, None]
+        * np.cos(np.radians(raster["solar_zenith_degrees"])),
+    )
+
+
+@pytest.mark.raster
+def test_outputs(tmp_path):
+    """Test that the grid is written into caller-provided arrays,
+    and into memory-mapped files."""
+    zenith = np.zeros((1, 13, 11), dtype=np.float32)
+    raster = calculate_raster_positions(
+        TIMESTAMPS[0],
+        LATITUDES,
+        LONGITUDES,
+        dtype="float32",
+        out={"solar_zenith_degrees": zenith},
+        memmap_dir=str(tmp_path),
+    )
+    expected = calculate_raster_positions(TIMESTAMPS[0], LATITUDES, LONGITUDES)
+    assert raster["solar_zenith_degrees"] is zenith
+    np.testing.assert_allclose(
+        zenith, expected["solar_zenith_degrees"], atol=1e-4
+    )
+    assert not (tmp_path / "solar_zenith_degrees.npy").exists()
+    azimuth = np.load(tmp_path / "solar_azimuth_degrees.npy", mmap_mode="r")
+    assert azimuth.dtype == np.float32
+    np.testing.assert_allclose(
+        azimuth, expected["solar_azimuth_degrees"], atol=1e-4
+    )
+
+
+@pytest.mark.raster
+def test_invalid_arguments():
+    """Test to ensure a ValueError is raised for invalid axes, tiles,
+    or output arrays."""
+    with pytest.raises(ValueError):
+        calculate_raster_positions(TIMESTAMPS, [0, 91], LONGITUDES)
+    with pytest.raises(ValueError):
+        calculate_raster_positions(TIMESTAMPS, LATITUDES, [[0, 10]])
+    with pytest.raises(ValueError):
+        calculate_raster_positions(TIMESTAMPS, LATITUDES, LONGITUDES, 1_367, 0)
+    with pytest.raises(ValueError):
+        calculate_raster_positions(
+            TIMESTAMPS,
+            LATITUDES,
+            LONGITUDES,
+            out={"solar_zenith_degrees": np.zeros((1, 13, 11))},
+        )
+    with pytest.raises(ValueError):
+        calculate_raster_positions(
+            TIMESTAMPS, LATITUDES, LONGITUDES, out={"air_mass": None}
+        )
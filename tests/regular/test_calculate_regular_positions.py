@@ -0,0 +1,156 @@
+from datetime import datetime, timedelta, timezone
+from math import nan
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pysoleng.regular import calculate_regular_positions
+from pysoleng.site import Site
+from pysoleng.streaming import calculate_batch_positions
+
+
+@pytest.mark.regular
+def test_calculate_regular_positions():
+    """Functional test to ensure the calculate_regular_positions() method
+    runs properly given valid arguments."""
+    positions = calculate_regular_positions(
+        start="2020-02-13 00:00 -06:00",
+        periods=1_440,
+        freq="1min",
+        latitude_degrees=43,
+        longitude_degrees=89.4,
+    )
+    assert positions["day_number"].dtype == np.int16
+    for values in positions.values():
+        assert isinstance(values, np.ndarray)
+        assert len(values) == 1_440
+
+
+@pytest.mark.regular
+@pytest.mark.parametrize(
+    "start,freq,periods",
+    [
+        ("2020-01-01 00:00 -06:00", "1min", 5_000),
+        # Spanning a year boundary, with an irregular start
+        ("2019-12-31 23:57:30 +09:00", "7min", 5_000),
+        ("2021-06-01 00:00 -03:30", "1H", 2_000),
+        (
+            datetime(2020, 3, 1, tzinfo=timezone(timedelta(hours=-5))),
+            "1D",
+            400,
+        ),
+    ],
+)
+def test_matches_batch_positions(start, freq, periods):
+    """Test that calculate_regular_positions() matches
+    calculate_batch_positions() for the equivalent timestamps."""
+    positions = calculate_regular_positions(
+        start, periods, freq, 43, 89.4, site_altitude_m=300
+    )
+    local_index = pd.date_range(start, periods=periods, freq=freq)
+    expected = calculate_batch_positions(
+        pd.Series(local_index), 43, 89.4, site_altitude_m=300
+    )
+    np.testing.assert_array_equal(
+        positions.pop("day_number"), local_index.dayofyear
+    )
+    assert positions.keys() == expected.keys()
+    for key, values in expected.items():
+        np.testing.assert_allclose(positions[key], values, atol=1e-8)
+
+
+@pytest.mark.regular
+def test_site():
+    """Test that a Site can be given in place of the site arguments."""
+    site = Site(
+        latitude_degrees=43, longitude_degrees=89.4, site_altitude_m=300
+    )
+    positions = calculate_regular_positions(
+        "2020-02-13 00:00 -06:00", 48, "30min", site, site, site
+    )
+    expected = calculate_regular_positions(
+        "2020-02-13 00:00 -06:00", 48, "30min", 43, 89.4, 300
+    )
+    for key, values in expected.items():
+        np.testing.assert_allclose(positions[key], values)
+
+
+@pytest.mark.regular
+@pytest.mark.parametrize("latitude", [43, -35, 75, -89.9])
+def test_daylight_only(latitude):
+    """Test that only night rows (with the sun held at the horizon)
+    differ with `daylight_only=True`, and that they are filled."""
+    positions = calculate_regular_positions(
+        "2020-01-01 00:00 -06:00",
+        366 * 48,
+        "30min",
+        latitude,
+        89.4,
+        daylight_only=True,
+    )
+    expected = calculate_regular_positions(
+        "2020-01-01 00:00 -06:00", 366 * 48, "30min", latitude, 89.4
+    )
+    night = np.isnan(positions["solar_azimuth_degrees"])
+    np.testing.assert_array_equal(np.isnan(positions["air_mass"]), night)
+    assert (expected["solar_zenith_degrees"][night] == 90).all()
+    assert (positions["solar_altitude_degrees"][night] == 0).all()
+    for key, values in expected.items():
+        np.testing.assert_allclose(
+            positions[key][~night], values[~night], rtol=0, atol=1e-12
+        )
+        if key not in ("solar_azimuth_degrees", "air_mass"):
+            np.testing.assert_array_equal(positions[key], values)
+
+    empty = calculate_regular_positions(
+        "2020-02-13 00:00 -06:00", 0, "1min", 43, 89.4, daylight_only=True
+    )
+    for values in empty.values():
+        assert len(values) == 0
+
+
+@pytest.mark.regular
+def test_empty():
+    """Test that zero periods return empty arrays."""
+    positions = calculate_regular_positions(
+        "2020-02-13 00:00 -06:00", 0, "1min", 43, 89.4
+    )
+    for values in positions.values():
+        assert len(values) == 0
+
+
+@pytest.mark.regular
+@pytest.mark.parametrize(
+    "start,periods,freq",
+    [
+        # Without a time zone offset
+        ("2020-02-13 00:00", 10, "1min"),
+        # Without a fixed time zone offset
+        (pd.Timestamp("2020-02-13", tz="America/Chicago"), 10, "1min"),
+        # Without a fixed frequency
+        ("2020-02-13 00:00 -06:00", 10, "1M"),
+        ("2020-02-13 00:00 -06:00", 10, "-1min"),
+        ("2020-02-13 00:00 -06:00", -1, "1min"),
+        ("2020-02-13 00:00 -06:00", nan, "1min"),
+    ],
+)
+def test_invalid_value(start, periods, freq):
+    """Test to ensure a ValueError is raised when an invalid value
+    is provided to calculate_regular_positions()."""
+    with pytest.raises(ValueError):
+        calculate_regular_positions(start, periods, freq, 43, 89.4)
+
+
+@pytest.mark.regular
+def test_invalid_type():
+    """Test to ensure a TypeError is raised when an invalid type
+    is provided to calculate_regular_positions()."""
+    with pytest.raises(TypeError):
+        calculate_regular_positions(
+            "2020-02-13 00:00 -06:00", 10.5, "1min", 43, 89.4
+        )
+    with pytest.raises(TypeError):
+        calculate_regular_positions(
+            ["2020-02-13 00:00 -06:00"], 10, "1min", 43, 89.4
+        )
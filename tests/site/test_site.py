@@ -0,0 +1,147 @@
+from datetime import datetime, timedelta, timezone
+from math import inf, nan
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pysoleng.site import Site
+from pysoleng.solar_geom import (
+    calculate_air_mass,
+    calculate_hour_angle_degrees,
+    calculate_solar_azimuth_degrees,
+    calculate_solar_noon_in_local_standard_time,
+    calculate_solar_zenith_degrees,
+    convert_to_solar_time,
+)
+from pysoleng.tracker import SolarTracker
+
+
+@pytest.mark.site
+def test_site():
+    """Functional test to ensure the Site class
+    runs properly given valid arguments."""
+    site = Site(latitude_degrees=43, longitude_degrees=89.4, tz=-6)
+    assert site.utc_offset_hours == -6
+    assert site.standard_meridian_degrees == 90
+    assert np.isclose(site.longitude_correction_mins, 2.4)
+    assert np.isclose(site.sin_latitude, np.sin(np.radians(43)))
+    assert np.isclose(site.cos_latitude, np.cos(np.radians(43)))
+    assert site.air_mass_altitude_factor == 1.0
+    assert not hasattr(site, "__dict__")
+
+
+@pytest.mark.site
+@pytest.mark.parametrize(
+    "tz,expected",
+    [
+        (None, None),
+        ("America/Chicago", None),
+        (timezone(timedelta(hours=-5)), -5),
+        (9.5, 9.5),
+    ],
+)
+def test_fixed_offset(tz, expected):
+    """Test that only fixed offsets from UTC precompute
+    the standard meridian."""
+    site = Site(latitude_degrees=43, longitude_degrees=89.4, tz=tz)
+    assert site.utc_offset_hours == expected
+    assert (site.standard_meridian_degrees is None) == (expected is None)
+
+
+@pytest.mark.site
+def test_solar_geom_accepts_site():
+    """Test that the pysoleng.solar_geom methods give the same
+    output for a Site as for the equivalent loose arguments.
+
+    These known values are taken from Duffie & Beckman (2006) Example 1.6.1.
+    """
+    site = Site(
+        latitude_degrees=43, longitude_degrees=89.4, site_altitude_m=300
+    )
+    assert calculate_solar_zenith_degrees(
+        site, declination_degrees=-22.7, hour_angle_degrees=-52.5
+    ) == pytest.approx(calculate_solar_zenith_degrees(43, -22.7, -52.5))
+    assert calculate_solar_azimuth_degrees(
+        hour_angle_degrees=-52.5,
+        latitude_degrees=site,
+        declination_degrees=-22.7,
+    ) == pytest.approx(calculate_solar_azimuth_degrees(-52.5, 43, -22.7))
+    assert calculate_air_mass(66.5, site) == pytest.approx(
+        calculate_air_mass(66.5, site_altitude_m=300)
+    )
+
+    timestamp = "2020-02-13 10:42 -06:00"
+    assert convert_to_solar_time(timestamp, site) == convert_to_solar_time(
+        timestamp, 89.4
+    )
+    assert calculate_hour_angle_degrees(
+        timestamp, site
+    ) == calculate_hour_angle_degrees(timestamp, 89.4)
+    assert calculate_solar_noon_in_local_standard_time(
+        timestamp, site
+    ) == calculate_solar_noon_in_local_standard_time(timestamp, 89.4)
+
+
+@pytest.mark.site
+def test_site_time_zone_for_epoch_arrays():
+    """Test that a Site's time zone is used for epoch arrays
+    when no `tz` is given."""
+    site = Site(latitude_degrees=43, longitude_degrees=89.4, tz=-6)
+    epoch = np.array([1_581_612_120, 1_581_630_000])
+    np.testing.assert_allclose(
+        calculate_hour_angle_degrees(epoch, site),
+        calculate_hour_angle_degrees(epoch, 89.4, tz=-6),
+    )
+    expected = pd.DatetimeIndex(
+        calculate_solar_noon_in_local_standard_time(epoch, 89.4, tz=-6)
+    )
+    assert calculate_solar_noon_in_local_standard_time(epoch, site).equals(
+        expected
+    )
+
+
+@pytest.mark.site
+def test_solar_tracker_from_site():
+    """Test that a SolarTracker created from a Site
+    uses the Site's parameters."""
+    site = Site(latitude_degrees=43, longitude_degrees=89.4, tz=-6)
+    timestamp = datetime(
+        2020, 2, 13, 10, 42, tzinfo=timezone(timedelta(hours=-6))
+    )
+    expected = SolarTracker(43, 89.4, -6).at(timestamp)
+    tracker = SolarTracker.from_site(site).at(timestamp)
+    assert tracker.solar_zenith_degrees == pytest.approx(
+        expected.solar_zenith_degrees
+    )
+    with pytest.raises(ValueError):
+        SolarTracker.from_site(Site(43, 89.4, tz="America/Chicago"))
+    with pytest.raises(TypeError):
+        SolarTracker.from_site((43, 89.4))
+
+
+@pytest.mark.site
+@pytest.mark.parametrize(
+    "latitude_degrees,longitude_degrees,site_altitude_m,tz",
+    [
+        (91, 89.4, 0, None),
+        (43, -1, 0, None),
+        (43, 89.4, -500, None),
+        (43, 89.4, 0, 15),
+        (nan, 89.4, 0, None),
+        (43, inf, 0, None),
+    ],
+)
+def test_invalid_values(
+    latitude_degrees, longitude_degrees, site_altitude_m, tz
+):
+    """Test that invalid values raise a ValueError."""
+    with pytest.raises(ValueError):
+        Site(latitude_degrees, longitude_degrees, site_altitude_m, tz)
+
+
+@pytest.mark.site
+def test_invalid_types():
+    """Test that invalid types raise a TypeError."""
+    with pytest.raises(TypeError):
+        Site("43", 89.4)
@@ -65,3 +65,22 @@ def test_invalid_range():
     with pytest.raises(ValueError):
         # Test with too-high value
         assert calculate_B_degrees(day_number=1_000)
+
+
+@pytest.mark.solar_geom
+def test_errors_mask():
+    """Test to ensure invalid rows are set to NaN and flagged, rather
+    than raising a ValueError, with `errors="mask"`."""
+    B_degrees, validity = calculate_B_degrees(
+        np.array([1, 400, nan, 366]), errors="mask"
+    )
+    np.testing.assert_array_equal(validity.mask, [True, False, False, True])
+    np.testing.assert_allclose(
+        B_degrees[validity.mask], calculate_B_degrees(np.array([1, 366]))
+    )
+    assert np.isnan(B_degrees[~validity.mask]).all()
+    assert validity.counts == {
+        "day_number": {"nan": 1, "infinite": 0, "out_of_range": 1}
+    }
+    with pytest.raises(ValueError):
+        calculate_B_degrees(1, errors="ignore")
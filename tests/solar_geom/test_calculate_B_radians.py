@@ -0,0 +1,62 @@
+from math import inf, nan
+
+import numpy as np
+import pytest
+from hypothesis import given
+from hypothesis.strategies import integers
+
+from pysoleng.solar_geom import calculate_B_degrees, calculate_B_radians
+
+
+@pytest.mark.solar_geom
+@given(integers(min_value=1, max_value=366))
+def test_calculate_B_radians(day_number):
+    """Functional test to ensure the calculate_B_radians() method
+    runs properly given valid arguments, and matches
+    calculate_B_degrees()."""
+    B_radians = calculate_B_radians(day_number)
+    assert isinstance(B_radians, float)
+    assert B_radians == pytest.approx(
+        np.radians(calculate_B_degrees(day_number))
+    )
+
+
+@pytest.mark.solar_geom
+def test_calculate_B_radians_iterable():
+    """Functional test to ensure the calculate_B_radians() method
+    runs properly given a valid iterable."""
+    np.testing.assert_allclose(calculate_B_radians([1, 366]), [0, 2 * np.pi])
+
+
+@pytest.mark.solar_geom
+@pytest.mark.parametrize("day_number", [0, 367, nan, inf])
+def test_invalid_value(day_number):
+    """Test to ensure a ValueError is raised when an invalid value
+    is provided to calculate_B_radians()."""
+    with pytest.raises(ValueError):
+        calculate_B_radians(day_number)
+
+
+@pytest.mark.solar_geom
+def test_invalid_type():
+    """Test to ensure a TypeError is raised when an invalid type
+    is provided to calculate_B_radians()."""
+    with pytest.raises(TypeError):
+        calculate_B_radians("blah")
+
+
+@pytest.mark.solar_geom
+def test_errors_mask():
+    """Test to ensure invalid rows are set to NaN and flagged, rather
+    than raising a ValueError, with `errors="mask"`."""
+    B_radians, validity = calculate_B_radians(
+        np.array([1, 0, inf, 366]), errors="mask"
+    )
+    np.testing.assert_array_equal(validity.mask, [True, False, False, True])
+    np.testing.assert_allclose(
+        B_radians[validity.mask], calculate_B_radians(np.array([1, 366]))
+    )
+    assert np.isnan(B_radians[~validity.mask]).all()
+    assert validity.counts == {
+        "day_number": {"nan": 0, "infinite": 1, "out_of_range": 1}
+    }
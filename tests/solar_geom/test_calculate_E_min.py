@@ -74,3 +74,48 @@ def test_invalid_range():
     with pytest.raises(ValueError):
         # Test with too-high value
         assert calculate_E_min(B_degrees=1_000)
+
+
+@pytest.mark.solar_geom
+def test_polynomial_method():
+    """Test to ensure the polynomial fit of calculate_E_min() is within
+    its published maximum error (1e-5 minutes) of the Spencer series
+    over the whole year, and that unknown methods are rejected."""
+    B = np.linspace(calculate_B_degrees(1), calculate_B_degrees(366), 100_001)
+    np.testing.assert_allclose(
+        calculate_E_min(B, method="polynomial"),
+        calculate_E_min(B),
+        rtol=0,
+        atol=1e-5,
+    )
+    # Both methods return the same type for a scalar
+    for B in (100, 100.0):
+        assert type(calculate_E_min(B, method="polynomial")) is type(
+            calculate_E_min(B)
+        )
+    assert isinstance(calculate_E_min(100.0, method="polynomial"), np.float64)
+    with pytest.raises(ValueError):
+        calculate_E_min(100.0, method="chebyshev")
+
+
+@pytest.mark.solar_geom
+@pytest.mark.parametrize("method", ["spencer", "polynomial"])
+def test_errors_mask(method):
+    """Test to ensure invalid rows are set to NaN and flagged, rather
+    than raising a ValueError, with `errors="mask"`."""
+    E_min, validity = calculate_E_min(
+        np.array([0, 400, nan, 180]), method=method, errors="mask"
+    )
+    np.testing.assert_array_equal(validity.mask, [True, False, False, True])
+    np.testing.assert_allclose(
+        E_min[validity.mask],
+        calculate_E_min(np.array([0, 180]), method=method),
+    )
+    assert np.isnan(E_min[~validity.mask]).all()
+    assert validity.counts == {
+        "B_degrees": {"nan": 1, "infinite": 0, "out_of_range": 1}
+    }
+    # A single invalid value gives NaN
+    E_min, validity = calculate_E_min(400.0, method=method, errors="mask")
+    assert np.isnan(E_min)
+    assert not validity.mask
@@ -91,3 +91,23 @@ def test_invalid_range():
     with pytest.raises(ValueError):
         # Test with too-high value for `B_degrees`
         assert calculate_G_on_W_m2(B_degrees=1_000, G_sc=1_367)
+
+
+@pytest.mark.solar_geom
+def test_errors_mask():
+    """Test to ensure invalid rows are set to NaN and flagged, rather
+    than raising a ValueError, with `errors="mask"`, while an invalid
+    `G_sc` still raises."""
+    G_on_W_m2, validity = calculate_G_on_W_m2(
+        np.array([0, 400, nan, 180]), errors="mask"
+    )
+    np.testing.assert_array_equal(validity.mask, [True, False, False, True])
+    np.testing.assert_allclose(
+        G_on_W_m2[validity.mask], calculate_G_on_W_m2(np.array([0, 180]))
+    )
+    assert np.isnan(G_on_W_m2[~validity.mask]).all()
+    assert validity.counts == {
+        "B_degrees": {"nan": 1, "infinite": 0, "out_of_range": 1}
+    }
+    with pytest.raises(ValueError):
+        calculate_G_on_W_m2(np.array([0, 180]), G_sc=-1, errors="mask")
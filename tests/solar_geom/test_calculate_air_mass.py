@@ -94,3 +94,20 @@ def test_invalid_range():
         assert calculate_air_mass(
             solar_zenith_degrees=45, site_altitude_m=-500
         )
+
+
+@pytest.mark.solar_geom
+def test_errors_mask():
+    """Test to ensure invalid rows are set to NaN and flagged, rather
+    than raising a ValueError, with `errors="mask"`."""
+    air_mass, validity = calculate_air_mass(
+        np.array([0, 95, nan, 60]), errors="mask"
+    )
+    np.testing.assert_array_equal(validity.mask, [True, False, False, True])
+    np.testing.assert_allclose(
+        air_mass[validity.mask], calculate_air_mass(np.array([0, 60]))
+    )
+    assert np.isnan(air_mass[~validity.mask]).all()
+    assert validity.counts == {
+        "solar_zenith_degrees": {"nan": 1, "infinite": 0, "out_of_range": 1}
+    }
@@ -0,0 +1,48 @@
+from math import inf, nan
+
+import numpy as np
+import pytest
+from hypothesis import given
+from hypothesis.strategies import floats
+
+from pysoleng.solar_geom import (
+    calculate_air_mass,
+    calculate_air_mass_from_zenith_radians,
+)
+
+
+@pytest.mark.solar_geom
+@given(
+    floats(min_value=0, max_value=np.pi / 2),
+    floats(min_value=-413, max_value=9_000),
+)
+def test_calculate_air_mass_from_zenith_radians(zenith, altitude):
+    """Functional test to ensure the
+    calculate_air_mass_from_zenith_radians() method runs properly
+    given valid arguments, and matches calculate_air_mass()."""
+    air_mass = calculate_air_mass_from_zenith_radians(zenith, altitude)
+    assert isinstance(air_mass, float)
+    assert air_mass == pytest.approx(
+        calculate_air_mass(np.degrees(zenith), altitude)
+    )
+
+
+@pytest.mark.solar_geom
+def test_calculate_air_mass_from_zenith_radians_iterable():
+    """Functional test to ensure the
+    calculate_air_mass_from_zenith_radians() method runs properly
+    given a valid iterable."""
+    air_mass = calculate_air_mass_from_zenith_radians([0, np.pi / 3])
+    assert isinstance(air_mass, np.ndarray)
+    np.testing.assert_allclose(air_mass, [1.0, 2.0], atol=0.01)
+
+
+@pytest.mark.solar_geom
+@pytest.mark.parametrize(
+    "zenith,altitude", [(-1, 0), (2, 0), (nan, 0), (inf, 0), (0, -500)]
+)
+def test_invalid_value(zenith, altitude):
+    """Test to ensure a ValueError is raised when an invalid value
+    is provided to calculate_air_mass_from_zenith_radians()."""
+    with pytest.raises(ValueError):
+        calculate_air_mass_from_zenith_radians(zenith, altitude)
@@ -0,0 +1,58 @@
+from math import nan
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pysoleng.solar_geom import (
+    calculate_B_degrees,
+    calculate_daily_terms,
+    calculate_declination_degrees,
+    calculate_E_min,
+)
+
+
+@pytest.mark.solar_geom
+def test_calculate_daily_terms():
+    """Functional test to ensure the calculate_daily_terms() method
+    runs properly given valid arguments, and matches the
+    per-element methods."""
+    day_number = np.repeat([44, 45, 1, 366, 44], 1_000)
+    terms = calculate_daily_terms(day_number)
+    B_degrees = calculate_B_degrees(day_number)
+    np.testing.assert_allclose(terms["B_degrees"], B_degrees)
+    np.testing.assert_allclose(terms["E_min"], calculate_E_min(B_degrees))
+    np.testing.assert_allclose(
+        terms["declination_degrees"], calculate_declination_degrees(B_degrees)
+    )
+
+
+@pytest.mark.solar_geom
+def test_calculate_daily_terms_inputs():
+    """Test that calculate_daily_terms() accepts scalars, lists,
+    Pandas objects, and empty arrays."""
+    assert calculate_daily_terms(44)["E_min"] == pytest.approx(
+        calculate_E_min(calculate_B_degrees(44))
+    )
+    assert len(calculate_daily_terms([44, 45])["E_min"]) == 2
+    index = pd.date_range("2020-02-13 -06:00", periods=48, freq="1H")
+    assert len(calculate_daily_terms(index.dayofyear)["E_min"]) == 48
+    assert len(calculate_daily_terms(np.array([], dtype=int))["E_min"]) == 0
+
+
+@pytest.mark.solar_geom
+@pytest.mark.parametrize("day_number", [[0, 44], [44, 367]])
+def test_invalid_value(day_number):
+    """Test to ensure a ValueError is raised when an invalid value
+    is provided to calculate_daily_terms()."""
+    with pytest.raises(ValueError):
+        calculate_daily_terms(day_number)
+
+
+@pytest.mark.solar_geom
+@pytest.mark.parametrize("day_number", [[44.5], [nan], ["blah"]])
+def test_invalid_type(day_number):
+    """Test to ensure a TypeError is raised when an invalid type
+    is provided to calculate_daily_terms()."""
+    with pytest.raises(TypeError):
+        calculate_daily_terms(day_number)
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 import pytest
@@ -61,3 +62,34 @@ def test_invalid_string():
     ValueError with an invalid string input."""
     with pytest.raises(ValueError):
         assert calculate_day_number(date="January 1, blah blah blah")
+
+
+@pytest.mark.solar_geom
+def test_calculate_day_number_epoch():
+    """Functional test to ensure the calculate_day_number() method
+    runs properly on a numpy array of seconds since the Unix epoch,
+    using the local date in `tz`."""
+    # 2020-02-13 23:30 and 2020-02-14 00:30 at UTC-06:00
+    epoch = np.array([1_581_658_200, 1_581_661_800])
+    day_number = calculate_day_number(date=epoch, tz=-6)
+    assert isinstance(day_number, np.ndarray)
+    assert list(day_number) == [44, 45]
+    assert list(calculate_day_number(date=epoch, tz="UTC")) == [45, 45]
+
+
+@pytest.mark.solar_geom
+def test_calculate_day_number_daylight_saving_time():
+    """Test to ensure timestamps in a time zone with daylight saving
+    time are numbered by their local standard time date."""
+    x = pd.Series(
+        pd.date_range(
+            "2019-01-01",
+            "2019-12-31 23:30",
+            freq="30min",
+            tz="America/Chicago",
+        )
+    )
+    np.testing.assert_array_equal(
+        np.asarray(calculate_day_number(date=x)),
+        np.asarray(calculate_day_number(date=x.dt.tz_convert("Etc/GMT+6"))),
+    )
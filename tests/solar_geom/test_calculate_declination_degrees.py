@@ -85,3 +85,46 @@ def test_invalid_range():
     with pytest.raises(ValueError):
         # Test with too-high value
         assert calculate_declination_degrees(B_degrees=1_000)
+
+
+@pytest.mark.solar_geom
+def test_polynomial_method():
+    """Test to ensure the polynomial fit of calculate_declination_degrees()
+    is within its published maximum error (1e-4 degrees) of the Spencer
+    series over the whole year, and that unknown methods are rejected."""
+    B = np.linspace(0, 360, 100_001)
+    np.testing.assert_allclose(
+        calculate_declination_degrees(B, method="polynomial"),
+        calculate_declination_degrees(B),
+        rtol=0,
+        atol=1e-4,
+    )
+    # Both methods return the same type for a scalar
+    for B in (100, 100.0):
+        assert type(
+            calculate_declination_degrees(B, method="polynomial")
+        ) is type(calculate_declination_degrees(B))
+    assert isinstance(
+        calculate_declination_degrees(100.0, method="polynomial"), np.float64
+    )
+    with pytest.raises(ValueError):
+        calculate_declination_degrees(100.0, method="chebyshev")
+
+
+@pytest.mark.solar_geom
+@pytest.mark.parametrize("method", ["spencer", "polynomial"])
+def test_errors_mask(method):
+    """Test to ensure invalid rows are set to NaN and flagged, rather
+    than raising a ValueError, with `errors="mask"`."""
+    declination_degrees, validity = calculate_declination_degrees(
+        np.array([0, -inf, nan, 180]), method=method, errors="mask"
+    )
+    np.testing.assert_array_equal(validity.mask, [True, False, False, True])
+    np.testing.assert_allclose(
+        declination_degrees[validity.mask],
+        calculate_declination_degrees(np.array([0, 180]), method=method),
+    )
+    assert np.isnan(declination_degrees[~validity.mask]).all()
+    assert validity.counts == {
+        "B_degrees": {"nan": 1, "infinite": 1, "out_of_range": 0}
+    }
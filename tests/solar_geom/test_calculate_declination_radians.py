@@ -0,0 +1,90 @@
+from math import inf, nan
+
+import numpy as np
+import pytest
+from hypothesis import given
+from hypothesis.strategies import integers
+
+from pysoleng.solar_geom import (
+    calculate_B_degrees,
+    calculate_B_radians,
+    calculate_declination_degrees,
+    calculate_declination_radians,
+)
+
+
+@pytest.mark.solar_geom
+@given(integers(min_value=1, max_value=366))
+def test_calculate_declination_radians(day_number):
+    """Functional test to ensure the calculate_declination_radians()
+    method runs properly given valid arguments, and matches
+    calculate_declination_degrees()."""
+    declination_radians = calculate_declination_radians(
+        calculate_B_radians(day_number)
+    )
+    assert isinstance(declination_radians, float)
+    assert declination_radians == pytest.approx(
+        np.radians(
+            calculate_declination_degrees(calculate_B_degrees(day_number))
+        )
+    )
+
+
+@pytest.mark.solar_geom
+def test_calculate_declination_radians_iterable():
+    """Functional test to ensure the calculate_declination_radians()
+    method runs properly given a valid iterable."""
+    assert isinstance(
+        calculate_declination_radians(calculate_B_radians([1, 100, 200])),
+        np.ndarray,
+    )
+
+
+@pytest.mark.solar_geom
+@pytest.mark.parametrize("B_radians", [-1, 7, nan, inf])
+def test_invalid_value(B_radians):
+    """Test to ensure a ValueError is raised when an invalid value
+    is provided to calculate_declination_radians()."""
+    with pytest.raises(ValueError):
+        calculate_declination_radians(B_radians)
+
+
+@pytest.mark.solar_geom
+def test_invalid_type():
+    """Test to ensure a TypeError is raised when an invalid type
+    is provided to calculate_declination_radians()."""
+    with pytest.raises(TypeError):
+        calculate_declination_radians("blah")
+
+
+@pytest.mark.solar_geom
+def test_polynomial_method():
+    """Test to ensure the polynomial fit of calculate_declination_radians()
+    matches that of calculate_declination_degrees()."""
+    B = np.linspace(0, 2 * np.pi, 10_001)
+    np.testing.assert_allclose(
+        calculate_declination_radians(B, method="polynomial"),
+        np.radians(
+            calculate_declination_degrees(np.degrees(B), method="polynomial")
+        ),
+        rtol=0,
+        atol=1e-12,
+    )
+
+
+@pytest.mark.solar_geom
+def test_errors_mask():
+    """Test to ensure invalid rows are set to NaN and flagged, rather
+    than raising a ValueError, with `errors="mask"`."""
+    declination_radians, validity = calculate_declination_radians(
+        np.array([0, 7, nan, np.pi]), errors="mask"
+    )
+    np.testing.assert_array_equal(validity.mask, [True, False, False, True])
+    np.testing.assert_allclose(
+        declination_radians[validity.mask],
+        calculate_declination_radians(np.array([0, np.pi])),
+    )
+    assert np.isnan(declination_radians[~validity.mask]).all()
+    assert validity.counts == {
+        "B_radians": {"nan": 1, "infinite": 0, "out_of_range": 1}
+    }
@@ -124,3 +124,151 @@ def test_invalid_range():
             local_standard_time="February 3, 2020 10:30 AM",
             longitude_degrees=400,
         )
+
+
+@pytest.mark.solar_geom
+@pytest.mark.parametrize(
+    "epoch_unit,multiplier", [("s", 1), ("ms", 1_000), ("ns", 1_000_000_000)]
+)
+def test_calculate_hour_angle_epoch(epoch_unit, multiplier):
+    """Functional test to ensure the calculate_hour_angle() method
+    runs properly given numpy arrays of times since the Unix epoch.
+
+    These known values are taken from:
+    1) Duffie & Beckman (2006) Example 1.6.1
+    """
+    # February 13, 2020 10:42 AM -06:00, and 12 hours later
+    epoch = np.array([1_581_612_120, 1_581_655_320]) * multiplier
+    hour_angle = calculate_hour_angle_degrees(
+        local_standard_time=epoch,
+        longitude_degrees=89.4,
+        tz=-6,
+        epoch_unit=epoch_unit,
+    )
+    assert isinstance(hour_angle, np.ndarray)
+    assert hour_angle == pytest.approx([-22.46533, 157.53467], abs=1e-3)
+
+
+@pytest.mark.solar_geom
+def test_calculate_hour_angle_datetime64():
+    """Functional test to ensure the calculate_hour_angle() method
+    runs properly given a numpy array of datetime64 values (in UTC)."""
+    hour_angle = calculate_hour_angle_degrees(
+        local_standard_time=np.array(["2020-02-13T16:42"], "datetime64[m]"),
+        longitude_degrees=89.4,
+        tz="America/Chicago",
+    )
+    assert hour_angle == pytest.approx([-22.46533])
+
+
+@pytest.mark.solar_geom
+def test_calculate_hour_angle_mixed_offsets():
+    """Functional test to ensure the calculate_hour_angle() method
+    calculates each row of a batch mixing offsets from UTC (and
+    longitudes) with its own offset, in any form of input."""
+    local_standard_time = [
+        "2020-02-13T10:42:00-06:00",
+        "2020-07-01T15:00:00+02:00",
+        "2020-07-02T01:30:00+05:30",
+    ]
+    longitude_degrees = np.array([89.4, 345.0, 277.0])
+    expected = [
+        calculate_hour_angle_degrees(value, longitude)
+        for value, longitude in zip(local_standard_time, longitude_degrees)
+    ]
+    assert expected[0] == pytest.approx(-22.46533, abs=1e-3)
+    epoch_ns = np.array(
+        [pd.Timestamp(value).value for value in local_standard_time]
+    )
+    for hour_angle in (
+        calculate_hour_angle_degrees(local_standard_time, longitude_degrees),
+        calculate_hour_angle_degrees(
+            pd.Series(local_standard_time), longitude_degrees
+        ),
+        calculate_hour_angle_degrees(
+            [pd.Timestamp(value) for value in local_standard_time],
+            longitude_degrees,
+        ),
+        calculate_hour_angle_degrees(
+            epoch_ns,
+            longitude_degrees,
+            tz=np.array([-6, 2, 5.5]),
+            epoch_unit="ns",
+        ),
+    ):
+        np.testing.assert_allclose(hour_angle, expected)
+
+
+@pytest.mark.solar_geom
+def test_calculate_hour_angle_mixed_offsets_invalid():
+    """Test to ensure the calculate_hour_angle() method raises a
+    ValueError for per-row offsets that are misaligned or out of
+    range, or for a timestamp without an offset."""
+    epoch = np.array([1_581_612_120, 1_581_655_320])
+    with pytest.raises(ValueError):
+        calculate_hour_angle_degrees(epoch, 89.4, tz=np.array([-6]))
+    with pytest.raises(ValueError):
+        calculate_hour_angle_degrees(epoch, 89.4, tz=np.array([-6, 15]))
+    with pytest.raises(ValueError):
+        calculate_hour_angle_degrees(
+            ["2020-02-13T10:42:00-06:00", "2020-02-13T10:42:00"], 89.4
+        )
+
+
+@pytest.mark.solar_geom
+def test_errors_mask():
+    """Test to ensure rows with an invalid longitude are set to NaN and
+    flagged, rather than raising a ValueError, with `errors="mask"`."""
+    timestamps = pd.Series(
+        pd.date_range("2020-02-13 10:42 -06:00", periods=4, freq="H")
+    )
+    hour_angle_degrees, validity = calculate_hour_angle_degrees(
+        timestamps, np.array([89.4, 400, nan, 89.4]), errors="mask"
+    )
+    np.testing.assert_array_equal(validity.mask, [True, False, False, True])
+    np.testing.assert_allclose(
+        hour_angle_degrees[validity.mask],
+        np.asarray(calculate_hour_angle_degrees(timestamps, 89.4))[[0, 3]],
+    )
+    assert np.isnan(hour_angle_degrees[~validity.mask]).all()
+    assert validity.counts == {
+        "longitude_degrees": {"nan": 1, "infinite": 0, "out_of_range": 1}
+    }
+
+    # A single invalid longitude masks every row
+    hour_angle_degrees, validity = calculate_hour_angle_degrees(
+        timestamps, 400, errors="mask"
+    )
+    assert np.isnan(hour_angle_degrees).all()
+    assert not validity.mask
+    # Timestamps that cannot be parsed still raise
+    with pytest.raises(ValueError):
+        calculate_hour_angle_degrees("February 30, blah", 89.4, errors="mask")
+
+
+@pytest.mark.solar_geom
+def test_daylight_saving_time():
+    """Test to ensure timestamps in a time zone with daylight saving
+    time give the same hour angles as the same instants in the fixed
+    standard time offset, through both DST transitions of a year."""
+    x = pd.Series(
+        pd.date_range(
+            "2019-01-01",
+            "2019-12-31 23:50",
+            freq="10min",
+            tz="America/Chicago",
+        )
+    )
+    reference = np.asarray(
+        calculate_hour_angle_degrees(x.dt.tz_convert("Etc/GMT+6"), 90)
+    )
+    np.testing.assert_allclose(
+        np.asarray(calculate_hour_angle_degrees(x, 90)), reference
+    )
+    # Individual timestamps spanning both transitions are handled the
+    # same way
+    every_day = slice(None, None, 144)
+    np.testing.assert_allclose(
+        calculate_hour_angle_degrees(list(x[every_day]), 90),
+        reference[every_day],
+    )
@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+
+from pysoleng.site import Site
+from pysoleng.solar_geom import (
+    calculate_hour_angle_degrees,
+    calculate_hour_angle_radians,
+)
+
+
+@pytest.mark.solar_geom
+def test_calculate_hour_angle_radians():
+    """Functional test to ensure the calculate_hour_angle_radians()
+    method runs properly given valid arguments."""
+    assert isinstance(
+        calculate_hour_angle_radians(
+            local_standard_time="2020-02-13 10:30 -06:00",
+            longitude_degrees=89.4,
+        ),
+        float,
+    )
+
+
+@pytest.mark.solar_geom
+def test_known_values():
+    """Run a test with a known answer to ensure
+    calculate_hour_angle_radians() is giving the expected output.
+    This known value comes from Duffie & Beckman (2006) Example 1.6.1.
+    """
+
+    """`local_standard_time` here corresponds to
+    10:30 AM solar time for the day and location."""
+    assert calculate_hour_angle_radians(
+        local_standard_time="2020-02-13 10:42 -06:00",
+        longitude_degrees=89.4,
+    ) == pytest.approx(np.radians(-22.46533))
+
+
+@pytest.mark.solar_geom
+def test_matches_degrees():
+    """Test that calculate_hour_angle_radians() matches
+    calculate_hour_angle_degrees() for an epoch array."""
+    epoch = np.arange(1_577_836_800, 1_609_459_200, 3_571)
+    np.testing.assert_allclose(
+        calculate_hour_angle_radians(epoch, 89.4, tz="America/Chicago"),
+        np.radians(
+            calculate_hour_angle_degrees(epoch, 89.4, tz="America/Chicago")
+        ),
+        atol=1e-12,
+    )
+
+
+@pytest.mark.solar_geom
+def test_invalid_value():
+    """Test to ensure a ValueError is raised when an invalid value
+    is provided to calculate_hour_angle_radians()."""
+    with pytest.raises(ValueError):
+        calculate_hour_angle_radians("2020-02-13 10:30 -06:00", 400)
+    with pytest.raises(ValueError):
+        # Without a time zone offset
+        calculate_hour_angle_radians("2020-02-13 10:30", 89.4)
+
+
+@pytest.mark.solar_geom
+def test_errors_mask():
+    """Test to ensure rows with an invalid longitude are set to NaN and
+    flagged with `errors="mask"`, and that a Site is always valid."""
+    epoch = np.array([1_581_612_120, 1_581_655_320])
+    hour_angle_radians, validity = calculate_hour_angle_radians(
+        epoch, np.array([89.4, -1]), tz=-6, errors="mask"
+    )
+    np.testing.assert_array_equal(validity.mask, [True, False])
+    assert hour_angle_radians[0] == pytest.approx(
+        np.radians(calculate_hour_angle_degrees(epoch[:1], 89.4, tz=-6)[0])
+    )
+    assert np.isnan(hour_angle_radians[1])
+
+    site = Site(43, 89.4, tz=-6)
+    hour_angle_radians, validity = calculate_hour_angle_radians(
+        epoch, site, errors="mask"
+    )
+    assert validity.mask.all()
+    np.testing.assert_allclose(
+        hour_angle_radians, calculate_hour_angle_radians(epoch, site)
+    )
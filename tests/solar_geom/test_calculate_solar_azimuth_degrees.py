@@ -5,7 +5,10 @@ import pytest
 from hypothesis import given
 from hypothesis.strategies import floats
 
-from pysoleng.solar_geom import calculate_solar_azimuth_degrees
+from pysoleng.solar_geom import (
+    calculate_solar_azimuth_degrees,
+    calculate_solar_zenith_degrees,
+)
 
 
 @pytest.mark.solar_geom
@@ -184,3 +187,54 @@ def test_invalid_range():
         assert calculate_solar_azimuth_degrees(
             hour_angle_degrees=0, latitude_degrees=43, declination_degrees=30
         )
+
+
+@pytest.mark.solar_geom
+def test_precomputed_zenith():
+    """Test that calculate_solar_azimuth_degrees() gives the same output
+    when given an already-calculated solar zenith angle, and validates it."""
+    hour_angle = np.array([-97.5, -37.5, 0, 52.5])
+    declination = np.array([23.1, -14, -10, 5])
+    zenith = calculate_solar_zenith_degrees(
+        latitude_degrees=43,
+        declination_degrees=declination,
+        hour_angle_degrees=hour_angle,
+    )
+    np.testing.assert_allclose(
+        calculate_solar_azimuth_degrees(
+            hour_angle_degrees=hour_angle,
+            latitude_degrees=43,
+            declination_degrees=declination,
+            solar_zenith_degrees=zenith,
+        ),
+        calculate_solar_azimuth_degrees(
+            hour_angle_degrees=hour_angle,
+            latitude_degrees=43,
+            declination_degrees=declination,
+        ),
+    )
+    with pytest.raises(ValueError):
+        calculate_solar_azimuth_degrees(
+            hour_angle_degrees=0,
+            latitude_degrees=43,
+            declination_degrees=0,
+            solar_zenith_degrees=95,
+        )
+
+
+@pytest.mark.solar_geom
+def test_errors_mask():
+    """Test to ensure invalid rows are set to NaN (rather than to the
+    overhead-sun azimuth of 0) and flagged with `errors="mask"`."""
+    azimuth, validity = calculate_solar_azimuth_degrees(
+        hour_angle_degrees=np.array([-37.5, nan, 0, 0]),
+        latitude_degrees=43,
+        declination_degrees=np.array([-14, -14, 0, 0]),
+        solar_zenith_degrees=np.array([66.5, 60, 95, 43]),
+        errors="mask",
+    )
+    np.testing.assert_array_equal(validity.mask, [True, False, False, True])
+    assert np.isnan(azimuth[1:3]).all()
+    assert azimuth[3] == pytest.approx(0, abs=1e-6)
+    assert validity.counts["hour_angle_degrees"]["nan"] == 1
+    assert validity.counts["solar_zenith_degrees"]["out_of_range"] == 1
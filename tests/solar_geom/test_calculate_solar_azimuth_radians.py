@@ -0,0 +1,80 @@
+from math import nan
+
+import numpy as np
+import pytest
+
+from pysoleng.solar_geom import (
+    calculate_solar_azimuth_radians,
+    calculate_solar_zenith_radians,
+)
+
+
+@pytest.mark.solar_geom
+def test_calculate_solar_azimuth_radians_iterable():
+    """Functional test to ensure the calculate_solar_azimuth_radians()
+    method runs properly given valid iterables."""
+    azimuth = calculate_solar_azimuth_radians(
+        hour_angle_radians=np.radians([-10, 0, 10]),
+        latitude_radians=np.radians(43),
+        declination_radians=np.radians([-14, -10, 5]),
+    )
+    assert isinstance(azimuth, np.ndarray)
+    assert isinstance(azimuth[0], float)
+
+
+@pytest.mark.solar_geom
+def test_known_values():
+    """Run tests with known answers to ensure
+    calculate_solar_azimuth_radians() is giving the expected output.
+    These known values come from Duffie & Beckman (2006) Example 1.6.2.
+    """
+    assert calculate_solar_azimuth_radians(
+        hour_angle_radians=np.radians(-37.5),
+        latitude_radians=np.radians(43),
+        declination_radians=np.radians(-14),
+    ) == pytest.approx(np.radians(-40.08106))
+    assert calculate_solar_azimuth_radians(
+        hour_angle_radians=np.radians(97.5),
+        latitude_radians=np.radians(43),
+        declination_radians=np.radians(23.1),
+    ) == pytest.approx(np.radians(112.019756))
+    # On the equator, on an equinox, at solar noon
+    assert calculate_solar_azimuth_radians(
+        hour_angle_radians=0, latitude_radians=0, declination_radians=0
+    ) == pytest.approx(0)
+
+
+@pytest.mark.solar_geom
+def test_precomputed_zenith():
+    """Test that calculate_solar_azimuth_radians() gives the same output
+    when given an already-calculated solar zenith angle."""
+    arguments = dict(
+        hour_angle_radians=np.radians([-97.5, -37.5, 52.5]),
+        latitude_radians=np.radians(43),
+        declination_radians=np.radians([23.1, -14, 5]),
+    )
+    zenith = calculate_solar_zenith_radians(
+        latitude_radians=arguments["latitude_radians"],
+        declination_radians=arguments["declination_radians"],
+        hour_angle_radians=arguments["hour_angle_radians"],
+    )
+    np.testing.assert_allclose(
+        calculate_solar_azimuth_radians(
+            **arguments, solar_zenith_radians=zenith
+        ),
+        calculate_solar_azimuth_radians(**arguments),
+    )
+
+
+@pytest.mark.solar_geom
+@pytest.mark.parametrize(
+    "hour_angle,latitude,declination,zenith",
+    [(4, 0, 0, None), (0, 2, 0, None), (0, 0, nan, None), (0, 0, 0, 2)],
+)
+def test_invalid_value(hour_angle, latitude, declination, zenith):
+    """Test to ensure a ValueError is raised when an invalid value
+    is provided to calculate_solar_azimuth_radians()."""
+    with pytest.raises(ValueError):
+        calculate_solar_azimuth_radians(
+            hour_angle, latitude, declination, solar_zenith_radians=zenith
+        )
@@ -157,3 +157,48 @@ def test_invalid_range():
             local_standard_time="February 3, 2020 10:30 AM",
             longitude_degrees=400,
         )
+
+
+@pytest.mark.solar_geom
+def test_daylight_saving_time_series():
+    """Test to ensure a Pandas series spanning daylight saving time
+    transitions in an IANA time zone uses the offset from UTC
+    in effect on each day, matching the scalar calculation."""
+    x = pd.Series(
+        pd.date_range(
+            "2020-03-07", "2020-11-02", freq="11H", tz="America/Chicago"
+        )
+    )
+    calculated = calculate_solar_noon_in_local_standard_time(
+        local_standard_time=x, longitude_degrees=89.4
+    )
+    for i in [0, 2, len(x) // 2, len(x) - 1]:
+        reference = calculate_solar_noon_in_local_standard_time(
+            local_standard_time=x[i], longitude_degrees=89.4
+        )
+        assert abs((calculated[i] - reference).total_seconds()) <= 1e-3
+    # Solar noon stays near 12:00 local standard time year-round
+    hours = [
+        pd.Timestamp(noon).tz_convert("Etc/GMT+6").hour for noon in calculated
+    ]
+    assert set(hours) <= {11, 12}
+
+
+@pytest.mark.solar_geom
+def test_calculate_solar_noon_in_local_standard_time_epoch():
+    """Functional test to ensure the
+    calculate_solar_noon_in_local_standard_time() method
+    runs properly given a numpy array of seconds since the Unix epoch,
+    matching the result for the equivalent timestamps."""
+    x = pd.Series(
+        pd.date_range("2020-03-07", periods=72, freq="H", tz="America/Chicago")
+    )
+    epoch = x.values.astype("datetime64[s]").astype(np.int64)
+    calculated = calculate_solar_noon_in_local_standard_time(
+        local_standard_time=epoch, longitude_degrees=89.4, tz="America/Chicago"
+    )
+    assert isinstance(calculated, pd.DatetimeIndex)
+    reference = calculate_solar_noon_in_local_standard_time(
+        local_standard_time=x, longitude_degrees=89.4
+    )
+    assert (abs(calculated - pd.DatetimeIndex(reference)).seconds < 1).all()
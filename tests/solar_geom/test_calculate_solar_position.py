@@ -0,0 +1,178 @@
+from math import inf, nan
+
+import numpy as np
+import pytest
+from hypothesis import given
+from hypothesis.strategies import floats
+
+from pysoleng.solar_geom import (
+    calculate_solar_altitude_degrees,
+    calculate_solar_azimuth_degrees,
+    calculate_solar_position,
+    calculate_solar_zenith_degrees,
+)
+
+
+@pytest.mark.solar_geom
+@given(
+    floats(min_value=-180, max_value=180, exclude_min=True, exclude_max=True),
+    floats(min_value=-90, max_value=90, exclude_min=True, exclude_max=True),
+    floats(
+        min_value=-23.45, max_value=23.45, exclude_min=True, exclude_max=True
+    ),
+)
+def test_calculate_solar_position(hour_angle, latitude, declination):
+    """Functional test to ensure the calculate_solar_position() method
+    runs properly given valid arguments, and matches the separate
+    zenith, altitude, and azimuth methods."""
+    position = calculate_solar_position(
+        latitude_degrees=latitude,
+        declination_degrees=declination,
+        hour_angle_degrees=hour_angle,
+    )
+    for value in position.values():
+        assert isinstance(value, float)
+    zenith = calculate_solar_zenith_degrees(latitude, declination, hour_angle)
+    assert position["solar_zenith_degrees"] == pytest.approx(zenith)
+    assert position["solar_altitude_degrees"] == pytest.approx(
+        calculate_solar_altitude_degrees(zenith)
+    )
+    """The azimuth is ill-conditioned with the sun near the zenith
+    or near a pole, so only compare it elsewhere."""
+    if zenith > 1 and abs(latitude) < 89:
+        assert position["solar_azimuth_degrees"] == pytest.approx(
+            calculate_solar_azimuth_degrees(hour_angle, latitude, declination),
+            abs=1e-4,
+        )
+
+
+@pytest.mark.solar_geom
+def test_calculate_solar_position_iterable():
+    """Functional test to ensure the calculate_solar_position() method
+    runs properly given valid iterables."""
+    position = calculate_solar_position(
+        latitude_degrees=43,
+        declination_degrees=[-14, -10, 5],
+        hour_angle_degrees=[-10, 0, 10],
+    )
+    for value in position.values():
+        assert isinstance(value, np.ndarray)
+        assert len(value) == 3
+
+
+@pytest.mark.solar_geom
+def test_known_values():
+    """Run tests with known answers to ensure
+    calculate_solar_position() is giving the expected output.
+    These known values come from Duffie & Beckman (2006) Example 1.6.2.
+    """
+
+    position = calculate_solar_position(
+        latitude_degrees=43, declination_degrees=-14, hour_angle_degrees=-37.5
+    )
+    assert position["solar_zenith_degrees"] == pytest.approx(66.5, abs=0.1)
+    assert position["solar_azimuth_degrees"] == pytest.approx(-40.08106)
+    position = calculate_solar_position(
+        latitude_degrees=43, declination_degrees=23.1, hour_angle_degrees=97.5
+    )
+    assert position["solar_zenith_degrees"] == pytest.approx(79.6, abs=0.1)
+    assert position["solar_azimuth_degrees"] == pytest.approx(112.019756)
+    # Below the horizon, the sun is held at the horizon
+    position = calculate_solar_position(
+        latitude_degrees=43, declination_degrees=-14, hour_angle_degrees=180
+    )
+    assert position["solar_zenith_degrees"] == 90
+    assert position["solar_altitude_degrees"] == 0
+    # On the equator, on an equinox, at solar noon
+    position = calculate_solar_position(
+        latitude_degrees=0, declination_degrees=0, hour_angle_degrees=0
+    )
+    assert position["solar_zenith_degrees"] == pytest.approx(0)
+    assert position["solar_azimuth_degrees"] == pytest.approx(0)
+
+
+@pytest.mark.solar_geom
+@pytest.mark.parametrize(
+    "latitude,declination,hour_angle",
+    [
+        (nan, 0, 0),
+        (43, inf, 0),
+        (43, 0, nan),
+        (-100, 0, 0),
+        (43, 30, 0),
+        (43, 0, 200),
+    ],
+)
+def test_invalid_value(latitude, declination, hour_angle):
+    """Test to ensure a ValueError is raised when an invalid value
+    is provided to calculate_solar_position()."""
+    with pytest.raises(ValueError):
+        calculate_solar_position(
+            latitude_degrees=latitude,
+            declination_degrees=declination,
+            hour_angle_degrees=hour_angle,
+        )
+
+
+@pytest.mark.solar_geom
+def test_invalid_type():
+    """Test to ensure a TypeError is raised when an invalid type
+    is provided to calculate_solar_position()."""
+    with pytest.raises(TypeError):
+        calculate_solar_position(
+            latitude_degrees="blah",
+            declination_degrees=0,
+            hour_angle_degrees=0,
+        )
+
+
+@pytest.mark.solar_geom
+def test_errors_mask():
+    """Test to ensure invalid rows are set to NaN and flagged, rather
+    than raising a ValueError, with `errors="mask"`."""
+    declination = np.array([10.0, nan, 30.0, 10.0, -5.0])
+    hour_angle = np.array([15.0, 0.0, 0.0, 200.0, inf])
+    position, validity = calculate_solar_position(
+        latitude_degrees=43,
+        declination_degrees=declination,
+        hour_angle_degrees=hour_angle,
+        errors="mask",
+    )
+    np.testing.assert_array_equal(
+        validity.mask, [True, False, False, False, False]
+    )
+    assert validity.counts == {
+        "declination_degrees": {"nan": 1, "infinite": 0, "out_of_range": 1},
+        "hour_angle_degrees": {"nan": 0, "infinite": 1, "out_of_range": 1},
+    }
+    expected = calculate_solar_position(
+        latitude_degrees=43, declination_degrees=10, hour_angle_degrees=15
+    )
+    for key, value in position.items():
+        assert value[0] == pytest.approx(expected[key])
+        assert np.isnan(value[1:]).all()
+
+
+@pytest.mark.solar_geom
+def test_invalid_errors():
+    """Test to ensure a ValueError is raised for an unknown `errors`,
+    and that `errors="mask"` still type-checks its arguments."""
+    with pytest.raises(ValueError):
+        calculate_solar_position(43, 0, 0, errors="ignore")
+    with pytest.raises(TypeError):
+        calculate_solar_position(43, ["blah"], [0], errors="mask")
+
+
+@pytest.mark.solar_geom
+def test_latitude_array():
+    """Test to ensure calculate_solar_position() accepts a latitude
+    per row, matching the calculation of each row on its own."""
+    latitude = np.array([-60.0, 0.0, 43.0, 89.0])
+    declination = np.array([-13.8, 0.0, 23.1, 10.0])
+    hour_angle = np.array([-22.5, 45.0, 0.0, 170.0])
+    position = calculate_solar_position(latitude, declination, hour_angle)
+    for row, arguments in enumerate(zip(latitude, declination, hour_angle)):
+        for key, value in calculate_solar_position(*arguments).items():
+            assert position[key][row] == pytest.approx(value)
+    with pytest.raises(ValueError):
+        calculate_solar_position(latitude, declination[:2], hour_angle)
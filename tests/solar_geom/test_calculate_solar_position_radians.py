@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+from hypothesis import given
+from hypothesis.strategies import floats
+
+from pysoleng.site import Site
+from pysoleng.solar_geom import (
+    calculate_solar_position,
+    calculate_solar_position_radians,
+)
+
+
+@pytest.mark.solar_geom
+@given(
+    floats(min_value=-np.pi, max_value=np.pi),
+    floats(min_value=-1.5, max_value=1.5),
+    floats(min_value=-0.409, max_value=0.409),
+)
+def test_calculate_solar_position_radians(hour_angle, latitude, declination):
+    """Functional test to ensure the calculate_solar_position_radians()
+    method runs properly given valid arguments, and matches
+    calculate_solar_position()."""
+    position = calculate_solar_position_radians(
+        latitude_radians=latitude,
+        declination_radians=declination,
+        hour_angle_radians=hour_angle,
+    )
+    expected = calculate_solar_position(
+        latitude_degrees=np.degrees(latitude),
+        declination_degrees=np.degrees(declination),
+        hour_angle_degrees=np.degrees(hour_angle),
+    )
+    for quantity in ("zenith", "altitude", "azimuth"):
+        assert isinstance(position[f"solar_{quantity}_radians"], float)
+    """Near the zenith, the arccosine magnifies rounding
+    to around 1e-8 radians."""
+    for quantity in ("zenith", "altitude"):
+        assert position[f"solar_{quantity}_radians"] == pytest.approx(
+            np.radians(expected[f"solar_{quantity}_degrees"]), abs=1e-7
+        )
+    """The azimuth is ill-conditioned with the sun near the zenith,
+    so only compare it elsewhere."""
+    if expected["solar_zenith_degrees"] > 1:
+        assert position["solar_azimuth_radians"] == pytest.approx(
+            np.radians(expected["solar_azimuth_degrees"]), abs=1e-6
+        )
+
+
+@pytest.mark.solar_geom
+def test_site():
+    """Test that a Site can be given in place of `latitude_radians`."""
+    position = calculate_solar_position_radians(
+        latitude_radians=Site(latitude_degrees=43, longitude_degrees=89.4),
+        declination_radians=np.radians([-14, 23.1]),
+        hour_angle_radians=np.radians([-37.5, 97.5]),
+    )
+    np.testing.assert_allclose(
+        position["solar_azimuth_radians"],
+        np.radians([-40.08106, 112.019756]),
+        rtol=1e-6,
+    )
+
+
+@pytest.mark.solar_geom
+def test_invalid_value():
+    """Test to ensure a ValueError is raised when an invalid value
+    is provided to calculate_solar_position_radians()."""
+    with pytest.raises(ValueError):
+        calculate_solar_position_radians(0, 0, 4)
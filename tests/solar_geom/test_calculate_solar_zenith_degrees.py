@@ -181,3 +181,52 @@ def test_invalid_range():
             declination_degrees=-14,
             hour_angle_degrees=200,
         )
+
+
+@pytest.mark.solar_geom
+def test_errors_mask():
+    """Test to ensure invalid rows are set to NaN and flagged, rather
+    than raising a ValueError, with `errors="mask"`."""
+    zenith, validity = calculate_solar_zenith_degrees(
+        latitude_degrees=43,
+        declination_degrees=np.array([-14, -30, -14]),
+        hour_angle_degrees=np.array([-37.5, 0, nan]),
+        errors="mask",
+    )
+    np.testing.assert_array_equal(validity.mask, [True, False, False])
+    assert zenith[0] == pytest.approx(66.5, abs=0.1)
+    assert np.isnan(zenith[1:]).all()
+    assert validity.counts["declination_degrees"]["out_of_range"] == 1
+    assert validity.counts["hour_angle_degrees"]["nan"] == 1
+
+    # Scalars give a float, and the latitude is still checked strictly
+    zenith, validity = calculate_solar_zenith_degrees(
+        43, -30, 0, errors="mask"
+    )
+    assert isinstance(zenith, float) and np.isnan(zenith)
+    assert not validity.mask
+    with pytest.raises(ValueError):
+        calculate_solar_zenith_degrees(100, [-14], [0], errors="mask")
+
+
+@pytest.mark.solar_geom
+def test_latitude_array():
+    """Test to ensure calculate_solar_zenith_degrees() accepts a
+    latitude per row, and raises a ValueError for one that is not
+    aligned with the other per-row arguments."""
+    latitude = np.array([-60.0, 0.0, 43.0, 89.0])
+    declination = np.array([-13.8, 0.0, 23.1, 10.0])
+    hour_angle = np.array([-22.5, 45.0, 0.0, 170.0])
+    np.testing.assert_allclose(
+        calculate_solar_zenith_degrees(latitude, declination, hour_angle),
+        [
+            calculate_solar_zenith_degrees(*row)
+            for row in zip(latitude, declination, hour_angle)
+        ],
+    )
+    with pytest.raises(ValueError):
+        calculate_solar_zenith_degrees(latitude[:3], declination, hour_angle)
+    with pytest.raises(ValueError):
+        calculate_solar_zenith_degrees(
+            np.array([43.0, 91.0]), 0.0, np.array([0.0, 0.0])
+        )
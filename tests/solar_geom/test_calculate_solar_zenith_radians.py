@@ -0,0 +1,66 @@
+from math import inf, nan
+
+import numpy as np
+import pytest
+from hypothesis import given
+from hypothesis.strategies import floats
+
+from pysoleng.solar_geom import (
+    calculate_solar_zenith_degrees,
+    calculate_solar_zenith_radians,
+)
+
+
+@pytest.mark.solar_geom
+@given(
+    floats(min_value=-np.pi / 2, max_value=np.pi / 2),
+    floats(min_value=-0.409, max_value=0.409),
+    floats(min_value=-np.pi, max_value=np.pi),
+)
+def test_calculate_solar_zenith_radians(latitude, declination, hour_angle):
+    """Functional test to ensure the calculate_solar_zenith_radians()
+    method runs properly given valid arguments, and matches
+    calculate_solar_zenith_degrees()."""
+    zenith = calculate_solar_zenith_radians(latitude, declination, hour_angle)
+    assert isinstance(zenith, float)
+    assert 0 <= zenith <= np.pi / 2
+    assert zenith == pytest.approx(
+        np.radians(
+            calculate_solar_zenith_degrees(
+                np.degrees(latitude),
+                np.degrees(declination),
+                np.degrees(hour_angle),
+            )
+        ),
+        abs=1e-7,
+    )
+
+
+@pytest.mark.solar_geom
+def test_known_values():
+    """Run a test with a known answers to ensure
+    calculate_solar_zenith_radians() is giving the expected output.
+    These known values come from Duffie & Beckman (2006) Example 1.6.2.
+    """
+    assert calculate_solar_zenith_radians(
+        latitude_radians=np.radians(43),
+        declination_radians=np.radians(-14),
+        hour_angle_radians=np.radians(-37.5),
+    ) == pytest.approx(np.radians(66.54701))
+    assert calculate_solar_zenith_radians(
+        latitude_radians=np.radians(43),
+        declination_radians=np.radians(23.1),
+        hour_angle_radians=np.radians(97.5),
+    ) == pytest.approx(np.radians(79.64385))
+
+
+@pytest.mark.solar_geom
+@pytest.mark.parametrize(
+    "latitude,declination,hour_angle",
+    [(2, 0, 0), (0, 0.5, 0), (0, 0, 4), (nan, 0, 0), (0, inf, 0)],
+)
+def test_invalid_value(latitude, declination, hour_angle):
+    """Test to ensure a ValueError is raised when an invalid value
+    is provided to calculate_solar_zenith_radians()."""
+    with pytest.raises(ValueError):
+        calculate_solar_zenith_radians(latitude, declination, hour_angle)
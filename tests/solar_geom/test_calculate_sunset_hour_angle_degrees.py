@@ -0,0 +1,63 @@
+from math import nan
+
+import numpy as np
+import pytest
+from hypothesis import given
+from hypothesis.strategies import floats
+
+from pysoleng.site import Site
+from pysoleng.solar_geom import (
+    calculate_solar_zenith_degrees,
+    calculate_sunset_hour_angle_degrees,
+)
+
+
+@pytest.mark.solar_geom
+@given(
+    floats(min_value=-65, max_value=65),
+    floats(min_value=-23.45, max_value=23.45),
+)
+def test_calculate_sunset_hour_angle_degrees(latitude, declination):
+    """Functional test to ensure the calculate_sunset_hour_angle_degrees()
+    method runs properly given valid arguments, and that the sun is on
+    the horizon at the sunset hour angle."""
+    sunset_hour_angle = calculate_sunset_hour_angle_degrees(
+        latitude_degrees=latitude, declination_degrees=declination
+    )
+    assert isinstance(sunset_hour_angle, float)
+    assert 0 <= sunset_hour_angle <= 180
+    assert calculate_solar_zenith_degrees(
+        latitude, declination, sunset_hour_angle
+    ) == pytest.approx(90, abs=1e-6)
+
+
+@pytest.mark.solar_geom
+def test_known_values():
+    """Test to ensure calculate_sunset_hour_angle_degrees() gives the
+    expected output, including where the sun does not set or rise."""
+    # Duffie & Beckman (2006) Example 1.6.3: latitude 43, February 13
+    assert calculate_sunset_hour_angle_degrees(43, -14) == pytest.approx(
+        76.56, abs=0.01
+    )
+    # On an equinox, the sun sets at 90 degrees everywhere
+    np.testing.assert_allclose(
+        calculate_sunset_hour_angle_degrees(
+            Site(latitude_degrees=60, longitude_degrees=0), [0, 0]
+        ),
+        [90, 90],
+    )
+    # Polar day and polar night
+    assert calculate_sunset_hour_angle_degrees(80, 20) == 180
+    assert calculate_sunset_hour_angle_degrees(80, -20) == 0
+
+
+@pytest.mark.solar_geom
+def test_invalid_value():
+    """Test to ensure a ValueError is raised when an invalid value
+    is provided to calculate_sunset_hour_angle_degrees()."""
+    with pytest.raises(ValueError):
+        calculate_sunset_hour_angle_degrees(43, nan)
+    with pytest.raises(ValueError):
+        calculate_sunset_hour_angle_degrees(43, 30)
+    with pytest.raises(ValueError):
+        calculate_sunset_hour_angle_degrees(100, 0)
@@ -1,6 +1,7 @@
 from datetime import datetime
 from math import inf, nan
 
+import numpy as np
 import pandas as pd
 
 import pytest
@@ -142,3 +143,82 @@ def test_invalid_range():
             local_standard_time="February 3, 2020 10:30 AM",
             longitude_degrees=400,
         )
+
+
+@pytest.mark.solar_geom
+def test_daylight_saving_time_series():
+    """Test to ensure a Pandas series spanning daylight saving time
+    transitions in an IANA time zone uses the offset from UTC
+    of each timestamp, matching the scalar calculation."""
+    x = pd.Series(
+        pd.date_range(
+            "2020-03-07", "2020-11-02", freq="11H", tz="America/Chicago"
+        )
+    )
+    calculated = convert_to_solar_time(
+        local_standard_time=x, longitude_degrees=89.4
+    )
+    for i in [0, 2, len(x) // 2, len(x) - 1]:
+        reference = convert_to_solar_time(
+            local_standard_time=x[i], longitude_degrees=89.4
+        )
+        assert abs((calculated[i] - reference).total_seconds()) <= 1e-3
+    # Solar time (read on the local wall clock) is continuous
+    # across the transitions
+    wall_clock = pd.Series([ts.tz_localize(None) for ts in calculated])
+    gaps = wall_clock.diff().dropna().dt.total_seconds()
+    assert (gaps - 11 * 3_600).abs().max() <= 60
+
+
+@pytest.mark.solar_geom
+def test_convert_to_solar_time_epoch():
+    """Functional test to ensure the convert_to_solar_time() method
+    runs properly given a numpy array of seconds since the Unix epoch,
+    matching the result for the equivalent timestamps."""
+    x = pd.Series(
+        pd.date_range("2020-03-07", periods=72, freq="H", tz="America/Chicago")
+    )
+    epoch = x.values.astype("datetime64[s]").astype(np.int64)
+    calculated = convert_to_solar_time(
+        local_standard_time=epoch, longitude_degrees=89.4, tz="America/Chicago"
+    )
+    assert isinstance(calculated, pd.DatetimeIndex)
+    reference = convert_to_solar_time(
+        local_standard_time=x, longitude_degrees=89.4
+    )
+    assert (calculated == pd.DatetimeIndex(reference)).all()
+    # Epoch arrays without a time zone are not valid
+    with pytest.raises(ValueError):
+        assert convert_to_solar_time(
+            local_standard_time=epoch, longitude_degrees=89.4
+        )
+
+
+@pytest.mark.solar_geom
+def test_convert_to_solar_time_mixed_offsets():
+    """Functional test to ensure the convert_to_solar_time() method
+    keeps the order and offset from UTC of each row of a batch
+    mixing offsets."""
+    local_standard_time = [
+        "2020-07-01T15:00:00+02:00",
+        "2020-02-13T10:42:00-06:00",
+        "2020-07-01T16:00:00+02:00",
+    ]
+    longitude_degrees = np.array([345.0, 89.4, 345.0])
+    solar_time = convert_to_solar_time(local_standard_time, longitude_degrees)
+    assert isinstance(solar_time, list)
+    for result, value, longitude in zip(
+        solar_time, local_standard_time, longitude_degrees
+    ):
+        expected = convert_to_solar_time(value, longitude)
+        assert result.utcoffset() == pd.Timestamp(value).utcoffset()
+        assert abs(result - expected) < pd.Timedelta(microseconds=1)
+
+    epoch_solar_time = convert_to_solar_time(
+        np.array([pd.Timestamp(value).value for value in local_standard_time]),
+        longitude_degrees,
+        tz=np.array([2, -6, 2]),
+        epoch_unit="ns",
+    )
+    assert isinstance(epoch_solar_time, pd.Index)
+    assert list(epoch_solar_time) == solar_time
@@ -0,0 +1,166 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pysoleng.solar_geom import (
+    calculate_hour_angle_degrees,
+    calculate_solar_zenith_degrees,
+)
+from pysoleng.streaming import calculate_batch_positions
+
+TIMESTAMPS = [
+    "February 13, 2020 10:42 AM -06:00",
+    "February 13, 2020 11:42 AM -06:00",
+    "July 1, 2020 3:00 PM -06:00",
+]
+
+
+@pytest.mark.streaming
+def test_calculate_batch_positions():
+    """Functional test to ensure the calculate_batch_positions() method
+    runs properly given valid arguments."""
+    positions = calculate_batch_positions(
+        local_standard_time=TIMESTAMPS,
+        latitude_degrees=43,
+        longitude_degrees=89.4,
+    )
+    assert isinstance(positions, dict)
+    for values in positions.values():
+        assert isinstance(values, np.ndarray)
+        assert len(values) == len(TIMESTAMPS)
+
+
+@pytest.mark.streaming
+def test_known_values():
+    """Run a test with a known answer to ensure
+    calculate_batch_positions() agrees with the
+    pysoleng.solar_geom methods.
+
+    These known values are taken from Duffie & Beckman (2006) Example 1.6.1.
+    """
+    positions = calculate_batch_positions(
+        local_standard_time=TIMESTAMPS,
+        latitude_degrees=43,
+        longitude_degrees=89.4,
+    )
+    assert positions["hour_angle_degrees"][0] == pytest.approx(-22.46533)
+    assert positions["hour_angle_degrees"] == pytest.approx(
+        calculate_hour_angle_degrees(TIMESTAMPS, 89.4)
+    )
+    assert positions["solar_zenith_degrees"] == pytest.approx(
+        calculate_solar_zenith_degrees(
+            43,
+            positions["declination_degrees"],
+            positions["hour_angle_degrees"],
+        )
+    )
+
+
+@pytest.mark.streaming
+def test_daylight_only():
+    """Test that night rows are filled, and daylight rows unchanged,
+    with `daylight_only=True`."""
+    timestamps = [
+        "2020-02-13 10:42 -06:00",
+        "2020-02-13 11:42 -06:00",
+        "2020-07-01 15:00 -06:00",
+        "2020-07-01 23:00 -06:00",
+    ]
+    positions = calculate_batch_positions(
+        timestamps, 43, 89.4, 300, daylight_only=True
+    )
+    expected = calculate_batch_positions(timestamps, 43, 89.4, 300)
+    for key, values in expected.items():
+        np.testing.assert_allclose(positions[key][:3], values[:3])
+    assert positions["solar_zenith_degrees"][3] == 90
+    assert positions["solar_altitude_degrees"][3] == 0
+    assert np.isnan(positions["solar_azimuth_degrees"][3])
+    assert np.isnan(positions["air_mass"][3])
+
+
+@pytest.mark.streaming
+def test_mixed_offsets():
+    """Test that a batch mixing offsets from UTC (with a longitude
+    per row) matches calculating each row on its own."""
+    timestamps = [
+        "2020-07-01T15:00:00+02:00",
+        "2020-02-13T10:42:00-06:00",
+        "2020-07-02T01:30:00+05:30",
+    ]
+    longitude_degrees = np.array([345.0, 89.4, 277.0])
+    positions = calculate_batch_positions(timestamps, 43, longitude_degrees)
+    for row, (timestamp, longitude) in enumerate(
+        zip(timestamps, longitude_degrees)
+    ):
+        expected = calculate_batch_positions([timestamp], 43, longitude)
+        for key, values in expected.items():
+            assert positions[key][row] == pytest.approx(values[0])
+
+
+@pytest.mark.streaming
+@pytest.mark.parametrize("daylight_only", [False, True])
+def test_moving_platform(daylight_only):
+    """Test that a latitude, longitude, and altitude per row (a GPS
+    track) match calculating each row on its own."""
+    timestamps = [
+        f"2020-07-01T{hour:02}:00:00-06:00" for hour in range(0, 24, 3)
+    ]
+    latitude_degrees = np.linspace(-60, 60, len(timestamps))
+    longitude_degrees = np.linspace(80, 100, len(timestamps))
+    site_altitude_m = np.linspace(0, 2_000, len(timestamps))
+    positions = calculate_batch_positions(
+        timestamps,
+        latitude_degrees,
+        longitude_degrees,
+        site_altitude_m,
+        daylight_only=daylight_only,
+    )
+    for row, arguments in enumerate(
+        zip(timestamps, latitude_degrees, longitude_degrees, site_altitude_m)
+    ):
+        expected = calculate_batch_positions(
+            [arguments[0]], *arguments[1:], daylight_only=daylight_only
+        )
+        for key, values in expected.items():
+            np.testing.assert_allclose(positions[key][row], values[0])
+    with pytest.raises(ValueError):
+        calculate_batch_positions(timestamps, latitude_degrees[:2], 89.4)
+
+
+@pytest.mark.streaming
+@pytest.mark.parametrize("daylight_only", [False, True])
+@pytest.mark.parametrize(
+    "local_standard_time", [[], pd.Series([], dtype=object)]
+)
+def test_empty_batch(local_standard_time, daylight_only):
+    """Test to ensure an empty batch returns empty arrays for every
+    quantity of a non-empty batch."""
+    positions = calculate_batch_positions(
+        local_standard_time, 43, 89.4, daylight_only=daylight_only
+    )
+    expected = calculate_batch_positions(TIMESTAMPS, 43, 89.4)
+    assert list(positions) == list(expected)
+    for values in positions.values():
+        assert isinstance(values, np.ndarray)
+        assert values.shape == (0,)
+    with pytest.raises(ValueError):
+        calculate_batch_positions(local_standard_time, 100, 89.4)
+
+
+@pytest.mark.streaming
+def test_invalid_range():
+    """Test to ensure a ValueError is raised when a value
+    outside the specified range is provided to
+    calculate_batch_positions()."""
+    with pytest.raises(ValueError):
+        assert calculate_batch_positions(
+            local_standard_time=TIMESTAMPS,
+            latitude_degrees=100,
+            longitude_degrees=89.4,
+        )
+    with pytest.raises(ValueError):
+        assert calculate_batch_positions(
+            local_standard_time=TIMESTAMPS,
+            latitude_degrees=43,
+            longitude_degrees=-10,
+        )
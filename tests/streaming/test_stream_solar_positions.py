@@ -0,0 +1,113 @@
+import asyncio
+
+import pytest
+
+from pysoleng.streaming import (
+    calculate_batch_positions,
+    stream_solar_positions,
+)
+
+TIMESTAMPS = [
+    "2020-02-13 10:42 -06:00",
+    "2020-02-13 11:42 -06:00",
+    "2020-02-13 12:42 -06:00",
+    "2020-02-13 13:42 -06:00",
+    "2020-02-13 14:42 -06:00",
+]
+
+
+async def _queue_readings(queue):
+    """In-memory stand-in for a live telemetry feed:
+    yields readings from `queue` until `None` is received."""
+    while True:
+        reading = await queue.get()
+        if reading is None:
+            return
+        yield reading
+
+
+async def _collect(readings, **kwargs):
+    return [
+        record
+        async for record in stream_solar_positions(
+            readings, latitude_degrees=43, longitude_degrees=89.4, **kwargs
+        )
+    ]
+
+
+@pytest.mark.streaming
+def test_stream_solar_positions():
+    """Functional test to ensure the stream_solar_positions() method
+    enriches every reading, in order."""
+
+    async def _run():
+        queue = asyncio.Queue()
+        for i, timestamp in enumerate(TIMESTAMPS):
+            queue.put_nowait({"timestamp": timestamp, "power_kw": i})
+        queue.put_nowait(None)
+        return await _collect(_queue_readings(queue), batch_size=2)
+
+    records = asyncio.run(_run())
+    expected = calculate_batch_positions(TIMESTAMPS, 43, 89.4)
+    assert [record["power_kw"] for record in records] == list(range(5))
+    for i, record in enumerate(records):
+        assert record["timestamp"] == TIMESTAMPS[i]
+        for key, values in expected.items():
+            assert isinstance(record[key], float)
+            assert record[key] == pytest.approx(values[i])
+
+
+@pytest.mark.streaming
+def test_window_flush():
+    """Test to ensure a partial batch is emitted once `window_seconds`
+    have passed, rather than waiting for the batch to fill."""
+
+    async def _run():
+        queue = asyncio.Queue()
+        stream = stream_solar_positions(
+            _queue_readings(queue),
+            latitude_degrees=43,
+            longitude_degrees=89.4,
+            batch_size=100,
+            window_seconds=0.01,
+        )
+        queue.put_nowait({"timestamp": TIMESTAMPS[0]})
+        # The feed is still open, so only the window can end the batch
+        record = await asyncio.wait_for(stream.__anext__(), timeout=5)
+        queue.put_nowait(None)
+        remaining = [record async for record in stream]
+        return record, remaining
+
+    record, remaining = asyncio.run(_run())
+    assert record["hour_angle_degrees"] == pytest.approx(-22.46533)
+    assert remaining == []
+
+
+@pytest.mark.streaming
+def test_source_error():
+    """Test to ensure an exception raised by the feed
+    is propagated to the consumer."""
+
+    async def _failing_readings():
+        yield {"timestamp": TIMESTAMPS[0]}
+        raise RuntimeError("feed dropped")
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(_collect(_failing_readings()))
+
+
+@pytest.mark.streaming
+def test_invalid_range():
+    """Test to ensure a ValueError or TypeError is raised when an
+    invalid value is provided to stream_solar_positions()."""
+
+    async def _no_readings():
+        return
+        yield
+
+    with pytest.raises(ValueError):
+        asyncio.run(_collect(_no_readings(), batch_size=0))
+    with pytest.raises(TypeError):
+        asyncio.run(_collect(_no_readings(), batch_size=2.5))
+    with pytest.raises(ValueError):
+        asyncio.run(_collect(_no_readings(), window_seconds=-1))
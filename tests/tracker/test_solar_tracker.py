@@ -0,0 +1,142 @@
+from datetime import datetime, timedelta, timezone
+from math import inf, nan
+
+import pytest
+
+from pysoleng.solar_geom import (
+    calculate_air_mass,
+    calculate_hour_angle_degrees,
+    calculate_solar_azimuth_degrees,
+    calculate_solar_zenith_degrees,
+)
+from pysoleng.tracker import SolarTracker
+
+CST = timezone(timedelta(hours=-6))
+
+
+@pytest.mark.tracker
+def test_solar_tracker():
+    """Functional test to ensure the SolarTracker class
+    runs properly given valid arguments."""
+    tracker = SolarTracker(
+        latitude_degrees=43, longitude_degrees=89.4, utc_offset_hours=-6
+    )
+    assert tracker.at(datetime(2020, 2, 13, 10, 42, tzinfo=CST)) is tracker
+    assert tracker.step(1) is tracker
+    assert isinstance(tracker.hour_angle_degrees, float)
+    assert isinstance(tracker.solar_zenith_degrees, float)
+    assert isinstance(tracker.solar_azimuth_degrees, float)
+    assert isinstance(tracker.air_mass, float)
+    assert not hasattr(tracker, "__dict__")
+
+
+@pytest.mark.tracker
+def test_known_values():
+    """Run a test with a known answer to ensure
+    SolarTracker is giving the same output as the
+    pysoleng.solar_geom methods.
+
+    These known values are taken from Duffie & Beckman (2006) Example 1.6.1.
+    """
+    tracker = SolarTracker(
+        latitude_degrees=43, longitude_degrees=89.4, utc_offset_hours=-6
+    ).at(datetime(2020, 2, 13, 10, 42, tzinfo=CST))
+    assert tracker.day_number == 44
+    assert tracker.hour_angle_degrees == pytest.approx(-22.46533)
+
+    declination = tracker.declination_degrees
+    hour_angle = tracker.hour_angle_degrees
+    zenith = calculate_solar_zenith_degrees(43, declination, hour_angle)
+    assert tracker.solar_zenith_degrees == pytest.approx(zenith)
+    assert tracker.solar_altitude_degrees == pytest.approx(90 - zenith)
+    assert tracker.solar_azimuth_degrees == pytest.approx(
+        calculate_solar_azimuth_degrees(hour_angle, 43, declination)
+    )
+    assert tracker.air_mass == pytest.approx(calculate_air_mass(zenith))
+
+
+@pytest.mark.tracker
+def test_step_matches_at():
+    """Test to ensure stepping the tracker (including across
+    a local date rollover) matches setting the time directly."""
+    start = datetime(2020, 2, 13, 23, 0, tzinfo=CST)
+    tracker = SolarTracker(
+        latitude_degrees=43, longitude_degrees=89.4, utc_offset_hours=-6
+    ).at(start)
+    for _ in range(2 * 3_600):
+        tracker.step(1)
+    assert tracker.day_number == 45
+    assert tracker.hour_angle_degrees == pytest.approx(
+        calculate_hour_angle_degrees(start + timedelta(hours=2), 89.4)
+    )
+    # Stepping backward across the rollover
+    tracker.step(-2 * 3_600)
+    assert tracker.day_number == 44
+    assert tracker.hour_angle_degrees == pytest.approx(
+        calculate_hour_angle_degrees(start, 89.4)
+    )
+
+
+@pytest.mark.tracker
+@pytest.mark.parametrize(
+    "utc_offset_hours, longitude_degrees", [(-3.5, 52.7), (5.5, 282.8)]
+)
+def test_fractional_utc_offset(utc_offset_hours, longitude_degrees):
+    """Test to ensure the tracker's hour angle matches
+    calculate_hour_angle_degrees() for an offset from UTC that is
+    not a whole number of hours."""
+    tz = timezone(timedelta(hours=utc_offset_hours))
+    local_time = datetime(2020, 2, 13, 10, tzinfo=tz)
+    tracker = SolarTracker(
+        latitude_degrees=0,
+        longitude_degrees=longitude_degrees,
+        utc_offset_hours=utc_offset_hours,
+    ).at(local_time)
+    assert tracker.hour_angle_degrees == pytest.approx(
+        calculate_hour_angle_degrees(local_time, longitude_degrees)
+    )
+
+
+@pytest.mark.tracker
+def test_epoch_seconds():
+    """Test to ensure SolarTracker accepts seconds since the Unix epoch."""
+    dt = datetime(2020, 2, 13, 10, 42, tzinfo=CST)
+    tracker = SolarTracker(
+        latitude_degrees=43, longitude_degrees=89.4, utc_offset_hours=-6
+    )
+    assert tracker.at(dt.timestamp()).hour_angle_degrees == pytest.approx(
+        tracker.at(dt).hour_angle_degrees
+    )
+
+
+@pytest.mark.tracker
+def test_naive_datetime():
+    """Run a test with a naive datetime object,
+    which should result in a `ValueError`.
+    """
+    tracker = SolarTracker(
+        latitude_degrees=43, longitude_degrees=89.4, utc_offset_hours=-6
+    )
+    with pytest.raises(ValueError):
+        assert tracker.at(datetime(2020, 2, 13, 10, 42))
+    with pytest.raises(ValueError):
+        # `step()` before `at()`
+        assert tracker.step(1)
+
+
+@pytest.mark.tracker
+def test_invalid_range():
+    """Test to ensure a ValueError is raised when a value
+    outside the specified range is provided to SolarTracker."""
+    with pytest.raises(ValueError):
+        assert SolarTracker(
+            latitude_degrees=100, longitude_degrees=89.4, utc_offset_hours=-6
+        )
+    with pytest.raises(ValueError):
+        assert SolarTracker(
+            latitude_degrees=43, longitude_degrees=nan, utc_offset_hours=-6
+        )
+    with pytest.raises(ValueError):
+        assert SolarTracker(
+            latitude_degrees=43, longitude_degrees=89.4, utc_offset_hours=inf
+        )
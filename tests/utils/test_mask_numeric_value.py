@@ -0,0 +1,39 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pysoleng.utils import mask_numeric_value
+
+
+@pytest.mark.utils
+def test_mask_numeric_value():
+    """Functional test to ensure mask_numeric_value() flags NaN,
+    infinite, and out-of-range values, and counts them by reason."""
+    mask, counts = mask_numeric_value(
+        np.array([0.0, np.nan, 10.005, 10.5, -np.inf, np.inf, -3]),
+        minimum=0,
+        maximum=10,
+    )
+    np.testing.assert_array_equal(
+        mask, [True, False, True, False, False, False, False]
+    )
+    assert counts == {"nan": 1, "infinite": 2, "out_of_range": 2}
+
+
+@pytest.mark.utils
+def test_mask_numeric_value_scalar():
+    """Test to ensure mask_numeric_value() works for scalars,
+    and for values with no range requirements."""
+    mask, counts = mask_numeric_value(5, minimum=0, maximum=10)
+    assert mask.shape == () and mask
+    assert counts == {"nan": 0, "infinite": 0, "out_of_range": 0}
+    mask, counts = mask_numeric_value(pd.Series([np.inf, 1e300]))
+    np.testing.assert_array_equal(mask, [True, True])
+
+
+@pytest.mark.utils
+def test_invalid_type():
+    """Test to ensure a TypeError is still raised when a
+    non-numeric value is provided."""
+    with pytest.raises(TypeError):
+        mask_numeric_value(["blah", 1], minimum=0, maximum=10)
@@ -0,0 +1,102 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pysoleng.solar_geom import calculate_hour_angle_degrees
+from pysoleng.utils import parse_iso8601_timestamps
+
+TIMESTAMPS = [
+    "2020-07-01T15:00:00-06:00",
+    "2020-07-01 10:42:00.5+05:30",
+    "2020-12-31T23:59:59Z",
+    "2020-02-29T00:00:00.123456789+14:00",
+    "1969-12-31T23:00:00-12:00",
+]
+
+
+@pytest.mark.utils
+@pytest.mark.parametrize(
+    "timestamps",
+    [
+        TIMESTAMPS,
+        np.array(TIMESTAMPS),
+        np.array(TIMESTAMPS, dtype="S"),
+        pd.Series(TIMESTAMPS),
+        pd.Index(TIMESTAMPS),
+    ],
+)
+def test_parse_iso8601_timestamps(timestamps):
+    """Functional test to ensure parse_iso8601_timestamps() matches
+    Pandas for mixed offsets, UTC ("Z"), and fractional seconds."""
+    epoch_ns, offset_minutes = parse_iso8601_timestamps(timestamps)
+    assert epoch_ns.dtype == np.int64 and offset_minutes.dtype == np.int16
+    np.testing.assert_array_equal(
+        epoch_ns, [pd.Timestamp(value).value for value in TIMESTAMPS]
+    )
+    np.testing.assert_array_equal(offset_minutes, [-360, 330, 0, 840, -720])
+
+
+@pytest.mark.utils
+def test_parse_iso8601_timestamps_empty():
+    """Test to ensure parse_iso8601_timestamps() accepts no timestamps."""
+    epoch_ns, offset_minutes = parse_iso8601_timestamps([])
+    assert epoch_ns.shape == (0,) and offset_minutes.shape == (0,)
+
+
+@pytest.mark.utils
+def test_parse_iso8601_timestamps_hour_angle():
+    """Test to ensure the parsed timestamps give the same hour angles
+    as the timestamp strings."""
+    timestamps = pd.date_range(
+        "2019-01-01 00:00 -06:00", periods=500, freq="17H"
+    )
+    epoch_ns, offset_minutes = parse_iso8601_timestamps(
+        timestamps.strftime("%Y-%m-%dT%H:%M:%S%z").str[:-2]
+        + ":"
+        + timestamps.strftime("%z").str[-2:]
+    )
+    np.testing.assert_allclose(
+        calculate_hour_angle_degrees(
+            epoch_ns, 90.0, tz=offset_minutes[0] / 60, epoch_unit="ns"
+        ),
+        calculate_hour_angle_degrees(pd.Series(timestamps), 90.0),
+    )
+
+
+@pytest.mark.utils
+@pytest.mark.parametrize(
+    "timestamp",
+    [
+        "2020-02-30T00:00:00Z",
+        "2019-02-29T00:00:00Z",
+        "2020-13-01T00:00:00Z",
+        "2020-07-01T24:00:00Z",
+        "2020-07-01T15:60:00Z",
+        "2020-07-01T15:00:00",
+        "2020-07-01T15:00:00+15:00",
+        "2020-07-01T15:00:00-06:60",
+        "2020-07-01T15:00:00.1234567890Z",
+        "2020-07-01T15:00:00.Z",
+        "2020-07-01T15:0a:00Z",
+        "2020/07/01T15:00:00Z",
+        "July 1, 2020 3:00 PM -06:00",
+        "2020-07-01T15:00:00-06:00é",
+    ],
+)
+def test_parse_iso8601_timestamps_invalid(timestamp):
+    """Test to ensure parse_iso8601_timestamps() raises a ValueError,
+    naming the row, for strings that are not ISO-8601 timestamps
+    with offsets from UTC."""
+    with pytest.raises(ValueError, match=r"\(row 1\)"):
+        parse_iso8601_timestamps([TIMESTAMPS[0], timestamp])
+
+
+@pytest.mark.utils
+@pytest.mark.parametrize(
+    "timestamps", [[1.5], np.array([1, 2]), pd.Series(["2020", None])]
+)
+def test_parse_iso8601_timestamps_type(timestamps):
+    """Test to ensure parse_iso8601_timestamps() raises a TypeError
+    for anything but strings."""
+    with pytest.raises(TypeError):
+        parse_iso8601_timestamps(timestamps)
@@ -1,4 +1,5 @@
 from datetime import datetime
+import numpy as np
 import pandas as pd
 
 import pytest
@@ -43,3 +44,47 @@ def test_invalid_string():
     ValueError with an invalid string input."""
     with pytest.raises(ValueError):
         assert validate_datetime("January 1, blah blah blah")
+
+
+@pytest.mark.utils
+def test_validate_datetime_epoch():
+    """Functional test to ensure validate_datetime() converts
+    numpy arrays of times since the Unix epoch when `tz` is given,
+    reusing the buffer of int64 nanoseconds."""
+    epoch = np.array([1_581_612_120, 1_581_655_320], dtype=np.int64)
+    for tz in ["America/Chicago", -6]:
+        index = validate_datetime(epoch, tz=tz)
+        assert isinstance(index, pd.DatetimeIndex)
+        assert index[0] == pd.Timestamp("February 13, 2020 10:42 AM -06:00")
+
+    epoch_ns = epoch * 1_000_000_000
+    index = validate_datetime(epoch_ns, tz="UTC", epoch_unit="ns")
+    assert np.shares_memory(index.asi8, epoch_ns)
+
+    # Without `tz`, arrays are parsed by Pandas as before
+    assert validate_datetime(epoch_ns).tz is None
+
+
+@pytest.mark.utils
+def test_invalid_epoch_unit():
+    """Test to ensure validate_datetime() will throw a
+    ValueError with an invalid `epoch_unit`."""
+    with pytest.raises(ValueError):
+        assert validate_datetime(np.array([0]), tz="UTC", epoch_unit="days")
+
+
+@pytest.mark.utils
+def test_validate_datetime_float_epoch():
+    """Functional test to ensure validate_datetime() converts numpy
+    arrays of float times since the Unix epoch, keeping fractions
+    of the unit, and raises a ValueError for NaN or infinite times."""
+    epoch = np.array([1_581_612_120.0, 1_581_655_320.5])
+    index = validate_datetime(epoch, tz=-6)
+    assert index[0] == pd.Timestamp("February 13, 2020 10:42 AM -06:00")
+    assert index[1] == pd.Timestamp("February 13, 2020 10:42:00.5 PM -06:00")
+    index_ms = validate_datetime(epoch * 1_000, tz=-6, epoch_unit="ms")
+    assert (index_ms == index).all()
+
+    for invalid in [np.nan, np.inf]:
+        with pytest.raises(ValueError):
+            validate_datetime(np.array([epoch[0], invalid]), tz="UTC")
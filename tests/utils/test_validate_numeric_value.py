@@ -1,3 +1,5 @@
+import numpy as np
+import pandas as pd
 import pytest
 from hypothesis import given
 from hypothesis.strategies import floats
@@ -54,3 +56,17 @@ def test_outside_range():
     with pytest.raises(ValueError):
         # Check `maximum` requirement
         assert validate_numeric_value(10, minimum=0, maximum=9)
+
+
+@pytest.mark.utils
+def test_invalid_array():
+    """Test to ensure a ValueError is raised for a NaN or out-of-range
+    element of a numpy array or Pandas Series."""
+    with pytest.raises(ValueError):
+        validate_numeric_value(
+            np.array([1.0, 2.0, 11.0]), minimum=0, maximum=10
+        )
+    with pytest.raises(ValueError):
+        validate_numeric_value(pd.Series([1, -1]), minimum=0, maximum=10)
+    with pytest.raises(ValueError):
+        validate_numeric_value(np.array([1.0, np.nan]), minimum=0, maximum=10)